@@ -0,0 +1,41 @@
+"""add background_tasks table
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "007"
+down_revision = "006"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "background_tasks",
+        sa.Column("id", sa.String(36), primary_key=True),
+        sa.Column("kind", sa.String(50), nullable=False),
+        sa.Column("payload_json", sa.Text(), nullable=False, server_default="{}"),
+        sa.Column("user_id", sa.String(36), sa.ForeignKey("users.id"), nullable=True),
+        sa.Column("status", sa.String(20), nullable=False, server_default="queued"),
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("max_attempts", sa.Integer(), nullable=False, server_default="3"),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column("run_after", sa.String(50), nullable=False),
+        sa.Column("locked_until", sa.String(50), nullable=True),
+        sa.Column("created_at", sa.String(50), nullable=False),
+        sa.Column("updated_at", sa.String(50), nullable=False),
+    )
+    op.create_index("ix_background_tasks_user_id", "background_tasks", ["user_id"])
+    op.create_index(
+        "ix_background_tasks_status_run_after", "background_tasks", ["status", "run_after"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_background_tasks_status_run_after", table_name="background_tasks")
+    op.drop_index("ix_background_tasks_user_id", table_name="background_tasks")
+    op.drop_table("background_tasks")
@@ -0,0 +1,32 @@
+"""add running history summary columns to chat-style session tables
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "008"
+down_revision = "007"
+branch_labels = None
+depends_on = None
+
+TABLES = ("sessions", "resume_sessions", "interview_sessions")
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        op.add_column(table, sa.Column("history_summary", sa.Text(), nullable=True))
+        op.add_column(
+            table,
+            sa.Column(
+                "history_summarized_through", sa.Integer(), nullable=False, server_default="0"
+            ),
+        )
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.drop_column(table, "history_summarized_through")
+        op.drop_column(table, "history_summary")
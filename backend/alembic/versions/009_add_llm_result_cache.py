@@ -0,0 +1,34 @@
+"""add llm_result_cache table
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "009"
+down_revision = "008"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "llm_result_cache",
+        sa.Column("key", sa.String(64), primary_key=True),
+        sa.Column("namespace", sa.String(50), nullable=False),
+        sa.Column("value_json", sa.Text(), nullable=False),
+        sa.Column("created_at", sa.String(50), nullable=False),
+        sa.Column("last_used_at", sa.String(50), nullable=False),
+    )
+    op.create_index(
+        "ix_llm_result_cache_namespace_last_used",
+        "llm_result_cache",
+        ["namespace", "last_used_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_llm_result_cache_namespace_last_used", table_name="llm_result_cache")
+    op.drop_table("llm_result_cache")
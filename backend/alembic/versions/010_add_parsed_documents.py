@@ -0,0 +1,38 @@
+"""add parsed_documents table
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "010"
+down_revision = "009"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "parsed_documents",
+        sa.Column("id", sa.String(36), primary_key=True),
+        sa.Column("user_id", sa.String(36), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("parser", sa.String(30), nullable=False),
+        sa.Column("file_sha256", sa.String(64), nullable=False),
+        sa.Column("parser_version", sa.String(64), nullable=False),
+        sa.Column("result_json", sa.Text(), nullable=False),
+        sa.Column("created_at", sa.String(50), nullable=False),
+        sa.Column("last_used_at", sa.String(50), nullable=False),
+    )
+    op.create_index(
+        "ix_parsed_documents_lookup",
+        "parsed_documents",
+        ["user_id", "parser", "file_sha256", "parser_version"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_parsed_documents_lookup", table_name="parsed_documents")
+    op.drop_table("parsed_documents")
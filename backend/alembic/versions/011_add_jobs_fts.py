@@ -0,0 +1,36 @@
+"""add jobs_fts full-text index
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-17
+"""
+from alembic import op
+
+revision = "011"
+down_revision = "010"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+            job_id UNINDEXED, title, company, location, description,
+            tokenize = 'unicode61 remove_diacritics 2',
+            prefix = '2 3'
+        )
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO jobs_fts (job_id, title, company, location, description)
+        SELECT id, title, company, coalesce(location, ''), coalesce(description, '')
+        FROM jobs
+        WHERE id NOT IN (SELECT job_id FROM jobs_fts)
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE IF EXISTS jobs_fts")
@@ -0,0 +1,22 @@
+"""add composite indexes for job feed keyset pagination
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-10-17
+"""
+from alembic import op
+
+revision = "012"
+down_revision = "011"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_jobs_scraped_at_id", "jobs", ["scraped_at", "id"])
+    op.create_index("ix_jobs_category_scraped_at_id", "jobs", ["role_category", "scraped_at", "id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_jobs_category_scraped_at_id", table_name="jobs")
+    op.drop_index("ix_jobs_scraped_at_id", table_name="jobs")
@@ -0,0 +1,28 @@
+"""add job_match_scores table
+
+Revision ID: 013
+Revises: 012
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "013"
+down_revision = "012"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "job_match_scores",
+        sa.Column("user_id", sa.String(36), sa.ForeignKey("users.id"), primary_key=True),
+        sa.Column("job_id", sa.String(36), sa.ForeignKey("jobs.id"), primary_key=True),
+        sa.Column("score", sa.Integer(), nullable=False),
+    )
+    op.create_index("ix_job_match_scores_user_score", "job_match_scores", ["user_id", "score"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_job_match_scores_user_score", table_name="job_match_scores")
+    op.drop_table("job_match_scores")
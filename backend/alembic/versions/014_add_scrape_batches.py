@@ -0,0 +1,38 @@
+"""add scrape_batches table
+
+Revision ID: 014
+Revises: 013
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "014"
+down_revision = "013"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "scrape_batches",
+        sa.Column("id", sa.String(36), primary_key=True),
+        sa.Column("trigger", sa.String(20), nullable=False),
+        sa.Column("status", sa.String(20), nullable=False, server_default="queued"),
+        sa.Column("queries_total", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("queries_done", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("completed_json", sa.Text(), nullable=False, server_default="[]"),
+        sa.Column("jobs_added", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("jobs_skipped", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("errors", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("rate_limited", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column("started_at", sa.String(50), nullable=True),
+        sa.Column("finished_at", sa.String(50), nullable=True),
+        sa.Column("created_at", sa.String(50), nullable=False),
+        sa.Column("updated_at", sa.String(50), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("scrape_batches")
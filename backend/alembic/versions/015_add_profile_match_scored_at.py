@@ -0,0 +1,21 @@
+"""add user_profiles.match_scored_at
+
+Revision ID: 015
+Revises: 014
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "015"
+down_revision = "014"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("user_profiles", sa.Column("match_scored_at", sa.String(50), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("user_profiles", "match_scored_at")
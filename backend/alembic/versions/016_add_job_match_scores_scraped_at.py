@@ -0,0 +1,36 @@
+"""add job_match_scores.scraped_at and the feed's match keyset index
+
+Revision ID: 016
+Revises: 015
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "016"
+down_revision = "015"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "job_match_scores",
+        sa.Column("scraped_at", sa.String(50), nullable=False, server_default=""),
+    )
+    op.execute(
+        """
+        UPDATE job_match_scores
+        SET scraped_at = (SELECT scraped_at FROM jobs WHERE jobs.id = job_match_scores.job_id)
+        """
+    )
+    op.drop_index("ix_job_match_scores_user_score", table_name="job_match_scores")
+    op.create_index(
+        "ix_job_match_scores_user_rank", "job_match_scores", ["user_id", "score", "scraped_at", "job_id"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_job_match_scores_user_rank", table_name="job_match_scores")
+    op.create_index("ix_job_match_scores_user_score", "job_match_scores", ["user_id", "score"])
+    op.drop_column("job_match_scores", "scraped_at")
@@ -7,7 +7,7 @@ from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
 
 from app.config import JWT_SECRET, JWT_ALGORITHM, JWT_EXPIRE_DAYS
-from app.database import get_db
+from app.database import get_db, SessionLocal
 from app.models import User
 
 security = HTTPBearer(auto_error=False)
@@ -66,3 +66,24 @@ def get_current_user(
             detail="User not found",
         )
     return user
+
+
+def get_stream_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+) -> User:
+    """``get_current_user`` for streaming endpoints.
+
+    Loads the user in its own short-lived session and closes it before the
+    handler runs. A ``get_db`` dependency would otherwise keep its connection
+    until the SSE response finishes. The returned user is detached; its
+    column attributes are already loaded.
+    """
+    db = SessionLocal()
+    try:
+        return get_current_user(credentials, db)
+    finally:
+        try:
+            db.close()
+        except Exception:
+            # Turso libsql driver can panic on close — swallow it
+            pass
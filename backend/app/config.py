@@ -24,5 +24,96 @@ ELEVENLABS_INTERVIEW_VOICE_ID = os.environ.get(
     "ELEVENLABS_INTERVIEW_VOICE_ID", "21m00Tcm4TlvDq8ikWAM"
 )  # Default: Rachel
 
+# Threads used by async handlers to run blocking DB calls off the event loop
+DB_THREADPOOL_SIZE = int(os.environ.get("DB_THREADPOOL_SIZE", "10"))
+
+# Background task workers (session summaries, context condensation, ...)
+TASK_WORKERS = int(os.environ.get("TASK_WORKERS", "2"))
+
+# Conversation history sent to Claude: the last N turns verbatim, older
+# turns folded into a running summary once the estimate passes the budget
+HISTORY_TOKEN_BUDGET = int(os.environ.get("HISTORY_TOKEN_BUDGET", "8000"))
+HISTORY_KEEP_TURNS = int(os.environ.get("HISTORY_KEEP_TURNS", "6"))
+
+# Claude concurrency governor: a global cap plus per-lane caps for
+# interactive streams vs. batch work (ATS scoring, reports, summaries).
+# Requests beyond a lane's queue depth get an immediate 429.
+LLM_MAX_CONCURRENCY = int(os.environ.get("LLM_MAX_CONCURRENCY", "32"))
+LLM_STREAM_CONCURRENCY = int(os.environ.get("LLM_STREAM_CONCURRENCY", "28"))
+LLM_BATCH_CONCURRENCY = int(os.environ.get("LLM_BATCH_CONCURRENCY", "12"))
+LLM_MAX_QUEUE = int(os.environ.get("LLM_MAX_QUEUE", "200"))
+LLM_MAX_QUEUED_PER_USER = int(os.environ.get("LLM_MAX_QUEUED_PER_USER", "3"))
+# Fair-queueing weight of batch calls made from background tasks (reports,
+# summaries): at 0.5 each counts as two calls against its user's share
+LLM_BACKGROUND_WEIGHT = float(os.environ.get("LLM_BACKGROUND_WEIGHT", "0.5"))
+
+# LLM backend: "anthropic" (default) or "fake" for offline load tests / CI.
+# The fake streams canned responses at a configurable rate; responses can be
+# overridden per scenario with a JSON file.
+LLM_BACKEND = os.environ.get("LLM_BACKEND", "anthropic")
+FAKE_LLM_TOKENS_PER_SECOND = float(os.environ.get("FAKE_LLM_TOKENS_PER_SECOND", "60"))
+FAKE_LLM_FIRST_TOKEN_MS = int(os.environ.get("FAKE_LLM_FIRST_TOKEN_MS", "400"))
+FAKE_LLM_RESPONSES_FILE = os.environ.get("FAKE_LLM_RESPONSES_FILE", "")
+
+# Record / replay cassettes for Claude, ElevenLabs and Firecrawl calls
+# (off | record | replay). CASSETTE_SPEED scales replay timing; 0 = instant.
+CASSETTE_MODE = os.environ.get("CASSETTE_MODE", "off")
+CASSETTE_DIR = os.environ.get("CASSETTE_DIR", "cassettes")
+CASSETTE_SPEED = float(os.environ.get("CASSETTE_SPEED", "1.0"))
+
+# Persistent cache for Claude-graded results (ATS semantic scores, ...):
+# entries expire after the TTL; past MAX_ENTRIES per namespace the least
+# recently used rows are evicted. A small in-process LRU sits in front.
+LLM_CACHE_TTL_HOURS = float(os.environ.get("LLM_CACHE_TTL_HOURS", "168"))
+LLM_CACHE_MAX_ENTRIES = int(os.environ.get("LLM_CACHE_MAX_ENTRIES", "5000"))
+LLM_CACHE_MEMORY_ENTRIES = int(os.environ.get("LLM_CACHE_MEMORY_ENTRIES", "512"))
+
+# Rendered PDFs cached on local disk, keyed by content hash; least recently
+# served files are evicted once the directory passes PDF_CACHE_MAX_MB
+PDF_CACHE_DIR = os.environ.get("PDF_CACHE_DIR", "pdf_cache")
+PDF_CACHE_MAX_MB = int(os.environ.get("PDF_CACHE_MAX_MB", "256"))
+
+# reportlab rendering runs in a process pool so PDF bursts don't stall the
+# event loop. 0 workers = render on a thread in-process (dev / constrained
+# hosts). Requests beyond the queue depth get a 503 with Retry-After.
+PDF_RENDER_WORKERS = int(os.environ.get("PDF_RENDER_WORKERS", "2"))
+PDF_RENDER_MAX_QUEUE = int(os.environ.get("PDF_RENDER_MAX_QUEUE", "16"))
+PDF_RENDER_TIMEOUT_SECONDS = float(os.environ.get("PDF_RENDER_TIMEOUT_SECONDS", "30"))
+
+# Admin bulk resume export: renders in flight at once (kept at the worker
+# count so interactive downloads still find room in the render queue) and
+# the most drafts one export may include
+PDF_EXPORT_CONCURRENCY = int(os.environ.get("PDF_EXPORT_CONCURRENCY", str(max(PDF_RENDER_WORKERS, 1))))
+PDF_EXPORT_MAX_DRAFTS = int(os.environ.get("PDF_EXPORT_MAX_DRAFTS", "2000"))
+
+# Uploaded resume / document parsing (pdfplumber, python-docx) runs in its own
+# process pool (0 = a thread); only the first MAX_PAGES pages are read
+TEXT_EXTRACT_WORKERS = int(os.environ.get("TEXT_EXTRACT_WORKERS", "1"))
+TEXT_EXTRACT_MAX_PAGES = int(os.environ.get("TEXT_EXTRACT_MAX_PAGES", "50"))
+TEXT_EXTRACT_TIMEOUT_SECONDS = float(os.environ.get("TEXT_EXTRACT_TIMEOUT_SECONDS", "30"))
+# Read PDFs with pdfium first, falling back to pdfplumber when the fast
+# output fails a quality check; 0 = always pdfplumber
+TEXT_EXTRACT_FAST_PATH = os.environ.get("TEXT_EXTRACT_FAST_PATH", "1") == "1"
+
+# Claude's structured parse of an uploaded resume is kept per user, keyed by
+# file hash + prompt version; only the most recently used are retained
+PARSED_DOCUMENTS_PER_USER = int(os.environ.get("PARSED_DOCUMENTS_PER_USER", "20"))
+
+# Profile photos for the sidebar resume template, downloaded and resized once
+# (on upload, or on the first download after a deploy) and read from disk
+PROFILE_IMAGE_CACHE_DIR = os.environ.get("PROFILE_IMAGE_CACHE_DIR", "profile_image_cache")
+PROFILE_IMAGE_FETCH_TIMEOUT_SECONDS = float(os.environ.get("PROFILE_IMAGE_FETCH_TIMEOUT_SECONDS", "10"))
+
+# Background job scrape (Firecrawl): searches in flight at once, and a token
+# bucket capping the request rate (RATE per second, bursts of BURST). 429s
+# and transient failures are retried up to MAX_RETRIES times with jittered
+# exponential backoff, capped at BACKOFF_MAX_SECONDS
+SCRAPE_CONCURRENCY = int(os.environ.get("SCRAPE_CONCURRENCY", "4"))
+SCRAPE_RATE_PER_SECOND = float(os.environ.get("SCRAPE_RATE_PER_SECOND", "1.0"))
+SCRAPE_BURST = int(os.environ.get("SCRAPE_BURST", "2"))
+SCRAPE_MAX_RETRIES = int(os.environ.get("SCRAPE_MAX_RETRIES", "3"))
+SCRAPE_BACKOFF_MAX_SECONDS = float(os.environ.get("SCRAPE_BACKOFF_MAX_SECONDS", "30"))
+SCRAPE_TIMEOUT_SECONDS = float(os.environ.get("SCRAPE_TIMEOUT_SECONDS", "15"))
+
 # Turso docs: sqlite+{TURSO_DATABASE_URL}?secure=true
 SQLALCHEMY_DATABASE_URL = f"sqlite+{TURSO_DATABASE_URL}?secure=true"
@@ -1,7 +1,12 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from functools import partial
+
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, DeclarativeBase
+from sqlalchemy.orm import sessionmaker, DeclarativeBase, Session
 
-from app.config import SQLALCHEMY_DATABASE_URL, TURSO_AUTH_TOKEN
+from app.config import SQLALCHEMY_DATABASE_URL, TURSO_AUTH_TOKEN, DB_THREADPOOL_SIZE
 
 engine = create_engine(
     SQLALCHEMY_DATABASE_URL,
@@ -13,6 +18,13 @@ engine = create_engine(
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Dedicated threads for DB work issued from async handlers. Kept separate from
+# the default executor so a burst of slow Turso round-trips can't starve
+# FastAPI's sync endpoints (and vice versa).
+_db_executor = ThreadPoolExecutor(
+    max_workers=DB_THREADPOOL_SIZE, thread_name_prefix="db"
+)
+
 
 class Base(DeclarativeBase):
     pass
@@ -28,3 +40,66 @@ def get_db():
         except Exception:
             # Turso libsql driver can panic on close — swallow it
             pass
+
+
+class AsyncDBSession:
+    """Awaitable facade over a regular ``Session`` for ``async def`` handlers.
+
+    The libsql driver is blocking (the ``sqlite+aiolibsql`` dialect only sets
+    ``is_async`` and still calls the sync client), so SQLAlchemy's
+    ``AsyncSession`` can't drive it. Instead every DB call is shipped to
+    ``_db_executor`` and awaited, keeping the event loop free to serve other
+    SSE streams while a query waits on Turso.
+
+    Group related queries into one function and pass it to ``run_sync`` —
+    one thread hop per batch, not per statement.
+    """
+
+    def __init__(self, session: Session):
+        self.sync_session = session
+
+    async def run_sync(self, fn, *args, **kwargs):
+        """Run ``fn(sync_session, *args, **kwargs)`` on a DB thread."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _db_executor, partial(fn, self.sync_session, *args, **kwargs)
+        )
+
+    def add(self, obj) -> None:
+        # Pure in-memory bookkeeping — no I/O until flush/commit
+        self.sync_session.add(obj)
+
+    async def commit(self) -> None:
+        await self.run_sync(Session.commit)
+
+    async def rollback(self) -> None:
+        await self.run_sync(Session.rollback)
+
+    async def refresh(self, obj) -> None:
+        await self.run_sync(Session.refresh, obj)
+
+    async def close(self) -> None:
+        try:
+            await self.run_sync(Session.close)
+        except Exception:
+            # Turso libsql driver can panic on close — swallow it
+            pass
+
+
+def AsyncSessionLocal() -> AsyncDBSession:
+    return AsyncDBSession(SessionLocal())
+
+
+@asynccontextmanager
+async def async_session_scope():
+    """Short-lived ``AsyncDBSession``; its pooled connection goes back on exit.
+
+    Streaming endpoints open one for their up-front reads and another in the
+    generator's ``finally`` for the writes, so no connection stays checked out
+    while Claude is streaming.
+    """
+    db = AsyncSessionLocal()
+    try:
+        yield db
+    finally:
+        await db.close()
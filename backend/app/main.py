@@ -1,10 +1,16 @@
 import os
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 
 from app.database import engine, Base
-from app.routers import auth, profile, sessions, resume, resume_drafts, classroom, jobs, mentorship, assessments, mentor_auth, mentor_sessions, notifications, analytics, interview, broadcast_quiz
+from app.routers import auth, profile, sessions, resume, resume_drafts, classroom, jobs, mentorship, assessments, mentor_auth, mentor_sessions, notifications, analytics, interview, broadcast_quiz, tasks, metrics
+from app.services.claude_service import LLMOverloaded
+from app.services.task_queue_service import start_workers, stop_workers
+from app.services.pdf_render_service import RenderUnavailable, start_render_pool, stop_render_pool
+from app.services.text_extraction_service import start_extract_pool, stop_extract_pool
+from app.services import job_search_service
 
 Base.metadata.create_all(bind=engine)
 
@@ -13,6 +19,19 @@ from sqlalchemy import text as _text
 with engine.connect() as _conn:
     _migrations = [
         "ALTER TABLE interview_sessions ADD COLUMN warning_issued INTEGER NOT NULL DEFAULT 0",
+        "ALTER TABLE sessions ADD COLUMN history_summary TEXT",
+        "ALTER TABLE sessions ADD COLUMN history_summarized_through INTEGER NOT NULL DEFAULT 0",
+        "ALTER TABLE resume_sessions ADD COLUMN history_summary TEXT",
+        "ALTER TABLE resume_sessions ADD COLUMN history_summarized_through INTEGER NOT NULL DEFAULT 0",
+        "ALTER TABLE interview_sessions ADD COLUMN history_summary TEXT",
+        "ALTER TABLE interview_sessions ADD COLUMN history_summarized_through INTEGER NOT NULL DEFAULT 0",
+        "ALTER TABLE user_profiles ADD COLUMN match_scored_at VARCHAR(50)",
+        "CREATE INDEX IF NOT EXISTS ix_jobs_scraped_at_id ON jobs (scraped_at, id)",
+        "CREATE INDEX IF NOT EXISTS ix_jobs_category_scraped_at_id ON jobs (role_category, scraped_at, id)",
+        # Rows scored before this column sort as oldest among their score until the user's next rescore
+        "ALTER TABLE job_match_scores ADD COLUMN scraped_at VARCHAR(50) NOT NULL DEFAULT ''",
+        "DROP INDEX IF EXISTS ix_job_match_scores_user_score",
+        "CREATE INDEX IF NOT EXISTS ix_job_match_scores_user_rank ON job_match_scores (user_id, score, scraped_at, job_id)",
     ]
     for _sql in _migrations:
         try:
@@ -20,6 +39,7 @@ with engine.connect() as _conn:
             _conn.commit()
         except Exception:
             _conn.rollback()  # Column already exists — ignore
+    job_search_service.ensure_index(_conn)
 
 app = FastAPI(
     title="IKLAVYA API",
@@ -36,6 +56,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Retry-After", "ETag"],
 )
 
 app.include_router(auth.router)
@@ -53,6 +74,40 @@ app.include_router(notifications.router)
 app.include_router(analytics.router)
 app.include_router(interview.router)
 app.include_router(broadcast_quiz.router)
+app.include_router(tasks.router)
+app.include_router(metrics.router)
+
+
+@app.exception_handler(LLMOverloaded)
+async def _llm_overloaded_handler(request: Request, exc: LLMOverloaded):
+    return JSONResponse(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        content={"detail": str(exc)},
+        headers={"Retry-After": str(exc.retry_after)},
+    )
+
+
+@app.exception_handler(RenderUnavailable)
+async def _render_unavailable_handler(request: Request, exc: RenderUnavailable):
+    return JSONResponse(
+        status_code=exc.status_code,
+        content={"detail": str(exc)},
+        headers={"Retry-After": str(exc.retry_after)},
+    )
+
+
+@app.on_event("startup")
+async def _start_task_workers():
+    await start_workers()
+    start_render_pool()
+    start_extract_pool()
+
+
+@app.on_event("shutdown")
+async def _stop_task_workers():
+    await stop_workers()
+    stop_render_pool()
+    stop_extract_pool()
 
 
 @app.get("/health")
@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime, timezone
 
-from sqlalchemy import String, Text, Integer, ForeignKey
+from sqlalchemy import String, Text, Integer, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database import Base
@@ -85,6 +85,9 @@ class UserProfile(Base):
     achievements: Mapped[str] = mapped_column(Text, nullable=True)  # JSON array
     extracurriculars: Mapped[str] = mapped_column(Text, nullable=True)  # JSON array
     summary: Mapped[str] = mapped_column(Text, nullable=True)
+    # Set by the job_match.rescore_user task; None until the user's match
+    # scores have been computed once
+    match_scored_at: Mapped[str] = mapped_column(String(50), nullable=True)
     created_at: Mapped[str] = mapped_column(
         String(50), nullable=False, default=utc_now
     )
@@ -117,6 +120,10 @@ class ChatSession(Base):
     analysis_generated: Mapped[int] = mapped_column(
         Integer, nullable=False, default=0
     )  # 0 or 1 (boolean as int for SQLite)
+    history_summary: Mapped[str] = mapped_column(Text, nullable=True)  # running summary of compacted turns
+    history_summarized_through: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0
+    )  # message_order of the last message folded into history_summary
 
 
 class Message(Base):
@@ -202,6 +209,10 @@ class ResumeSession(Base):
     template: Mapped[str] = mapped_column(
         String(30), nullable=False, default="professional"
     )
+    history_summary: Mapped[str] = mapped_column(Text, nullable=True)  # running summary of compacted turns
+    history_summarized_through: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0
+    )  # message_order of the last message folded into history_summary
 
 
 class ResumeMessage(Base):
@@ -346,6 +357,11 @@ class ModuleQuiz(Base):
 
 class Job(Base):
     __tablename__ = "jobs"
+    __table_args__ = (
+        # Feed keyset pagination: newest first, id breaks scraped_at ties
+        Index("ix_jobs_scraped_at_id", "scraped_at", "id"),
+        Index("ix_jobs_category_scraped_at_id", "role_category", "scraped_at", "id"),
+    )
 
     id: Mapped[str] = mapped_column(
         String(36), primary_key=True, default=generate_uuid
@@ -404,6 +420,60 @@ class JobApplication(Base):
     )
 
 
+class JobMatchScore(Base):
+    """Precomputed ``compute_match_score`` per (user, job); rows only for scores > 0.
+
+    ``scraped_at`` is copied from the job (jobs are never edited) so the
+    feed's match order is one index walk.
+    """
+
+    __tablename__ = "job_match_scores"
+    __table_args__ = (
+        # Feed sort_by=match keyset: one user's jobs, best first, newest among ties
+        Index("ix_job_match_scores_user_rank", "user_id", "score", "scraped_at", "job_id"),
+    )
+
+    user_id: Mapped[str] = mapped_column(
+        String(36), ForeignKey("users.id"), primary_key=True
+    )
+    job_id: Mapped[str] = mapped_column(
+        String(36), ForeignKey("jobs.id"), primary_key=True
+    )
+    score: Mapped[int] = mapped_column(Integer, nullable=False)
+    scraped_at: Mapped[str] = mapped_column(String(50), nullable=False)
+
+
+class ScrapeBatch(Base):
+    """Progress of one background job scrape; ``id`` is the jobs' ``scrape_batch_id``."""
+
+    __tablename__ = "scrape_batches"
+
+    id: Mapped[str] = mapped_column(
+        String(36), primary_key=True, default=generate_uuid
+    )
+    trigger: Mapped[str] = mapped_column(String(20), nullable=False)  # admin, cron
+    status: Mapped[str] = mapped_column(
+        String(20), nullable=False, default="queued"
+    )  # queued, running, done, failed
+    queries_total: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    queries_done: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    # Checkpoint: "category\tquery" keys already stored, skipped if the task is retried
+    completed_json: Mapped[str] = mapped_column(Text, nullable=False, default="[]")
+    jobs_added: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    jobs_skipped: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    errors: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    rate_limited: Mapped[int] = mapped_column(Integer, nullable=False, default=0)  # 429s received
+    last_error: Mapped[str] = mapped_column(Text, nullable=True)
+    started_at: Mapped[str] = mapped_column(String(50), nullable=True)
+    finished_at: Mapped[str] = mapped_column(String(50), nullable=True)
+    created_at: Mapped[str] = mapped_column(
+        String(50), nullable=False, default=utc_now
+    )
+    updated_at: Mapped[str] = mapped_column(
+        String(50), nullable=False, default=utc_now, onupdate=utc_now
+    )
+
+
 class UserModuleProgress(Base):
     __tablename__ = "user_module_progress"
 
@@ -772,6 +842,10 @@ class InterviewSession(Base):
     created_at: Mapped[str] = mapped_column(
         String(50), nullable=False, default=utc_now
     )
+    history_summary: Mapped[str] = mapped_column(Text, nullable=True)  # running summary of compacted turns
+    history_summarized_through: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0
+    )  # message_order of the last message folded into history_summary
 
 
 class InterviewMessage(Base):
@@ -820,3 +894,92 @@ class InterviewReport(Base):
     created_at: Mapped[str] = mapped_column(
         String(50), nullable=False, default=utc_now
     )
+
+
+# ─── Background Tasks ─────────────────────────────────────
+
+
+class BackgroundTask(Base):
+    __tablename__ = "background_tasks"
+    __table_args__ = (
+        Index("ix_background_tasks_status_run_after", "status", "run_after"),
+    )
+
+    id: Mapped[str] = mapped_column(
+        String(36), primary_key=True, default=generate_uuid
+    )
+    kind: Mapped[str] = mapped_column(String(50), nullable=False)
+    payload_json: Mapped[str] = mapped_column(Text, nullable=False, default="{}")
+    user_id: Mapped[str] = mapped_column(
+        String(36), ForeignKey("users.id"), nullable=True, index=True
+    )
+    status: Mapped[str] = mapped_column(
+        String(20), nullable=False, default="queued"
+    )  # queued, running, done, failed
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    max_attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=3)
+    last_error: Mapped[str] = mapped_column(Text, nullable=True)
+    run_after: Mapped[str] = mapped_column(
+        String(50), nullable=False, default=utc_now
+    )
+    locked_until: Mapped[str] = mapped_column(String(50), nullable=True)  # lease while running
+    created_at: Mapped[str] = mapped_column(
+        String(50), nullable=False, default=utc_now
+    )
+    updated_at: Mapped[str] = mapped_column(
+        String(50), nullable=False, default=utc_now, onupdate=utc_now
+    )
+
+
+# ─── LLM Result Cache ─────────────────────────────────────
+
+
+class LLMCacheEntry(Base):
+    __tablename__ = "llm_result_cache"
+    __table_args__ = (
+        Index("ix_llm_result_cache_namespace_last_used", "namespace", "last_used_at"),
+    )
+
+    key: Mapped[str] = mapped_column(String(64), primary_key=True)  # sha256 of namespace + inputs
+    namespace: Mapped[str] = mapped_column(String(50), nullable=False)
+    value_json: Mapped[str] = mapped_column(Text, nullable=False)
+    created_at: Mapped[str] = mapped_column(
+        String(50), nullable=False, default=utc_now
+    )
+    last_used_at: Mapped[str] = mapped_column(
+        String(50), nullable=False, default=utc_now
+    )
+
+
+# ─── Parsed Documents ─────────────────────────────────────
+
+
+class ParsedDocument(Base):
+    """Claude's structured parse of a file a user uploaded, reused when the
+    same user uploads the same bytes again."""
+
+    __tablename__ = "parsed_documents"
+    __table_args__ = (
+        Index(
+            "ix_parsed_documents_lookup",
+            "user_id", "parser", "file_sha256", "parser_version",
+            unique=True,
+        ),
+    )
+
+    id: Mapped[str] = mapped_column(
+        String(36), primary_key=True, default=generate_uuid
+    )
+    user_id: Mapped[str] = mapped_column(
+        String(36), ForeignKey("users.id"), nullable=False
+    )
+    parser: Mapped[str] = mapped_column(String(30), nullable=False)  # resume_draft, profile_document
+    file_sha256: Mapped[str] = mapped_column(String(64), nullable=False)
+    parser_version: Mapped[str] = mapped_column(String(64), nullable=False)
+    result_json: Mapped[str] = mapped_column(Text, nullable=False)
+    created_at: Mapped[str] = mapped_column(
+        String(50), nullable=False, default=utc_now
+    )
+    last_used_at: Mapped[str] = mapped_column(
+        String(50), nullable=False, default=utc_now
+    )
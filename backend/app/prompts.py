@@ -123,6 +123,17 @@ Conversation:
 {conversation}"""
 
 
+HISTORY_SUMMARY_PROMPT = """You are maintaining a running summary of an ongoing conversation so that older turns can be dropped from the model's context.
+
+Merge the new turns below into the existing summary. Preserve every concrete fact the {user_label} shared (names, institutions, dates, grades, scores, companies, projects, skills, numbers, links, preferences) and any decisions, commitments or open questions. Keep the order of events. Do not invent anything. Write compact bullet points, at most 400 words.
+
+Existing summary:
+{summary}
+
+New turns:
+{conversation}"""
+
+
 def _parse_json_list(value: str | None) -> str:
     """Parse a JSON string list field into a human-readable comma-separated string."""
     if not value:
@@ -137,8 +148,43 @@ def _parse_json_list(value: str | None) -> str:
     return value
 
 
+# Shortest prefix claude-sonnet-4 will cache; anything shorter is billed in full
+CACHE_MIN_TOKENS = 1024
+
+
+def _system_blocks(template: str, split_at: str | None, **values) -> list[dict]:
+    """Render ``template`` as Anthropic system blocks.
+
+    Everything before the ``split_at`` placeholder stays the same for the
+    whole session — the instructions plus the user's profile, resume, JD or
+    context summary — so it is sent as one block marked for prompt caching
+    and every turn after the first reads it from cache. The instructions
+    alone are under ``CACHE_MIN_TOKENS``; with the session's context they
+    clear it. The rest (e.g. a late "answer now" instruction) goes in a
+    second, uncached block. ``split_at=None`` caches the whole prompt.
+    """
+    idx = template.index(split_at) if split_at else len(template)
+    blocks = [
+        {
+            "type": "text",
+            "text": template[:idx].format(**values),
+            "cache_control": {"type": "ephemeral"},
+        },
+    ]
+    if idx < len(template):
+        blocks.append({"type": "text", "text": template[idx:].format(**values)})
+    return blocks
+
+
+def system_prompt_text(system) -> str:
+    """Flatten system blocks back into a single prompt string."""
+    if isinstance(system, str):
+        return system
+    return "".join(block["text"] for block in system)
+
+
 def build_system_prompt(user, profile=None, context_summary=None, force_analysis=False):
-    """Build the complete system prompt with user context interpolated."""
+    """Build the system prompt blocks with user context interpolated."""
     user_context = f"\n## Student Information\n- Name: {user.name}\n- Institution: {user.college}"
 
     if profile:
@@ -197,7 +243,9 @@ def build_system_prompt(user, profile=None, context_summary=None, force_analysis
             "and <roadmap_json> tags. Do NOT ask any more questions."
         )
 
-    return CAREER_COUNSELOR_SYSTEM_PROMPT.format(
+    return _system_blocks(
+        CAREER_COUNSELOR_SYSTEM_PROMPT,
+        "{force_analysis_instruction}",
         user_context=user_context,
         session_context=session_context,
         force_analysis_instruction=force_analysis_instruction,
@@ -340,7 +388,9 @@ def build_resume_system_prompt(user, profile=None, force_resume=False):
             "the complete resume JSON inside <resume_json> tags. Do NOT ask any more questions."
         )
 
-    return RESUME_BUILDER_SYSTEM_PROMPT.format(
+    return _system_blocks(
+        RESUME_BUILDER_SYSTEM_PROMPT,
+        "{force_resume_instruction}",
         user_context=user_context,
         force_resume_instruction=force_resume_instruction,
     )
@@ -456,7 +506,9 @@ def build_mentorship_system_prompt(
 - Dr. Kavita Reddy — Career Planning & Higher Education (PhD counselor, career path guidance)
 - Rahul Verma — Technical Skills & Coding (Ex-Google engineer, mentors aspiring developers)"""
 
-    return MENTORSHIP_SYSTEM_PROMPT.format(
+    return _system_blocks(
+        MENTORSHIP_SYSTEM_PROMPT,
+        None,
         user_context=user_context,
         activity_context=activity_context,
         mentor_profiles=mentor_profiles,
@@ -600,7 +652,9 @@ def build_interview_system_prompt(job_role, resume_text=None, job_description=No
     else:
         jd_context = "\n## Job Description\nNo specific JD provided. Use standard expectations for the role."
 
-    return INTERVIEW_SYSTEM_PROMPT.format(
+    return _system_blocks(
+        INTERVIEW_SYSTEM_PROMPT,
+        None,
         job_role=job_role,
         resume_context=resume_context,
         jd_context=jd_context,
@@ -1,13 +1,13 @@
 import json
-import io
 from datetime import datetime, timezone
+from types import SimpleNamespace
 
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, status
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Request, status
 from fastapi.responses import StreamingResponse, Response
 from sqlalchemy.orm import Session
 from sqlalchemy import text
 
-from app.database import get_db
+from app.database import get_db, async_session_scope
 from app.models import User, InterviewSession, InterviewMessage, InterviewReport
 from app.schemas import (
     InterviewSessionCreateRequest,
@@ -20,7 +20,7 @@ from app.schemas import (
     InterviewTTSRequest,
     ErrorResponse,
 )
-from app.auth import get_current_user
+from app.auth import get_current_user, get_stream_user
 from app.prompts import build_interview_system_prompt
 from app.services.interview_service import (
     stream_interview_question,
@@ -30,8 +30,21 @@ from app.services.interview_service import (
     clean_interview_response,
     detect_fillers,
 )
+from app.services.history_service import (
+    unsummarized_history,
+    fit_history,
+    needs_compaction,
+    with_history_summary,
+    compaction_task,
+)
+from app.services.task_queue_service import wake_workers
+from app.services.claude_service import governor, STREAM_LANE, BATCH_LANE
 from app.services.tts_service import synthesize_speech
+from app.services import interview_pdf_service
 from app.services.interview_pdf_service import generate_interview_pdf
+from app.services.pdf_cache_service import artifact_key, not_modified, get_or_render, pdf_response
+from app.services.pdf_render_service import render_blocking
+from app.services.text_extraction_service import DocumentUnreadable, document_kind, extract_text
 
 router = APIRouter(prefix="/interview", tags=["interview"])
 
@@ -249,43 +262,35 @@ def get_interview_session(
 async def upload_interview_resume(
     session_id: str,
     file: UploadFile = File(...),
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    current_user: User = Depends(get_stream_user),
 ):
-    session = _get_interview_or_404(session_id, current_user.id, db)
+    user_id = current_user.id
 
-    if session.status != "setup":
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Cannot upload resume after interview has started",
-        )
+    def _check_setup(sync_db: Session) -> InterviewSession:
+        session = _get_interview_or_404(session_id, user_id, sync_db)
+        if session.status != "setup":
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Cannot upload resume after interview has started",
+            )
+        return session
+
+    async with async_session_scope() as db:
+        await db.run_sync(_check_setup)
 
     content = await file.read()
 
-    # Extract text based on file type
-    extracted_text = ""
-    filename = (file.filename or "").lower()
-
-    if filename.endswith(".pdf"):
-        import pdfplumber
-        with pdfplumber.open(io.BytesIO(content)) as pdf:
-            pages_text = []
-            for page in pdf.pages:
-                text = page.extract_text()
-                if text:
-                    pages_text.append(text)
-            extracted_text = "\n".join(pages_text)
-    elif filename.endswith(".docx"):
-        from docx import Document
-        doc = Document(io.BytesIO(content))
-        extracted_text = "\n".join(p.text for p in doc.paragraphs if p.text.strip())
-    elif filename.endswith(".txt"):
-        extracted_text = content.decode("utf-8", errors="ignore")
-    else:
+    kind = document_kind(file.filename)
+    if kind is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Unsupported file format. Upload PDF, DOCX, or TXT.",
         )
+    # No connection held while the extractor pool works
+    try:
+        extracted_text = await extract_text(content, kind)
+    except DocumentUnreadable:
+        extracted_text = ""
 
     if not extracted_text.strip():
         raise HTTPException(
@@ -293,8 +298,13 @@ async def upload_interview_resume(
             detail="Could not extract text from the uploaded file.",
         )
 
-    session.resume_text = extracted_text.strip()
-    db.commit()
+    def _save(sync_db: Session) -> None:
+        session = _check_setup(sync_db)  # may have started meanwhile
+        session.resume_text = extracted_text.strip()
+        sync_db.commit()
+
+    async with async_session_scope() as db:
+        await db.run_sync(_save)
 
     return {"message": "Resume uploaded successfully", "characters": len(extracted_text)}
 
@@ -307,20 +317,29 @@ async def upload_interview_resume(
 )
 async def start_interview(
     session_id: str,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    current_user: User = Depends(get_stream_user),
 ):
-    session = _get_interview_or_404(session_id, current_user.id, db)
+    user_id = current_user.id
+    # Fail fast with 429 + Retry-After before touching the DB or opening SSE
+    governor.check(STREAM_LANE, user_id)
 
-    if session.status != "setup":
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Interview has already been started",
-        )
+    def _activate(sync_db: Session) -> InterviewSession:
+        session = _get_interview_or_404(session_id, user_id, sync_db)
 
-    session.status = "active"
-    session.interview_started_at = datetime.now(timezone.utc).isoformat()
-    db.commit()
+        if session.status != "setup":
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Interview has already been started",
+            )
+
+        session.status = "active"
+        session.interview_started_at = datetime.now(timezone.utc).isoformat()
+        sync_db.commit()
+        sync_db.refresh(session)
+        return session
+
+    async with async_session_scope() as db:
+        session = await db.run_sync(_activate)
 
     # Build system prompt and generate first question
     system_prompt = build_interview_system_prompt(
@@ -329,14 +348,17 @@ async def start_interview(
         job_description=session.job_description,
     )
 
-    user_id = current_user.id
     full_chunks = []
     meta = None
 
     async def event_generator():
         nonlocal full_chunks, meta
         try:
-            async for chunk in stream_interview_question(system_prompt, [{"role": "user", "content": "Begin the interview."}]):
+            async for chunk in stream_interview_question(
+                system_prompt,
+                [{"role": "user", "content": "Begin the interview."}],
+                user_id=user_id,
+            ):
                 full_chunks.append(chunk)
                 yield f"event: message\ndata: {json.dumps({'text': chunk})}\n\n"
 
@@ -354,33 +376,36 @@ async def start_interview(
 
         finally:
             if full_chunks:
-                try:
-                    raw_text = "".join(full_chunks)
-                    stored_text = clean_interview_response(raw_text)
-
-                    msg = InterviewMessage(
-                        session_id=session_id,
-                        user_id=user_id,
-                        role="interviewer",
-                        content=stored_text,
-                        question_index=0,
-                        is_follow_up=0,
-                        message_order=1,
-                    )
-                    db.add(msg)
-
-                    final_meta = extract_interview_meta(raw_text)
-                    if final_meta and final_meta.get("estimated_remaining"):
-                        s = db.query(InterviewSession).filter(
-                            InterviewSession.id == session_id
-                        ).first()
-                        if s:
-                            s.estimated_total = final_meta["question_number"] + final_meta["estimated_remaining"]
-                            s.questions_answered = 0
-
-                    db.commit()
-                except Exception:
-                    db.rollback()
+                raw_text = "".join(full_chunks)
+                stored_text = clean_interview_response(raw_text)
+
+                async with async_session_scope() as db:
+                    try:
+                        msg = InterviewMessage(
+                            session_id=session_id,
+                            user_id=user_id,
+                            role="interviewer",
+                            content=stored_text,
+                            question_index=0,
+                            is_follow_up=0,
+                            message_order=1,
+                        )
+                        db.add(msg)
+
+                        final_meta = extract_interview_meta(raw_text)
+                        if final_meta and final_meta.get("estimated_remaining"):
+                            s = await db.run_sync(
+                                lambda sync_db: sync_db.query(InterviewSession).filter(
+                                    InterviewSession.id == session_id
+                                ).first()
+                            )
+                            if s:
+                                s.estimated_total = final_meta["question_number"] + final_meta["estimated_remaining"]
+                                s.questions_answered = 0
+
+                        await db.commit()
+                    except Exception:
+                        await db.rollback()
 
     return StreamingResponse(
         event_generator(),
@@ -402,62 +427,72 @@ async def start_interview(
 async def send_interview_message(
     session_id: str,
     data: InterviewMessageSendRequest,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    current_user: User = Depends(get_stream_user),
 ):
-    session = _get_interview_or_404(session_id, current_user.id, db)
+    user_id = current_user.id
+    # Fail fast with 429 + Retry-After before touching the DB or opening SSE
+    governor.check(STREAM_LANE, user_id)
 
-    if session.status != "active":
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Interview is not active",
-        )
+    def _prepare_turn(sync_db: Session):
+        session = _get_interview_or_404(session_id, user_id, sync_db)
 
-    msg_count = (
-        db.query(InterviewMessage)
-        .filter(InterviewMessage.session_id == session_id)
-        .count()
-    )
-    if msg_count >= MAX_MESSAGES_PER_INTERVIEW:
-        raise HTTPException(
-            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-            detail="Maximum interview length reached.",
+        if session.status != "active":
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Interview is not active",
+            )
+
+        msg_count = (
+            sync_db.query(InterviewMessage)
+            .filter(InterviewMessage.session_id == session_id)
+            .count()
         )
+        if msg_count >= MAX_MESSAGES_PER_INTERVIEW:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Maximum interview length reached.",
+            )
 
-    # Save candidate's answer
-    candidate_msg = InterviewMessage(
-        session_id=session_id,
-        user_id=current_user.id,
-        role="candidate",
-        content=data.content,
-        question_index=session.questions_answered,
-        message_order=msg_count + 1,
-    )
-    db.add(candidate_msg)
-    session.questions_answered = session.questions_answered + 1
-    db.commit()
+        # Save candidate's answer
+        candidate_msg = InterviewMessage(
+            session_id=session_id,
+            user_id=user_id,
+            role="candidate",
+            content=data.content,
+            question_index=session.questions_answered,
+            message_order=msg_count + 1,
+        )
+        sync_db.add(candidate_msg)
+        session.questions_answered = session.questions_answered + 1
+        sync_db.commit()
+        sync_db.refresh(session)
+
+        # Load conversation history
+        all_messages = (
+            sync_db.query(InterviewMessage)
+            .filter(InterviewMessage.session_id == session_id)
+            .order_by(InterviewMessage.message_order.asc())
+            .all()
+        )
+        return session, msg_count, all_messages
 
-    # Load conversation history
-    all_messages = (
-        db.query(InterviewMessage)
-        .filter(InterviewMessage.session_id == session_id)
-        .order_by(InterviewMessage.message_order.asc())
-        .all()
-    )
+    # Reads happen up front; the connection goes back to the pool before
+    # streaming starts and a fresh session is opened for the writes.
+    async with async_session_scope() as db:
+        session, msg_count, all_messages = await db.run_sync(_prepare_turn)
 
-    # Map to Claude's expected format: interviewer=assistant, candidate=user
-    chat_history = []
-    for m in all_messages:
-        role = "assistant" if m.role == "interviewer" else "user"
-        chat_history.append({"role": role, "content": m.content})
+    # Map to Claude's expected format: interviewer=assistant, candidate=user.
+    # Turns already folded into the running summary are not replayed.
+    history = unsummarized_history("interview", session, all_messages)
+    chat_history = fit_history(history)
 
     system_prompt = build_interview_system_prompt(
         job_role=session.job_role,
         resume_text=session.resume_text,
         job_description=session.job_description,
     )
+    system_prompt = with_history_summary(system_prompt, session.history_summary)
 
-    user_id = current_user.id
     new_msg_order = msg_count + 2
     full_chunks = []
     meta = None  # initialize before generator to avoid UnboundLocalError
@@ -465,7 +500,7 @@ async def send_interview_message(
     async def event_generator():
         nonlocal full_chunks, meta
         try:
-            async for chunk in stream_interview_question(system_prompt, chat_history):
+            async for chunk in stream_interview_question(system_prompt, chat_history, user_id=user_id):
                 full_chunks.append(chunk)
                 yield f"event: message\ndata: {json.dumps({'text': chunk})}\n\n"
 
@@ -496,50 +531,56 @@ async def send_interview_message(
 
         finally:
             if full_chunks:
-                try:
-                    raw_text = "".join(full_chunks)
-                    stored_text = clean_interview_response(raw_text)
-
-                    interviewer_msg = InterviewMessage(
-                        session_id=session_id,
-                        user_id=user_id,
-                        role="interviewer",
-                        content=stored_text,
-                        question_index=session.questions_answered,
-                        is_follow_up=1 if (meta and meta.get("is_follow_up")) else 0,
-                        message_order=new_msg_order,
-                    )
-                    db.add(interviewer_msg)
-
-                    # Update session estimates
-                    s = db.query(InterviewSession).filter(
-                        InterviewSession.id == session_id
-                    ).first()
-                    if s and meta and meta.get("estimated_remaining") is not None:
-                        s.estimated_total = meta["question_number"] + meta["estimated_remaining"]
-
-                    # Auto-complete if AI said so — but enforce warning rule
-                    is_done = check_interview_complete(raw_text)
-                    if is_done and s:
-                        if s.warning_issued == 0 and s.questions_answered < 10:
-                            # First offense but no warning yet — DON'T end, mark warning issued
-                            s.warning_issued = 1
-                            # Don't set status to completed — interview continues
-                        else:
-                            # Warning was already issued OR enough questions asked — OK to end
-                            s.status = "completed"
-                            s.ended_at = datetime.now(timezone.utc).isoformat()
-                            if s.interview_started_at:
-                                try:
-                                    start = datetime.fromisoformat(s.interview_started_at)
-                                    end = datetime.now(timezone.utc)
-                                    s.duration_seconds = int((end - start).total_seconds())
-                                except (ValueError, TypeError):
-                                    pass
-
-                    db.commit()
-                except Exception:
-                    db.rollback()
+                raw_text = "".join(full_chunks)
+                stored_text = clean_interview_response(raw_text)
+
+                async with async_session_scope() as db:
+                    try:
+                        interviewer_msg = InterviewMessage(
+                            session_id=session_id,
+                            user_id=user_id,
+                            role="interviewer",
+                            content=stored_text,
+                            question_index=session.questions_answered,
+                            is_follow_up=1 if (meta and meta.get("is_follow_up")) else 0,
+                            message_order=new_msg_order,
+                        )
+                        db.add(interviewer_msg)
+
+                        # Update session estimates
+                        s = await db.run_sync(
+                            lambda sync_db: sync_db.query(InterviewSession).filter(
+                                InterviewSession.id == session_id
+                            ).first()
+                        )
+                        if s and meta and meta.get("estimated_remaining") is not None:
+                            s.estimated_total = meta["question_number"] + meta["estimated_remaining"]
+
+                        # Auto-complete if AI said so — but enforce warning rule
+                        is_done = check_interview_complete(raw_text)
+                        if is_done and s:
+                            if s.warning_issued == 0 and s.questions_answered < 10:
+                                # First offense but no warning yet — DON'T end, mark warning issued
+                                s.warning_issued = 1
+                                # Don't set status to completed — interview continues
+                            else:
+                                # Warning was already issued OR enough questions asked — OK to end
+                                s.status = "completed"
+                                s.ended_at = datetime.now(timezone.utc).isoformat()
+                                if s.interview_started_at:
+                                    try:
+                                        start = datetime.fromisoformat(s.interview_started_at)
+                                        end = datetime.now(timezone.utc)
+                                        s.duration_seconds = int((end - start).total_seconds())
+                                    except (ValueError, TypeError):
+                                        pass
+
+                        if needs_compaction(history + [{"role": "assistant", "content": stored_text}]):
+                            db.add(compaction_task("interview", session_id, user_id))
+                        await db.commit()
+                    except Exception:
+                        await db.rollback()
+                wake_workers()
 
     return StreamingResponse(
         event_generator(),
@@ -596,60 +637,71 @@ def end_interview(
 )
 async def generate_report(
     session_id: str,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    current_user: User = Depends(get_stream_user),
 ):
-    session = _get_interview_or_404(session_id, current_user.id, db)
+    user_id = current_user.id
 
-    if session.status != "completed":
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Interview must be completed before generating report",
+    def _load_transcript(sync_db: Session):
+        session = _get_interview_or_404(session_id, user_id, sync_db)
+
+        if session.status != "completed":
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Interview must be completed before generating report",
+            )
+
+        # Check if report already exists
+        existing = sync_db.query(InterviewReport).filter(
+            InterviewReport.session_id == session_id
+        ).first()
+        if existing:
+            return session, existing, []
+
+        messages = (
+            sync_db.query(InterviewMessage)
+            .filter(InterviewMessage.session_id == session_id)
+            .order_by(InterviewMessage.message_order.asc())
+            .all()
         )
+        return session, None, messages
+
+    async with async_session_scope() as db:
+        session, existing, messages = await db.run_sync(_load_transcript)
 
-    # Check if report already exists
-    existing = db.query(InterviewReport).filter(
-        InterviewReport.session_id == session_id
-    ).first()
     if existing:
         return {"report": InterviewReportResponse.model_validate(existing).model_dump()}
 
-    messages = (
-        db.query(InterviewMessage)
-        .filter(InterviewMessage.session_id == session_id)
-        .order_by(InterviewMessage.message_order.asc())
-        .all()
-    )
-
     if not messages:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="No interview messages found",
         )
 
+    governor.check(BATCH_LANE, user_id)
+
     chat_messages = [{"role": m.role, "content": m.content} for m in messages]
 
     async def event_generator():
         try:
             yield f"event: progress\ndata: {json.dumps({'percent': 10, 'status': 'Analyzing transcript...'})}\n\n"
 
-            report_data = await generate_interview_report(session.job_role, chat_messages)
+            report_data = await generate_interview_report(session.job_role, chat_messages, user_id)
 
             yield f"event: progress\ndata: {json.dumps({'percent': 80, 'status': 'Building report...'})}\n\n"
 
             overall_score = report_data.get("overall_score", 50)
             verdict = report_data.get("verdict", "needs_practice")
 
-            report = InterviewReport(
-                session_id=session_id,
-                user_id=current_user.id,
-                report_json=json.dumps(report_data),
-                overall_score=overall_score,
-                verdict=verdict,
-            )
-            db.add(report)
-            db.commit()
-            db.refresh(report)
+            async with async_session_scope() as db:
+                report = InterviewReport(
+                    session_id=session_id,
+                    user_id=user_id,
+                    report_json=json.dumps(report_data),
+                    overall_score=overall_score,
+                    verdict=verdict,
+                )
+                db.add(report)
+                await db.commit()
 
             yield f"event: progress\ndata: {json.dumps({'percent': 100, 'status': 'Complete'})}\n\n"
             yield f"event: report\ndata: {json.dumps(report_data)}\n\n"
@@ -705,6 +757,7 @@ def get_report(
 )
 def download_report_pdf(
     session_id: str,
+    request: Request,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
@@ -721,19 +774,30 @@ def download_report_pdf(
         )
 
     report_data = json.loads(report.report_json)
-    pdf_bytes = generate_interview_pdf(
-        user=current_user,
-        session=session,
-        report_data=report_data,
+    # Picklable snapshots of everything generate_interview_pdf reads — they
+    # are shipped to a render worker and double as the cache key
+    user = SimpleNamespace(name=current_user.name, college=current_user.college)
+    report_session = SimpleNamespace(
+        started_at=session.started_at,
+        created_at=session.created_at,
+        duration_seconds=session.duration_seconds,
+        job_role=session.job_role,
     )
+    key = artifact_key("interview_report", "default", {
+        "user": vars(user), "session": vars(report_session), "report": report_data,
+    }, interview_pdf_service)
+    cached = not_modified(request, key)
+    if cached:
+        return cached
+
+    pdf_bytes = get_or_render(key, lambda: render_blocking(
+        generate_interview_pdf,
+        user=user,
+        session=report_session,
+        report_data=report_data,
+    ))
 
-    return Response(
-        content=pdf_bytes,
-        media_type="application/pdf",
-        headers={
-            "Content-Disposition": f'attachment; filename="iklavya-interview-{session_id[:8]}.pdf"',
-        },
-    )
+    return pdf_response(key, pdf_bytes, f"iklavya-interview-{session_id[:8]}.pdf")
 
 
 # ── TTS proxy ──────────────────────────────────────────
@@ -1,20 +1,24 @@
+import base64
 import json
 import logging
 import re
 import os
+import threading
 import time
-import uuid
 from datetime import datetime, timedelta, timezone
 from urllib.parse import urlparse
 
-import httpx
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from sqlalchemy import and_, exists, func, tuple_
 from sqlalchemy.orm import Session
 
 from app.auth import get_current_user
 from app.database import get_db
-from app.models import Job, JobApplication, User, UserProfile
+from app.models import Job, JobApplication, JobMatchScore, ScrapeBatch, User, UserProfile
 from app.routers.notifications import create_notification
+from app.services import job_scrape_service, job_search_service
+from app.services.job_match_service import compute_match_score, queue_rescore
+from app.services.task_queue_service import task_handler, wake_workers
 
 logger = logging.getLogger(__name__)
 
@@ -166,6 +170,122 @@ RECENCY_MAP = {
 }
 
 
+# ── Feed pagination ──────────────────────────────────────
+
+# Cursor mode reports a total only on request, and then from a short-lived
+# per-filter count cache: infinite scroll shouldn't COUNT(*) on every fetch
+FEED_TOTAL_TTL_SECONDS = 60
+FEED_TOTAL_CACHE_SIZE = 512
+
+_feed_totals: dict[tuple, tuple[float, int]] = {}
+_feed_totals_lock = threading.Lock()
+
+
+def _encode_cursor(state: dict) -> str:
+    raw = json.dumps(state, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> dict:
+    try:
+        state = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except ValueError:
+        state = None
+    if not isinstance(state, dict):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return state
+
+
+def _approximate_total(query, key: tuple) -> int:
+    now = time.monotonic()
+    with _feed_totals_lock:
+        hit = _feed_totals.get(key)
+    if hit and now - hit[0] < FEED_TOTAL_TTL_SECONDS:
+        return hit[1]
+    total = query.count()
+    with _feed_totals_lock:
+        if len(_feed_totals) >= FEED_TOTAL_CACHE_SIZE:
+            _feed_totals.pop(next(iter(_feed_totals)))
+        _feed_totals[key] = (now, total)
+    return total
+
+
+def _keyset_page(query, state: dict, limit: int) -> tuple[list, dict | None]:
+    """Next ``limit`` jobs after ``state``'s (scraped_at, id), newest first.
+
+    Served by ``ix_jobs_scraped_at_id`` (or the per-category index) without
+    scanning the pages before it.
+    """
+    if "s" in state:
+        if not isinstance(state["s"], str) or not isinstance(state.get("i"), str):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        query = query.filter(
+            (Job.scraped_at < state["s"])
+            | ((Job.scraped_at == state["s"]) & (Job.id < state["i"]))
+        )
+    rows = query.order_by(Job.scraped_at.desc(), Job.id.desc()).limit(limit + 1).all()
+    if len(rows) <= limit:
+        return rows, None
+    last = rows[limit - 1]
+    return rows[:limit], {"s": last.scraped_at, "i": last.id}
+
+
+def _match_page(query, user_id: str, state: dict, limit: int) -> tuple[list, dict | None]:
+    """Next ``limit`` jobs in (coalesce(score, 0), scraped_at, id) order, best first.
+
+    Scored jobs come off ``ix_job_match_scores_user_rank`` (cursor ``m`` is
+    the last score); once they run out, ``m`` is 0 and the unscored jobs
+    follow newest first via ``_keyset_page``.
+    """
+    unscored = query.filter(
+        ~exists().where(JobMatchScore.user_id == user_id, JobMatchScore.job_id == Job.id)
+    )
+    last_score = state.get("m")
+    if last_score == 0:
+        rows, next_state = _keyset_page(unscored, state, limit)
+        return rows, {"m": 0, **next_state} if next_state else None
+
+    scored = query.join(
+        JobMatchScore,
+        and_(JobMatchScore.job_id == Job.id, JobMatchScore.user_id == user_id),
+    ).add_columns(JobMatchScore.score)
+    if last_score is not None:
+        if (
+            not isinstance(last_score, int) or isinstance(last_score, bool) or last_score < 0
+            or not isinstance(state.get("s"), str) or not isinstance(state.get("i"), str)
+        ):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        # A row-value bound, so the index walk starts at the cursor
+        scored = scored.filter(
+            tuple_(JobMatchScore.score, JobMatchScore.scraped_at, JobMatchScore.job_id)
+            < tuple_(last_score, state["s"], state["i"])
+        )
+    rows = scored.order_by(
+        JobMatchScore.score.desc(), JobMatchScore.scraped_at.desc(), JobMatchScore.job_id.desc()
+    ).limit(limit + 1).all()
+    jobs = [job for job, _ in rows]
+    if len(rows) > limit:
+        last, score = rows[limit - 1]
+        return jobs[:limit], {"m": score, "s": last.scraped_at, "i": last.id}
+
+    if len(jobs) == limit:
+        return jobs, {"m": 0} if unscored.with_entities(Job.id).first() is not None else None
+    more, next_state = _keyset_page(unscored, {}, limit - len(jobs))
+    return jobs + more, {"m": 0, **next_state} if next_state else None
+
+
+def _ranked_page(query, order_by: list, state: dict, limit: int) -> tuple[list, dict | None]:
+    """Search results in relevance order. bm25 scores shift as jobs are
+    added, so the cursor holds a position rather than a key."""
+    offset = state.get("o", 0)
+    if not isinstance(offset, int) or offset < 0:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    rows = query.order_by(*order_by).offset(offset).limit(limit + 1).all()
+    if len(rows) <= limit:
+        return rows, None
+    return rows[:limit], {"o": offset + limit}
+
+
 # ── Feed endpoint ─────────────────────────────────────────
 
 
@@ -183,13 +303,22 @@ def get_job_feed(
     location: str | None = Query(None),
     recency: str | None = Query(None),
     sort_by: str = Query("recency"),
+    cursor: str | None = Query(None),
+    with_total: bool = Query(False),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
+    """Paged job feed.
+
+    ``page`` mode (default) returns an exact ``total``. Passing ``cursor``
+    switches to cursor mode for infinite scroll: send ``cursor=`` (empty) for
+    the first page, then each response's ``nextCursor``; ``total`` is null
+    unless ``with_total`` asks for an approximate one.
+    """
     logger.info(
-        "[feed] user=%s category=%s search=%s page=%d filters=[sal=%s-%s exp=%s-%s type=%s loc=%s rec=%s]",
+        "[feed] user=%s category=%s search=%s page=%s filters=[sal=%s-%s exp=%s-%s type=%s loc=%s rec=%s]",
         current_user.id[:8], category, search[:30] if search else "",
-        page, salary_min, salary_max, experience_min, experience_max,
+        "cursor" if cursor is not None else page, salary_min, salary_max, experience_min, experience_max,
         job_type, location, recency,
     )
 
@@ -199,15 +328,21 @@ def get_job_feed(
     if category and category != "all":
         query = query.filter(Job.role_category == category)
 
-    # Text search
+    # Text search (FTS5 prefix match, ranked by bm25)
+    order_by = [Job.scraped_at.desc(), Job.id.desc()]
     if search:
-        like = f"%{search}%"
-        query = query.filter(
-            (Job.title.ilike(like))
-            | (Job.company.ilike(like))
-            | (Job.location.ilike(like))
-            | (Job.description.ilike(like))
+        query, order_by = job_search_service.apply_search(query, search)
+
+    # Match sort: the user's precomputed scores, ranked across every job.
+    # Cursor mode without bm25 ranking pages by key instead (_match_page)
+    ranked = bool(search) and job_search_service.ranks(search)
+    match_keyset = sort_by == "match" and cursor is not None and not ranked
+    if sort_by == "match" and not match_keyset:
+        query = query.outerjoin(
+            JobMatchScore,
+            and_(JobMatchScore.job_id == Job.id, JobMatchScore.user_id == current_user.id),
         )
+        order_by = [func.coalesce(JobMatchScore.score, 0).desc(), *order_by]
 
     # Salary range filter — exclude jobs with unknown salary when filtering
     if salary_min is not None or salary_max is not None:
@@ -260,13 +395,32 @@ def get_job_feed(
         cutoff = (datetime.now(timezone.utc) - RECENCY_MAP[recency]).isoformat()
         query = query.filter(Job.scraped_at >= cutoff)
 
-    total = query.count()
-    jobs = (
-        query.order_by(Job.scraped_at.desc())
-        .offset((page - 1) * limit)
-        .limit(limit)
-        .all()
-    )
+    next_cursor = None
+    if cursor is not None:
+        state = _decode_cursor(cursor) if cursor else {}
+        total = None
+        if with_total:
+            total = _approximate_total(query, (
+                category, search, salary_min, salary_max, experience_min,
+                experience_max, job_type, location, recency,
+            ))
+        if match_keyset:
+            jobs, next_state = _match_page(query, current_user.id, state, limit)
+        elif ranked:
+            jobs, next_state = _ranked_page(query, order_by, state, limit)
+        else:
+            jobs, next_state = _keyset_page(query, state, limit)
+        has_more = next_state is not None
+        next_cursor = _encode_cursor(next_state) if has_more else None
+    else:
+        total = query.count()
+        has_more = page * limit < total
+        jobs = (
+            query.order_by(*order_by)
+            .offset((page - 1) * limit)
+            .limit(limit)
+            .all()
+        )
 
     # Get user's applied/saved jobs for status
     user_actions = (
@@ -284,6 +438,13 @@ def get_job_feed(
         .first()
     )
 
+    # Profile set up before scores were stored: compute them in the background.
+    # Writes only until the first rescore has been queued
+    if sort_by == "match" and profile and profile.match_scored_at is None:
+        if queue_rescore(db, current_user.id, profile_changed=False):
+            db.commit()
+            wake_workers()
+
     result = []
     for job in jobs:
         tags = []
@@ -318,9 +479,7 @@ def get_job_feed(
         })
 
     # Preference-based boosting: interleave high-match jobs
-    if sort_by == "match":
-        result.sort(key=lambda j: j["matchScore"], reverse=True)
-    elif sort_by == "recency" and len(result) > 3:
+    if sort_by == "recency" and len(result) > 3:
         high_match = [j for j in result if j["matchScore"] >= 70]
         normal = [j for j in result if j["matchScore"] < 70]
         if high_match:
@@ -337,13 +496,23 @@ def get_job_feed(
             merged.extend(normal[lo_idx:])
             result = merged
 
-    logger.info("[feed] Returning %d jobs (total=%d page=%d hasMore=%s)", len(result), total, page, page * limit < total)
+    logger.info(
+        "[feed] Returning %d jobs (total=%s page=%s hasMore=%s)",
+        len(result), total, "cursor" if cursor is not None else page, has_more,
+    )
 
+    if cursor is not None:
+        return {
+            "jobs": result,
+            "total": total,
+            "nextCursor": next_cursor,
+            "hasMore": has_more,
+        }
     return {
         "jobs": result,
         "total": total,
         "page": page,
-        "hasMore": page * limit < total,
+        "hasMore": has_more,
     }
 
 
@@ -441,7 +610,7 @@ def apply_to_job(
 # ── Scrape trigger (admin) ───────────────────────────────
 
 
-@router.post("/scrape")
+@router.post("/scrape", status_code=202)
 def trigger_scrape(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
@@ -457,22 +626,37 @@ def trigger_scrape(
         )
 
     logger.info("[scrape] Admin trigger by user=%s", current_user.id[:8])
-    return _run_scrape(db)
+    return _start_scrape(db, "admin")
+
+
+@router.get("/scrape/{batch_id}")
+def scrape_status(
+    batch_id: str,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    if current_user.role != "admin":
+        raise HTTPException(status_code=403, detail="Admin only")
+    return _scrape_status(db, batch_id)
 
 
 # ── Scrape trigger (cron / Cloud Scheduler) ──────────────
 
 
-@router.post("/scrape/cron")
-def trigger_scrape_cron(
-    request: Request,
-    db: Session = Depends(get_db),
-):
+def _check_cron_secret(request: Request) -> None:
     auth = request.headers.get("X-Cron-Secret", "")
     if not CRON_SECRET or auth != CRON_SECRET:
         logger.warning("[scrape/cron] Unauthorized cron attempt")
         raise HTTPException(status_code=403, detail="Unauthorized")
 
+
+@router.post("/scrape/cron", status_code=202)
+def trigger_scrape_cron(
+    request: Request,
+    db: Session = Depends(get_db),
+):
+    _check_cron_secret(request)
+
     if not FIRECRAWL_API_KEY:
         logger.error("[scrape/cron] FIRECRAWL_API_KEY not configured")
         raise HTTPException(
@@ -480,92 +664,61 @@ def trigger_scrape_cron(
         )
 
     logger.info("[scrape/cron] Cron trigger received")
-    return _run_scrape(db)
+    return _start_scrape(db, "cron")
 
 
-# ── Shared scrape logic ──────────────────────────────────
+@router.get("/scrape/cron/{batch_id}")
+def scrape_status_cron(
+    batch_id: str,
+    request: Request,
+    db: Session = Depends(get_db),
+):
+    _check_cron_secret(request)
+    return _scrape_status(db, batch_id)
 
 
-def _run_scrape(db: Session) -> dict:
-    batch_id = str(uuid.uuid4())
-    total_added = 0
-    total_skipped = 0
-    errors = 0
-
-    logger.info("[scrape] Starting scrape batch=%s categories=%d", batch_id, len(SCRAPE_QUERIES))
-
-    for category, queries in SCRAPE_QUERIES.items():
-        cat_added = 0
-        for q in queries:
-            try:
-                results = _firecrawl_search(q)
-                logger.info("[scrape] category=%s query=%s results=%d", category, q[:50], len(results))
-                for result in results:
-                    job = _process_scrape_result(result, category, batch_id, db)
-                    if job:
-                        db.add(job)
-                        total_added += 1
-                        cat_added += 1
-                    else:
-                        total_skipped += 1
-                # Rate limiting between API calls
-                time.sleep(1.5)
-            except Exception as e:
-                logger.error("[scrape] Error processing category=%s query=%s: %s", category, q[:50], str(e))
-                errors += 1
-                continue
-        if cat_added > 0:
-            logger.info("[scrape] category=%s added=%d jobs", category, cat_added)
+# ── Shared scrape logic ──────────────────────────────────
 
-    db.commit()
-    logger.info(
-        "[scrape] Batch complete batch=%s added=%d skipped=%d errors=%d",
-        batch_id, total_added, total_skipped, errors,
-    )
-    return {"message": f"Scrape complete. {total_added} new jobs added.", "batch_id": batch_id}
 
+def _start_scrape(db: Session, trigger: str) -> dict:
+    """Queue a background scrape (see job_scrape_service); returns at once."""
+    total = sum(len(queries) for queries in SCRAPE_QUERIES.values())
+    batch, started = job_scrape_service.start_batch(db, trigger, total)
+    if started:
+        logger.info("[scrape] Queued batch=%s trigger=%s searches=%d", batch.id, trigger, total)
+        message = "Scrape started."
+    else:
+        message = "A scrape is already in progress."
+    return {"message": message, "batch_id": batch.id, "status": batch.status}
+
+
+def _scrape_status(db: Session, batch_id: str) -> dict:
+    batch = db.get(ScrapeBatch, batch_id)
+    if not batch:
+        raise HTTPException(status_code=404, detail="Scrape batch not found")
+    return job_scrape_service.batch_status(batch)
+
+
+def _store_results(db: Session, batch_id: str, category: str, results: list[dict]) -> tuple[int, int]:
+    """Add one search's new jobs to ``db`` and the search index, uncommitted.
+    Returns (added, skipped)."""
+    added = []
+    skipped = 0
+    for result in results:
+        job = _process_scrape_result(result, category, batch_id, db)
+        if job:
+            db.add(job)
+            db.flush()  # so the next result's dedup query sees it
+            added.append(job.id)
+        else:
+            skipped += 1
+    job_search_service.index_jobs(db, added)
+    return len(added), skipped
 
-def _firecrawl_search(query: str, retries: int = 1) -> list[dict]:
-    """Call Firecrawl search API with retry on failure."""
-    for attempt in range(retries + 1):
-        try:
-            resp = httpx.post(
-                "https://api.firecrawl.dev/v1/search",
-                headers={
-                    "Content-Type": "application/json",
-                    "Authorization": f"Bearer {FIRECRAWL_API_KEY}",
-                },
-                json={
-                    "query": query,
-                    "limit": 10,
-                    "scrapeOptions": {"formats": ["markdown"]},
-                },
-                timeout=15.0,
-            )
-            if resp.status_code == 429:
-                logger.warning("[firecrawl] Rate limited (429) query=%s attempt=%d", query[:50], attempt + 1)
-                if attempt < retries:
-                    time.sleep(3.0)
-                    continue
-                return []
-            if resp.status_code != 200:
-                logger.warning("[firecrawl] Non-200 status=%d query=%s", resp.status_code, query[:50])
-                return []
-            data = resp.json()
-            return data.get("data", [])
-        except httpx.TimeoutException:
-            logger.warning("[firecrawl] Timeout query=%s attempt=%d", query[:50], attempt + 1)
-            if attempt < retries:
-                time.sleep(3.0)
-                continue
-            return []
-        except Exception as e:
-            logger.error("[firecrawl] Unexpected error query=%s: %s", query[:50], str(e))
-            if attempt < retries:
-                time.sleep(3.0)
-                continue
-            return []
-    return []
+
+@task_handler("jobs.scrape")
+async def _scrape_task(payload: dict):
+    await job_scrape_service.run_batch(payload["batch_id"], SCRAPE_QUERIES, _store_results, FIRECRAWL_API_KEY)
 
 
 def _clean_description(raw: str) -> str:
@@ -749,58 +902,6 @@ def _process_scrape_result(
     )
 
 
-# ── Match scoring ────────────────────────────────────────
-
-
-def compute_match_score(job: Job, profile: UserProfile | None) -> int:
-    if not profile:
-        return 0
-
-    score = 0
-    text = f"{job.title or ''} {job.description or ''}"
-    text_lower = text.lower()
-
-    # Location match (30) — use normalized city for better matching
-    job_city = (job.city or "").lower()
-    job_location = (job.location or "").lower()
-    profile_city = (profile.city or "").lower()
-    profile_state = (profile.state or "").lower()
-
-    if profile_city and (profile_city in job_city or profile_city in job_location):
-        score += 30
-    elif profile_state and (
-        profile_state in (job.state or "").lower() or profile_state in job_location
-    ):
-        score += 15
-
-    # Education match (25)
-    if profile.education_level:
-        edu = profile.education_level.lower()
-        if edu in text_lower or "graduate" in text_lower or "any degree" in text_lower:
-            score += 25
-        elif "12th pass" in text_lower or "10th pass" in text_lower:
-            score += 15
-
-    # Fresher boost (20)
-    if "fresher" in text_lower or "no experience" in text_lower:
-        score += 20
-
-    # Interest match (25)
-    interests = (profile.career_aspiration_raw or "").lower()
-    try:
-        interest_list = json.loads(profile.interests) if profile.interests else []
-        interests += " " + " ".join(interest_list).lower()
-    except (json.JSONDecodeError, TypeError):
-        pass
-
-    if interests:
-        words = text_lower.split()
-        matched = sum(1 for w in words if len(w) > 3 and w in interests)
-        score += min(25, matched * 5)
-
-    return min(100, score)
-
-
 # ── Parsing helpers (numeric, for filter columns) ────────
 
 
@@ -8,14 +8,14 @@ from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
-from app.database import get_db
+from app.database import get_db, async_session_scope
 from app.models import (
     User, UserProfile, ContextSummary,
     ChatSession, JobApplication, Job,
     ResumeSession,
 )
-from app.auth import get_current_user
-from app.services.claude_service import stream_chat_response
+from app.auth import get_current_user, get_stream_user
+from app.services.claude_service import stream_chat_response, governor, STREAM_LANE
 from app.prompts import build_mentorship_system_prompt
 
 logger = logging.getLogger(__name__)
@@ -34,45 +34,54 @@ class ChatRequest(BaseModel):
 @router.post("/chat")
 async def mentorship_chat(
     body: ChatRequest,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    current_user: User = Depends(get_stream_user),
 ):
     """Stream a mentorship chat response with full user context."""
+    user_id = current_user.id
+    # Fail fast with 429 + Retry-After before touching the DB or opening SSE
+    governor.check(STREAM_LANE, user_id)
+
+    def _gather_context(sync_db: Session):
+        profile = sync_db.query(UserProfile).filter(
+            UserProfile.user_id == user_id
+        ).first()
+
+        ctx_summary = sync_db.query(ContextSummary).filter(
+            ContextSummary.user_id == user_id
+        ).first()
+
+        # Recent career guidance sessions (last 3)
+        recent_sessions = (
+            sync_db.query(ChatSession)
+            .filter(ChatSession.user_id == user_id)
+            .order_by(ChatSession.started_at.desc())
+            .limit(3)
+            .all()
+        )
 
-    # Gather user context
-    profile = db.query(UserProfile).filter(
-        UserProfile.user_id == current_user.id
-    ).first()
-
-    ctx_summary = db.query(ContextSummary).filter(
-        ContextSummary.user_id == current_user.id
-    ).first()
-
-    # Recent career guidance sessions (last 3)
-    recent_sessions = (
-        db.query(ChatSession)
-        .filter(ChatSession.user_id == current_user.id)
-        .order_by(ChatSession.started_at.desc())
-        .limit(3)
-        .all()
-    )
+        # Recent job clicks (last 10)
+        recent_applications = (
+            sync_db.query(JobApplication, Job)
+            .join(Job, JobApplication.job_id == Job.id)
+            .filter(JobApplication.user_id == user_id)
+            .order_by(JobApplication.created_at.desc())
+            .limit(10)
+            .all()
+        )
 
-    # Recent job clicks (last 10)
-    recent_applications = (
-        db.query(JobApplication, Job)
-        .join(Job, JobApplication.job_id == Job.id)
-        .filter(JobApplication.user_id == current_user.id)
-        .order_by(JobApplication.created_at.desc())
-        .limit(10)
-        .all()
-    )
+        # Resume sessions count
+        resume_count = (
+            sync_db.query(ResumeSession)
+            .filter(ResumeSession.user_id == user_id)
+            .count()
+        )
+        return profile, ctx_summary, recent_sessions, recent_applications, resume_count
 
-    # Resume sessions count
-    resume_count = (
-        db.query(ResumeSession)
-        .filter(ResumeSession.user_id == current_user.id)
-        .count()
-    )
+    # Gather user context; the connection is released before streaming
+    async with async_session_scope() as db:
+        (
+            profile, ctx_summary, recent_sessions, recent_applications, resume_count,
+        ) = await db.run_sync(_gather_context)
 
     system_prompt = build_mentorship_system_prompt(
         user=current_user,
@@ -90,7 +99,7 @@ async def mentorship_chat(
 
     async def event_generator():
         try:
-            async for chunk in stream_chat_response(system_prompt, chat_history):
+            async for chunk in stream_chat_response(system_prompt, chat_history, user_id=user_id):
                 yield f"event: message\ndata: {json.dumps({'text': chunk})}\n\n"
             yield "event: done\ndata: {}\n\n"
         except Exception as e:
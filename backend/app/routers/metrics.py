@@ -0,0 +1,25 @@
+from fastapi import APIRouter, Depends, HTTPException
+
+from app.models import User
+from app.auth import get_current_user
+from app.services.claude_service import governor, get_usage_stats
+from app.services.llm_cache_service import get_cache_stats
+from app.services import pdf_cache_service, pdf_render_service
+
+router = APIRouter(prefix="/metrics", tags=["metrics"])
+
+
+@router.get("/llm")
+def llm_metrics(current_user: User = Depends(get_current_user)):
+    """Claude governor queue depth per lane, token/cache usage and result-cache
+    hit rates (admin only)."""
+    if current_user.role != "admin":
+        raise HTTPException(status_code=403, detail="Admin only")
+
+    return {
+        "governor": governor.stats(),
+        "usage": get_usage_stats(),
+        "result_caches": get_cache_stats(),
+        "pdf_cache": pdf_cache_service.get_stats(),
+        "pdf_render": pdf_render_service.get_stats(),
+    }
@@ -17,6 +17,9 @@ from app.schemas import (
     ErrorResponse,
 )
 from app.auth import get_current_user
+from app.services.task_queue_service import make_task, wake_workers
+from app.services import profile_image_service  # noqa: F401  (registers the prefetch task)
+from app.services.job_match_service import MATCH_PROFILE_FIELDS, queue_rescore
 
 MAX_FILE_SIZE = 2 * 1024 * 1024  # 2MB
 ALLOWED_CONTENT_TYPES = {"image/jpeg", "image/png", "image/webp"}
@@ -102,7 +105,9 @@ def create_profile(
 
     # Mark profile as partially completed (step 2)
     current_user.profile_completed = 1
+    queue_rescore(db, current_user.id)
     db.commit()
+    wake_workers()
     db.refresh(profile)
 
     return ProfileResponse(**_from_db(profile))
@@ -133,7 +138,10 @@ def update_profile(
 
     # Mark profile as fully completed (step 3)
     current_user.profile_completed = 2
+    if MATCH_PROFILE_FIELDS & update_data.keys():
+        queue_rescore(db, current_user.id)
     db.commit()
+    wake_workers()
     db.refresh(profile)
 
     return ProfileResponse(**_from_db(profile))
@@ -206,9 +214,16 @@ async def update_profile_image(
 
     image_url = resp.json().get("secure_url", "")
 
-    # Save to DB
+    # Save to DB, and queue the resized local copy the sidebar resume uses
+    previous_image = current_user.profile_image
     current_user.profile_image = image_url
+    db.add(make_task(
+        "profile_image.prefetch",
+        {"url": image_url, "replaces": previous_image},
+        user_id=current_user.id,
+    ))
     db.commit()
+    wake_workers()
     db.refresh(current_user)
     return {"profile_image": current_user.profile_image}
 
@@ -229,7 +244,8 @@ async def parse_and_save_document(
     db: Session = Depends(get_db),
 ):
     """Upload a PDF resume/document, parse it with AI, and auto-fill the profile."""
-    from app.services.document_parsing_service import parse_document
+    from app.services.document_parsing_service import PARSE_VERSION, parse_document
+    from app.services.parsed_document_service import get_or_parse
 
     # Validate file type
     if file.content_type != "application/pdf":
@@ -252,9 +268,12 @@ async def parse_and_save_document(
             detail="The uploaded file is empty",
         )
 
-    # Parse document via Claude
+    # Parse document via Claude (or reuse this user's earlier parse of the same file)
     try:
-        extracted = await parse_document(contents)
+        extracted = await get_or_parse(
+            current_user.id, "profile_document", PARSE_VERSION, contents,
+            lambda: parse_document(contents, current_user.id),
+        )
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -284,7 +303,10 @@ async def parse_and_save_document(
         db.add(profile)
 
     current_user.profile_completed = max(current_user.profile_completed, 1)
+    if any(db_data.get(key) is not None for key in MATCH_PROFILE_FIELDS):
+        queue_rescore(db, current_user.id)
     db.commit()
+    wake_workers()
     db.refresh(profile)
 
     return ProfileResponse(**_from_db(profile))
@@ -2,11 +2,11 @@ import json
 import re
 from datetime import datetime, timezone
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.responses import StreamingResponse, Response
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
-from app.database import get_db
+from app.database import get_db, async_session_scope
 from app.models import User, UserProfile, ResumeSession, ResumeMessage, Resume
 from app.services.resume_enhance_service import enhance_resume_for_pdf
 from app.schemas import (
@@ -21,10 +21,22 @@ from app.schemas import (
     ResumeListResponse,
     ErrorResponse,
 )
-from app.auth import get_current_user
+from app.auth import get_current_user, get_stream_user
 from app.prompts import build_resume_system_prompt
-from app.services.claude_service import stream_chat_response
+from app.services.claude_service import stream_chat_response, governor, STREAM_LANE
+from app.services.history_service import (
+    unsummarized_history,
+    fit_history,
+    needs_compaction,
+    with_history_summary,
+    compaction_task,
+)
+from app.services.task_queue_service import wake_workers
+from app.services import resume_pdf_service
 from app.services.resume_pdf_service import generate_resume_pdf
+from app.services.pdf_cache_service import artifact_key, not_modified, get_or_render_async, pdf_response
+from app.services.pdf_render_service import render
+from app.services.profile_image_service import ensure_profile_image
 from app.services.ats_scoring_service import compute_ats_score
 
 router = APIRouter(prefix="/resume", tags=["resume"])
@@ -151,54 +163,67 @@ def get_resume_session(
 async def send_resume_message(
     session_id: str,
     data: ResumeMessageSendRequest,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    current_user: User = Depends(get_stream_user),
 ):
-    session = _get_session_or_404(session_id, current_user.id, db)
-
-    if session.status != "active":
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Resume session is no longer active",
+    user_id = current_user.id
+    # Fail fast with 429 + Retry-After before touching the DB or opening SSE
+    governor.check(STREAM_LANE, user_id)
+
+    def _prepare_turn(sync_db: Session):
+        session = _get_session_or_404(session_id, user_id, sync_db)
+
+        if session.status != "active":
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Resume session is no longer active",
+            )
+
+        msg_count = (
+            sync_db.query(ResumeMessage)
+            .filter(ResumeMessage.session_id == session_id)
+            .count()
         )
-
-    msg_count = (
-        db.query(ResumeMessage)
-        .filter(ResumeMessage.session_id == session_id)
-        .count()
-    )
-    if msg_count >= MAX_MESSAGES_PER_SESSION:
-        raise HTTPException(
-            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-            detail=f"Maximum {MAX_MESSAGES_PER_SESSION} messages per resume session reached.",
+        if msg_count >= MAX_MESSAGES_PER_SESSION:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail=f"Maximum {MAX_MESSAGES_PER_SESSION} messages per resume session reached.",
+            )
+
+        # Save user message
+        user_msg = ResumeMessage(
+            session_id=session_id,
+            user_id=user_id,
+            role="user",
+            content=data.content,
+            message_order=msg_count + 1,
+        )
+        sync_db.add(user_msg)
+        session.message_count = msg_count + 1
+        sync_db.commit()
+
+        # Load all messages for context
+        all_messages = (
+            sync_db.query(ResumeMessage)
+            .filter(ResumeMessage.session_id == session_id)
+            .order_by(ResumeMessage.message_order.asc())
+            .all()
         )
 
-    # Save user message
-    user_msg = ResumeMessage(
-        session_id=session_id,
-        user_id=current_user.id,
-        role="user",
-        content=data.content,
-        message_order=msg_count + 1,
-    )
-    db.add(user_msg)
-    session.message_count = msg_count + 1
-    db.commit()
+        profile = sync_db.query(UserProfile).filter(
+            UserProfile.user_id == user_id
+        ).first()
+        history = unsummarized_history("resume", session, all_messages)
+        return msg_count, all_messages, profile, history, session.history_summary
 
-    # Load all messages for context
-    all_messages = (
-        db.query(ResumeMessage)
-        .filter(ResumeMessage.session_id == session_id)
-        .order_by(ResumeMessage.message_order.asc())
-        .all()
-    )
-    chat_history = [{"role": m.role, "content": m.content} for m in all_messages]
+    # Reads happen up front; the connection goes back to the pool before
+    # streaming starts and a fresh session is opened for the writes.
+    async with async_session_scope() as db:
+        (
+            msg_count, all_messages, profile, history, history_summary,
+        ) = await db.run_sync(_prepare_turn)
+    chat_history = fit_history(history)
 
     # Build system prompt
-    profile = db.query(UserProfile).filter(
-        UserProfile.user_id == current_user.id
-    ).first()
-
     assistant_msg_count = sum(1 for m in all_messages if m.role == "assistant")
     force_resume = assistant_msg_count >= FORCE_RESUME_AFTER
 
@@ -207,8 +232,8 @@ async def send_resume_message(
         profile=profile,
         force_resume=force_resume,
     )
+    system_prompt = with_history_summary(system_prompt, history_summary)
 
-    user_id = current_user.id
     new_msg_order = msg_count + 2
 
     full_response_chunks = []
@@ -216,7 +241,7 @@ async def send_resume_message(
     async def event_generator():
         nonlocal full_response_chunks
         try:
-            async for chunk in stream_chat_response(system_prompt, chat_history):
+            async for chunk in stream_chat_response(system_prompt, chat_history, user_id=user_id):
                 full_response_chunks.append(chunk)
                 yield f"event: message\ndata: {json.dumps({'text': chunk})}\n\n"
 
@@ -225,29 +250,31 @@ async def send_resume_message(
             resume_json_str = _extract_resume_json(complete_text)
 
             if resume_json_str:
-                # Use pre-selected template from the session
-                session_for_template = db.query(ResumeSession).filter(
-                    ResumeSession.id == session_id
-                ).first()
-                selected_template = session_for_template.template if session_for_template else "professional"
-
-                resume = Resume(
-                    session_id=session_id,
-                    user_id=user_id,
-                    resume_json=resume_json_str,
-                    template=selected_template,
-                )
-                db.add(resume)
-
-                session_obj = db.query(ResumeSession).filter(
-                    ResumeSession.id == session_id
-                ).first()
-                if session_obj:
-                    session_obj.status = "completed"
-                    session_obj.ended_at = datetime.now(timezone.utc).isoformat()
-
-                db.commit()
-                db.refresh(resume)
+                def _save_resume(sync_db: Session) -> Resume:
+                    # Use pre-selected template from the session
+                    session_obj = sync_db.query(ResumeSession).filter(
+                        ResumeSession.id == session_id
+                    ).first()
+                    selected_template = session_obj.template if session_obj else "professional"
+
+                    resume = Resume(
+                        session_id=session_id,
+                        user_id=user_id,
+                        resume_json=resume_json_str,
+                        template=selected_template,
+                    )
+                    sync_db.add(resume)
+
+                    if session_obj:
+                        session_obj.status = "completed"
+                        session_obj.ended_at = datetime.now(timezone.utc).isoformat()
+
+                    sync_db.commit()
+                    sync_db.refresh(resume)
+                    return resume
+
+                async with async_session_scope() as db:
+                    resume = await db.run_sync(_save_resume)
 
                 yield f"event: resume_ready\ndata: {json.dumps({'resume_id': resume.id, 'resume_json': resume_json_str})}\n\n"
 
@@ -258,26 +285,32 @@ async def send_resume_message(
 
         finally:
             if full_response_chunks:
-                try:
-                    complete_text = "".join(full_response_chunks)
-                    assistant_msg = ResumeMessage(
-                        session_id=session_id,
-                        user_id=user_id,
-                        role="assistant",
-                        content=complete_text,
-                        message_order=new_msg_order,
-                    )
-                    db.add(assistant_msg)
-
-                    session_obj = db.query(ResumeSession).filter(
-                        ResumeSession.id == session_id
-                    ).first()
-                    if session_obj:
-                        session_obj.message_count = new_msg_order
-
-                    db.commit()
-                except Exception:
-                    db.rollback()
+                complete_text = "".join(full_response_chunks)
+                async with async_session_scope() as db:
+                    try:
+                        assistant_msg = ResumeMessage(
+                            session_id=session_id,
+                            user_id=user_id,
+                            role="assistant",
+                            content=complete_text,
+                            message_order=new_msg_order,
+                        )
+                        db.add(assistant_msg)
+
+                        session_obj = await db.run_sync(
+                            lambda sync_db: sync_db.query(ResumeSession).filter(
+                                ResumeSession.id == session_id
+                            ).first()
+                        )
+                        if session_obj:
+                            session_obj.message_count = new_msg_order
+
+                        if needs_compaction(history + [{"role": "assistant", "content": complete_text}]):
+                            db.add(compaction_task("resume", session_id, user_id))
+                        await db.commit()
+                    except Exception:
+                        await db.rollback()
+                wake_workers()
 
     return StreamingResponse(
         event_generator(),
@@ -363,26 +396,35 @@ def update_resume_template(
     return ResumeResponse.model_validate(resume)
 
 
+async def _load_resume(resume_id: str, user_id: str) -> tuple[str, str]:
+    """``(resume_json, template)`` of the user's resume, read in a scope that
+    is closed before the caller's slow work (Claude, PDF render) begins."""
+    def _read(sync_db: Session) -> tuple[str, str]:
+        resume = sync_db.query(Resume).filter(
+            Resume.id == resume_id,
+            Resume.user_id == user_id,
+        ).first()
+        if not resume:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Resume not found",
+            )
+        return resume.resume_json, resume.template
+
+    async with async_session_scope() as db:
+        return await db.run_sync(_read)
+
+
 @router.post(
     "/{resume_id}/ats-score",
     responses={404: {"model": ErrorResponse}},
 )
 async def get_ats_score(
     resume_id: str,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    current_user: User = Depends(get_stream_user),
 ):
-    resume = db.query(Resume).filter(
-        Resume.id == resume_id,
-        Resume.user_id == current_user.id,
-    ).first()
-    if not resume:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Resume not found",
-        )
-
-    result = await compute_ats_score(resume.resume_json)
+    resume_json, _template = await _load_resume(resume_id, current_user.id)
+    result = await compute_ats_score(resume_json, current_user.id)
     return result
 
 
@@ -392,33 +434,35 @@ async def get_ats_score(
 )
 async def download_resume(
     resume_id: str,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    request: Request,
+    current_user: User = Depends(get_stream_user),
 ):
-    resume = db.query(Resume).filter(
-        Resume.id == resume_id,
-        Resume.user_id == current_user.id,
-    ).first()
-    if not resume:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Resume not found",
-        )
+    resume_json, template = await _load_resume(resume_id, current_user.id)
 
     # AI-enhance sparse content before PDF generation
-    resume_data = json.loads(resume.resume_json) if isinstance(resume.resume_json, str) else resume.resume_json
-    resume_data = await enhance_resume_for_pdf(resume_data)
+    resume_data = json.loads(resume_json) if isinstance(resume_json, str) else resume_json
+    resume_data = await enhance_resume_for_pdf(resume_data, current_user.id)
 
-    pdf_bytes = generate_resume_pdf(
-        resume_data,
-        resume.template,
-        profile_image_url=current_user.profile_image,
+    # Only the sidebar template shows the photo: a local copy, or None if unavailable
+    profile_image_path = (
+        await ensure_profile_image(current_user.profile_image)
+        if template == "sidebar" else None
     )
 
-    return Response(
-        content=pdf_bytes,
-        media_type="application/pdf",
-        headers={
-            "Content-Disposition": f'attachment; filename="iklavya-resume-{resume_id[:8]}.pdf"',
-        },
+    key = artifact_key(
+        "resume", template,
+        {"resume": resume_data, "profile_image": profile_image_path},
+        resume_pdf_service,
     )
+    cached = not_modified(request, key)
+    if cached:
+        return cached
+
+    pdf_bytes = await get_or_render_async(key, lambda: render(
+        generate_resume_pdf,
+        resume_data,
+        template,
+        profile_image_path=profile_image_path,
+    ))
+
+    return pdf_response(key, pdf_bytes, f"iklavya-resume-{resume_id[:8]}.pdf")
@@ -1,15 +1,19 @@
+import asyncio
+import csv
 import json
 import io
+import logging
 import os
 import re
-import tempfile
 from datetime import datetime, timezone
 
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, status
-from fastapi.responses import Response
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, Query, Request, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import and_, func, select
 from sqlalchemy.orm import Session
 
-from app.database import get_db
+from app.config import PDF_EXPORT_CONCURRENCY, PDF_EXPORT_MAX_DRAFTS
+from app.database import get_db, async_session_scope
 from app.models import User, UserProfile, ResumeDraft
 from app.services.resume_enhance_service import enhance_resume_for_pdf
 from app.schemas import (
@@ -21,10 +25,20 @@ from app.schemas import (
     ResumeDraftAIOptimizeResponse,
     ErrorResponse,
 )
-from app.auth import get_current_user
-from app.services.claude_service import get_chat_response
+from app.auth import get_current_user, get_stream_user
+from app.services.claude_service import MODEL, get_chat_response
+from app.services.llm_cache_service import prompt_version
+from app.services import resume_pdf_service
 from app.services.resume_pdf_service import generate_resume_pdf
-from app.services.ats_scoring_service import compute_ats_score
+from app.services.pdf_cache_service import artifact_key, not_modified, get_or_render_async, pdf_response
+from app.services.profile_image_service import ensure_profile_image
+from app.services.pdf_render_service import render, RenderUnavailable
+from app.services.ats_scoring_service import compute_ats_score, compute_section_ats_score
+from app.services.resume_export_service import map_ordered, safe_name, zip_stream
+from app.services.text_extraction_service import EXTRACTOR_VERSION, DocumentUnreadable, document_kind, extract_text
+from app.services.parsed_document_service import get_or_parse
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/resume-drafts", tags=["resume-drafts"])
 
@@ -33,6 +47,8 @@ ALLOWED_EXTENSIONS = {".pdf", ".docx", ".doc"}
 MAX_UPLOAD_SIZE = 10 * 1024 * 1024  # 10 MB
 PDF_MAGIC = b"%PDF"
 DOCX_MAGIC = b"PK"
+UPLOAD_MAX_PAGES = 5
+UPLOAD_MAX_CHARS = 8000  # of extracted text sent to Claude
 
 
 # ── Helpers ──────────────────────────────────────────────────────────────────
@@ -261,8 +277,8 @@ async def upload_and_parse(
 
     # Extract text
     try:
-        raw_text = _extract_text(content, ext)
-    except Exception:
+        raw_text = await extract_text(content, document_kind(filename), max_pages=UPLOAD_MAX_PAGES)
+    except DocumentUnreadable:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Could not read this file. It may be corrupted or password-protected.",
@@ -274,8 +290,16 @@ async def upload_and_parse(
             detail="Could not extract meaningful text. This may be a scanned/image-based PDF. Please upload a text-based file.",
         )
 
-    # AI field mapping
-    resume_json_str = await _parse_resume_with_ai(raw_text)
+    # AI field mapping (reused if this user already uploaded the same file)
+    try:
+        resume_data = await get_or_parse(
+            current_user.id, "resume_draft", RESUME_PARSE_VERSION, content,
+            lambda: _parse_resume_with_ai(raw_text, current_user.id),
+        )
+    except ValueError:
+        # Return empty structure if AI fails
+        resume_data = _empty_resume_json()
+    resume_json_str = json.dumps(resume_data)
 
     # Validate template
     if template not in ("professional", "modern", "simple", "rendercv", "sidebar", "jake"):
@@ -294,51 +318,9 @@ async def upload_and_parse(
     return ResumeDraftResponse.model_validate(draft)
 
 
-def _extract_text(content: bytes, ext: str) -> str:
-    """Extract text from PDF or DOCX bytes."""
-    if ext == ".pdf":
-        return _extract_pdf_text(content)
-    else:
-        return _extract_docx_text(content)
-
-
-def _extract_pdf_text(content: bytes) -> str:
-    """Extract text from PDF using pdfplumber (already in requirements)."""
-    import pdfplumber
-    text_parts = []
-    with pdfplumber.open(io.BytesIO(content)) as pdf:
-        for i, page in enumerate(pdf.pages[:5]):  # Max 5 pages
-            page_text = page.extract_text()
-            if page_text:
-                text_parts.append(page_text)
-    return "\n\n".join(text_parts)
+RESUME_PARSE_SYSTEM_PROMPT = "You are a precise resume parser. Output only valid JSON."
 
-
-def _extract_docx_text(content: bytes) -> str:
-    """Extract text from DOCX using python-docx."""
-    try:
-        from docx import Document
-    except ImportError:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="DOCX parsing not available. Please upload a PDF instead.",
-        )
-    doc = Document(io.BytesIO(content))
-    paragraphs = [p.text for p in doc.paragraphs if p.text.strip()]
-
-    # Also try to get text from tables
-    for table in doc.tables:
-        for row in table.rows:
-            cells_text = [cell.text.strip() for cell in row.cells if cell.text.strip()]
-            if cells_text:
-                paragraphs.append(" | ".join(cells_text))
-
-    return "\n".join(paragraphs)
-
-
-async def _parse_resume_with_ai(raw_text: str) -> str:
-    """Use Claude to map raw resume text into structured JSON."""
-    prompt = f"""You are a resume parser. Extract structured data from the following resume text.
+RESUME_PARSE_PROMPT = """You are a resume parser. Extract structured data from the following resume text.
 
 Return ONLY valid JSON in this exact structure (no explanation, no markdown):
 {{
@@ -403,11 +385,25 @@ Rules:
 - Return ONLY the JSON, nothing else
 
 Resume text:
-{raw_text[:8000]}"""
+{raw_text}"""
+
+# Key for stored parses — editing the prompt, model or limits retires them
+RESUME_PARSE_VERSION = prompt_version(
+    RESUME_PARSE_SYSTEM_PROMPT, RESUME_PARSE_PROMPT, MODEL, EXTRACTOR_VERSION,
+    f"{UPLOAD_MAX_PAGES}/{UPLOAD_MAX_CHARS}",
+)
+
+
+async def _parse_resume_with_ai(raw_text: str, user_id: str) -> dict:
+    """Use Claude to map raw resume text into structured JSON.
 
+    Raises ValueError if the reply isn't a JSON object, so a failed parse is
+    never stored.
+    """
     response = await get_chat_response(
-        system_prompt="You are a precise resume parser. Output only valid JSON.",
-        messages=[{"role": "user", "content": prompt}],
+        system_prompt=RESUME_PARSE_SYSTEM_PROMPT,
+        messages=[{"role": "user", "content": RESUME_PARSE_PROMPT.format(raw_text=raw_text[:UPLOAD_MAX_CHARS])}],
+        user_id=user_id,
     )
 
     # Extract JSON from response (handle cases where AI wraps in markdown)
@@ -416,15 +412,10 @@ Resume text:
         text = re.sub(r"^```(?:json)?\n?", "", text)
         text = re.sub(r"\n?```$", "", text)
 
-    # Validate JSON
-    try:
-        data = json.loads(text)
-        if not isinstance(data, dict):
-            raise ValueError
-        return json.dumps(data)
-    except (json.JSONDecodeError, ValueError):
-        # Return empty structure if AI fails
-        return json.dumps(_empty_resume_json())
+    data = json.loads(text)
+    if not isinstance(data, dict):
+        raise ValueError("Resume parse is not a JSON object")
+    return data
 
 
 # ── AI Per-Field Optimization ────────────────────────────────────────────────
@@ -472,6 +463,7 @@ Return ONLY the improved text, nothing else. No quotes, no explanation."""
     response = await get_chat_response(
         system_prompt="You are an expert resume writer and ATS optimization specialist. You write concise, impactful, keyword-rich resume content.",
         messages=[{"role": "user", "content": prompt}],
+        user_id=current_user.id,
     )
 
     return ResumeDraftAIOptimizeResponse(optimized_value=response.strip())
@@ -487,7 +479,7 @@ async def get_ats_score(
 ):
     draft = _get_draft_or_404(draft_id, current_user.id, db)
     resume_data = _validate_resume_json(draft.resume_json)
-    result = await compute_ats_score(resume_data)
+    result = await compute_ats_score(resume_data, current_user.id)
 
     # Cache the total score
     if isinstance(result, dict) and "total_score" in result:
@@ -497,11 +489,29 @@ async def get_ats_score(
     return result
 
 
+@router.post("/{draft_id}/ats-score/live")
+async def get_live_ats_score(
+    draft_id: str,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Section-level score for the live ATS meter, called after each autosave.
+
+    Only sections whose content changed since they were last graded go to
+    Claude; the rest come from cache. The stored ``ats_score`` is left to the
+    full scoring endpoint.
+    """
+    draft = _get_draft_or_404(draft_id, current_user.id, db)
+    resume_data = _validate_resume_json(draft.resume_json)
+    return await compute_section_ats_score(resume_data, current_user.id)
+
+
 # ── PDF Download ─────────────────────────────────────────────────────────────
 
 @router.get("/{draft_id}/download")
 async def download_pdf(
     draft_id: str,
+    request: Request,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
@@ -518,21 +528,17 @@ async def download_pdf(
     # Sanitize: replace None values with empty strings to prevent reportlab crashes
     _sanitize_resume_data(resume_data)
 
-    # AI-enhance sparse content before PDF generation
-    resume_data = await enhance_resume_for_pdf(resume_data)
-
-    # Get profile image URL if available
-    profile = db.query(UserProfile).filter(
-        UserProfile.user_id == current_user.id
-    ).first()
-    profile_image_url = getattr(profile, "profile_image", None) if profile else None
+    key, render_pdf = await _prepare_pdf(
+        resume_data, draft.template, current_user.profile_image, current_user.id
+    )
+    cached = not_modified(request, key)
+    if cached:
+        return cached
 
     try:
-        pdf_bytes = generate_resume_pdf(
-            resume_json=resume_data,
-            template=draft.template,
-            profile_image_url=profile_image_url,
-        )
+        pdf_bytes = await get_or_render_async(key, render_pdf)
+    except RenderUnavailable:
+        raise
     except Exception as e:
         import traceback
         traceback.print_exc()
@@ -541,12 +547,192 @@ async def download_pdf(
             detail=f"PDF generation failed: {type(e).__name__}: {str(e)[:200]}",
         )
 
-    return Response(
-        content=pdf_bytes,
-        media_type="application/pdf",
-        headers={
-            "Content-Disposition": f'attachment; filename="resume-{draft.template}.pdf"',
-        },
+    return pdf_response(key, pdf_bytes, f"resume-{draft.template}.pdf")
+
+
+async def _prepare_pdf(
+    resume_data: dict, template: str, profile_image_url: str | None, user_id: str
+):
+    """Enhance the content, resolve the photo and derive the PDF cache key.
+
+    Returns ``(key, render)`` where ``render()`` produces the bytes in the
+    render pool. Shared by the single and bulk downloads so both hit the
+    same cached files. ``user_id`` is whose Claude queue the enhancement
+    waits in (the admin's, for an export).
+    """
+    # AI-enhance sparse content before PDF generation
+    resume_data = await enhance_resume_for_pdf(resume_data, user_id)
+
+    # Only the sidebar template shows the photo: a local copy, or None if unavailable
+    profile_image_path = (
+        await ensure_profile_image(profile_image_url)
+        if template == "sidebar" else None
+    )
+
+    key = artifact_key(
+        "resume", template,
+        {"resume": resume_data, "profile_image": profile_image_path},
+        resume_pdf_service,
+    )
+    return key, lambda: render(
+        generate_resume_pdf,
+        resume_json=resume_data,
+        template=template,
+        profile_image_path=profile_image_path,
+    )
+
+
+# ── Bulk Export (admin) ──────────────────────────────────────────────────────
+
+EXPORT_RENDER_ATTEMPTS = 3
+
+
+def _select_export_drafts(
+    sync_db: Session,
+    template: str | None,
+    updated_since: str | None,
+    college: str | None,
+    class_or_year: str | None,
+    limit: int,
+) -> list:
+    """Each matching student's most recently updated draft (metadata only)."""
+    latest = (
+        select(ResumeDraft.user_id, func.max(ResumeDraft.updated_at).label("updated_at"))
+        .group_by(ResumeDraft.user_id)
+        .subquery()
+    )
+    query = (
+        sync_db.query(
+            ResumeDraft.id,
+            ResumeDraft.user_id,
+            ResumeDraft.template,
+            ResumeDraft.updated_at,
+            User.name,
+            User.email,
+            User.college,
+            User.profile_image,
+        )
+        .join(latest, and_(
+            ResumeDraft.user_id == latest.c.user_id,
+            ResumeDraft.updated_at == latest.c.updated_at,
+        ))
+        .join(User, User.id == ResumeDraft.user_id)
+        .outerjoin(UserProfile, UserProfile.user_id == User.id)
+    )
+    if template:
+        query = query.filter(ResumeDraft.template == template)
+    if updated_since:
+        query = query.filter(ResumeDraft.updated_at >= updated_since)
+    if college:
+        query = query.filter(func.lower(User.college) == college.strip().lower())
+    if class_or_year:
+        query = query.filter(UserProfile.class_or_year == class_or_year)
+
+    rows, seen = [], set()
+    for row in query.order_by(User.college, User.name, ResumeDraft.id).limit(limit * 2):
+        if row.user_id not in seen:  # two drafts saved in the same instant
+            seen.add(row.user_id)
+            rows.append(row)
+    return rows[:limit]
+
+
+async def _export_one(row, admin_id: str) -> tuple[object, bytes | None, str]:
+    """Render one draft for the export: ``(row, pdf or None, status)``."""
+    try:
+        async with async_session_scope() as db:
+            raw = await db.run_sync(
+                lambda s: s.query(ResumeDraft.resume_json).filter(ResumeDraft.id == row.id).scalar()
+            )
+        resume_data = json.loads(raw or "{}")
+        _sanitize_resume_data(resume_data)
+        key, render_pdf = await _prepare_pdf(resume_data, row.template, row.profile_image, admin_id)
+        for attempt in range(EXPORT_RENDER_ATTEMPTS):
+            try:
+                return row, await get_or_render_async(key, render_pdf), "ok"
+            except RenderUnavailable as e:
+                # Pool busy with interactive downloads: wait our turn
+                if e.status_code != 503 or attempt == EXPORT_RENDER_ATTEMPTS - 1:
+                    raise
+                await asyncio.sleep(e.retry_after)
+    except Exception as e:
+        logger.warning("[export] draft %s failed", row.id, exc_info=True)
+        return row, None, f"failed: {type(e).__name__}"
+
+
+def _utc_timestamp(value: str) -> str:
+    """``value`` as a UTC ISO timestamp, the form ``updated_at`` is stored in
+    (naive input is taken as UTC)."""
+    try:
+        parsed = datetime.fromisoformat(value.strip().replace("Z", "+00:00"))
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="updated_since must be an ISO 8601 timestamp",
+        )
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc).isoformat()
+
+
+def _export_filename(row) -> str:
+    return (
+        f"{safe_name(row.college, 'unknown-college')}/"
+        f"{safe_name(row.name, 'student')}-{row.id[:8]}.pdf"
+    )
+
+
+@router.get("/admin/export")
+async def export_drafts(
+    template: str | None = None,
+    updated_since: str | None = Query(default=None, description="ISO timestamp"),
+    college: str | None = None,
+    class_or_year: str | None = None,
+    limit: int = Query(default=500, ge=1, le=PDF_EXPORT_MAX_DRAFTS),
+    current_user: User = Depends(get_stream_user),
+):
+    """Every matching student's latest draft as PDFs in one streamed ZIP.
+
+    Files are grouped by college and followed by ``manifest.csv`` (one row
+    per draft, including any that failed to render). Drafts render
+    ``PDF_EXPORT_CONCURRENCY`` at a time through the render pool and reuse
+    any PDF already in the cache.
+    """
+    if current_user.role != "admin":
+        raise HTTPException(status_code=403, detail="Admin only")
+    if updated_since:
+        updated_since = _utc_timestamp(updated_since)
+
+    async with async_session_scope() as db:
+        rows = await db.run_sync(
+            _select_export_drafts, template, updated_since, college, class_or_year, limit
+        )
+    if not rows:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="No resume drafts match these filters",
+        )
+    logger.info("[export] %s exporting %d drafts", current_user.id, len(rows))
+    admin_id = current_user.id
+
+    async def files():
+        manifest = io.StringIO()
+        writer = csv.writer(manifest)
+        writer.writerow(["file", "name", "email", "college", "template", "updated_at", "draft_id", "status"])
+        async for row, pdf_bytes, outcome in map_ordered(rows, lambda row: _export_one(row, admin_id), PDF_EXPORT_CONCURRENCY):
+            filename = _export_filename(row) if pdf_bytes else ""
+            writer.writerow([
+                filename, row.name, row.email, row.college,
+                row.template, row.updated_at, row.id, outcome,
+            ])
+            if pdf_bytes:
+                yield filename, pdf_bytes
+        yield "manifest.csv", manifest.getvalue().encode("utf-8")
+
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%d-%H%M")
+    return StreamingResponse(
+        zip_stream(files()),
+        media_type="application/zip",
+        headers={"Content-Disposition": f'attachment; filename="resumes-{stamp}.zip"'},
     )
 
 
@@ -1,11 +1,12 @@
 import json
 from datetime import datetime, timezone
+from types import SimpleNamespace
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.responses import StreamingResponse, Response
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
-from app.database import get_db
+from app.database import get_db, async_session_scope
 from app.models import User, UserProfile, ChatSession, Message, SessionAnalysis, ContextSummary
 from app.schemas import (
     SessionCreateRequest,
@@ -17,18 +18,27 @@ from app.schemas import (
     AnalysisResponse,
     ErrorResponse,
 )
-from app.auth import get_current_user
+from app.auth import get_current_user, get_stream_user
 from app.prompts import build_system_prompt
-from app.services.claude_service import stream_chat_response
+from app.services.claude_service import stream_chat_response, governor, STREAM_LANE
 from app.services.analysis_service import (
     extract_analysis,
     extract_options,
     extract_progress,
     clean_response_text,
-    generate_session_summary,
-    update_context_summary,
 )
+from app.services.history_service import (
+    unsummarized_history,
+    fit_history,
+    needs_compaction,
+    with_history_summary,
+    compaction_task,
+)
+from app.services.task_queue_service import make_task, wake_workers
+from app.services import pdf_service
 from app.services.pdf_service import generate_pdf_report
+from app.services.pdf_cache_service import artifact_key, not_modified, get_or_render, pdf_response
+from app.services.pdf_render_service import render_blocking
 
 router = APIRouter(prefix="/sessions", tags=["sessions"])
 
@@ -134,57 +144,70 @@ def get_session(
 async def send_message(
     session_id: str,
     data: MessageSendRequest,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    current_user: User = Depends(get_stream_user),
 ):
-    session = _get_session_or_404(session_id, current_user.id, db)
-
-    if session.status != "active":
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Session is no longer active",
+    user_id = current_user.id
+    # Fail fast with 429 + Retry-After before touching the DB or opening SSE
+    governor.check(STREAM_LANE, user_id)
+
+    def _prepare_turn(sync_db: Session):
+        session = _get_session_or_404(session_id, user_id, sync_db)
+
+        if session.status != "active":
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Session is no longer active",
+            )
+
+        # Count existing messages
+        msg_count = (
+            sync_db.query(Message)
+            .filter(Message.session_id == session_id)
+            .count()
         )
-
-    # Count existing messages
-    msg_count = (
-        db.query(Message)
-        .filter(Message.session_id == session_id)
-        .count()
-    )
-    if msg_count >= MAX_MESSAGES_PER_SESSION:
-        raise HTTPException(
-            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-            detail=f"Maximum {MAX_MESSAGES_PER_SESSION} messages per session reached.",
+        if msg_count >= MAX_MESSAGES_PER_SESSION:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail=f"Maximum {MAX_MESSAGES_PER_SESSION} messages per session reached.",
+            )
+
+        # Save user message
+        user_msg = Message(
+            session_id=session_id,
+            user_id=user_id,
+            role="user",
+            content=data.content,
+            message_order=msg_count + 1,
+        )
+        sync_db.add(user_msg)
+        session.questions_asked_count = session.questions_asked_count + 1
+        sync_db.commit()
+
+        # Load all messages for context
+        all_messages = (
+            sync_db.query(Message)
+            .filter(Message.session_id == session_id)
+            .order_by(Message.message_order.asc())
+            .all()
         )
 
-    # Save user message
-    user_msg = Message(
-        session_id=session_id,
-        user_id=current_user.id,
-        role="user",
-        content=data.content,
-        message_order=msg_count + 1,
-    )
-    db.add(user_msg)
-    session.questions_asked_count = session.questions_asked_count + 1
-    db.commit()
-
-    # Load all messages for context
-    all_messages = (
-        db.query(Message)
-        .filter(Message.session_id == session_id)
-        .order_by(Message.message_order.asc())
-        .all()
-    )
-    chat_history = [{"role": m.role, "content": m.content} for m in all_messages]
-
-    # Build system prompt with user profile + context summary
-    profile = db.query(UserProfile).filter(
-        UserProfile.user_id == current_user.id
-    ).first()
-    ctx_summary = db.query(ContextSummary).filter(
-        ContextSummary.user_id == current_user.id
-    ).first()
+        # User profile + context summary for the system prompt
+        profile = sync_db.query(UserProfile).filter(
+            UserProfile.user_id == user_id
+        ).first()
+        ctx_summary = sync_db.query(ContextSummary).filter(
+            ContextSummary.user_id == user_id
+        ).first()
+        history = unsummarized_history("chat", session, all_messages)
+        return msg_count, all_messages, profile, ctx_summary, history, session.history_summary
+
+    # Reads happen up front; the connection goes back to the pool before
+    # streaming starts and a fresh session is opened for the writes.
+    async with async_session_scope() as db:
+        (
+            msg_count, all_messages, profile, ctx_summary, history, history_summary,
+        ) = await db.run_sync(_prepare_turn)
+    chat_history = fit_history(history)
 
     # Count assistant messages for force-analysis check
     assistant_msg_count = sum(1 for m in all_messages if m.role == "assistant")
@@ -196,9 +219,9 @@ async def send_message(
         context_summary=ctx_summary,
         force_analysis=force_analysis,
     )
+    system_prompt = with_history_summary(system_prompt, history_summary)
 
     # Capture context needed for post-stream DB operations
-    user_id = current_user.id
     new_msg_order = msg_count + 2
 
     # Stream response — collect full text, emit SSE events, then do DB work
@@ -208,7 +231,7 @@ async def send_message(
         nonlocal full_response_chunks
         complete_text = ""
         try:
-            async for chunk in stream_chat_response(system_prompt, chat_history):
+            async for chunk in stream_chat_response(system_prompt, chat_history, user_id=user_id):
                 full_response_chunks.append(chunk)
                 yield f"event: message\ndata: {json.dumps({'text': chunk})}\n\n"
 
@@ -237,56 +260,52 @@ async def send_message(
         finally:
             # Always save the assistant message if we got any response
             if full_response_chunks:
-                try:
-                    raw_text = complete_text or "".join(full_response_chunks)
-                    # Strip metadata tags before storing — keeps DB clean and
-                    # prevents metadata leaking into future context windows
-                    stored_text = clean_response_text(raw_text)
-
-                    assistant_msg = Message(
-                        session_id=session_id,
-                        user_id=user_id,
-                        role="assistant",
-                        content=stored_text,
-                        message_order=new_msg_order,
-                    )
-                    db.add(assistant_msg)
-                    db.commit()
-
-                    # Check for analysis tags and persist to DB
-                    analysis_data = extract_analysis(raw_text)
-                    if analysis_data:
-                        analysis = SessionAnalysis(
+                raw_text = complete_text or "".join(full_response_chunks)
+                # Strip metadata tags before storing — keeps DB clean and
+                # prevents metadata leaking into future context windows
+                stored_text = clean_response_text(raw_text)
+
+                # Analysis persistence and the summary / context-summary
+                # updates (two more Claude calls) run as background tasks so
+                # the stream closes as soon as the model is done.
+                analysis_data = extract_analysis(raw_text)
+
+                async with async_session_scope() as db:
+                    try:
+                        assistant_msg = Message(
                             session_id=session_id,
                             user_id=user_id,
-                            analysis_json=analysis_data.get("analysis_json"),
-                            analysis_markdown=analysis_data.get("analysis_markdown"),
-                            roadmap_json=analysis_data.get("roadmap_json"),
+                            role="assistant",
+                            content=stored_text,
+                            message_order=new_msg_order,
                         )
-                        db.add(analysis)
-
-                        # Mark session as completed
-                        session_obj = db.query(ChatSession).filter(
-                            ChatSession.id == session_id
-                        ).first()
-                        if session_obj:
-                            session_obj.status = "completed"
-                            session_obj.ended_at = datetime.now(timezone.utc).isoformat()
-                            session_obj.analysis_generated = 1
-
-                            # Generate session summary
-                            summary = await generate_session_summary(chat_history + [
-                                {"role": "assistant", "content": stored_text}
-                            ])
-                            session_obj.session_summary = summary
-
-                            # Update rolling context summary
-                            await update_context_summary(db, user_id, summary)
-
-                        db.commit()
-
-                except Exception:
-                    db.rollback()
+                        db.add(assistant_msg)
+                        if analysis_data:
+                            # Close the session now so no further turns slip
+                            # in before the analysis row lands.
+                            session_obj = await db.run_sync(
+                                lambda s: s.query(ChatSession).filter(
+                                    ChatSession.id == session_id
+                                ).first()
+                            )
+                            if session_obj:
+                                session_obj.status = "completed"
+                                session_obj.ended_at = datetime.now(timezone.utc).isoformat()
+                            db.add(make_task(
+                                "session.persist_analysis",
+                                {
+                                    "session_id": session_id,
+                                    "user_id": user_id,
+                                    "analysis_data": analysis_data,
+                                },
+                                user_id=user_id,
+                            ))
+                        if needs_compaction(history + [{"role": "assistant", "content": stored_text}]):
+                            db.add(compaction_task("chat", session_id, user_id))
+                        await db.commit()
+                    except Exception:
+                        await db.rollback()
+                wake_workers()
 
     return StreamingResponse(
         event_generator(),
@@ -304,11 +323,14 @@ async def send_message(
     response_model=SessionResponse,
     responses={404: {"model": ErrorResponse}},
 )
-async def end_session(
+def end_session(
     session_id: str,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
+    """End the session. ``session_summary`` is null in this response: the
+    summary is written by a background task shortly after, so read it from
+    ``GET /sessions/{session_id}`` (or the session list) later."""
     session = _get_session_or_404(session_id, current_user.id, db)
 
     if session.status != "active":
@@ -320,20 +342,14 @@ async def end_session(
     session.status = "completed"
     session.ended_at = datetime.now(timezone.utc).isoformat()
 
-    # Generate summary from messages
-    messages = (
-        db.query(Message)
-        .filter(Message.session_id == session_id)
-        .order_by(Message.message_order.asc())
-        .all()
-    )
-    if messages:
-        chat_history = [{"role": m.role, "content": m.content} for m in messages]
-        summary = await generate_session_summary(chat_history)
-        session.session_summary = summary
-        await update_context_summary(db, current_user.id, summary)
-
+    # Summary + rolling context update happen in the background
+    db.add(make_task(
+        "session.summarize",
+        {"session_id": session_id, "user_id": current_user.id},
+        user_id=current_user.id,
+    ))
     db.commit()
+    wake_workers()
     db.refresh(session)
 
     return SessionResponse.model_validate(session)
@@ -369,6 +385,7 @@ def get_analysis(
 )
 def download_report(
     session_id: str,
+    request: Request,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
@@ -384,16 +401,27 @@ def download_report(
             detail="No analysis available to generate report",
         )
 
-    pdf_bytes = generate_pdf_report(
-        user=current_user,
-        session=session,
-        analysis=analysis,
-    )
-
-    return Response(
-        content=pdf_bytes,
-        media_type="application/pdf",
-        headers={
-            "Content-Disposition": f'attachment; filename="iklavya-report-{session_id[:8]}.pdf"',
-        },
+    # Picklable snapshots of everything generate_pdf_report reads — they are
+    # shipped to a render worker and double as the cache key
+    user = SimpleNamespace(name=current_user.name, college=current_user.college)
+    report_session = SimpleNamespace(title=session.title, started_at=session.started_at)
+    report_analysis = SimpleNamespace(
+        analysis_json=analysis.analysis_json,
+        analysis_markdown=analysis.analysis_markdown,
+        roadmap_json=analysis.roadmap_json,
     )
+    key = artifact_key("career_report", "default", {
+        "user": vars(user), "session": vars(report_session), "analysis": vars(report_analysis),
+    }, pdf_service)
+    cached = not_modified(request, key)
+    if cached:
+        return cached
+
+    pdf_bytes = get_or_render(key, lambda: render_blocking(
+        generate_pdf_report,
+        user=user,
+        session=report_session,
+        analysis=report_analysis,
+    ))
+
+    return pdf_response(key, pdf_bytes, f"iklavya-report-{session_id[:8]}.pdf")
@@ -0,0 +1,54 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.database import get_db
+from app.models import User, BackgroundTask
+from app.schemas import BackgroundTaskResponse, BackgroundTaskStatsResponse, ErrorResponse
+from app.auth import get_current_user
+
+router = APIRouter(prefix="/tasks", tags=["tasks"])
+
+
+@router.get("", response_model=BackgroundTaskStatsResponse)
+def queue_stats(
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Queue depth by status (admin only)."""
+    if current_user.role != "admin":
+        raise HTTPException(status_code=403, detail="Admin only")
+
+    rows = (
+        db.query(BackgroundTask.status, func.count(BackgroundTask.id))
+        .group_by(BackgroundTask.status)
+        .all()
+    )
+    oldest = (
+        db.query(func.min(BackgroundTask.created_at))
+        .filter(BackgroundTask.status == "queued")
+        .scalar()
+    )
+    return BackgroundTaskStatsResponse(
+        counts={s: c for s, c in rows},
+        oldest_queued_at=oldest,
+    )
+
+
+@router.get(
+    "/{task_id}",
+    response_model=BackgroundTaskResponse,
+    responses={404: {"model": ErrorResponse}},
+)
+def get_task(
+    task_id: str,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    task = db.query(BackgroundTask).filter(BackgroundTask.id == task_id).first()
+    if not task or (task.user_id != current_user.id and current_user.role != "admin"):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Task not found",
+        )
+    return BackgroundTaskResponse.model_validate(task)
@@ -141,6 +141,7 @@ class SessionResponse(BaseModel):
     started_at: str
     ended_at: Optional[str] = None
     status: str
+    # Filled in the background after the session ends; null until then
     session_summary: Optional[str] = None
     questions_asked_count: int
     analysis_generated: int
@@ -741,3 +742,25 @@ class InterviewTTSRequest(BaseModel):
 
 class InterviewMessageSendRequest(BaseModel):
     content: str = Field(min_length=1, max_length=10000)
+
+
+# ─── Background Tasks ─────────────────────────────────────
+
+
+class BackgroundTaskResponse(BaseModel):
+    id: str
+    kind: str
+    status: str
+    attempts: int
+    max_attempts: int
+    last_error: Optional[str] = None
+    run_after: str
+    created_at: str
+    updated_at: str
+
+    model_config = {"from_attributes": True}
+
+
+class BackgroundTaskStatsResponse(BaseModel):
+    counts: dict[str, int]
+    oldest_queued_at: Optional[str] = None
@@ -1,13 +1,11 @@
 import json
 import re
-import anthropic
+from datetime import datetime, timezone
 
-from app.config import ANTHROPIC_API_KEY
+from app.database import async_session_scope
 from app.prompts import SESSION_SUMMARY_PROMPT
-
-client = anthropic.AsyncAnthropic(api_key=ANTHROPIC_API_KEY)
-
-MODEL = "claude-sonnet-4-20250514"
+from app.services.claude_service import get_chat_response
+from app.services.task_queue_service import task_handler, make_task, wake_workers
 
 
 def extract_options(response_text: str) -> list[str] | None:
@@ -125,7 +123,7 @@ def extract_analysis(response_text: str) -> dict | None:
     }
 
 
-async def generate_session_summary(messages: list[dict]) -> str:
+async def generate_session_summary(messages: list[dict], user_id: str | None = None) -> str:
     """Generate a 150-200 word summary of the session conversation."""
     conversation_text = "\n".join(
         f"{'Student' if m['role'] == 'user' else 'Counselor'}: {m['content']}"
@@ -134,45 +132,42 @@ async def generate_session_summary(messages: list[dict]) -> str:
 
     prompt = SESSION_SUMMARY_PROMPT.format(conversation=conversation_text)
 
-    response = await client.messages.create(
-        model=MODEL,
-        max_tokens=500,
-        messages=[{"role": "user", "content": prompt}],
+    return await get_chat_response(
+        None, [{"role": "user", "content": prompt}], user_id=user_id, max_tokens=500
     )
 
-    return response.content[0].text
 
-
-async def update_context_summary(db, user_id: str, new_summary: str):
+async def update_context_summary(user_id: str, new_summary: str):
     """Update or create the rolling context summary for a user.
 
     If the cumulative summary exceeds 1000 words, condense it using Claude.
+    No DB session is held while Claude runs: the summary is read in one
+    scope and written back in another, unless it changed in between.
     """
     from app.models import ContextSummary
 
-    ctx = db.query(ContextSummary).filter(
-        ContextSummary.user_id == user_id
-    ).first()
+    def _read(sync_db) -> str | None:
+        ctx = sync_db.query(ContextSummary).filter(ContextSummary.user_id == user_id).first()
+        if ctx:
+            return ctx.cumulative_summary
+        sync_db.add(ContextSummary(user_id=user_id, cumulative_summary=new_summary))
+        sync_db.commit()
+        return None
 
-    if not ctx:
-        ctx = ContextSummary(
-            user_id=user_id,
-            cumulative_summary=new_summary,
-        )
-        db.add(ctx)
-        db.commit()
+    async with async_session_scope() as db:
+        previous = await db.run_sync(_read)
+    if previous is None:
         return
 
     # Append new summary
-    updated = f"{ctx.cumulative_summary}\n\n---\n\n{new_summary}"
+    updated = f"{previous}\n\n---\n\n{new_summary}"
 
     # Condense if too long
     word_count = len(updated.split())
     if word_count > 1000:
-        condense_response = await client.messages.create(
-            model=MODEL,
-            max_tokens=600,
-            messages=[{
+        updated = await get_chat_response(
+            None,
+            [{
                 "role": "user",
                 "content": (
                     "Condense the following career counseling session summaries into "
@@ -181,8 +176,100 @@ async def update_context_summary(db, user_id: str, new_summary: str):
                     f"{updated}"
                 ),
             }],
+            user_id=user_id,
+            max_tokens=600,
         )
-        updated = condense_response.content[0].text
 
-    ctx.cumulative_summary = updated
-    db.commit()
+    def _write(sync_db):
+        ctx = sync_db.query(ContextSummary).filter(ContextSummary.user_id == user_id).first()
+        if ctx.cumulative_summary != previous:
+            # Another summary landed meanwhile; the task retries from a fresh read
+            raise RuntimeError(f"context summary for user {user_id} changed during update")
+        ctx.cumulative_summary = updated
+        sync_db.commit()
+
+    async with async_session_scope() as db:
+        await db.run_sync(_write)
+
+
+# ─── Background tasks ──────────────────────────────────────
+# Enqueued by the sessions router so the SSE stream can close as soon as the
+# model finishes; each step enqueues the next in the same transaction.
+
+
+@task_handler("session.persist_analysis")
+async def _persist_analysis_task(payload: dict):
+    from app.models import ChatSession, SessionAnalysis
+
+    session_id = payload["session_id"]
+    user_id = payload["user_id"]
+    analysis_data = payload["analysis_data"]
+
+    def _persist(sync_db):
+        exists = sync_db.query(SessionAnalysis.id).filter(
+            SessionAnalysis.session_id == session_id
+        ).first()
+        if exists:
+            return  # retried after a partial run
+
+        sync_db.add(SessionAnalysis(
+            session_id=session_id,
+            user_id=user_id,
+            analysis_json=analysis_data.get("analysis_json"),
+            analysis_markdown=analysis_data.get("analysis_markdown"),
+            roadmap_json=analysis_data.get("roadmap_json"),
+        ))
+        session = sync_db.query(ChatSession).filter(ChatSession.id == session_id).first()
+        if session:
+            session.status = "completed"
+            session.ended_at = session.ended_at or datetime.now(timezone.utc).isoformat()
+            session.analysis_generated = 1
+        sync_db.add(make_task(
+            "session.summarize", {"session_id": session_id, "user_id": user_id}, user_id=user_id
+        ))
+        sync_db.commit()
+
+    async with async_session_scope() as db:
+        await db.run_sync(_persist)
+    wake_workers()
+
+
+@task_handler("session.summarize")
+async def _summarize_session_task(payload: dict):
+    from app.models import ChatSession, Message
+
+    session_id = payload["session_id"]
+    user_id = payload["user_id"]
+
+    async with async_session_scope() as db:
+        history = await db.run_sync(
+            lambda s: [
+                {"role": m.role, "content": m.content}
+                for m in s.query(Message)
+                .filter(Message.session_id == session_id)
+                .order_by(Message.message_order.asc())
+                .all()
+            ]
+        )
+    if not history:
+        return
+
+    summary = await generate_session_summary(history, user_id)
+
+    def _save(sync_db):
+        session = sync_db.query(ChatSession).filter(ChatSession.id == session_id).first()
+        if session:
+            session.session_summary = summary
+        sync_db.add(make_task(
+            "context_summary.update", {"user_id": user_id, "summary": summary}, user_id=user_id
+        ))
+        sync_db.commit()
+
+    async with async_session_scope() as db:
+        await db.run_sync(_save)
+    wake_workers()
+
+
+@task_handler("context_summary.update")
+async def _update_context_summary_task(payload: dict):
+    await update_context_summary(payload["user_id"], payload["summary"])
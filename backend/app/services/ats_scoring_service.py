@@ -1,6 +1,8 @@
+import asyncio
 import json
 import re
-from app.services.claude_service import get_chat_response
+from app.services.claude_service import MODEL, get_chat_response
+from app.services.llm_cache_service import ResultCache, canonical_json, prompt_version
 
 # ─── Action Verb Set ────────────────────────────────────────
 
@@ -169,6 +171,34 @@ def _deterministic_score(data: dict) -> dict:
 
 # ─── Claude Semantic Scoring (60 pts) ──────────────────────
 
+SEMANTIC_WEIGHTS = {
+    "hard_skills": 20,
+    "soft_skills": 5,
+    "experience_relevance": 15,
+    "job_title_alignment": 5,
+    "content_quality": 10,
+    "action_language": 5,
+}
+
+SEMANTIC_LABELS = {
+    "hard_skills": "Hard Skills Match",
+    "soft_skills": "Soft Skills",
+    "experience_relevance": "Experience Relevance",
+    "job_title_alignment": "Job Title Alignment",
+    "content_quality": "Content Quality",
+    "action_language": "Action Language",
+}
+
+# What Claude is told each category means, by both the full and the section grader
+SEMANTIC_CRITERIA = {
+    "hard_skills": "Technical/hard skills match for the target role",
+    "soft_skills": "Relevant soft skills presence",
+    "experience_relevance": "Work experience/projects relevance. For freshers, evaluate projects.",
+    "job_title_alignment": "Resume profile alignment with career objective",
+    "content_quality": "Clear, impactful descriptions with specific results",
+    "action_language": "Strong professional language, highlighted achievements",
+}
+
 ATS_SCORING_PROMPT = """You are an expert ATS (Applicant Tracking System) resume analyzer. Score the resume against the candidate's stated career objective.
 
 Grade each dimension A through E:
@@ -179,12 +209,10 @@ Grade each dimension A through E:
 - E = Poor (0-24%)
 
 Categories:
-1. hard_skills (weight: 20pts) - Technical/hard skills match for the target role
-2. soft_skills (weight: 5pts) - Relevant soft skills presence
-3. experience_relevance (weight: 15pts) - Work experience/projects relevance. For freshers, evaluate projects.
-4. job_title_alignment (weight: 5pts) - Resume profile alignment with career objective
-5. content_quality (weight: 10pts) - Clear, impactful descriptions with specific results
-6. action_language (weight: 5pts) - Strong professional language, highlighted achievements
+""" + "\n".join(
+    f"{i}. {key} (weight: {SEMANTIC_WEIGHTS[key]}pts) - {criterion}"
+    for i, (key, criterion) in enumerate(SEMANTIC_CRITERIA.items(), 1)
+) + """
 
 Also provide:
 - matched_keywords: 5-10 strong keywords found that match the target role
@@ -206,72 +234,70 @@ Respond ONLY with valid JSON (no markdown, no explanation):
   "top_suggestions": ["Add metrics to internship bullets", "Include Docker skills"]
 }"""
 
-SEMANTIC_WEIGHTS = {
-    "hard_skills": 20,
-    "soft_skills": 5,
-    "experience_relevance": 15,
-    "job_title_alignment": 5,
-    "content_quality": 10,
-    "action_language": 5,
-}
-
-SEMANTIC_LABELS = {
-    "hard_skills": "Hard Skills Match",
-    "soft_skills": "Soft Skills",
-    "experience_relevance": "Experience Relevance",
-    "job_title_alignment": "Job Title Alignment",
-    "content_quality": "Content Quality",
-    "action_language": "Action Language",
-}
-
 
 def _grade_to_score(grade: str, max_pts: int) -> int:
     return round(GRADE_MAP.get(grade.upper().strip(), 0.5) * max_pts)
 
 
-async def _semantic_score(resume_json: str, objective: str) -> dict:
+# Part of every cache key — editing the prompt or switching model retires old grades
+ATS_PROMPT_VERSION = prompt_version(ATS_SCORING_PROMPT, MODEL)
+
+_semantic_cache = ResultCache("ats_semantic")
+
+
+async def _grade_resume(resume_json: str, objective: str, user_id: str | None) -> dict:
+    """One Claude grading call. Raises if the reply can't be parsed."""
     user_message = (
         f"## Career Objective / Target Role\n"
         f"{objective if objective else 'General fresher role - no specific objective stated'}\n\n"
         f"## Resume Data (JSON)\n{resume_json}"
     )
 
-    try:
-        response_text = await get_chat_response(
-            system_prompt=ATS_SCORING_PROMPT,
-            messages=[{"role": "user", "content": user_message}],
-        )
-
-        cleaned = response_text.strip()
-        if cleaned.startswith("```"):
-            cleaned = re.sub(r"^```(?:json)?\n?", "", cleaned)
-            cleaned = re.sub(r"\n?```$", "", cleaned)
+    response_text = await get_chat_response(
+        system_prompt=ATS_SCORING_PROMPT,
+        messages=[{"role": "user", "content": user_message}],
+        user_id=user_id,
+    )
 
-        result = json.loads(cleaned)
-        grades = result.get("grades", {})
+    cleaned = response_text.strip()
+    if cleaned.startswith("```"):
+        cleaned = re.sub(r"^```(?:json)?\n?", "", cleaned)
+        cleaned = re.sub(r"\n?```$", "", cleaned)
+
+    result = json.loads(cleaned)
+    grades = result.get("grades", {})
+
+    categories = {}
+    total = 0
+    for key, max_pts in SEMANTIC_WEIGHTS.items():
+        grade = grades.get(key, "C")
+        pts = _grade_to_score(grade, max_pts)
+        total += pts
+        categories[key] = {
+            "label": SEMANTIC_LABELS.get(key, key),
+            "grade": grade,
+            "score": pts,
+            "max": max_pts,
+        }
 
-        categories = {}
-        total = 0
-        for key, max_pts in SEMANTIC_WEIGHTS.items():
-            grade = grades.get(key, "C")
-            pts = _grade_to_score(grade, max_pts)
-            total += pts
-            categories[key] = {
-                "label": SEMANTIC_LABELS.get(key, key),
-                "grade": grade,
-                "score": pts,
-                "max": max_pts,
-            }
+    return {
+        "categories": categories,
+        "total": total,
+        "max_total": 60,
+        "matched_keywords": result.get("matched_keywords", []),
+        "missing_keywords": result.get("missing_keywords", []),
+        "top_suggestions": result.get("top_suggestions", []),
+    }
 
-        return {
-            "categories": categories,
-            "total": total,
-            "max_total": 60,
-            "matched_keywords": result.get("matched_keywords", []),
-            "missing_keywords": result.get("missing_keywords", []),
-            "top_suggestions": result.get("top_suggestions", []),
-        }
 
+async def _semantic_score(resume_json: str, objective: str, user_id: str | None) -> dict:
+    """Claude grades, served from the content-addressed cache when the
+    resume (canonical JSON) and prompt version are unchanged."""
+    try:
+        return await _semantic_cache.get_or_compute(
+            _semantic_cache.key(ATS_PROMPT_VERSION, resume_json),
+            lambda: _grade_resume(resume_json, objective, user_id),
+        )
     except Exception:
         # Fallback: middle-of-road scores
         categories = {}
@@ -295,6 +321,182 @@ async def _semantic_score(resume_json: str, objective: str) -> dict:
         }
 
 
+# ─── Section-level Semantic Scoring (60 pts) ───────────────
+# For the live ATS meter: each section is graded on its own with a much
+# smaller prompt and cached by (section, content, objective), so after an
+# autosave only the sections that actually changed go back to Claude. Each
+# section grades the rubric categories it informs, and a category's grade
+# is the mean over its filled sections, so the meter reports the same
+# categories and weights as ``compute_ats_score``.
+
+ATS_SECTION_PROMPT = """You are an ATS section grader. Grade ONE section of a resume against the candidate's career objective, on only the categories listed with it.
+
+Grade each category A through E:
+- A = Excellent (90-100% match)
+- B = Good (70-89%)
+- C = Average (50-69%)
+- D = Below Average (25-49%)
+- E = Poor (0-24%)
+
+Respond ONLY with valid JSON (no markdown, no explanation):
+{
+  "grades": {"hard_skills": "B", "soft_skills": "C"},
+  "matched_keywords": ["Python"],
+  "missing_keywords": ["Docker"],
+  "suggestion": "One specific, actionable improvement for this section"
+}"""
+
+# Which rubric categories each section is graded on. With no experience
+# (a fresher), projects alone carry the experience categories
+SECTION_CATEGORIES = {
+    "skills": ("hard_skills", "soft_skills"),
+    "experience": ("experience_relevance", "content_quality", "action_language"),
+    "projects": ("experience_relevance", "content_quality", "action_language"),
+    "objective": ("job_title_alignment",),
+    "education": ("job_title_alignment",),
+}
+
+ATS_SECTION_PROMPT_VERSION = prompt_version(
+    ATS_SECTION_PROMPT, canonical_json(SECTION_CATEGORIES), *SEMANTIC_CRITERIA.values(), MODEL
+)
+
+_section_cache = ResultCache("ats_section")
+
+
+def _section_filled(value) -> bool:
+    if isinstance(value, str):
+        return bool(value.strip())
+    if isinstance(value, dict):
+        return any(value.values())
+    return bool(value)
+
+
+async def _grade_section(section: str, content_json: str, objective: str, user_id: str | None) -> dict:
+    """One small Claude call for one section. Raises if the reply can't be parsed."""
+    criteria = "\n".join(f"- {key}: {SEMANTIC_CRITERIA[key]}" for key in SECTION_CATEGORIES[section])
+    user_message = (
+        f"## Career Objective / Target Role\n"
+        f"{objective if objective else 'General fresher role - no specific objective stated'}\n\n"
+        f"## Section: {section}\n"
+        f"Categories:\n{criteria}\n\n"
+        f"{content_json}"
+    )
+    response_text = await get_chat_response(
+        system_prompt=ATS_SECTION_PROMPT,
+        messages=[{"role": "user", "content": user_message}],
+        user_id=user_id,
+        max_tokens=512,
+    )
+
+    cleaned = response_text.strip()
+    if cleaned.startswith("```"):
+        cleaned = re.sub(r"^```(?:json)?\n?", "", cleaned)
+        cleaned = re.sub(r"\n?```$", "", cleaned)
+
+    result = json.loads(cleaned)
+    grades = result.get("grades", {})
+    return {
+        "grades": {
+            key: str(grades.get(key, "C")).upper().strip() or "C"
+            for key in SECTION_CATEGORIES[section]
+        },
+        "matched_keywords": result.get("matched_keywords", []),
+        "missing_keywords": result.get("missing_keywords", []),
+        "suggestion": result.get("suggestion", ""),
+    }
+
+
+async def _section_grade(
+    section: str, content, objective: str, regraded: list[str], user_id: str | None
+) -> dict:
+    """Grades for the section's categories; empty (no grades) if the section is."""
+    if not _section_filled(content):
+        return {
+            "grades": {},
+            "matched_keywords": [],
+            "missing_keywords": [],
+            "suggestion": f"Add your {section} section",
+        }
+
+    content_json = canonical_json(content)
+
+    async def compute():
+        regraded.append(section)
+        return await _grade_section(section, content_json, objective, user_id)
+
+    try:
+        return await _section_cache.get_or_compute(
+            _section_cache.key(ATS_SECTION_PROMPT_VERSION, section, content_json, objective),
+            compute,
+        )
+    except Exception:
+        # Fallback for this section only; not cached, so the next save retries
+        return {
+            "grades": {key: "C" for key in SECTION_CATEGORIES[section]},
+            "matched_keywords": [],
+            "missing_keywords": [],
+            "suggestion": "",
+        }
+
+
+def _mean_grade(grades: list[str]) -> str:
+    """The letter nearest the mean of ``grades`` (ties go to the better
+    one); E when there are none."""
+    if not grades:
+        return "E"
+    mean = sum(GRADE_MAP.get(grade, 0.5) for grade in grades) / len(grades)
+    return min(GRADE_MAP, key=lambda letter: abs(GRADE_MAP[letter] - mean))
+
+
+def _unique(items: list, limit: int) -> list:
+    seen, out = set(), []
+    for item in items:
+        if isinstance(item, str) and item.lower() not in seen:
+            seen.add(item.lower())
+            out.append(item)
+    return out[:limit]
+
+
+async def _section_semantic_score(data: dict, user_id: str | None) -> tuple[dict, list[str]]:
+    """Same shape and categories as ``_semantic_score``, plus the sections
+    sent to Claude."""
+    objective = data.get("objective", "")
+
+    regraded: list[str] = []
+    graded = await asyncio.gather(*(
+        _section_grade(section, data.get(section), objective, regraded, user_id)
+        for section in SECTION_CATEGORIES
+    ))
+
+    categories = {}
+    total = 0
+    for key, max_pts in SEMANTIC_WEIGHTS.items():
+        grade = _mean_grade([g["grades"][key] for g in graded if key in g["grades"]])
+        pts = _grade_to_score(grade, max_pts)
+        total += pts
+        categories[key] = {
+            "label": SEMANTIC_LABELS[key],
+            "grade": grade,
+            "score": pts,
+            "max": max_pts,
+        }
+
+    # Weakest sections' advice first; an empty section is the weakest
+    def weakest(g: dict) -> float:
+        values = [GRADE_MAP.get(grade, 0.5) for grade in g["grades"].values()]
+        return sum(values) / len(values) if values else 0.0
+
+    by_grade = sorted(graded, key=weakest)
+    return {
+        "categories": categories,
+        "total": total,
+        "max_total": 60,
+        "matched_keywords": _unique([k for g in graded for k in g["matched_keywords"]], 10),
+        "missing_keywords": _unique([k for g in graded for k in g["missing_keywords"]], 7),
+        "top_suggestions": _unique([g["suggestion"] for g in by_grade if g["suggestion"]], 5),
+    }, regraded
+
+
 # ─── Combined Score ─────────────────────────────────────────
 
 DET_LABELS = {
@@ -308,13 +510,7 @@ DET_LABELS = {
 }
 
 
-async def compute_ats_score(resume_json: str) -> dict:
-    data = json.loads(resume_json)
-    objective = data.get("objective", "")
-
-    det_result = _deterministic_score(data)
-    sem_result = await _semantic_score(resume_json, objective)
-
+def _combine(det_result: dict, sem_result: dict) -> dict:
     total_score = det_result["total"] + sem_result["total"]
 
     all_categories = []
@@ -353,3 +549,28 @@ async def compute_ats_score(resume_json: str) -> dict:
         "missing_keywords": sem_result["missing_keywords"],
         "suggestions": sem_result["top_suggestions"],
     }
+
+
+def _parse(resume_json: str | dict) -> dict:
+    return json.loads(resume_json) if isinstance(resume_json, str) else resume_json
+
+
+async def compute_ats_score(resume_json: str | dict, user_id: str | None = None) -> dict:
+    """``user_id`` is the fair-queueing key for the Claude call."""
+    data = _parse(resume_json)
+    objective = data.get("objective", "")
+
+    det_result = _deterministic_score(data)
+    sem_result = await _semantic_score(canonical_json(data), objective, user_id)
+    return _combine(det_result, sem_result)
+
+
+async def compute_section_ats_score(resume_json: str | dict, user_id: str | None = None) -> dict:
+    """Cheap score for the live meter: the same categories and weights as
+    ``compute_ats_score``, graded section by section so only changed
+    sections go back to Claude. ``regraded_sections`` lists those calls."""
+    data = _parse(resume_json)
+
+    det_result = _deterministic_score(data)
+    sem_result, regraded = await _section_semantic_score(data, user_id)
+    return {**_combine(det_result, sem_result), "regraded_sections": regraded}
@@ -0,0 +1,182 @@
+"""Record / replay cassettes for outbound API calls (Claude, ElevenLabs, Firecrawl).
+
+``CASSETTE_MODE``:
+    off     — default; calls go straight through.
+    record  — make the live call and save request + response to disk.
+    replay  — serve responses from disk; a missing cassette raises
+              ``CassetteMiss`` instead of touching the network.
+
+Each interaction is one gzipped JSON file at
+``CASSETTE_DIR/<service>/<key>.json.gz`` where ``key`` hashes the
+normalised request (API keys are never part of it). HTTP cassettes keep
+status, content type, body and the elapsed time; Claude stream cassettes
+keep every text chunk with its offset from the start of the request.
+Replays sleep for the recorded time divided by ``CASSETTE_SPEED``
+(1 = original timing, 10 = ten times faster, 0 = no delay). Cassettes are
+read and written in a worker thread, off the event loop.
+"""
+
+import asyncio
+import base64
+import gzip
+import hashlib
+import json
+import logging
+import os
+import time
+from typing import Awaitable, Callable
+
+import httpx
+
+from app.config import CASSETTE_MODE, CASSETTE_DIR, CASSETTE_SPEED
+
+logger = logging.getLogger(__name__)
+
+CASSETTE_VERSION = 1
+
+
+class CassetteMiss(Exception):
+    """Replay mode found no cassette for a request."""
+
+
+def enabled() -> bool:
+    return CASSETTE_MODE in ("record", "replay")
+
+
+def cassette_key(request: dict) -> str:
+    canonical = json.dumps(request, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:32]
+
+
+def _path(service: str, key: str) -> str:
+    return os.path.join(CASSETTE_DIR, service, f"{key}.json.gz")
+
+
+def load(service: str, request: dict) -> dict:
+    key = cassette_key(request)
+    try:
+        with gzip.open(_path(service, key), "rt", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        raise CassetteMiss(f"No {service} cassette for key {key}") from None
+
+
+def save(service: str, request: dict, entry: dict) -> None:
+    key = cassette_key(request)
+    path = _path(service, key)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.tmp"
+    with gzip.open(tmp, "wt", encoding="utf-8") as f:
+        json.dump({"version": CASSETTE_VERSION, "service": service, "request": request, **entry}, f)
+    os.replace(tmp, path)
+    logger.debug("[cassette] recorded %s/%s", service, key)
+
+
+def _replay_delay(seconds: float) -> float:
+    return seconds / CASSETTE_SPEED if CASSETTE_SPEED > 0 else 0.0
+
+
+# ─── HTTP ──────────────────────────────────────────────────
+
+
+def _response_entry(response: httpx.Response, elapsed: float) -> dict:
+    return {
+        "method": response.request.method,
+        "url": str(response.request.url),
+        "status_code": response.status_code,
+        "content_type": response.headers.get("content-type", ""),
+        "body_b64": base64.b64encode(response.content).decode("ascii"),
+        "elapsed_ms": round(elapsed * 1000, 1),
+    }
+
+
+def _rebuild_response(entry: dict) -> httpx.Response:
+    headers = {"content-type": entry["content_type"]} if entry["content_type"] else {}
+    return httpx.Response(
+        entry["status_code"],
+        headers=headers,
+        content=base64.b64decode(entry["body_b64"]),
+        request=httpx.Request(entry["method"], entry["url"]),
+    )
+
+
+async def http_call(
+    service: str,
+    request: dict,
+    send: Callable[[], Awaitable[httpx.Response]],
+) -> httpx.Response:
+    """Run ``send()`` through the cassette layer."""
+    if CASSETTE_MODE == "replay":
+        entry = await asyncio.to_thread(load, service, request)
+        delay = _replay_delay(entry["elapsed_ms"] / 1000)
+        if delay:
+            await asyncio.sleep(delay)
+        return _rebuild_response(entry)
+
+    started = time.monotonic()
+    response = await send()
+    if CASSETTE_MODE == "record":
+        await asyncio.to_thread(save, service, request, _response_entry(response, time.monotonic() - started))
+    return response
+
+
+# ─── Claude ────────────────────────────────────────────────
+
+
+class CassetteLLMBackend:
+    """Wraps another LLM backend (see ``claude_service.get_backend``)."""
+
+    service = "claude"
+
+    def __init__(self, inner, model: str):
+        self.inner = inner
+        self.model = model
+        self.name = f"cassette:{CASSETTE_MODE}:{inner.name}"
+
+    def _request(self, kind: str, system_prompt, messages: list[dict], max_tokens: int) -> dict:
+        return {
+            "kind": kind,
+            "model": self.model,
+            "system": system_prompt,
+            "messages": messages,
+            "max_tokens": max_tokens,
+        }
+
+    async def stream(self, system_prompt, messages: list[dict], max_tokens: int):
+        request = self._request("stream", system_prompt, messages, max_tokens)
+
+        if CASSETTE_MODE == "replay":
+            entry = await asyncio.to_thread(load, self.service, request)
+            started = time.monotonic()
+            for offset_ms, text in entry["chunks"]:
+                delay = _replay_delay(offset_ms / 1000) - (time.monotonic() - started)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                yield text
+            return
+
+        started = time.monotonic()
+        chunks = []
+        async for text in self.inner.stream(system_prompt, messages, max_tokens):
+            chunks.append([round((time.monotonic() - started) * 1000, 1), text])
+            yield text
+        # Only complete streams are worth replaying
+        await asyncio.to_thread(save, self.service, request, {"chunks": chunks})
+
+    async def create(self, system_prompt, messages: list[dict], max_tokens: int) -> str:
+        request = self._request("create", system_prompt, messages, max_tokens)
+
+        if CASSETTE_MODE == "replay":
+            entry = await asyncio.to_thread(load, self.service, request)
+            delay = _replay_delay(entry["elapsed_ms"] / 1000)
+            if delay:
+                await asyncio.sleep(delay)
+            return entry["text"]
+
+        started = time.monotonic()
+        text = await self.inner.create(system_prompt, messages, max_tokens)
+        await asyncio.to_thread(save, self.service, request, {
+            "text": text,
+            "elapsed_ms": round((time.monotonic() - started) * 1000, 1),
+        })
+        return text
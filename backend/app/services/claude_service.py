@@ -1,38 +1,362 @@
+import asyncio
+import logging
+import math
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+
 import anthropic
-from app.config import ANTHROPIC_API_KEY
+from app.config import (
+    ANTHROPIC_API_KEY,
+    LLM_MAX_CONCURRENCY,
+    LLM_STREAM_CONCURRENCY,
+    LLM_BATCH_CONCURRENCY,
+    LLM_MAX_QUEUE,
+    LLM_MAX_QUEUED_PER_USER,
+    LLM_BACKGROUND_WEIGHT,
+    LLM_BACKEND,
+)
+from app.services.task_queue_service import current_task
+
+logger = logging.getLogger(__name__)
 
 client = anthropic.AsyncAnthropic(api_key=ANTHROPIC_API_KEY)
 
 MODEL = "claude-sonnet-4-20250514"
 MAX_TOKENS = 4096
 
+STREAM_LANE = "stream"
+BATCH_LANE = "batch"
+# Fair-queue key shared by calls made without a user (health checks); it gets
+# one user's share of the lane but isn't held to the per-user queue cap
+ANONYMOUS_KEY = "anonymous"
+
+
+# ─── Concurrency governor ──────────────────────────────────
+
+
+class LLMOverloaded(Exception):
+    """Raised when a lane's queue is full. ``main`` maps it to a 429."""
+
+    def __init__(self, lane: str, retry_after: int):
+        super().__init__(f"AI service is busy ({lane} queue full). Please retry shortly.")
+        self.lane = lane
+        self.retry_after = retry_after
+
+
+class _Lane:
+    def __init__(self, name: str, limit: int, max_queue: int):
+        self.name = name
+        self.limit = limit
+        self.max_queue = max_queue
+        self.active = 0
+        self.queued = 0
+        # user key → FIFO of (future, weight, enqueued_at)
+        self.waiting: dict[str, deque] = {}
+        # Start-time fair queueing: each waiting user carries a virtual time
+        # that advances by 1/weight per grant; the lowest goes next.
+        self.vtime: dict[str, float] = {}
+        self.clock = 0.0
+        self.admitted = 0
+        self.rejected = 0
+        self.wait_total = 0.0
+        self.avg_hold = 5.0  # EWMA of seconds a slot is held
+
+
+class LLMGovernor:
+    """Caps concurrent Claude calls and queues the rest fairly per user.
+
+    Each lane has its own concurrency limit and queue; all lanes share the
+    global cap. Lanes are dispatched in declaration order, so interactive
+    streams get freed slots first, while the batch lane's own limit keeps it
+    from being starved (global cap > stream limit).
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        lanes: dict[str, int],
+        max_queue: int,
+        max_queued_per_user: int,
+    ):
+        self.max_concurrency = max_concurrency
+        self.max_queued_per_user = max_queued_per_user
+        self.active = 0
+        self.lanes = {name: _Lane(name, limit, max_queue) for name, limit in lanes.items()}
+
+    def _has_capacity(self, lane: _Lane) -> bool:
+        return lane.active < lane.limit and self.active < self.max_concurrency
+
+    def _retry_after(self, lane: _Lane) -> int:
+        seconds = (lane.queued + 1) / max(lane.limit, 1) * lane.avg_hold
+        return max(1, min(60, math.ceil(seconds)))
+
+    def check(self, lane_name: str, user_key: str | None) -> None:
+        """Raise ``LLMOverloaded`` if a new request would be rejected.
+
+        Routes call this before opening an SSE response so an overloaded
+        queue becomes a real 429 rather than an error event mid-stream.
+        Keyless requests are only limited by the lane's queue depth.
+        """
+        lane = self.lanes[lane_name]
+        if self._has_capacity(lane) and not lane.queued:
+            return
+        user_queue = lane.waiting.get(user_key) if user_key else None
+        if lane.queued >= lane.max_queue or (
+            user_queue is not None and len(user_queue) >= self.max_queued_per_user
+        ):
+            lane.rejected += 1
+            raise LLMOverloaded(lane_name, self._retry_after(lane))
+
+    def _grant(self, lane: _Lane) -> None:
+        lane.active += 1
+        lane.admitted += 1
+        self.active += 1
+
+    def _dispatch(self) -> None:
+        for lane in self.lanes.values():
+            while lane.queued and self._has_capacity(lane):
+                user_key = min(lane.waiting, key=lane.vtime.__getitem__)
+                queue = lane.waiting[user_key]
+                fut, weight, enqueued_at = queue.popleft()
+                lane.queued -= 1
+                lane.clock = lane.vtime[user_key]
+                lane.vtime[user_key] += 1.0 / weight
+                if not queue:
+                    del lane.waiting[user_key]
+                    del lane.vtime[user_key]
+                if fut.done():  # waiter gave up
+                    continue
+                lane.wait_total += time.monotonic() - enqueued_at
+                self._grant(lane)
+                fut.set_result(None)
+
+    def _release(self, lane: _Lane, held: float) -> None:
+        lane.active -= 1
+        self.active -= 1
+        lane.avg_hold = 0.9 * lane.avg_hold + 0.1 * held
+        self._dispatch()
+
+    async def _acquire(self, lane: _Lane, user_key: str | None, weight: float) -> None:
+        if self._has_capacity(lane) and not lane.queued:
+            self._grant(lane)
+            return
+
+        self.check(lane.name, user_key)
+        user_key = user_key or ANONYMOUS_KEY
+        fut = asyncio.get_running_loop().create_future()
+        if user_key not in lane.waiting:
+            lane.waiting[user_key] = deque()
+            lane.vtime[user_key] = lane.clock
+        lane.waiting[user_key].append((fut, weight, time.monotonic()))
+        lane.queued += 1
+        try:
+            await fut
+        except asyncio.CancelledError:
+            if fut.done() and not fut.cancelled():
+                # Granted just as we were cancelled — hand the slot back
+                self._release(lane, 0.0)
+            else:
+                self._forget(lane, user_key, fut)
+            raise
+
+    def _forget(self, lane: _Lane, user_key: str, fut) -> None:
+        queue = lane.waiting.get(user_key)
+        if not queue:
+            return
+        for entry in queue:
+            if entry[0] is fut:
+                queue.remove(entry)
+                lane.queued -= 1
+                break
+        if not queue:
+            del lane.waiting[user_key]
+            del lane.vtime[user_key]
+
+    @asynccontextmanager
+    async def slot(self, lane_name: str, user_key: str | None = None, weight: float = 1.0):
+        """Hold one upstream slot for the duration of the block.
+
+        Pass the user the call is made for: it is their fair-queueing key
+        and per-user queue cap. Keyless calls share ``ANONYMOUS_KEY``.
+        ``weight`` is the call's share of the lane against other keys' calls
+        (below 1 for background work).
+        """
+        lane = self.lanes[lane_name]
+        await self._acquire(lane, user_key, weight)
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self._release(lane, time.monotonic() - started)
+
+    def stats(self) -> dict:
+        return {
+            "active": self.active,
+            "max_concurrency": self.max_concurrency,
+            "lanes": {
+                name: {
+                    "active": lane.active,
+                    "limit": lane.limit,
+                    "queued": lane.queued,
+                    "max_queue": lane.max_queue,
+                    "waiting_users": len(lane.waiting),
+                    "admitted": lane.admitted,
+                    "rejected": lane.rejected,
+                    "avg_wait_ms": round(
+                        lane.wait_total / lane.admitted * 1000, 1
+                    ) if lane.admitted else 0.0,
+                    "avg_hold_s": round(lane.avg_hold, 2),
+                }
+                for name, lane in self.lanes.items()
+            },
+        }
 
-async def stream_chat_response(system_prompt: str, messages: list[dict]):
+
+governor = LLMGovernor(
+    max_concurrency=LLM_MAX_CONCURRENCY,
+    lanes={STREAM_LANE: LLM_STREAM_CONCURRENCY, BATCH_LANE: LLM_BATCH_CONCURRENCY},
+    max_queue=LLM_MAX_QUEUE,
+    max_queued_per_user=LLM_MAX_QUEUED_PER_USER,
+)
+
+# Running token totals for this process, including prompt-cache hits.
+_usage_totals = {
+    "requests": 0,
+    "input_tokens": 0,
+    "output_tokens": 0,
+    "cache_read_input_tokens": 0,
+    "cache_creation_input_tokens": 0,
+}
+
+
+def _record_usage(usage) -> None:
+    if usage is None:
+        return
+    _usage_totals["requests"] += 1
+    for key in (
+        "input_tokens",
+        "output_tokens",
+        "cache_read_input_tokens",
+        "cache_creation_input_tokens",
+    ):
+        _usage_totals[key] += getattr(usage, key, None) or 0
+    logger.debug(
+        "[claude] in=%s out=%s cache_read=%s cache_write=%s",
+        usage.input_tokens,
+        usage.output_tokens,
+        getattr(usage, "cache_read_input_tokens", None),
+        getattr(usage, "cache_creation_input_tokens", None),
+    )
+
+
+def get_usage_stats() -> dict:
+    """Token totals since process start, with the prompt-cache hit ratio."""
+    stats = dict(_usage_totals)
+    prompt_tokens = (
+        stats["input_tokens"]
+        + stats["cache_read_input_tokens"]
+        + stats["cache_creation_input_tokens"]
+    )
+    stats["cache_hit_ratio"] = (
+        round(stats["cache_read_input_tokens"] / prompt_tokens, 4) if prompt_tokens else 0.0
+    )
+    return stats
+
+
+# ─── Backends ──────────────────────────────────────────────
+# A backend exposes ``stream(...)`` (async iterator of text chunks) and
+# ``create(...)`` (full text), and reports usage via ``_record_usage``.
+# LLM_BACKEND=fake swaps in the offline fake (see fake_llm_service) so the
+# chat / interview / resume / ATS flows run with no network; CASSETTE_MODE
+# wraps whichever backend is active to record or replay its traffic.
+
+
+def _request_kwargs(system_prompt, messages: list[dict], max_tokens: int) -> dict:
+    kwargs = {"model": MODEL, "max_tokens": max_tokens, "messages": messages}
+    if system_prompt:
+        kwargs["system"] = system_prompt
+    return kwargs
+
+
+class AnthropicBackend:
+    name = "anthropic"
+
+    async def stream(self, system_prompt, messages: list[dict], max_tokens: int = MAX_TOKENS):
+        async with client.messages.stream(
+            **_request_kwargs(system_prompt, messages, max_tokens)
+        ) as stream:
+            async for text in stream.text_stream:
+                yield text
+            final = await stream.get_final_message()
+            _record_usage(final.usage)
+
+    async def create(self, system_prompt, messages: list[dict], max_tokens: int = MAX_TOKENS) -> str:
+        response = await client.messages.create(
+            **_request_kwargs(system_prompt, messages, max_tokens)
+        )
+        _record_usage(response.usage)
+        return response.content[0].text
+
+
+_backend = None
+
+
+def get_backend():
+    global _backend
+    if _backend is None:
+        if LLM_BACKEND == "fake":
+            from app.services.fake_llm_service import FakeLLMBackend
+            _backend = FakeLLMBackend()
+        else:
+            _backend = AnthropicBackend()
+
+        from app.services import cassette_service
+        if cassette_service.enabled():
+            _backend = cassette_service.CassetteLLMBackend(_backend, MODEL)
+        logger.info("[claude] using %s backend", _backend.name)
+    return _backend
+
+
+def set_backend(backend) -> None:
+    """Swap the backend at runtime (tests, load-test harnesses)."""
+    global _backend
+    _backend = backend
+
+
+async def stream_chat_response(
+    system_prompt: str | list[dict],
+    messages: list[dict],
+    user_id: str | None = None,
+    max_tokens: int = MAX_TOKENS,
+):
     """Stream Claude's response as an async generator yielding text chunks.
 
     Args:
-        system_prompt: The system prompt with user context
+        system_prompt: The system prompt — a string, or a list of text blocks
+            where the session-constant prefix carries ``cache_control`` (see
+            ``prompts._system_blocks``)
         messages: List of {"role": "user"|"assistant", "content": "..."} dicts
+        user_id: Fair-queueing key for the streaming lane
     """
-    async with client.messages.stream(
-        model=MODEL,
-        max_tokens=MAX_TOKENS,
-        system=system_prompt,
-        messages=messages,
-    ) as stream:
-        async for text in stream.text_stream:
+    async with governor.slot(STREAM_LANE, user_id):
+        async for text in get_backend().stream(system_prompt, messages, max_tokens):
             yield text
 
 
-async def get_chat_response(system_prompt: str, messages: list[dict]) -> str:
+async def get_chat_response(
+    system_prompt: str | list[dict] | None,
+    messages: list[dict],
+    user_id: str | None = None,
+    max_tokens: int = MAX_TOKENS,
+) -> str:
     """Get a complete (non-streaming) response from Claude.
 
-    Used for structured JSON responses like ATS scoring.
+    Used for structured JSON responses like ATS scoring. Runs in the batch
+    lane so it never competes with interactive streams for their slots.
+    Calls from a background task queue at ``LLM_BACKGROUND_WEIGHT``, so
+    users with reports being generated yield to users waiting on a reply.
     """
-    response = await client.messages.create(
-        model=MODEL,
-        max_tokens=MAX_TOKENS,
-        system=system_prompt,
-        messages=messages,
-    )
-    return response.content[0].text
+    weight = LLM_BACKGROUND_WEIGHT if current_task() else 1.0
+    async with governor.slot(BATCH_LANE, user_id, weight):
+        return await get_backend().create(system_prompt, messages, max_tokens)
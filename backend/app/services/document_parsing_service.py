@@ -1,16 +1,16 @@
 """Parse PDF documents (resumes/CVs) and extract structured profile data using Claude."""
 
-import io
 import json
 import logging
 
-import pdfplumber
-
-from app.services.claude_service import get_chat_response
+from app.services.claude_service import MODEL, get_chat_response
+from app.services.llm_cache_service import prompt_version
+from app.services.text_extraction_service import EXTRACTOR_VERSION, extract_document
 
 logger = logging.getLogger(__name__)
 
 MAX_PAGES = 50
+MAX_TEXT_CHARS = 30000
 
 EXTRACTION_SYSTEM_PROMPT = """You are an expert document parser specialising in resumes, CVs, and professional documents.
 
@@ -61,18 +61,8 @@ Rules:
 - Extract phone numbers and emails only if clearly present; do not include them in the output (they are managed separately).
 - Be thorough — extract every piece of relevant information you can find."""
 
-
-async def extract_text_from_pdf(file_bytes: bytes) -> str:
-    """Extract text content from a PDF file."""
-    text_parts = []
-    with pdfplumber.open(io.BytesIO(file_bytes)) as pdf:
-        if len(pdf.pages) > MAX_PAGES:
-            raise ValueError(f"PDF has {len(pdf.pages)} pages. Maximum allowed is {MAX_PAGES}.")
-        for page in pdf.pages:
-            page_text = page.extract_text()
-            if page_text:
-                text_parts.append(page_text)
-    return "\n\n".join(text_parts)
+# Key for stored parses — editing the prompt, model or limits retires them
+PARSE_VERSION = prompt_version(EXTRACTION_SYSTEM_PROMPT, MODEL, EXTRACTOR_VERSION, f"{MAX_PAGES}/{MAX_TEXT_CHARS}")
 
 
 def _clean_json_response(raw: str) -> str:
@@ -87,11 +77,12 @@ def _clean_json_response(raw: str) -> str:
     return cleaned
 
 
-async def parse_document(file_bytes: bytes) -> dict:
+async def parse_document(file_bytes: bytes, user_id: str | None = None) -> dict:
     """Parse a PDF document and extract structured profile data.
 
     Args:
         file_bytes: Raw bytes of the PDF file.
+        user_id: Fair-queueing key for the Claude call
 
     Returns:
         Dictionary of extracted profile fields.
@@ -101,13 +92,16 @@ async def parse_document(file_bytes: bytes) -> dict:
         json.JSONDecodeError: If Claude's response is not valid JSON.
     """
     # 1. Extract text
-    text = await extract_text_from_pdf(file_bytes)
+    doc = await extract_document(file_bytes, "pdf")
+    if doc["page_count"] > MAX_PAGES:
+        raise ValueError(f"PDF has {doc['page_count']} pages. Maximum allowed is {MAX_PAGES}.")
+    text = "\n\n".join(page for page in doc["pages"] if page)
     if not text.strip():
         raise ValueError("Could not extract any text from the uploaded PDF. The file may be scanned or image-based.")
 
     # Truncate very long documents to stay within token limits
-    if len(text) > 30000:
-        text = text[:30000] + "\n\n[Document truncated due to length]"
+    if len(text) > MAX_TEXT_CHARS:
+        text = text[:MAX_TEXT_CHARS] + "\n\n[Document truncated due to length]"
 
     # 2. Send to Claude for structured extraction
     messages = [
@@ -117,7 +111,7 @@ async def parse_document(file_bytes: bytes) -> dict:
         }
     ]
 
-    response = await get_chat_response(EXTRACTION_SYSTEM_PROMPT, messages)
+    response = await get_chat_response(EXTRACTION_SYSTEM_PROMPT, messages, user_id=user_id)
 
     # 3. Parse JSON response
     cleaned = _clean_json_response(response)
@@ -0,0 +1,422 @@
+"""Deterministic offline stand-in for Claude (``LLM_BACKEND=fake``).
+
+Recognises which flow is calling from the system prompt / request text and
+returns a canned response for it. The responses carry the same tags the real
+prompts ask for — ``<options>``, ``<progress>``, ``<analysis_json>`` /
+``<analysis_markdown>`` / ``<roadmap_json>``, ``<resume_json>``,
+``<interview_meta>`` / ``<interview_complete>`` — so the SSE routes, parsers
+and DB writes do exactly what they would against the real API.
+
+Streaming is paced like the real thing: ``FAKE_LLM_FIRST_TOKEN_MS`` before
+the first chunk, then roughly one token per chunk at
+``FAKE_LLM_TOKENS_PER_SECOND`` (0 disables the delay). Output depends only
+on the request, never on randomness or wall-clock time.
+
+``FAKE_LLM_RESPONSES_FILE`` may point at a JSON object mapping scenario name
+to a string or a list of strings (picked by turn number) to replace the
+built-in responses, e.g. with transcripts recorded from production.
+"""
+
+import asyncio
+import json
+import logging
+import re
+from types import SimpleNamespace
+
+from app.config import (
+    FAKE_LLM_TOKENS_PER_SECOND,
+    FAKE_LLM_FIRST_TOKEN_MS,
+    FAKE_LLM_RESPONSES_FILE,
+)
+from app.prompts import system_prompt_text
+from app.services.claude_service import MAX_TOKENS, _record_usage
+
+logger = logging.getLogger(__name__)
+
+CHAT_QUESTIONS_BEFORE_ANALYSIS = 4
+RESUME_QUESTIONS_BEFORE_JSON = 4
+INTERVIEW_QUESTIONS = 10
+
+_CHUNK_PATTERN = re.compile(r"\S+\s*|\s+")
+
+
+def _estimate_tokens(text: str) -> int:
+    return max(1, len(text) // 4)
+
+
+# ─── Canned responses ──────────────────────────────────────
+
+_CHAT_QUESTIONS = [
+    "Thanks for sharing that! To start, which subjects do you enjoy the most in school or college?",
+    "That's helpful. When you have free time, what kind of activities make you lose track of time?",
+    "Great. Do you prefer working with people, with data and ideas, or with your hands on practical things?",
+    "Understood. Where do you see yourself in five years — what would a good day at work look like?",
+]
+
+_CHAT_OPTIONS = [
+    ["Science & Maths", "Commerce & Economics", "Arts & Languages", "Computers", "Something else / I'll type my own"],
+    ["Building or fixing things", "Reading and writing", "Sports", "Helping others", "Something else / I'll type my own"],
+    ["People", "Data and ideas", "Hands-on work", "A mix of these", "Something else / I'll type my own"],
+    ["Leading a team", "Solving technical problems", "Creating something new", "Not sure yet", "Something else / I'll type my own"],
+]
+
+_ANALYSIS_JSON = {
+    "top_careers": [
+        {"title": "Software Developer", "match_score": 86, "reason": "Enjoys logical problem solving and building things."},
+        {"title": "Data Analyst", "match_score": 78, "reason": "Comfortable with numbers and spotting patterns."},
+        {"title": "Product Designer", "match_score": 71, "reason": "Likes creating things that people use."},
+    ],
+    "strengths_identified": ["Analytical thinking", "Curiosity", "Persistence"],
+    "areas_to_develop": ["Public speaking", "Time management"],
+    "personality_traits": ["Introspective", "Methodical", "Creative"],
+    "education_recommendations": ["B.Tech / BCA in Computer Science", "Online courses in Python and SQL"],
+}
+
+_ROADMAP_JSON = {
+    "steps": [
+        {"order": 1, "title": "Learn the basics of programming", "description": "Complete an introductory Python course.", "timeline": "Next 3 months"},
+        {"order": 2, "title": "Build two small projects", "description": "Publish them on GitHub.", "timeline": "3-6 months"},
+        {"order": 3, "title": "Apply for an internship", "description": "Target startups and college placement drives.", "timeline": "6-12 months"},
+    ]
+}
+
+_ANALYSIS_RESPONSE = (
+    "Thank you for answering all my questions! Here is your personalised career analysis.\n\n"
+    f'<progress>{{"percent": 100, "remaining_estimate": 0, "status": "ready"}}</progress>\n\n'
+    f"<analysis_json>\n{json.dumps(_ANALYSIS_JSON, indent=2)}\n</analysis_json>\n\n"
+    "<analysis_markdown>\n## Your Career Analysis\n\n"
+    "### Top Career Recommendations\n"
+    "1. **Software Developer** — you enjoy logical problem solving.\n"
+    "2. **Data Analyst** — you are comfortable with numbers.\n"
+    "3. **Product Designer** — you like creating useful things.\n\n"
+    "### Your Key Strengths\n- Analytical thinking\n- Curiosity\n- Persistence\n\n"
+    "### Areas for Growth\n- Public speaking\n- Time management\n\n"
+    "### Recommended Next Steps\n- Start an introductory Python course this month.\n"
+    "</analysis_markdown>\n\n"
+    f"<roadmap_json>\n{json.dumps(_ROADMAP_JSON, indent=2)}\n</roadmap_json>"
+)
+
+_RESUME_QUESTIONS = [
+    "Let's build your resume! What is your full name, email and phone number?",
+    "Thanks! Tell me about your education — degree, institution, year and CGPA.",
+    "Great. Do you have any internships, jobs or projects you'd like to include?",
+    "Almost done. Which technical and soft skills should we highlight?",
+]
+
+_RESUME_JSON = {
+    "personal_info": {
+        "name": "Aarav Sharma",
+        "email": "aarav.sharma@example.com",
+        "phone": "+91 98765 43210",
+        "location": "Pune, Maharashtra",
+        "linkedin": None,
+        "portfolio": None,
+        "github": None,
+    },
+    "objective": "Computer Science graduate seeking a software developer role where I can apply strong fundamentals in Python and web development to build reliable products.",
+    "education": [
+        {
+            "degree": "B.Tech",
+            "institution": "Pune Institute of Technology",
+            "year": "2021 - 2025",
+            "grade": "CGPA: 8.2/10",
+            "board": None,
+            "stream": "Computer Science",
+        }
+    ],
+    "experience": [
+        {
+            "title": "Software Intern",
+            "company": "Acme Technologies",
+            "duration": "May 2024 - Jul 2024",
+            "location": "Pune",
+            "bullets": [
+                "Developed 3 REST endpoints in FastAPI used by 2,000+ daily users",
+                "Reduced report generation time by 40% by caching database queries",
+            ],
+        }
+    ],
+    "projects": [
+        {
+            "name": "Campus Events App",
+            "description": "Event discovery app for college clubs",
+            "tech_stack": ["React", "Node.js", "MongoDB"],
+            "bullets": ["Built and launched to 500+ students in the first month"],
+        }
+    ],
+    "skills": {
+        "technical": ["Python", "JavaScript", "SQL", "FastAPI", "React"],
+        "soft": ["Communication", "Teamwork"],
+        "languages": ["English", "Hindi", "Marathi"],
+        "tools": ["Git", "Docker", "VS Code"],
+    },
+    "achievements": ["Winner, college hackathon 2023"],
+    "certifications": [
+        {"name": "Python for Everybody", "issuer": "Coursera", "year": "2023"}
+    ],
+}
+
+_RESUME_RESPONSE = (
+    f"<resume_json>\n{json.dumps(_RESUME_JSON, indent=2)}\n</resume_json>\n\n"
+    "Your resume is ready! You can preview it and choose a template to download as PDF."
+)
+
+_INTERVIEW_TOPICS = [
+    "introduction", "motivation", "strengths", "teamwork", "conflict",
+    "technical depth", "problem solving", "failure", "leadership", "career goals",
+]
+
+_INTERVIEW_REPORT = {
+    "overall_score": 68,
+    "verdict": "almost_ready",
+    "verdict_label": "Almost There",
+    "verdict_description": "The candidate communicated clearly and gave relevant examples, but answers lacked quantified impact.",
+    "scores": {
+        "confidence": 70, "clarity": 72, "structure": 64,
+        "persuasiveness": 60, "pace": 75, "domain_knowledge": 66,
+    },
+    "filler_analysis": {
+        "total_fillers": 6,
+        "fillers_per_minute": 0.8,
+        "breakdown": [{"word": "um", "count": 4}, {"word": "like", "count": 2}],
+    },
+    "communication_metrics": {
+        "avg_answer_length_words": 62,
+        "vocabulary_richness": "moderate",
+        "stammering_frequency": "low",
+        "stammering_details": "Occasional restarts at the beginning of answers.",
+    },
+    "question_breakdown": [
+        {
+            "question_number": 1,
+            "question": "Tell me about yourself.",
+            "answer_summary": "Covered education and one internship.",
+            "score": 70,
+            "feedback": "Good structure; add a closing line tying back to the role.",
+            "better_phrasing": "I'm a CS graduate who ships reliable backend features...",
+        }
+    ],
+    "improvement_plan": [
+        {"priority": 1, "area": "Quantify impact", "action": "Add one metric to every example answer."},
+        {"priority": 2, "area": "Structure", "action": "Practise the STAR method on five common questions."},
+        {"priority": 3, "area": "Fillers", "action": "Record yourself and pause instead of saying 'um'."},
+    ],
+}
+
+_ATS_GRADES = {
+    "grades": {
+        "hard_skills": "B",
+        "soft_skills": "B",
+        "experience_relevance": "C",
+        "job_title_alignment": "B",
+        "content_quality": "B",
+        "action_language": "A",
+    },
+    "matched_keywords": ["Python", "SQL", "REST APIs", "Git", "React"],
+    "missing_keywords": ["Docker", "CI/CD", "Unit testing"],
+    "top_suggestions": [
+        "Add metrics to every internship bullet",
+        "Mention testing and deployment tools you have used",
+        "Tailor the objective to the target role",
+    ],
+}
+
+_ATS_SECTION_GRADE = {
+    # Graders ignore the categories a section isn't asked about
+    "grades": {key: "B" for key in _ATS_GRADES["grades"]},
+    "matched_keywords": ["Python", "SQL"],
+    "missing_keywords": ["Docker"],
+    "suggestion": "Quantify the impact of each bullet",
+}
+
+_PROFILE_EXTRACTION = {
+    "date_of_birth": None, "gender": None, "city": "Pune", "state": "Maharashtra",
+    "pin_code": None, "education_level": "Undergraduate", "class_or_year": "4th Year",
+    "institution": "Pune Institute of Technology", "board": None,
+    "stream": "Computer Science", "cgpa": "8.2", "hobbies": ["Chess"],
+    "interests": ["Web development"], "strengths": ["Problem solving"],
+    "weaknesses": None, "languages": ["English", "Hindi"],
+    "career_aspiration_raw": "Software developer", "linkedin_url": None,
+    "portfolio_url": None, "github_url": None,
+    "summary": "Final-year CS student interested in backend development.",
+    "skills": ["Python", "SQL", "React"], "achievements": ["Hackathon winner"],
+    "extracurriculars": None,
+    "work_experience": [
+        {"company": "Acme Technologies", "role": "Software Intern", "duration": "3 months", "description": "Built REST APIs."}
+    ],
+    "projects": None, "certifications": None,
+}
+
+_SUMMARY = (
+    "The student discussed their interest in technology and problem solving, "
+    "showed strength in analytical thinking, and is considering software "
+    "development and data analysis as career paths."
+)
+
+_CANNED = {
+    "career_chat_question": _CHAT_QUESTIONS,
+    "career_chat_analysis": _ANALYSIS_RESPONSE,
+    "resume_chat_question": _RESUME_QUESTIONS,
+    "resume_chat_json": _RESUME_RESPONSE,
+    "mentorship_chat": (
+        "I understand — figuring out the next step can feel overwhelming. Based on your "
+        "profile, a good place to start is a Career Guidance session, and Rahul Verma "
+        "would be a great mentor to talk to about technical skills."
+    ),
+    "interview_report": json.dumps(_INTERVIEW_REPORT),
+    "ats_score": json.dumps(_ATS_GRADES),
+    "ats_section": json.dumps(_ATS_SECTION_GRADE),
+    "resume_parse": json.dumps(_RESUME_JSON),
+    "profile_extraction": json.dumps(_PROFILE_EXTRACTION),
+    "field_optimize": "Developed and shipped 3 production REST APIs serving 2,000+ daily users",
+    "summary": _SUMMARY,
+    "default": "OK",
+}
+
+
+def _load_overrides() -> dict:
+    if not FAKE_LLM_RESPONSES_FILE:
+        return {}
+    try:
+        with open(FAKE_LLM_RESPONSES_FILE, encoding="utf-8") as f:
+            overrides = json.load(f)
+        logger.info("[fake-llm] loaded %d scenario overrides", len(overrides))
+        return overrides
+    except (OSError, json.JSONDecodeError) as e:
+        logger.error("[fake-llm] could not load %s: %s", FAKE_LLM_RESPONSES_FILE, e)
+        return {}
+
+
+class FakeLLMBackend:
+    name = "fake"
+
+    def __init__(
+        self,
+        tokens_per_second: float = FAKE_LLM_TOKENS_PER_SECOND,
+        first_token_ms: int = FAKE_LLM_FIRST_TOKEN_MS,
+        responses: dict | None = None,
+    ):
+        self.tokens_per_second = tokens_per_second
+        self.first_token_ms = first_token_ms
+        self.responses = {**_CANNED, **(responses if responses is not None else _load_overrides())}
+
+    # ── Scenario selection ──
+
+    def _pick(self, scenario: str, turn: int = 0) -> str:
+        response = self.responses.get(scenario, self.responses["default"])
+        if isinstance(response, list):
+            return response[turn % len(response)]
+        return response
+
+    def respond(self, system_prompt, messages: list[dict]) -> str:
+        """Build the full response text for a request."""
+        system = system_prompt_text(system_prompt or "")
+        last_user = next(
+            (m["content"] for m in reversed(messages) if m["role"] == "user"), ""
+        )
+        if not isinstance(last_user, str):
+            last_user = ""
+        turn = sum(1 for m in messages if m["role"] == "assistant")
+        forced = "## IMPORTANT INSTRUCTION" in system
+
+        if "AI Career Counselor" in system:
+            if forced or turn >= CHAT_QUESTIONS_BEFORE_ANALYSIS:
+                return self._pick("career_chat_analysis")
+            question = self._pick("career_chat_question", turn)
+            options = _CHAT_OPTIONS[turn % len(_CHAT_OPTIONS)]
+            percent = min(90, 20 * (turn + 1))
+            progress = {
+                "percent": percent,
+                "remaining_estimate": CHAT_QUESTIONS_BEFORE_ANALYSIS - turn,
+                "status": "on_track",
+            }
+            return (
+                f"{question}\n\n<options>{json.dumps(options)}</options>\n"
+                f"<progress>{json.dumps(progress)}</progress>"
+            )
+
+        if "AI Resume Builder" in system:
+            if forced or turn >= RESUME_QUESTIONS_BEFORE_JSON:
+                return self._pick("resume_chat_json")
+            return self._pick("resume_chat_question", turn)
+
+        if "senior HR interviewer" in system:
+            return self._interview_turn(turn)
+
+        if "mentorship assistant" in system:
+            return self._pick("mentorship_chat", turn)
+
+        if "interview analyst" in system:
+            return self._pick("interview_report")
+        if "ATS section grader" in system:
+            return self._pick("ats_section")
+        if "ATS (Applicant Tracking System) resume analyzer" in system:
+            return self._pick("ats_score")
+        if "precise resume parser" in system:
+            return self._pick("resume_parse")
+        if "document parser" in system:
+            return self._pick("profile_extraction")
+        if "Enhance this resume" in system:
+            # The enhancer must keep the same structure — echo the input JSON
+            brace = last_user.find("{")
+            return last_user[brace:] if brace >= 0 else self._pick("resume_parse")
+        if "resume writer" in system:
+            return self._pick("field_optimize")
+        if re.search(r"\b(Summarize|Condense|Merge the new turns)\b", last_user) or "condense" in system:
+            return self._pick("summary")
+        return self._pick("default", turn)
+
+    def _interview_turn(self, turn: int) -> str:
+        if "interview_question" in self.responses:
+            return self._pick("interview_question", turn)
+        if turn >= INTERVIEW_QUESTIONS:
+            return (
+                "Thank you for your time. That concludes our interview. Your detailed "
+                "performance report will be generated now.\n"
+                "<interview_complete>true</interview_complete>"
+            )
+        topic = _INTERVIEW_TOPICS[turn % len(_INTERVIEW_TOPICS)]
+        meta = {
+            "question_number": turn + 1,
+            "estimated_remaining": INTERVIEW_QUESTIONS - turn - 1,
+            "is_follow_up": turn % 3 == 2,
+            "topic": topic,
+        }
+        opener = "Good afternoon, and welcome. " if turn == 0 else "Thank you. "
+        return (
+            f"{opener}Let's talk about {topic}. Can you walk me through a specific "
+            f"example from your experience that shows this?\n"
+            f"<interview_meta>{json.dumps(meta)}</interview_meta>"
+        )
+
+    # ── Backend interface ──
+
+    def _record(self, system_prompt, messages: list[dict], text: str) -> None:
+        prompt_text = system_prompt_text(system_prompt or "") + "".join(
+            m["content"] for m in messages if isinstance(m.get("content"), str)
+        )
+        _record_usage(SimpleNamespace(
+            input_tokens=_estimate_tokens(prompt_text),
+            output_tokens=_estimate_tokens(text),
+        ))
+
+    async def stream(self, system_prompt, messages: list[dict], max_tokens: int = MAX_TOKENS):
+        text = self.respond(system_prompt, messages)
+        if self.first_token_ms:
+            await asyncio.sleep(self.first_token_ms / 1000)
+        delay = 1 / self.tokens_per_second if self.tokens_per_second > 0 else 0
+        for chunk in _CHUNK_PATTERN.findall(text):
+            yield chunk
+            if delay:
+                await asyncio.sleep(delay)
+        self._record(system_prompt, messages, text)
+
+    async def create(self, system_prompt, messages: list[dict], max_tokens: int = MAX_TOKENS) -> str:
+        text = self.respond(system_prompt, messages)
+        latency = self.first_token_ms / 1000
+        if self.tokens_per_second > 0:
+            latency += _estimate_tokens(text) / self.tokens_per_second
+        if latency:
+            await asyncio.sleep(latency)
+        self._record(system_prompt, messages, text)
+        return text
@@ -0,0 +1,229 @@
+"""Token-budgeted conversation history for the chat-style routes.
+
+Instead of replaying the full transcript every turn, each session keeps a
+running ``history_summary`` on its row plus ``history_summarized_through``
+(the ``message_order`` of the last message folded into it). A turn sends:
+
+    system prompt + "earlier in this conversation" summary block
+    + every message after ``history_summarized_through``
+
+trimmed to ``HISTORY_TOKEN_BUDGET`` while always keeping the last
+``HISTORY_KEEP_TURNS`` turns verbatim. Once the unsummarized tail grows past
+half the budget, the route enqueues a ``history.compact`` task that folds
+everything but the last N turns into the summary, so trimming only bites if
+the worker falls behind.
+
+Token counts use a local estimate (~4 chars per token) — no API round-trip.
+"""
+
+import logging
+
+from sqlalchemy.orm import Session
+
+from app.config import HISTORY_TOKEN_BUDGET, HISTORY_KEEP_TURNS
+from app.database import async_session_scope
+from app.models import (
+    ChatSession,
+    Message,
+    InterviewSession,
+    InterviewMessage,
+    ResumeSession,
+    ResumeMessage,
+)
+from app.prompts import HISTORY_SUMMARY_PROMPT
+from app.services.claude_service import get_chat_response
+from app.services.task_queue_service import task_handler, make_task
+
+logger = logging.getLogger(__name__)
+
+CHARS_PER_TOKEN = 4
+MESSAGE_OVERHEAD_TOKENS = 4  # role markers / separators per message
+
+# kind → (session model, message model, Claude role for each stored role,
+#         speaker labels used when summarizing)
+_KINDS = {
+    "chat": (
+        ChatSession, Message,
+        {"user": "user", "assistant": "assistant"},
+        {"user": "Student", "assistant": "Counselor"},
+    ),
+    "resume": (
+        ResumeSession, ResumeMessage,
+        {"user": "user", "assistant": "assistant"},
+        {"user": "Student", "assistant": "Resume Assistant"},
+    ),
+    "interview": (
+        InterviewSession, InterviewMessage,
+        {"candidate": "user", "interviewer": "assistant"},
+        {"candidate": "Candidate", "interviewer": "Interviewer"},
+    ),
+}
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count for ``text`` (errs slightly high for English)."""
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def estimate_history_tokens(messages: list[dict]) -> int:
+    return sum(estimate_tokens(m["content"]) + MESSAGE_OVERHEAD_TOKENS for m in messages)
+
+
+def unsummarized_history(kind: str, session, messages) -> list[dict]:
+    """Map stored message rows after the summary cut-off to Claude's format."""
+    roles = _KINDS[kind][2]
+    through = session.history_summarized_through or 0
+    return [
+        {"role": roles[m.role], "content": m.content}
+        for m in messages
+        if m.message_order > through
+    ]
+
+
+def fit_history(
+    messages: list[dict],
+    budget: int = HISTORY_TOKEN_BUDGET,
+    keep_turns: int = HISTORY_KEEP_TURNS,
+) -> list[dict]:
+    """Drop the oldest messages until the estimate fits ``budget``.
+
+    The last ``keep_turns`` user/assistant pairs are never dropped, and the
+    result starts on a user message whenever anything was trimmed.
+    """
+    keep = keep_turns * 2
+    total = estimate_history_tokens(messages)
+    start = 0
+    while total > budget and len(messages) - start > keep:
+        total -= estimate_tokens(messages[start]["content"]) + MESSAGE_OVERHEAD_TOKENS
+        start += 1
+    if start:
+        while start < len(messages) - 1 and messages[start]["role"] != "user":
+            start += 1
+    return messages[start:]
+
+
+def needs_compaction(
+    messages: list[dict],
+    budget: int = HISTORY_TOKEN_BUDGET,
+    keep_turns: int = HISTORY_KEEP_TURNS,
+) -> bool:
+    return (
+        len(messages) > keep_turns * 2
+        and estimate_history_tokens(messages) > budget // 2
+    )
+
+
+def with_history_summary(system_prompt, history_summary: str | None):
+    """Append the running summary to the system blocks, if there is one."""
+    if not history_summary:
+        return system_prompt
+    block = {
+        "type": "text",
+        "text": (
+            "\n\n## Earlier in this conversation\n"
+            "Older turns have been condensed into this summary:\n"
+            f"{history_summary}"
+        ),
+    }
+    if isinstance(system_prompt, str):
+        return system_prompt + block["text"]
+    return [*system_prompt, block]
+
+
+def compaction_task(kind: str, session_id: str, user_id: str):
+    return make_task(
+        "history.compact", {"kind": kind, "session_id": session_id}, user_id=user_id
+    )
+
+
+# ─── Background compaction ─────────────────────────────────
+
+
+@task_handler("history.compact")
+async def _compact_history_task(payload: dict):
+    kind = payload["kind"]
+    session_id = payload["session_id"]
+    session_model, message_model, roles, labels = _KINDS[kind]
+
+    def _load(sync_db: Session):
+        session = sync_db.query(session_model).filter(session_model.id == session_id).first()
+        if not session:
+            return None
+        through = session.history_summarized_through or 0
+        rows = (
+            sync_db.query(message_model)
+            .filter(
+                message_model.session_id == session_id,
+                message_model.message_order > through,
+            )
+            .order_by(message_model.message_order.asc())
+            .all()
+        )
+        return (
+            session.user_id,
+            session.history_summary,
+            through,
+            [(m.role, m.content, m.message_order) for m in rows],
+        )
+
+    async with async_session_scope() as db:
+        loaded = await db.run_sync(_load)
+    if not loaded:
+        return
+    user_id, summary, through, rows = loaded
+
+    history = [{"role": roles[r], "content": c} for r, c, _ in rows]
+    if not needs_compaction(history):
+        return
+
+    # Fold everything except the last N turns; the kept tail starts on a
+    # user message so the request still alternates correctly.
+    cut = len(rows) - HISTORY_KEEP_TURNS * 2
+    while cut < len(rows) and roles[rows[cut][0]] != "user":
+        cut += 1
+    fold = rows[:cut]
+    if not fold:
+        return
+
+    conversation = "\n".join(f"{labels[r]}: {c}" for r, c, _ in fold)
+    user_label = next(v for k, v in labels.items() if roles[k] == "user").lower()
+    new_summary = await get_chat_response(
+        "You condense conversations faithfully.",
+        [{
+            "role": "user",
+            "content": HISTORY_SUMMARY_PROMPT.format(
+                user_label=user_label,
+                summary=summary or "(none yet)",
+                conversation=conversation,
+            ),
+        }],
+        user_id=user_id,
+    )
+    new_through = fold[-1][2]
+
+    def _save(sync_db: Session):
+        # Only apply if nobody compacted this session in the meantime
+        updated = (
+            sync_db.query(session_model)
+            .filter(
+                session_model.id == session_id,
+                session_model.history_summarized_through == through,
+            )
+            .update(
+                {
+                    session_model.history_summary: new_summary,
+                    session_model.history_summarized_through: new_through,
+                },
+                synchronize_session=False,
+            )
+        )
+        sync_db.commit()
+        return updated
+
+    async with async_session_scope() as db:
+        updated = await db.run_sync(_save)
+    if updated:
+        logger.info(
+            "[history] %s session=%s compacted %d messages (through #%d)",
+            kind, session_id[:8], len(fold), new_through,
+        )
@@ -7,6 +7,7 @@ Mirrors the design language of the career-guidance PDF (pdf_service.py).
 
 import io
 import re
+from functools import lru_cache
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.colors import HexColor
 from reportlab.lib.styles import ParagraphStyle
@@ -135,8 +136,12 @@ def _build_styles():
 
 # ── Interview-specific styles ───────────────────────────────────────────────
 
+@lru_cache(maxsize=None)
 def _interview_styles():
-    """Extend the base styles with interview-specific paragraph styles."""
+    """Extend the base styles with interview-specific paragraph styles.
+
+    Built once per process and shared by every render (read-only).
+    """
     styles = _build_styles()
 
     styles.add(ParagraphStyle(
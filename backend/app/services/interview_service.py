@@ -55,9 +55,13 @@ def clean_interview_response(text: str) -> str:
     return text.strip()
 
 
-async def stream_interview_question(system_prompt: str, messages: list[dict]):
+async def stream_interview_question(
+    system_prompt: str | list[dict],
+    messages: list[dict],
+    user_id: str | None = None,
+):
     """Stream the AI interviewer's next question."""
-    async for chunk in stream_chat_response(system_prompt, messages):
+    async for chunk in stream_chat_response(system_prompt, messages, user_id=user_id):
         yield chunk
 
 
@@ -132,7 +136,7 @@ def _validate_report(data: dict) -> dict:
     return data
 
 
-async def generate_interview_report(job_role: str, messages: list[dict]) -> dict:
+async def generate_interview_report(job_role: str, messages: list[dict], user_id: str | None = None) -> dict:
     """Generate the full interview analysis report with retry logic.
 
     Retries up to REPORT_MAX_RETRIES times on JSON parse failures.
@@ -153,6 +157,7 @@ async def generate_interview_report(job_role: str, messages: list[dict]) -> dict
             response = await get_chat_response(
                 system_prompt="You are an expert interview analyst. Output only valid JSON. No markdown, no explanation, just the JSON object.",
                 messages=[{"role": "user", "content": analysis_prompt}],
+                user_id=user_id,
             )
 
             report_data = _extract_json_from_response(response)
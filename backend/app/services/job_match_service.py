@@ -0,0 +1,242 @@
+"""Per-user job match scores, precomputed so the feed can sort by them.
+
+``compute_match_score`` used to run only for the ten jobs on the current
+page, so ``sort_by=match`` merely reordered that page. Scores now live in
+``job_match_scores`` and are recomputed in the background:
+
+- for one user across every job, when their profile changes
+  (``job_match.rescore_user``)
+- for every user across the new jobs, when a scrape batch lands
+  (``job_match.score_batch``)
+
+Every job is tokenized once per process: ``job_index`` holds a
+``JobMatrix`` of the whole table and appends only the jobs scraped since it
+last looked (jobs are never edited), so a profile rescore is just the
+sparse product.
+
+Only non-zero scores are stored; a missing row means 0, so a rescore also
+stamps ``UserProfile.match_scored_at`` to tell "scored, nothing matched"
+from "never scored". Both passes score
+through ``match_engine.JobMatrix`` (same results, one sparse product per
+block instead of a Python loop per job x profile); ``compute_match_score``
+stays for the live ``matchScore`` on each feed page.
+"""
+
+import logging
+import threading
+
+import numpy as np
+
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.orm import Session
+
+from app.database import async_session_scope
+from app.models import BackgroundTask, Job, JobMatchScore, UserProfile, utc_now
+from app.services.match_engine import JobMatrix, interest_text
+from app.services.task_queue_service import make_task, task_handler
+
+logger = logging.getLogger(__name__)
+
+# Profile fields compute_match_score reads; editing anything else doesn't rescore
+MATCH_PROFILE_FIELDS = {"city", "state", "education_level", "career_aspiration_raw", "interests"}
+
+# Rows fetched per block when indexing jobs, and profiles scored per block
+# against a scrape batch (a block's scores are held densely)
+SCORE_CHUNK_SIZE = 2000
+
+_JOB_COLUMNS = (Job.id, Job.title, Job.description, Job.city, Job.location, Job.state)
+_PROFILE_COLUMNS = (
+    UserProfile.user_id, UserProfile.city, UserProfile.state, UserProfile.education_level,
+    UserProfile.career_aspiration_raw, UserProfile.interests,
+)
+
+
+def compute_match_score(job, profile) -> int:
+    """0-100 fit of a job (anything with title, description, city, location,
+    state) for a profile."""
+    if not profile:
+        return 0
+
+    score = 0
+    text = f"{job.title or ''} {job.description or ''}"
+    text_lower = text.lower()
+
+    # Location match (30) — use normalized city for better matching
+    job_city = (job.city or "").lower()
+    job_location = (job.location or "").lower()
+    profile_city = (profile.city or "").lower()
+    profile_state = (profile.state or "").lower()
+
+    if profile_city and (profile_city in job_city or profile_city in job_location):
+        score += 30
+    elif profile_state and (
+        profile_state in (job.state or "").lower() or profile_state in job_location
+    ):
+        score += 15
+
+    # Education match (25)
+    if profile.education_level:
+        edu = profile.education_level.lower()
+        if edu in text_lower or "graduate" in text_lower or "any degree" in text_lower:
+            score += 25
+        elif "12th pass" in text_lower or "10th pass" in text_lower:
+            score += 15
+
+    # Fresher boost (20)
+    if "fresher" in text_lower or "no experience" in text_lower:
+        score += 20
+
+    # Interest match (25)
+    interests = interest_text(profile)
+    if interests:
+        words = text_lower.split()
+        matched = sum(1 for w in words if len(w) > 3 and w in interests)
+        score += min(25, matched * 5)
+
+    return min(100, score)
+
+
+# ─── Job index ─────────────────────────────────────────────
+
+
+class JobIndex:
+    """Every job in one ``JobMatrix``, kept current by appending the jobs
+    scraped since the last refresh (keyset on ``(scraped_at, id)``)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self) -> None:
+        self.matrix = JobMatrix()
+        self.scraped_at: list[str] = []  # per matrix row, for JobMatchScore
+        self._through: tuple[str, str] | None = None
+
+    def _append_new(self, sync_db: Session) -> int:
+        query = select(*_JOB_COLUMNS, Job.scraped_at).order_by(Job.scraped_at.asc(), Job.id.asc())
+        if self._through:
+            scraped_at, job_id = self._through
+            query = query.where(
+                (Job.scraped_at > scraped_at) | ((Job.scraped_at == scraped_at) & (Job.id > job_id))
+            )
+        added = 0
+        rows = sync_db.execute(query.execution_options(yield_per=SCORE_CHUNK_SIZE))
+        for chunk in rows.partitions():
+            added += self.matrix.extend(chunk)
+            self.scraped_at.extend(row.scraped_at for row in chunk)
+            self._through = (chunk[-1].scraped_at, chunk[-1].id)
+        return added
+
+    def refresh(self, sync_db: Session) -> int:
+        """Index jobs added since the last call. Returns how many."""
+        with self._lock:
+            added = self._append_new(sync_db)
+            # A job committed with an older scraped_at than one already
+            # indexed would be missed by the keyset; start over if so
+            if self.matrix.size != sync_db.scalar(select(func.count()).select_from(Job)):
+                logger.warning("[job-match] job index out of step with the table; rebuilding")
+                self._reset()
+                added = self._append_new(sync_db)
+            return added
+
+    def score(self, sync_db: Session, profiles) -> tuple[list, list, np.ndarray]:
+        """(job ids, their scraped_at, scores of ``profiles`` x every job),
+        after a refresh."""
+        self.refresh(sync_db)
+        with self._lock:
+            return list(self.matrix.ids), list(self.scraped_at), self.matrix.score(profiles)
+
+
+job_index = JobIndex()
+
+
+# ─── Bulk scoring ──────────────────────────────────────────
+
+
+def _rows(user_ids, job_ids, scraped_at, scores: np.ndarray) -> list[dict]:
+    users, jobs = np.nonzero(scores)
+    return [
+        {"user_id": user_ids[u], "job_id": job_ids[j], "scraped_at": scraped_at[j], "score": int(scores[u, j])}
+        for u, j in zip(users.tolist(), jobs.tolist())
+    ]
+
+
+def rescore_user(sync_db: Session, user_id: str) -> int:
+    """Replace one user's scores against every job. Returns rows stored."""
+    profile = sync_db.execute(select(*_PROFILE_COLUMNS).where(UserProfile.user_id == user_id)).first()
+    sync_db.execute(delete(JobMatchScore).where(JobMatchScore.user_id == user_id))
+    stored = 0
+    if profile:
+        job_ids, scraped_at, scores = job_index.score(sync_db, [profile])
+        rows = _rows([user_id], job_ids, scraped_at, scores)
+        if rows:
+            sync_db.execute(insert(JobMatchScore), rows)
+            stored = len(rows)
+        sync_db.execute(
+            update(UserProfile)
+            .where(UserProfile.user_id == user_id)
+            # Not a profile edit, so leave updated_at alone
+            .values(match_scored_at=utc_now(), updated_at=UserProfile.updated_at)
+        )
+    sync_db.commit()
+    return stored
+
+
+def score_jobs(sync_db: Session, job_ids: list[str]) -> int:
+    """Score new jobs for every user with a profile. Returns rows stored.
+
+    The jobs are tokenized once and every profile is scored against them.
+    """
+    jobs = sync_db.execute(select(*_JOB_COLUMNS, Job.scraped_at).where(Job.id.in_(job_ids))).all()
+    matrix = JobMatrix(jobs)
+    scraped_at = [job.scraped_at for job in jobs]
+    stored = 0
+    if matrix.size:
+        profiles = sync_db.execute(select(*_PROFILE_COLUMNS).execution_options(yield_per=SCORE_CHUNK_SIZE))
+        for chunk in profiles.partitions():
+            rows = _rows([p.user_id for p in chunk], matrix.ids, scraped_at, matrix.score(chunk))
+            if rows:
+                sync_db.execute(insert(JobMatchScore).prefix_with("OR REPLACE"), rows)
+                stored += len(rows)
+    sync_db.commit()
+    return stored
+
+
+def queue_rescore(db: Session, user_id: str, profile_changed: bool = True) -> bool:
+    """Add a rescore task for ``user_id`` to the caller's session, unless one
+    already covers it. Returns True if a task was added; commit, then
+    ``wake_workers()``.
+
+    A queued task always does. A running one only does when the profile
+    hasn't just changed (a backfill), since it may have read the old profile.
+    """
+    statuses = ("queued",) if profile_changed else ("queued", "running")
+    pending = db.query(BackgroundTask.id).filter(
+        BackgroundTask.kind == "job_match.rescore_user",
+        BackgroundTask.user_id == user_id,
+        BackgroundTask.status.in_(statuses),
+    ).first()
+    if pending:
+        return False
+    db.add(make_task("job_match.rescore_user", {"user_id": user_id}, user_id=user_id))
+    return True
+
+
+@task_handler("job_match.rescore_user")
+async def _rescore_user_task(payload: dict):
+    async with async_session_scope() as db:
+        stored = await db.run_sync(rescore_user, payload["user_id"])
+    logger.info("[job-match] rescored user=%s rows=%d", payload["user_id"][:8], stored)
+
+
+@task_handler("job_match.score_batch")
+async def _score_batch_task(payload: dict):
+    def _batch_job_ids(sync_db: Session) -> list[str]:
+        return list(sync_db.scalars(select(Job.id).where(Job.scrape_batch_id == payload["batch_id"])))
+
+    async with async_session_scope() as db:
+        job_ids = await db.run_sync(_batch_job_ids)
+        stored = await db.run_sync(score_jobs, job_ids) if job_ids else 0
+        # Tokenize the batch for later profile rescores now, not on the next save
+        await db.run_sync(job_index.refresh)
+    logger.info("[job-match] scored batch=%s jobs=%d rows=%d", payload["batch_id"], len(job_ids), stored)
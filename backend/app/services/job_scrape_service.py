@@ -0,0 +1,360 @@
+"""Background job scrapes: concurrent, rate-limited Firecrawl searches.
+
+A scrape used to run inside the ``/jobs/scrape`` request, one query at a
+time with a blocking ``httpx.post`` and fixed sleeps, holding a worker for
+minutes. Now the endpoints record a ``scrape_batches`` row and queue a
+``jobs.scrape`` task, and the task runs the batch's searches on one pooled
+``httpx.AsyncClient``:
+
+- at most ``SCRAPE_CONCURRENCY`` searches in flight, started no faster than
+  a token bucket allows (``SCRAPE_RATE_PER_SECOND``, bursts of ``SCRAPE_BURST``)
+- a 429 is retried after a jittered exponential backoff (never sooner than
+  its Retry-After) and pauses the bucket, so the other searches back off too;
+  timeouts and 5xx are retried the same way
+- each search's jobs are stored together with the batch's checkpoint in one
+  transaction, so a retried task skips the searches already stored
+- every checkpoint renews the task's lease, so a long batch isn't picked up
+  by a second worker while it is still making progress; the batch stays
+  ``running`` (blocking a new scrape) until its task's last attempt fails
+
+``GET /jobs/scrape/{batch_id}`` reports the row as the batch progresses.
+"""
+
+import asyncio
+import json
+import logging
+import random
+import time
+from typing import Callable
+
+import httpx
+from sqlalchemy.orm import Session
+
+from app.config import (
+    SCRAPE_BACKOFF_MAX_SECONDS,
+    SCRAPE_BURST,
+    SCRAPE_CONCURRENCY,
+    SCRAPE_MAX_RETRIES,
+    SCRAPE_RATE_PER_SECOND,
+    SCRAPE_TIMEOUT_SECONDS,
+)
+from app.database import async_session_scope
+from app.models import ScrapeBatch, utc_now
+from app.services.cassette_service import http_call
+from app.services.task_queue_service import current_task, make_task, renew_lease, wake_workers
+
+logger = logging.getLogger(__name__)
+
+FIRECRAWL_SEARCH_URL = "https://api.firecrawl.dev/v1/search"
+RESULTS_PER_QUERY = 10
+BACKOFF_BASE_SECONDS = 2.0
+MAX_ERROR_LENGTH = 2000
+
+# store(sync_db, batch_id, category, results) -> (added, skipped); adds the
+# new jobs to the session without committing
+StoreResults = Callable[[Session, str, str, list[dict]], tuple[int, int]]
+
+
+# ─── Rate limiting ─────────────────────────────────────────
+
+
+class TokenBucket:
+    """``rate`` tokens per second, up to ``burst`` saved. ``acquire`` waits
+    for one (waiters are served in order); ``hold`` hands out none for a while."""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._held_until = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        if self.rate <= 0:
+            return
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._held_until:
+                    await asyncio.sleep(self._held_until - now)
+                    continue
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    def hold(self, seconds: float) -> None:
+        """Pause every caller for ``seconds``; the bucket restarts empty."""
+        self._held_until = max(self._held_until, time.monotonic() + seconds)
+        self._tokens = 0.0
+        self._updated = self._held_until
+
+
+def backoff_delay(attempt: int, retry_after: str | None = None) -> float:
+    """Seconds to wait before retry ``attempt`` (0 = first retry): exponential
+    with equal jitter, at least a numeric Retry-After, at most the cap."""
+    ceiling = min(SCRAPE_BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * 2 ** attempt)
+    delay = ceiling / 2 + random.uniform(0, ceiling / 2)
+    try:
+        delay = max(delay, float(retry_after)) if retry_after else delay
+    except ValueError:
+        pass  # HTTP-date form; the backoff alone will do
+    return min(delay, SCRAPE_BACKOFF_MAX_SECONDS)
+
+
+# ─── Firecrawl ─────────────────────────────────────────────
+
+
+class SearchFailed(Exception):
+    """A search that failed for good (after retries, or on a 4xx)."""
+
+    def __init__(self, message: str, throttled: int):
+        super().__init__(message)
+        self.throttled = throttled
+
+
+async def search(client: httpx.AsyncClient, bucket: TokenBucket, query: str) -> tuple[list[dict], int]:
+    """Firecrawl results for ``query`` and how many 429s it took to get them."""
+    payload = {
+        "query": query,
+        "limit": RESULTS_PER_QUERY,
+        "scrapeOptions": {"formats": ["markdown"]},
+    }
+    throttled = 0
+    for attempt in range(SCRAPE_MAX_RETRIES + 1):
+        await bucket.acquire()
+        limited, retry_after = False, None
+        try:
+            resp = await http_call(
+                "firecrawl",
+                {"attempt": attempt, **payload},
+                lambda: client.post(FIRECRAWL_SEARCH_URL, json=payload),
+            )
+        except httpx.TransportError as e:  # includes timeouts
+            problem = type(e).__name__
+        else:
+            if resp.status_code == 200:
+                return resp.json().get("data", []), throttled
+            problem = f"status {resp.status_code}"
+            if resp.status_code == 429:
+                throttled += 1
+                limited = True
+                retry_after = resp.headers.get("Retry-After")
+            elif resp.status_code < 500:
+                raise SearchFailed(f"Firecrawl {problem}", throttled)
+
+        if attempt == SCRAPE_MAX_RETRIES:
+            break
+        delay = backoff_delay(attempt, retry_after)
+        if limited:
+            bucket.hold(delay)
+        logger.warning(
+            "[firecrawl] %s query=%s attempt=%d, retrying in %.1fs", problem, query[:50], attempt + 1, delay
+        )
+        await asyncio.sleep(delay)
+    raise SearchFailed(f"Firecrawl {problem} after {SCRAPE_MAX_RETRIES + 1} attempts", throttled)
+
+
+# ─── Batches ───────────────────────────────────────────────
+
+
+class LeaseLost(Exception):
+    """This run's task lease lapsed and another worker has the batch now."""
+
+
+def batch_status(batch: ScrapeBatch) -> dict:
+    """The status endpoint's view of a batch."""
+    return {
+        "batchId": batch.id,
+        "status": batch.status,
+        "trigger": batch.trigger,
+        "queriesTotal": batch.queries_total,
+        "queriesDone": batch.queries_done,
+        "jobsAdded": batch.jobs_added,
+        "jobsSkipped": batch.jobs_skipped,
+        "errors": batch.errors,
+        "rateLimited": batch.rate_limited,
+        "lastError": batch.last_error,
+        "createdAt": batch.created_at,
+        "startedAt": batch.started_at,
+        "finishedAt": batch.finished_at,
+    }
+
+
+def _key(category: str, query: str) -> str:
+    return f"{category}\t{query}"
+
+
+def start_batch(db: Session, trigger: str, queries_total: int) -> tuple[ScrapeBatch, bool]:
+    """Queue a scrape, or return the one already queued / running.
+
+    Returns ``(batch, started)``. Commits and wakes the workers when started.
+    """
+    active = (
+        db.query(ScrapeBatch)
+        .filter(ScrapeBatch.status.in_(("queued", "running")))
+        .order_by(ScrapeBatch.created_at.desc())
+        .first()
+    )
+    if active:
+        return active, False
+    batch = ScrapeBatch(trigger=trigger, queries_total=queries_total)
+    db.add(batch)
+    db.flush()
+    db.add(make_task("jobs.scrape", {"batch_id": batch.id}))
+    db.commit()
+    wake_workers()
+    return batch, True
+
+
+def _begin(sync_db: Session, batch_id: str, queries_total: int) -> set[str]:
+    batch = sync_db.get(ScrapeBatch, batch_id)
+    if batch is None:
+        raise LookupError(f"scrape batch {batch_id} not found")
+    batch.status = "running"
+    batch.queries_total = queries_total
+    batch.started_at = batch.started_at or utc_now()
+    sync_db.commit()
+    return set(json.loads(batch.completed_json))
+
+
+def _renew(sync_db: Session, batch_id: str, task: dict | None) -> None:
+    if not renew_lease(sync_db, task):
+        sync_db.rollback()
+        raise LeaseLost(f"scrape batch {batch_id} was claimed by another worker")
+
+
+def _checkpoint(
+    sync_db: Session,
+    task: dict | None,
+    batch_id: str,
+    category: str,
+    query: str,
+    store: StoreResults,
+    results: list[dict],
+    throttled: int,
+    error: str | None,
+) -> None:
+    """Store one search's jobs and mark it done, in one transaction."""
+    batch = sync_db.get(ScrapeBatch, batch_id)
+    completed = json.loads(batch.completed_json)
+    if _key(category, query) in completed:  # another run of this task got here first
+        return
+
+    added = skipped = 0
+    if error is None:
+        try:
+            added, skipped = store(sync_db, batch_id, category, results)
+        except Exception as e:
+            sync_db.rollback()
+            logger.error("[scrape] Error storing category=%s query=%s: %s", category, query[:50], e)
+            error = f"{type(e).__name__}: {e}"
+            batch = sync_db.get(ScrapeBatch, batch_id)
+
+    completed.append(_key(category, query))
+    batch.completed_json = json.dumps(completed)
+    batch.queries_done = len(completed)
+    batch.jobs_added += added
+    batch.jobs_skipped += skipped
+    batch.rate_limited += throttled
+    if error is not None:
+        batch.errors += 1
+        batch.last_error = error[:MAX_ERROR_LENGTH]
+    _renew(sync_db, batch_id, task)
+    sync_db.commit()
+    logger.info("[scrape] category=%s query=%s added=%d skipped=%d", category, query[:50], added, skipped)
+
+
+def _complete(sync_db: Session, task: dict | None, batch_id: str) -> dict:
+    _renew(sync_db, batch_id, task)
+    batch = sync_db.get(ScrapeBatch, batch_id)
+    batch.status = "failed" if batch.queries_total and batch.errors >= batch.queries_total else "done"
+    batch.finished_at = utc_now()
+    if batch.jobs_added:
+        sync_db.add(make_task("job_match.score_batch", {"batch_id": batch_id}))
+    sync_db.commit()
+    return batch_status(batch)
+
+
+def _fail(sync_db: Session, batch_id: str, error: str, final: bool) -> None:
+    """Record a failed run. Until the task's last attempt the batch stays
+    ``running``, so ``start_batch`` won't queue a second one alongside the retry."""
+    batch = sync_db.get(ScrapeBatch, batch_id)
+    if batch is not None:
+        if final:
+            batch.status = "failed"
+            batch.finished_at = utc_now()
+        batch.last_error = error[:MAX_ERROR_LENGTH]
+        sync_db.commit()
+
+
+async def run_batch(batch_id: str, queries: dict[str, list[str]], store: StoreResults, api_key: str) -> None:
+    """Run (or resume) a queued batch: search every (category, query) not yet
+    checkpointed and store what comes back."""
+    task = current_task()
+    try:
+        await _run_batch(task, batch_id, queries, store, api_key)
+    except LeaseLost:
+        logger.warning("[scrape] Lease lost on batch=%s; leaving it to the new run", batch_id)
+        raise
+    except Exception as e:
+        final = task is None or task["attempts"] >= task["max_attempts"]
+        async with async_session_scope() as db:
+            await db.run_sync(_fail, batch_id, f"{type(e).__name__}: {e}", final)
+        raise
+
+
+async def _run_batch(
+    task: dict | None, batch_id: str, queries: dict[str, list[str]], store: StoreResults, api_key: str
+) -> None:
+    searches = [(category, query) for category, qs in queries.items() for query in qs]
+    async with async_session_scope() as db:
+        completed = await db.run_sync(_begin, batch_id, len(searches))
+    pending = [(c, q) for c, q in searches if _key(c, q) not in completed]
+    logger.info("[scrape] Starting batch=%s searches=%d (%d already done)", batch_id, len(pending), len(completed))
+
+    bucket = TokenBucket(SCRAPE_RATE_PER_SECOND, SCRAPE_BURST)
+    in_flight = asyncio.Semaphore(max(1, SCRAPE_CONCURRENCY))
+    storing = asyncio.Lock()  # one writer, so dedup sees earlier searches' jobs
+
+    async def run_one(client: httpx.AsyncClient, category: str, query: str) -> None:
+        results, throttled, error = [], 0, None
+        async with in_flight:
+            try:
+                results, throttled = await search(client, bucket, query)
+                logger.info("[scrape] category=%s query=%s results=%d", category, query[:50], len(results))
+            except SearchFailed as e:
+                throttled, error = e.throttled, str(e)
+            except Exception as e:
+                error = f"{type(e).__name__}: {e}"
+            if error:
+                logger.error("[scrape] Error searching category=%s query=%s: %s", category, query[:50], error)
+        async with storing:
+            async with async_session_scope() as db:
+                await db.run_sync(_checkpoint, task, batch_id, category, query, store, results, throttled, error)
+
+    async with httpx.AsyncClient(
+        timeout=SCRAPE_TIMEOUT_SECONDS,
+        limits=httpx.Limits(max_connections=max(1, SCRAPE_CONCURRENCY)),
+        headers={"Authorization": f"Bearer {api_key}"},
+    ) as client:
+        runs = [asyncio.create_task(run_one(client, c, q)) for c, q in pending]
+        try:
+            await asyncio.gather(*runs)
+        except BaseException:
+            # e.g. LeaseLost: stop the other searches before the client closes
+            for run in runs:
+                run.cancel()
+            await asyncio.gather(*runs, return_exceptions=True)
+            raise
+
+    async with async_session_scope() as db:
+        batch = await db.run_sync(_complete, task, batch_id)
+    wake_workers()
+    logger.info(
+        "[scrape] Batch complete batch=%s status=%s added=%d skipped=%d errors=%d rate_limited=%d",
+        batch_id, batch["status"], batch["jobsAdded"], batch["jobsSkipped"], batch["errors"], batch["rateLimited"],
+    )
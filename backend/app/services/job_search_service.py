@@ -0,0 +1,129 @@
+"""Full-text search for the job feed (SQLite FTS5, local and on libsql).
+
+``jobs_fts`` mirrors the searchable columns of ``jobs`` — title, company,
+location, description — with ``job_id`` stored unindexed to join back. It
+keeps its own copy of the text rather than pointing at ``jobs`` as external
+content: ``jobs`` has a string primary key, so its rowids aren't stable
+across VACUUM.
+
+The feed turns each word of the search box into a prefix query (``sal``
+matches "sales") and ranks by bm25, weighting title over company over
+location over description. If the FTS5 module isn't available the feed
+falls back to the old ``ILIKE`` scan.
+"""
+
+import logging
+import re
+
+from sqlalchemy import Float, String, bindparam, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Query, Session
+
+from app.models import Job
+
+logger = logging.getLogger(__name__)
+
+# bm25 column weights: title, company, location, description
+BM25_WEIGHTS = (10.0, 5.0, 2.0, 1.0)
+
+_CREATE = """
+CREATE VIRTUAL TABLE jobs_fts USING fts5(
+    job_id UNINDEXED, title, company, location, description,
+    tokenize = 'unicode61 remove_diacritics 2',
+    prefix = '2 3'
+)
+"""
+
+_INSERT = """
+INSERT INTO jobs_fts (job_id, title, company, location, description)
+SELECT id, title, company, coalesce(location, ''), coalesce(description, '')
+FROM jobs
+"""
+
+_TERM = re.compile(r"\w+", re.UNICODE)
+
+_available = False
+
+
+def _index_exists(conn: Connection) -> bool:
+    return conn.execute(text(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'jobs_fts'"
+    )).first() is not None
+
+
+def ensure_index(conn: Connection) -> bool:
+    """Create ``jobs_fts`` if missing and fill it from ``jobs``.
+
+    Run once at startup. Returns whether full-text search is usable.
+    """
+    global _available
+    try:
+        if not _index_exists(conn):
+            conn.execute(text(_CREATE))
+            conn.execute(text(_INSERT))
+            conn.commit()
+            logger.info("[job-search] built jobs_fts index")
+        _available = True
+    except Exception:
+        conn.rollback()
+        # Another instance may have created it first
+        _available = _index_exists(conn)
+        if not _available:
+            logger.warning("[job-search] FTS5 unavailable, feed search will scan with ILIKE", exc_info=True)
+    return _available
+
+
+def index_jobs(db: Session, job_ids: list[str]) -> None:
+    """Add freshly inserted (flushed) jobs to the index, in the caller's transaction."""
+    if not _available or not job_ids:
+        return
+    db.execute(
+        text(_INSERT + " WHERE id IN :ids").bindparams(bindparam("ids", expanding=True)),
+        {"ids": job_ids},
+    )
+
+
+def match_expression(search: str) -> str | None:
+    """FTS5 query matching jobs that contain every word as a prefix.
+
+    Words are quoted, so operators and punctuation typed into the search box
+    are taken literally. ``None`` if the search has no words.
+    """
+    terms = _TERM.findall(search.lower())
+    if not terms:
+        return None
+    return " ".join(f'"{term}"*' for term in terms)
+
+
+def ranks(search: str) -> bool:
+    """Whether ``apply_search`` will order ``search``'s results by relevance."""
+    return _available and match_expression(search) is not None
+
+
+def apply_search(query: Query, search: str) -> tuple[Query, list]:
+    """Filter ``query`` (over ``Job``) to jobs matching ``search``.
+
+    Returns the filtered query and the ORDER BY clauses to page it with:
+    best bm25 first, newest first among equally relevant jobs, with ``id``
+    as the final tie-break so pages never overlap.
+    """
+    match = match_expression(search) if _available else None
+    if match is None:
+        like = f"%{search}%"
+        query = query.filter(
+            (Job.title.ilike(like))
+            | (Job.company.ilike(like))
+            | (Job.location.ilike(like))
+            | (Job.description.ilike(like))
+        )
+        return query, [Job.scraped_at.desc(), Job.id.desc()]
+
+    weights = ", ".join(str(w) for w in BM25_WEIGHTS)
+    hits = (
+        text(f"SELECT job_id, bm25(jobs_fts, 0.0, {weights}) AS score FROM jobs_fts WHERE jobs_fts MATCH :match")
+        .bindparams(match=match)
+        .columns(job_id=String, score=Float)
+        .subquery("fts")
+    )
+    query = query.join(hits, hits.c.job_id == Job.id)
+    return query, [hits.c.score, Job.scraped_at.desc(), Job.id.desc()]  # bm25: lower is better
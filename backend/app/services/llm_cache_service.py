@@ -0,0 +1,206 @@
+"""Content-addressed cache for results Claude has already produced.
+
+A ``ResultCache`` maps a hash of the inputs (canonical JSON + prompt version)
+to a JSON-serialisable result. Lookups go:
+
+    in-process LRU  →  ``llm_result_cache`` table  →  ``compute()``
+
+Rows expire ``LLM_CACHE_TTL_HOURS`` after they were written; past
+``LLM_CACHE_MAX_ENTRIES`` rows per namespace the least recently used are
+evicted. Concurrent misses for the same key share one ``compute()`` call, so
+a student hammering the score button costs a single Claude request.
+
+The table is only an accelerator — if it can't be read or written the cache
+logs and carries on with the computed value.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Callable
+
+from sqlalchemy.orm import Session
+
+from app.config import LLM_CACHE_TTL_HOURS, LLM_CACHE_MAX_ENTRIES, LLM_CACHE_MEMORY_ENTRIES
+from app.database import async_session_scope
+from app.models import LLMCacheEntry, utc_now
+
+logger = logging.getLogger(__name__)
+
+_caches: dict[str, "ResultCache"] = {}
+
+
+def canonical_json(data) -> str:
+    """Key-order and whitespace independent JSON for hashing."""
+    return json.dumps(data, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+
+def content_hash(*parts) -> str:
+    return hashlib.sha256(canonical_json(parts).encode("utf-8")).hexdigest()
+
+
+def prompt_version(*texts: str) -> str:
+    """Short fingerprint of the prompt(s) and model behind a cached result."""
+    return hashlib.sha256("\x00".join(texts).encode("utf-8")).hexdigest()[:12]
+
+
+class ResultCache:
+    def __init__(
+        self,
+        namespace: str,
+        ttl_hours: float = LLM_CACHE_TTL_HOURS,
+        max_entries: int = LLM_CACHE_MAX_ENTRIES,
+        memory_entries: int = LLM_CACHE_MEMORY_ENTRIES,
+    ):
+        self.namespace = namespace
+        self.ttl_seconds = ttl_hours * 3600
+        self.max_entries = max_entries
+        self.memory_entries = memory_entries
+        # key → (written_at epoch seconds, value), oldest use first
+        self._memory: OrderedDict[str, tuple[float, object]] = OrderedDict()
+        self._inflight: dict[str, asyncio.Future] = {}
+        self.memory_hits = 0
+        self.db_hits = 0
+        self.misses = 0
+        _caches[namespace] = self
+
+    def key(self, *parts) -> str:
+        return content_hash(self.namespace, *parts)
+
+    # ── In-process LRU ───────────────────────────────────────
+
+    def _memory_get(self, key: str):
+        entry = self._memory.get(key)
+        if entry is None:
+            return None
+        written_at, value = entry
+        if time.time() - written_at > self.ttl_seconds:
+            del self._memory[key]
+            return None
+        self._memory.move_to_end(key)
+        return entry
+
+    def _memory_put(self, key: str, written_at: float, value) -> None:
+        self._memory[key] = (written_at, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    # ── Table ───────────────────────────────────────────────
+
+    def _cutoff(self) -> str:
+        return (datetime.now(timezone.utc) - timedelta(seconds=self.ttl_seconds)).isoformat()
+
+    def _db_get(self, sync_db: Session, key: str):
+        row = sync_db.query(LLMCacheEntry).filter(LLMCacheEntry.key == key).first()
+        if not row or row.created_at < self._cutoff():
+            return None
+        row.last_used_at = utc_now()
+        sync_db.commit()
+        written_at = datetime.fromisoformat(row.created_at).timestamp()
+        return written_at, json.loads(row.value_json)
+
+    def _db_put(self, sync_db: Session, key: str, value) -> None:
+        now = utc_now()
+        sync_db.merge(LLMCacheEntry(
+            key=key,
+            namespace=self.namespace,
+            value_json=json.dumps(value),
+            created_at=now,
+            last_used_at=now,
+        ))
+        sync_db.query(LLMCacheEntry).filter(
+            LLMCacheEntry.namespace == self.namespace,
+            LLMCacheEntry.created_at < self._cutoff(),
+        ).delete(synchronize_session=False)
+        # LRU eviction: keep the newest ``max_entries`` by last use
+        stale = (
+            sync_db.query(LLMCacheEntry.key)
+            .filter(LLMCacheEntry.namespace == self.namespace)
+            .order_by(LLMCacheEntry.last_used_at.desc())
+            .offset(self.max_entries)
+            .all()
+        )
+        if stale:
+            sync_db.query(LLMCacheEntry).filter(
+                LLMCacheEntry.key.in_([k for (k,) in stale])
+            ).delete(synchronize_session=False)
+        sync_db.commit()
+
+    # ── Public API ───────────────────────────────────────────
+
+    async def get(self, key: str):
+        """Cached value for ``key`` or ``None`` (never computes)."""
+        entry = self._memory_get(key)
+        if entry is not None:
+            self.memory_hits += 1
+            return entry[1]
+        try:
+            async with async_session_scope() as db:
+                entry = await db.run_sync(self._db_get, key)
+        except Exception:
+            logger.warning("[cache] %s read failed", self.namespace, exc_info=True)
+            return None
+        if entry is None:
+            return None
+        self.db_hits += 1
+        self._memory_put(key, *entry)
+        return entry[1]
+
+    async def put(self, key: str, value) -> None:
+        self._memory_put(key, time.time(), value)
+        try:
+            async with async_session_scope() as db:
+                await db.run_sync(self._db_put, key, value)
+        except Exception:
+            logger.warning("[cache] %s write failed", self.namespace, exc_info=True)
+
+    async def get_or_compute(self, key: str, compute: Callable[[], Awaitable]):
+        """Return the cached value, or run ``compute()`` once and store it.
+
+        Exceptions from ``compute()`` propagate and nothing is cached, so
+        callers can fall back without poisoning the cache.
+        """
+        value = await self.get(key)
+        if value is not None:
+            return value
+
+        pending = self._inflight.get(key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        fut = asyncio.get_running_loop().create_future()
+        self._inflight[key] = fut
+        try:
+            self.misses += 1
+            value = await compute()
+            await self.put(key, value)
+            fut.set_result(value)
+            return value
+        except BaseException as exc:
+            if isinstance(exc, asyncio.CancelledError):
+                fut.cancel()
+            else:
+                fut.set_exception(exc)
+                fut.exception()  # waiters re-raise it; don't log "never retrieved"
+            raise
+        finally:
+            del self._inflight[key]
+
+    def stats(self) -> dict:
+        lookups = self.memory_hits + self.db_hits + self.misses
+        return {
+            "memory_entries": len(self._memory),
+            "memory_hits": self.memory_hits,
+            "db_hits": self.db_hits,
+            "misses": self.misses,
+            "hit_ratio": round((lookups - self.misses) / lookups, 4) if lookups else 0.0,
+        }
+
+
+def get_cache_stats() -> dict:
+    return {name: cache.stats() for name, cache in _caches.items()}
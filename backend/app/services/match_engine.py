@@ -0,0 +1,185 @@
+"""Vectorized ``compute_match_score`` for many jobs x many profiles.
+
+``JobMatrix`` tokenizes jobs once: a sparse jobs x terms count
+matrix over the words the interest rule looks at (``len > 3``), plus the
+per-job flags (fresher, degree, 10th/12th pass). Profiles are encoded as
+sparse term sets, so the interest rule for a whole block is one sparse
+product. Location and education rules are evaluated once per distinct
+profile value and broadcast.
+
+Scores are identical to ``job_match_service.compute_match_score``. Its
+interest test is ``word in interests`` on the joined interest string; a
+word never contains whitespace, so that holds exactly when the word is a
+substring of one whitespace-free token of that string — which is how
+profiles are encoded here.
+"""
+
+import json
+
+import numpy as np
+from scipy import sparse
+
+MIN_TERM_LENGTH = 4
+# Interest tokens longer than this are matched by scanning the vocabulary
+# rather than enumerating their substrings
+MAX_ENUMERATED_TOKEN = 64
+
+
+def interest_text(profile) -> str:
+    """The lowercased aspiration + interests string the interest rule searches."""
+    interests = (profile.career_aspiration_raw or "").lower()
+    try:
+        interest_list = json.loads(profile.interests) if profile.interests else []
+        interests += " " + " ".join(interest_list).lower()
+    except (json.JSONDecodeError, TypeError):
+        pass
+    return interests
+
+
+def _lower(value) -> str:
+    return (value or "").lower()
+
+
+class JobMatrix:
+    """A batch of jobs, tokenized once and scored against any number of
+    profiles. ``extend`` appends more jobs without re-tokenizing these."""
+
+    def __init__(self, jobs=()):
+        """``jobs``: objects or rows with id, title, description, city, location, state."""
+        self.ids: list = []
+        self.vocab: dict[str, int] = {}
+        self.size = 0
+        self.terms = sparse.csr_matrix((0, 0), dtype=np.int32)
+        self._texts: list[str] = []
+        self._fresher = np.zeros(0, dtype=bool)
+        self._degree = np.zeros(0, dtype=bool)
+        self._school = np.zeros(0, dtype=bool)
+        # Location rules only see (city, location) / (state, location): few
+        # distinct pairs, so match each pair once and index back per job
+        self._cities: dict[tuple, int] = {}
+        self._states: dict[tuple, int] = {}
+        self._city_of = np.zeros(0, dtype=np.int64)
+        self._state_of = np.zeros(0, dtype=np.int64)
+        self._masks: dict[tuple, np.ndarray] = {}
+        self.extend(jobs)
+
+    def extend(self, jobs) -> int:
+        """Tokenize and append ``jobs``. Returns how many were added."""
+        jobs = list(jobs)
+        if not jobs:
+            return 0
+        indptr, indices, counts = [0], [], []
+        fresher, degree, school = [], [], []
+        for job in jobs:
+            self.ids.append(job.id)
+            text = f"{job.title or ''} {job.description or ''}".lower()
+            self._texts.append(text)
+            terms: dict[int, int] = {}
+            for word in text.split():
+                if len(word) >= MIN_TERM_LENGTH:
+                    term = self.vocab.setdefault(word, len(self.vocab))
+                    terms[term] = terms.get(term, 0) + 1
+            indices.extend(terms)
+            counts.extend(terms.values())
+            indptr.append(len(indices))
+            fresher.append("fresher" in text or "no experience" in text)
+            degree.append("graduate" in text or "any degree" in text)
+            school.append("12th pass" in text or "10th pass" in text)
+
+        added = sparse.csr_matrix(
+            (np.array(counts, dtype=np.int32), np.array(indices, dtype=np.int32), np.array(indptr, dtype=np.int64)),
+            shape=(len(jobs), len(self.vocab)),
+        )
+        self.terms.resize(self.size, len(self.vocab))  # new words are new columns
+        self.terms = sparse.vstack([self.terms, added], format="csr") if self.size else added
+        self.size += len(jobs)
+        self._fresher = np.concatenate([self._fresher, fresher])
+        self._degree = np.concatenate([self._degree, degree])
+        self._school = np.concatenate([self._school, school])
+        self._city_of = np.concatenate([self._city_of, self._distinct(
+            self._cities, ((_lower(job.city), _lower(job.location)) for job in jobs)
+        )])
+        self._state_of = np.concatenate([self._state_of, self._distinct(
+            self._states, ((_lower(job.state), _lower(job.location)) for job in jobs)
+        )])
+        self._masks.clear()
+        return len(jobs)
+
+    @staticmethod
+    def _distinct(index: dict[tuple, int], pairs) -> np.ndarray:
+        return np.array([index.setdefault(pair, len(index)) for pair in pairs], dtype=np.int64)
+
+    # ── Per-value rule vectors (cached across profile blocks) ──
+
+    def _place_mask(self, kind: str, value: str) -> np.ndarray:
+        key = (kind, value)
+        if key not in self._masks:
+            pairs, inverse = (self._cities, self._city_of) if kind == "city" else (self._states, self._state_of)
+            hits = np.array([value in own or value in location for own, location in pairs], dtype=bool)
+            self._masks[key] = hits[inverse]
+        return self._masks[key]
+
+    def _location_points(self, city: str, state: str) -> np.ndarray:
+        key = ("location", city, state)
+        if key not in self._masks:
+            points = np.zeros(self.size, dtype=np.int16)
+            city_hit = self._place_mask("city", city) if city else np.zeros(self.size, dtype=bool)
+            if state:
+                points[~city_hit & self._place_mask("state", state)] = 15
+            points[city_hit] = 30
+            self._masks[key] = points
+        return self._masks[key]
+
+    def _education_points(self, education: str) -> np.ndarray:
+        key = ("education", education)
+        if key not in self._masks:
+            points = np.zeros(self.size, dtype=np.int16)
+            if education:
+                named = np.array([education in text for text in self._texts], dtype=bool)
+                points[self._school] = 15
+                points[named | self._degree] = 25
+            self._masks[key] = points
+        return self._masks[key]
+
+    # ── Profiles ──
+
+    def _interest_terms(self, interests: str) -> list[int]:
+        found = set()
+        for token in set(interests.split()):
+            if len(token) < MIN_TERM_LENGTH:
+                continue
+            if len(token) > MAX_ENUMERATED_TOKEN:
+                found.update(t for word, t in self.vocab.items() if word in token)
+                continue
+            for start in range(len(token) - MIN_TERM_LENGTH + 1):
+                for end in range(start + MIN_TERM_LENGTH, len(token) + 1):
+                    term = self.vocab.get(token[start:end])
+                    if term is not None:
+                        found.add(term)
+        return list(found)
+
+    def score(self, profiles) -> np.ndarray:
+        """``(len(profiles), jobs)`` int16 scores. Score profiles in blocks:
+        the result is dense."""
+        profiles = list(profiles)
+        scores = np.zeros((len(profiles), self.size), dtype=np.int16)
+        if not profiles or not self.size:
+            return scores
+
+        rows, cols = [], []
+        for i, profile in enumerate(profiles):
+            scores[i] += self._location_points(_lower(profile.city), _lower(profile.state))
+            scores[i] += self._education_points(_lower(profile.education_level))
+            terms = self._interest_terms(interest_text(profile))
+            rows.extend([i] * len(terms))
+            cols.extend(terms)
+        scores += self._fresher.astype(np.int16) * 20
+
+        interest = sparse.csr_matrix(
+            (np.ones(len(rows), dtype=np.int32), (rows, cols)),
+            shape=(len(profiles), len(self.vocab)),
+        )
+        matched = (interest @ self.terms.T).tocsr()
+        matched.data = np.minimum(matched.data * 5, 25).astype(np.int16)
+        scores += matched.toarray()
+        return np.minimum(scores, 100, out=scores)
@@ -0,0 +1,124 @@
+"""Per-user store of Claude's structured parses of uploaded files.
+
+Uploading the same resume to the profile page and then to the resume
+builder used to send its text to Claude twice. Parses are now stored in
+``parsed_documents`` keyed by (user, parser, SHA-256 of the file bytes,
+parser version): an identical upload by the same user is answered from the
+table, and editing a prompt or switching model retires old parses because
+the version changes. Each user keeps their ``PARSED_DOCUMENTS_PER_USER``
+most recently used parses.
+
+Like the result cache, the table is only an accelerator — if it can't be
+read or written the upload carries on with a fresh parse.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+from typing import Awaitable, Callable
+
+from sqlalchemy.orm import Session
+
+from app.config import PARSED_DOCUMENTS_PER_USER
+from app.database import async_session_scope
+from app.models import ParsedDocument, utc_now
+
+logger = logging.getLogger(__name__)
+
+_inflight: dict[tuple, asyncio.Future] = {}
+
+
+def file_fingerprint(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()
+
+
+def _load(sync_db: Session, user_id: str, parser: str, file_sha256: str, version: str):
+    row = sync_db.query(ParsedDocument).filter(
+        ParsedDocument.user_id == user_id,
+        ParsedDocument.parser == parser,
+        ParsedDocument.file_sha256 == file_sha256,
+        ParsedDocument.parser_version == version,
+    ).first()
+    if not row:
+        return None
+    row.last_used_at = utc_now()
+    sync_db.commit()
+    return json.loads(row.result_json)
+
+
+def _save(sync_db: Session, user_id: str, parser: str, file_sha256: str, version: str, result) -> None:
+    now = utc_now()
+    sync_db.add(ParsedDocument(
+        user_id=user_id,
+        parser=parser,
+        file_sha256=file_sha256,
+        parser_version=version,
+        result_json=json.dumps(result),
+        created_at=now,
+        last_used_at=now,
+    ))
+    sync_db.flush()
+    stale = (
+        sync_db.query(ParsedDocument.id)
+        .filter(ParsedDocument.user_id == user_id)
+        .order_by(ParsedDocument.last_used_at.desc())
+        .offset(PARSED_DOCUMENTS_PER_USER)
+        .all()
+    )
+    if stale:
+        sync_db.query(ParsedDocument).filter(
+            ParsedDocument.id.in_([i for (i,) in stale])
+        ).delete(synchronize_session=False)
+    sync_db.commit()
+
+
+async def get_or_parse(
+    user_id: str,
+    parser: str,
+    version: str,
+    content: bytes,
+    parse: Callable[[], Awaitable],
+):
+    """The stored parse of ``content`` for this user, or ``await parse()``.
+
+    ``parser`` names the result shape (``resume_draft``, ``profile_document``)
+    and ``version`` fingerprints everything that shapes it — prompt, model,
+    extraction limits. Exceptions from ``parse()`` propagate and nothing is
+    stored; concurrent uploads of the same file share one ``parse()``.
+    """
+    key = (user_id, parser, file_fingerprint(content), version)
+    try:
+        async with async_session_scope() as db:
+            stored = await db.run_sync(_load, *key)
+    except Exception:
+        logger.warning("[parsed-doc] read failed", exc_info=True)
+        stored = None
+    if stored is not None:
+        logger.info("[parsed-doc] reused %s parse for user %s", parser, user_id)
+        return stored
+
+    pending = _inflight.get(key)
+    if pending is not None:
+        return await asyncio.shield(pending)
+
+    fut = asyncio.get_running_loop().create_future()
+    _inflight[key] = fut
+    try:
+        result = await parse()
+        try:
+            async with async_session_scope() as db:
+                await db.run_sync(_save, *key, result)
+        except Exception:  # includes losing an insert race to another worker
+            logger.warning("[parsed-doc] write failed", exc_info=True)
+        fut.set_result(result)
+        return result
+    except BaseException as exc:
+        if isinstance(exc, asyncio.CancelledError):
+            fut.cancel()
+        else:
+            fut.set_exception(exc)
+            fut.exception()  # waiters re-raise it; don't log "never retrieved"
+        raise
+    finally:
+        del _inflight[key]
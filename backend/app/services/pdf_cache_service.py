@@ -0,0 +1,204 @@
+"""Content-addressed store for rendered PDFs.
+
+Every download is keyed by ``(doc type, template, data, renderer version)``
+where the renderer version fingerprints reportlab plus the source of the
+module that draws the document — deploying a layout change retires the old
+files without a manual bump. Files live at
+``PDF_CACHE_DIR/<key[:2]>/<key>.pdf``; serving one refreshes its mtime and
+the least recently served files are deleted once the directory passes
+``PDF_CACHE_MAX_MB``.
+
+The key doubles as a strong ``ETag``, so a browser revalidating with
+``If-None-Match`` gets a 304 without the PDF being read, let alone rendered.
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from types import ModuleType
+from typing import Awaitable, Callable
+
+import reportlab
+from fastapi import Request, status
+from fastapi.responses import Response
+
+from app.config import PDF_CACHE_DIR, PDF_CACHE_MAX_MB
+from app.services.llm_cache_service import canonical_json
+
+logger = logging.getLogger(__name__)
+
+_MAX_BYTES = PDF_CACHE_MAX_MB * 1024 * 1024
+
+_lock = threading.Lock()
+_index: OrderedDict[str, int] | None = None  # key → size, least recently served first
+_total_bytes = 0
+_stats = {"hits": 0, "misses": 0, "not_modified": 0, "evictions": 0}
+
+
+@lru_cache(maxsize=None)
+def renderer_version(module: ModuleType) -> str:
+    """reportlab version + hash of the rendering module's source."""
+    digest = hashlib.sha256(reportlab.Version.encode("utf-8"))
+    try:
+        with open(module.__file__, "rb") as f:
+            digest.update(f.read())
+    except OSError:
+        digest.update(module.__name__.encode("utf-8"))
+    return digest.hexdigest()[:12]
+
+
+def artifact_key(doc_type: str, template: str, data, renderer: ModuleType) -> str:
+    canonical = canonical_json([doc_type, template, renderer_version(renderer), data])
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _path(key: str) -> str:
+    return os.path.join(PDF_CACHE_DIR, key[:2], f"{key}.pdf")
+
+
+def _load_index() -> OrderedDict:
+    """Scan the cache directory once per process (caller holds ``_lock``)."""
+    global _index, _total_bytes
+    if _index is not None:
+        return _index
+    entries = []
+    for root, _dirs, files in os.walk(PDF_CACHE_DIR):
+        for name in files:
+            if not name.endswith(".pdf"):
+                continue
+            try:
+                st = os.stat(os.path.join(root, name))
+            except OSError:
+                continue
+            entries.append((st.st_mtime, name[:-4], st.st_size))
+    entries.sort()
+    _index = OrderedDict((key, size) for _mtime, key, size in entries)
+    _total_bytes = sum(_index.values())
+    return _index
+
+
+def _read(key: str) -> bytes | None:
+    try:
+        with open(_path(key), "rb") as f:
+            data = f.read()
+    except OSError:
+        with _lock:
+            _forget(key)
+        return None
+    try:
+        os.utime(_path(key))
+    except OSError:
+        pass
+    with _lock:
+        index = _load_index()
+        if key in index:
+            index.move_to_end(key)
+    return data
+
+
+def _forget(key: str) -> None:
+    global _total_bytes
+    index = _load_index()
+    size = index.pop(key, None)
+    if size is not None:
+        _total_bytes -= size
+
+
+def _write(key: str, pdf_bytes: bytes) -> None:
+    global _total_bytes
+    path = _path(key)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(pdf_bytes)
+        os.replace(tmp, path)
+    except OSError:
+        logger.warning("[pdf-cache] could not write %s", path, exc_info=True)
+        return
+
+    with _lock:
+        index = _load_index()
+        _forget(key)
+        index[key] = len(pdf_bytes)
+        _total_bytes += len(pdf_bytes)
+        victims = []
+        while _total_bytes > _MAX_BYTES and len(index) > 1:
+            old_key, size = index.popitem(last=False)
+            _total_bytes -= size
+            victims.append(old_key)
+        _stats["evictions"] += len(victims)
+    for old_key in victims:
+        try:
+            os.remove(_path(old_key))
+        except OSError:
+            pass
+
+
+def get_or_render(key: str, render: Callable[[], bytes]) -> bytes:
+    """Cached bytes for ``key``, or ``render()`` them and store the result."""
+    pdf_bytes = _read(key)
+    if pdf_bytes is not None:
+        _stats["hits"] += 1
+        return pdf_bytes
+    _stats["misses"] += 1
+    pdf_bytes = render()
+    _write(key, pdf_bytes)
+    return pdf_bytes
+
+
+async def get_or_render_async(key: str, render: Callable[[], Awaitable[bytes]]) -> bytes:
+    """``get_or_render`` for async handlers; disk I/O runs off the loop."""
+    pdf_bytes = await asyncio.to_thread(_read, key)
+    if pdf_bytes is not None:
+        _stats["hits"] += 1
+        return pdf_bytes
+    _stats["misses"] += 1
+    pdf_bytes = await render()
+    await asyncio.to_thread(_write, key, pdf_bytes)
+    return pdf_bytes
+
+
+def etag_for(key: str) -> str:
+    return f'"{key[:32]}"'
+
+
+def not_modified(request: Request, key: str) -> Response | None:
+    """A 304 if the client already holds this exact PDF, else ``None``."""
+    etag = etag_for(key)
+    if_none_match = request.headers.get("if-none-match", "")
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    if etag in candidates or "*" in candidates:
+        _stats["not_modified"] += 1
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={"ETag": etag, "Cache-Control": "private, no-cache"},
+        )
+    return None
+
+
+def pdf_response(key: str, pdf_bytes: bytes, filename: str) -> Response:
+    return Response(
+        content=pdf_bytes,
+        media_type="application/pdf",
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}"',
+            "ETag": etag_for(key),
+            "Cache-Control": "private, no-cache",
+        },
+    )
+
+
+def get_stats() -> dict:
+    with _lock:
+        index = _load_index()
+        return {
+            **_stats,
+            "files": len(index),
+            "bytes": _total_bytes,
+            "max_bytes": _MAX_BYTES,
+        }
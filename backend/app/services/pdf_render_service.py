@@ -0,0 +1,189 @@
+"""Process pool for reportlab rendering.
+
+Building a resume or report PDF is pure CPU work (hundreds of ms for a
+two-page sidebar resume) and holds the GIL, so doing it inline in an async
+handler — or even on a threadpool thread — stalls every SSE stream in the
+process. Render functions are shipped to a ``ProcessPoolExecutor`` instead:
+
+- workers are started with the app and warmed (reportlab, fonts and the
+  three PDF service modules imported, every template's styles built, one
+  throwaway render) so the first real download doesn't pay for it;
+- at most ``PDF_RENDER_WORKERS + PDF_RENDER_MAX_QUEUE`` renders are in
+  flight; beyond that callers get ``RenderUnavailable`` (503 + Retry-After);
+- a render that takes longer than ``PDF_RENDER_TIMEOUT_SECONDS`` returns a
+  504 to its caller. A worker can't be interrupted mid-render, so its slot
+  stays counted until it actually finishes.
+
+Render functions and their arguments must be picklable: pass plain dicts or
+``SimpleNamespace`` snapshots, never ORM instances.
+"""
+
+import asyncio
+import logging
+import math
+import multiprocessing
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeout
+from concurrent.futures.process import BrokenProcessPool
+
+from app.config import PDF_RENDER_WORKERS, PDF_RENDER_MAX_QUEUE, PDF_RENDER_TIMEOUT_SECONDS
+
+logger = logging.getLogger(__name__)
+
+
+class RenderUnavailable(Exception):
+    """Render rejected (pool saturated) or timed out. ``main`` maps it to
+    ``status_code`` with a Retry-After header."""
+
+    def __init__(self, message: str, status_code: int, retry_after: int):
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
+_executor = None
+_lock = threading.Lock()
+_in_flight = 0
+_stats = {"rendered": 0, "failed": 0, "rejected": 0, "timeouts": 0}
+_avg_render_s = 0.5  # EWMA, feeds Retry-After
+
+
+def _warm_worker() -> None:
+    """Pool initializer: pay the import and first-render cost up front."""
+    from app.services import resume_pdf_service, pdf_service, interview_pdf_service
+    try:
+        resume_pdf_service.warm_template_styles()
+        pdf_service._build_styles()
+        interview_pdf_service._interview_styles()
+        resume_pdf_service.generate_resume_pdf({}, "professional")
+    except Exception:
+        pass
+
+
+def _ping() -> bool:
+    return True
+
+
+def _capacity() -> int:
+    return max(PDF_RENDER_WORKERS, 1) + PDF_RENDER_MAX_QUEUE
+
+
+def _get_executor():
+    global _executor
+    with _lock:
+        if _executor is None:
+            if PDF_RENDER_WORKERS > 0:
+                methods = multiprocessing.get_all_start_methods()
+                # Never fork the server process: it owns DB threads and sockets
+                ctx = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+                _executor = ProcessPoolExecutor(
+                    max_workers=PDF_RENDER_WORKERS,
+                    mp_context=ctx,
+                    initializer=_warm_worker,
+                )
+            else:
+                _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pdf-render")
+        return _executor
+
+
+def start_render_pool() -> None:
+    """Spawn and warm the workers (call from app startup)."""
+    executor = _get_executor()
+    if isinstance(executor, ProcessPoolExecutor):
+        for _ in range(PDF_RENDER_WORKERS):
+            executor.submit(_ping)
+        logger.info("[pdf-render] starting %d render workers", PDF_RENDER_WORKERS)
+
+
+def stop_render_pool() -> None:
+    global _executor
+    with _lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _retry_after() -> int:
+    seconds = (_in_flight + 1) / max(PDF_RENDER_WORKERS, 1) * _avg_render_s
+    return max(1, min(30, math.ceil(seconds)))
+
+
+def _submit(fn, args, kwargs) -> Future:
+    global _in_flight
+    with _lock:
+        if _in_flight >= _capacity():
+            _stats["rejected"] += 1
+            raise RenderUnavailable(
+                "PDF rendering is busy. Please retry shortly.", 503, _retry_after()
+            )
+        _in_flight += 1
+
+    started = time.monotonic()
+
+    def _done(fut: Future) -> None:
+        global _in_flight, _avg_render_s
+        with _lock:
+            _in_flight -= 1
+            if fut.cancelled():
+                return
+            if fut.exception() is None:
+                _stats["rendered"] += 1
+                _avg_render_s = 0.9 * _avg_render_s + 0.1 * (time.monotonic() - started)
+            else:
+                _stats["failed"] += 1
+
+    try:
+        fut = _get_executor().submit(fn, *args, **kwargs)
+    except (BrokenProcessPool, RuntimeError):
+        # A worker died (OOM, segfault) and poisoned the pool — start over once
+        logger.warning("[pdf-render] pool broken, restarting", exc_info=True)
+        stop_render_pool()
+        try:
+            fut = _get_executor().submit(fn, *args, **kwargs)
+        except Exception:
+            with _lock:
+                _in_flight -= 1
+            raise
+    fut.add_done_callback(_done)
+    return fut
+
+
+def _timed_out(fut: Future) -> RenderUnavailable:
+    fut.cancel()  # only succeeds if it never started
+    with _lock:
+        _stats["timeouts"] += 1
+    logger.warning("[pdf-render] render exceeded %gs", PDF_RENDER_TIMEOUT_SECONDS)
+    return RenderUnavailable("PDF rendering timed out. Please retry.", 504, _retry_after())
+
+
+async def render(fn, *args, **kwargs) -> bytes:
+    """Run ``fn(*args, **kwargs)`` in the pool without blocking the loop."""
+    fut = _submit(fn, args, kwargs)
+    try:
+        return await asyncio.wait_for(
+            asyncio.shield(asyncio.wrap_future(fut)), PDF_RENDER_TIMEOUT_SECONDS
+        )
+    except asyncio.TimeoutError:
+        raise _timed_out(fut) from None
+
+
+def render_blocking(fn, *args, **kwargs) -> bytes:
+    """Same as ``render`` for sync (threadpool) handlers."""
+    fut = _submit(fn, args, kwargs)
+    try:
+        return fut.result(timeout=PDF_RENDER_TIMEOUT_SECONDS)
+    except FutureTimeout:
+        raise _timed_out(fut) from None
+
+
+def get_stats() -> dict:
+    with _lock:
+        return {
+            **_stats,
+            "workers": PDF_RENDER_WORKERS,
+            "in_flight": _in_flight,
+            "capacity": _capacity(),
+            "avg_render_ms": round(_avg_render_s * 1000, 1),
+        }
@@ -1,6 +1,7 @@
 import io
 import json
 import re
+from functools import lru_cache
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.colors import HexColor, Color
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
@@ -34,6 +35,8 @@ BLACK      = HexColor("#111827")
 
 
 # ── Styles ───────────────────────────────────────────────────────────────────
+# Built once per process: the sheet is only read while rendering.
+@lru_cache(maxsize=None)
 def _build_styles():
     styles = getSampleStyleSheet()
 
@@ -0,0 +1,145 @@
+"""Local store of profile photos for the sidebar resume template.
+
+Rendering must never wait on Cloudinary, so photos are downloaded once,
+centre-cropped and resized to the ``CircularImage`` in the sidebar, and kept
+at ``PROFILE_IMAGE_CACHE_DIR/<key[:2]>/<key>.jpg``. The key hashes the URL
+together with ``STORE_VERSION`` — a new upload gets a new Cloudinary URL, and
+changing the photo size or encoding retires every stored file.
+
+The store is filled:
+
+- by the ``profile_image.prefetch`` task queued when a photo is uploaded;
+- by ``ensure_profile_image`` in the download routes, for photos uploaded
+  before the store existed (one async fetch, then never again).
+
+The renderer only ever sees the local path ``ensure_profile_image`` returns.
+"""
+
+import asyncio
+import functools
+import hashlib
+import io
+import logging
+import os
+import threading
+import time
+
+import httpx
+from PIL import Image, ImageOps
+
+from app.config import PROFILE_IMAGE_CACHE_DIR, PROFILE_IMAGE_FETCH_TIMEOUT_SECONDS
+from app.services.task_queue_service import task_handler
+
+logger = logging.getLogger(__name__)
+
+PHOTO_PX = 400  # 50 mm circle at ~200 dpi; uploads are already 400×400
+STORE_VERSION = f"{PHOTO_PX}px-jpeg-1"
+MAX_DOWNLOAD_BYTES = 10 * 1024 * 1024
+FAILURE_BACKOFF_SECONDS = 600  # don't retry a dead URL on every download
+
+_inflight: dict[str, asyncio.Task] = {}
+_failed_at: dict[str, float] = {}
+
+
+def _key(url: str) -> str:
+    return hashlib.sha256(f"{STORE_VERSION}\x00{url}".encode("utf-8")).hexdigest()
+
+
+def _path(url: str) -> str:
+    key = _key(url)
+    return os.path.join(PROFILE_IMAGE_CACHE_DIR, key[:2], f"{key}.jpg")
+
+
+def _prepare(raw: bytes) -> bytes:
+    """Square-crop and resize to ``PHOTO_PX``, flattened to JPEG."""
+    with Image.open(io.BytesIO(raw)) as img:
+        img = ImageOps.exif_transpose(img)
+        img = ImageOps.fit(img, (PHOTO_PX, PHOTO_PX), Image.LANCZOS)
+        if img.mode != "RGB":
+            background = Image.new("RGB", img.size, "white")
+            background.paste(img, mask=img.convert("RGBA").getchannel("A"))
+            img = background
+        out = io.BytesIO()
+        img.save(out, format="JPEG", quality=88, optimize=True)
+        return out.getvalue()
+
+
+def _store(url: str, data: bytes) -> None:
+    path = _path(url)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.{threading.get_ident()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def discard_profile_image(url: str | None) -> None:
+    if not url:
+        return
+    try:
+        os.remove(_path(url))
+    except OSError:
+        pass
+
+
+async def _download(url: str) -> None:
+    async with httpx.AsyncClient(
+        timeout=PROFILE_IMAGE_FETCH_TIMEOUT_SECONDS, follow_redirects=True
+    ) as client:
+        resp = await client.get(url)
+    resp.raise_for_status()
+    if len(resp.content) > MAX_DOWNLOAD_BYTES:
+        raise ValueError(f"profile image too large ({len(resp.content)} bytes)")
+    data = await asyncio.to_thread(_prepare, resp.content)
+    await asyncio.to_thread(_store, url, data)
+
+
+def _finished(url: str, task: asyncio.Task) -> None:
+    _inflight.pop(url, None)
+    if not task.cancelled():
+        task.exception()  # awaiters re-raise it; don't log "never retrieved"
+
+
+async def warm_profile_image(url: str) -> None:
+    """Download and store ``url`` unless it is already stored.
+
+    Concurrent callers for the same URL share one download. Errors
+    propagate (the prefetch task retries on them).
+    """
+    if await asyncio.to_thread(os.path.exists, _path(url)):
+        return
+    task = _inflight.get(url)
+    if task is None:
+        task = _inflight[url] = asyncio.create_task(_download(url))
+        task.add_done_callback(functools.partial(_finished, url))
+    await asyncio.shield(task)
+
+
+async def ensure_profile_image(url: str | None) -> str | None:
+    """Local path of the photo for ``url`` (fetching it now if needed), or
+    ``None`` if there is no photo or it can't be fetched.
+
+    Download routes call this before rendering so a miss costs one async
+    fetch instead of a blocking one inside the renderer, and so a PDF
+    rendered without the photo is never cached under the photo's key.
+    """
+    if not url:
+        return None
+    failed_at = _failed_at.get(url)
+    if failed_at is not None and time.monotonic() - failed_at < FAILURE_BACKOFF_SECONDS:
+        return _path(url) if await asyncio.to_thread(os.path.exists, _path(url)) else None
+    try:
+        await warm_profile_image(url)
+    except Exception:
+        _failed_at[url] = time.monotonic()
+        logger.warning("[profile-image] could not fetch %s", url, exc_info=True)
+        return None
+    _failed_at.pop(url, None)
+    return _path(url)
+
+
+@task_handler("profile_image.prefetch")
+async def _prefetch_profile_image_task(payload: dict):
+    await warm_profile_image(payload["url"])
+    if payload.get("replaces") and payload["replaces"] != payload["url"]:
+        await asyncio.to_thread(discard_profile_image, payload["replaces"])
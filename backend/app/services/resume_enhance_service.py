@@ -5,10 +5,12 @@ Claude expands bullet points, adds metrics, and strengthens language
 while keeping all facts accurate.
 """
 
+import copy
 import json
 import re
 import logging
-from app.services.claude_service import get_chat_response
+from app.services.claude_service import MODEL, get_chat_response
+from app.services.llm_cache_service import ResultCache, canonical_json, prompt_version
 
 logger = logging.getLogger(__name__)
 
@@ -42,88 +44,105 @@ def _count_resume_words(data: dict) -> int:
     return words
 
 
-async def enhance_resume_for_pdf(data: dict) -> dict:
+ENHANCE_SYSTEM_PROMPT = (
+    "You are an expert resume writer and ATS optimization specialist. "
+    "Enhance this resume to be more professional and detailed. "
+    "CRITICAL RULES:\n"
+    "1. Keep the SAME facts — do NOT invent new companies, roles, degrees, or experiences.\n"
+    "2. Expand short bullet points: add quantifiable metrics (%, numbers, timeframes), "
+    "strong action verbs (Led, Developed, Implemented, Achieved), and specific outcomes.\n"
+    "3. If the objective/summary is too short, expand to 2-3 impactful sentences.\n"
+    "4. If skills list has fewer than 6 items per category, add 3-5 more relevant skills "
+    "based on the person's experience and role.\n"
+    "5. If achievements are missing or have fewer than 2 items, derive 2-3 achievements "
+    "from the experience bullets.\n"
+    "6. If certifications section is empty, leave it empty — do NOT invent certifications.\n"
+    "7. Output ONLY valid JSON. No markdown fences. No explanation. Just the JSON object.\n"
+    "8. The output JSON must have the EXACT same structure and field names as the input."
+)
+
+ENHANCE_PROMPT_VERSION = prompt_version(ENHANCE_SYSTEM_PROMPT, str(MINIMUM_WORDS), MODEL)
+
+# Enhanced JSON keyed by the canonical source JSON, so every template (and a
+# re-download) reuses one Claude call. An autosave changes the source hash,
+# which is what invalidates the old entry.
+_enhanced_cache = ResultCache("resume_enhanced")
+
+
+async def _enhance(data: dict, word_count: int, user_id: str | None) -> dict:
+    """One Claude enhancement call. Raises if the reply isn't usable."""
+    user_msg = (
+        f"This resume has only {word_count} words — too sparse for a professional resume. "
+        f"Expand it to approximately 400-500 words while keeping all facts accurate. "
+        f"Make every bullet point impactful with metrics and action verbs.\n\n"
+        f"{json.dumps(data, indent=2)}"
+    )
+
+    response = await get_chat_response(
+        system_prompt=ENHANCE_SYSTEM_PROMPT,
+        messages=[{"role": "user", "content": user_msg}],
+        user_id=user_id,
+    )
+
+    # Clean response — strip markdown fences if present
+    cleaned = response.strip()
+    if cleaned.startswith("```"):
+        cleaned = re.sub(r'^```(?:json)?\s*', '', cleaned)
+        cleaned = re.sub(r'\s*```$', '', cleaned)
+
+    # Find JSON object start
+    brace = cleaned.find('{')
+    if brace > 0:
+        cleaned = cleaned[brace:]
+
+    # Find matching closing brace
+    depth = 0
+    end_idx = -1
+    for i, ch in enumerate(cleaned):
+        if ch == '{':
+            depth += 1
+        elif ch == '}':
+            depth -= 1
+            if depth == 0:
+                end_idx = i
+                break
+    if end_idx > 0:
+        cleaned = cleaned[:end_idx + 1]
+
+    enhanced = json.loads(cleaned)
+
+    # Validate structure — must have personal_info at minimum
+    if "personal_info" not in enhanced:
+        raise ValueError("AI enhancement missing personal_info")
+
+    new_count = _count_resume_words(enhanced)
+    logger.info(f"Resume enhanced: {word_count} → {new_count} words")
+    return enhanced
+
+
+async def enhance_resume_for_pdf(data: dict, user_id: str | None = None) -> dict:
     """Enhance sparse resume content using AI before PDF generation.
 
     If the resume has fewer than MINIMUM_WORDS words, Claude is called
-    to expand content while keeping facts accurate. On any failure,
-    returns the original data unchanged.
+    to expand content while keeping facts accurate — once per distinct
+    source JSON; later downloads reuse the cached result. On any failure,
+    returns the original data unchanged (and caches nothing). ``user_id``
+    is the fair-queueing key for the Claude call.
     """
     word_count = _count_resume_words(data)
     if word_count >= MINIMUM_WORDS:
         return data
 
-    logger.info(f"Resume has {word_count} words (< {MINIMUM_WORDS}) — enhancing with AI")
-
+    key = _enhanced_cache.key(ENHANCE_PROMPT_VERSION, canonical_json(data))
     try:
-        system = (
-            "You are an expert resume writer and ATS optimization specialist. "
-            "Enhance this resume to be more professional and detailed. "
-            "CRITICAL RULES:\n"
-            "1. Keep the SAME facts — do NOT invent new companies, roles, degrees, or experiences.\n"
-            "2. Expand short bullet points: add quantifiable metrics (%, numbers, timeframes), "
-            "strong action verbs (Led, Developed, Implemented, Achieved), and specific outcomes.\n"
-            "3. If the objective/summary is too short, expand to 2-3 impactful sentences.\n"
-            "4. If skills list has fewer than 6 items per category, add 3-5 more relevant skills "
-            "based on the person's experience and role.\n"
-            "5. If achievements are missing or have fewer than 2 items, derive 2-3 achievements "
-            "from the experience bullets.\n"
-            "6. If certifications section is empty, leave it empty — do NOT invent certifications.\n"
-            "7. Output ONLY valid JSON. No markdown fences. No explanation. Just the JSON object.\n"
-            "8. The output JSON must have the EXACT same structure and field names as the input."
-        )
-
-        user_msg = (
-            f"This resume has only {word_count} words — too sparse for a professional resume. "
-            f"Expand it to approximately 400-500 words while keeping all facts accurate. "
-            f"Make every bullet point impactful with metrics and action verbs.\n\n"
-            f"{json.dumps(data, indent=2)}"
+        enhanced = await _enhanced_cache.get_or_compute(
+            key, lambda: _enhance(data, word_count, user_id)
         )
-
-        response = await get_chat_response(
-            system_prompt=system,
-            messages=[{"role": "user", "content": user_msg}],
-        )
-
-        # Clean response — strip markdown fences if present
-        cleaned = response.strip()
-        if cleaned.startswith("```"):
-            cleaned = re.sub(r'^```(?:json)?\s*', '', cleaned)
-            cleaned = re.sub(r'\s*```$', '', cleaned)
-
-        # Find JSON object start
-        brace = cleaned.find('{')
-        if brace > 0:
-            cleaned = cleaned[brace:]
-
-        # Find matching closing brace
-        depth = 0
-        end_idx = -1
-        for i, ch in enumerate(cleaned):
-            if ch == '{':
-                depth += 1
-            elif ch == '}':
-                depth -= 1
-                if depth == 0:
-                    end_idx = i
-                    break
-        if end_idx > 0:
-            cleaned = cleaned[:end_idx + 1]
-
-        enhanced = json.loads(cleaned)
-
-        # Validate structure — must have personal_info at minimum
-        if "personal_info" not in enhanced:
-            logger.warning("AI enhancement missing personal_info — using original")
-            return data
-
-        new_count = _count_resume_words(enhanced)
-        logger.info(f"Resume enhanced: {word_count} → {new_count} words")
-        return enhanced
-
     except (json.JSONDecodeError, ValueError) as e:
-        logger.warning(f"AI enhancement JSON parse failed: {e}")
+        logger.warning(f"AI enhancement JSON parse failed — using original: {e}")
         return data
     except Exception as e:
         logger.warning(f"AI enhancement failed: {e}")
         return data
+    # Callers (sanitizers, renderers) may mutate — never hand out the cached dict
+    return copy.deepcopy(enhanced)
@@ -0,0 +1,76 @@
+"""Streaming ZIP export of many rendered resumes.
+
+``zip_stream`` turns an async stream of ``(name, bytes)`` files into ZIP
+chunks as it goes: ``zipfile`` writes into a sink that is drained after
+every member, so only the current file (plus the central directory's few
+bytes per entry) is ever held — never the archive. ``map_ordered`` feeds it,
+keeping a small window of renders in flight while preserving order.
+"""
+
+import asyncio
+import re
+import zipfile
+from collections import deque
+from typing import AsyncIterator, Awaitable, Callable, Iterable
+
+_UNSAFE_NAME = re.compile(r"[^A-Za-z0-9._ -]+")
+
+
+class _ChunkSink:
+    """Write-only, unseekable file object: ``zipfile`` then emits data
+    descriptors and never seeks back."""
+
+    def __init__(self):
+        self._chunks: list[bytes] = []
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def safe_name(text: str, fallback: str = "file") -> str:
+    """A path component that is safe inside a ZIP on every OS."""
+    cleaned = _UNSAFE_NAME.sub("_", text or "").strip(" ._")
+    return cleaned[:80] or fallback
+
+
+async def map_ordered(
+    items: Iterable,
+    fn: Callable[[object], Awaitable],
+    window: int,
+) -> AsyncIterator:
+    """Yield ``await fn(item)`` for each item in order, with at most
+    ``window`` calls running at once."""
+    pending: deque[asyncio.Task] = deque()
+    try:
+        for item in items:
+            pending.append(asyncio.create_task(fn(item)))
+            if len(pending) >= window:
+                yield await pending.popleft()
+        while pending:
+            yield await pending.popleft()
+    finally:
+        for task in pending:  # client went away mid-export
+            task.cancel()
+
+
+async def zip_stream(files: AsyncIterator[tuple[str, bytes]]) -> AsyncIterator[bytes]:
+    """ZIP ``files`` incrementally, yielding each member as soon as it's written.
+
+    Members are stored, not deflated: PDFs are already compressed, and
+    deflating on the event loop would stall other requests.
+    """
+    sink = _ChunkSink()
+    with zipfile.ZipFile(sink, "w", compression=zipfile.ZIP_STORED) as zf:
+        async for name, data in files:
+            zf.writestr(name, data)
+            yield sink.drain()
+    yield sink.drain()  # central directory
@@ -1,6 +1,5 @@
 import io
 import json
-import urllib.request
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.colors import HexColor, Color
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
@@ -12,6 +11,7 @@ from reportlab.platypus import (
 )
 from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_RIGHT
 from reportlab.lib.utils import ImageReader
+from types import SimpleNamespace
 
 
 GREEN_800 = HexColor("#166534")
@@ -23,6 +23,7 @@ GRAY_600 = HexColor("#4B5563")
 GRAY_400 = HexColor("#9CA3AF")
 GRAY_200 = HexColor("#E5E7EB")
 WHITE = HexColor("#FFFFFF")
+GRAY_BG = HexColor("#F0F0F0")  # section header band
 
 
 # ─── Shared Design Tokens (LaTeX-inspired tight spacing) ───────
@@ -72,28 +73,66 @@ def _draw_page_footer(canvas, doc):
     canvas.restoreState()
 
 
+_ENTRY_ROW_TS = TableStyle([
+    ("VALIGN", (0, 0), (-1, -1), "TOP"),
+    ("LEFTPADDING", (0, 0), (-1, -1), 0),
+    ("RIGHTPADDING", (0, 0), (-1, -1), 0),
+    ("TOPPADDING", (0, 0), (-1, -1), 0),
+    ("BOTTOMPADDING", (0, 0), (-1, -1), 1),
+])
+
+
 def _build_entry_row(left_text: str, right_text: str, s_left, s_right, total_width: float):
     """Two-column row: title on left, date/info on right."""
     t = Table(
         [[Paragraph(left_text, s_left), Paragraph(right_text, s_right)]],
         colWidths=[total_width * 0.72, total_width * 0.28],
     )
-    t.setStyle(TableStyle([
-        ("VALIGN", (0, 0), (-1, -1), "TOP"),
-        ("LEFTPADDING", (0, 0), (-1, -1), 0),
-        ("RIGHTPADDING", (0, 0), (-1, -1), 0),
-        ("TOPPADDING", (0, 0), (-1, -1), 0),
-        ("BOTTOMPADDING", (0, 0), (-1, -1), 1),
-    ]))
+    t.setStyle(_ENTRY_ROW_TS)
     return t
 
 
+# ─── Template Style Registry ────────────────────────────────
+# ParagraphStyles and TableStyles are never mutated while rendering, so each
+# template's set is built once per process (on first use, or by the render
+# worker's warm-up) and shared by every render. Doc templates, frames and
+# page templates carry layout state and are still created per render.
+
+_STYLE_BUILDERS = {}
+_STYLE_CACHE = {}
+
+
+def _template_styles(template: str):
+    """Register the style builder for ``template``."""
+    def register(build):
+        _STYLE_BUILDERS[template] = build
+        return build
+    return register
+
+
+def get_template_styles(template: str) -> SimpleNamespace:
+    styles = _STYLE_CACHE.get(template)
+    if styles is None:
+        styles = _STYLE_CACHE[template] = _STYLE_BUILDERS[template]()
+    return styles
+
+
+def warm_template_styles() -> None:
+    """Build every template's styles now (render-worker initializer)."""
+    for template in _STYLE_BUILDERS:
+        get_template_styles(template)
+
+
 def generate_resume_pdf(
     resume_json,
     template: str = "professional",
-    profile_image_url: str | None = None,
+    profile_image_path: str | None = None,
 ) -> bytes:
-    """Generate resume PDF bytes for the given template."""
+    """Generate resume PDF bytes for the given template.
+
+    ``profile_image_path`` is a local file from ``profile_image_service``
+    (sidebar template only) — rendering never downloads anything.
+    """
     # Handle both str (from DB) and dict (already parsed) inputs
     if isinstance(resume_json, dict):
         data = resume_json
@@ -106,7 +145,7 @@ def generate_resume_pdf(
     elif template == "rendercv":
         return _generate_rendercv(data)
     elif template == "sidebar":
-        return _generate_sidebar(data, profile_image_url)
+        return _generate_sidebar(data, profile_image_path)
     elif template == "jake":
         return _generate_jake(data)
     return _generate_professional(data)
@@ -115,10 +154,58 @@ def generate_resume_pdf(
 # ─── Template 1: Professional ───────────────────────────────
 
 
+@_template_styles("professional")
+def _professional_styles() -> SimpleNamespace:
+    styles = getSampleStyleSheet()
+    return SimpleNamespace(
+        name=ParagraphStyle("PName", parent=styles["Title"], fontSize=SIZE_NAME, textColor=GRAY_900, spaceAfter=0, alignment=TA_LEFT, fontName="Helvetica-Bold"),
+        contact=ParagraphStyle("PContact", parent=styles["Normal"], fontSize=SIZE_CONTACT, textColor=GRAY_600, spaceAfter=0, alignment=TA_RIGHT),
+        section=ParagraphStyle("PSection", parent=styles["Normal"], fontSize=SIZE_SECTION, textColor=GRAY_900, fontName="Helvetica-Bold", spaceBefore=SPACE_SECTION_BEFORE, spaceAfter=0, leading=_leading(SIZE_SECTION, 1.2)),
+        body=ParagraphStyle("PBody", parent=styles["Normal"], fontSize=SIZE_BODY, textColor=GRAY_700, leading=_leading(SIZE_BODY, 1.3)),
+        bullet=ParagraphStyle("PBullet", parent=styles["Normal"], fontSize=SIZE_BODY, textColor=GRAY_700, leading=_leading(SIZE_BODY, 1.3), leftIndent=12, bulletIndent=3, spaceBefore=0.3 * mm),
+        entry_title=ParagraphStyle("PEntryTitle", parent=styles["Normal"], fontSize=SIZE_ENTRY_TITLE, textColor=GRAY_900, leading=_leading(SIZE_ENTRY_TITLE, 1.3), fontName="Helvetica-Bold"),
+        entry_sub=ParagraphStyle("PEntrySub", parent=styles["Normal"], fontSize=SIZE_SUB, textColor=GRAY_600, leading=_leading(SIZE_SUB, 1.3)),
+        entry_right=ParagraphStyle("PEntryRight", parent=styles["Normal"], fontSize=SIZE_SUB, textColor=GRAY_600, leading=_leading(SIZE_SUB, 1.3), alignment=TA_RIGHT),
+        skill_inline=ParagraphStyle("PSkillInline", parent=styles["Normal"], fontSize=SIZE_BODY, textColor=GRAY_700, leading=_leading(SIZE_BODY, 1.3), spaceBefore=0.5 * mm),
+        hdr=ParagraphStyle("SHdr", parent=styles["Normal"], fontSize=SIZE_SECTION, textColor=GRAY_900, fontName="Helvetica-Bold", leading=_leading(SIZE_SECTION, 1.2)),
+        edu_hdr=ParagraphStyle("EH", parent=styles["Normal"], fontSize=SIZE_SUB, textColor=WHITE, fontName="Helvetica-Bold", leading=_leading(SIZE_SUB, 1.2)),
+        edu_cell=ParagraphStyle("ECell", parent=styles["Normal"], fontSize=SIZE_SUB, textColor=GRAY_700, leading=_leading(SIZE_SUB, 1.3)),
+        header_ts=TableStyle([
+            ("VALIGN", (0, 0), (-1, -1), "BOTTOM"),
+            ("LEFTPADDING", (0, 0), (-1, -1), 0),
+            ("RIGHTPADDING", (0, 0), (-1, -1), 0),
+            ("TOPPADDING", (0, 0), (-1, -1), 0),
+            ("BOTTOMPADDING", (0, 0), (-1, -1), 0),
+        ]),
+        section_ts=TableStyle([
+            ("BACKGROUND", (0, 0), (-1, -1), GRAY_BG),
+            ("LEFTPADDING", (0, 0), (-1, -1), 4),
+            ("TOPPADDING", (0, 0), (-1, -1), 2.5),
+            ("BOTTOMPADDING", (0, 0), (-1, -1), 2.5),
+        ]),
+        entry_row_ts=TableStyle([
+            ("VALIGN", (0, 0), (-1, -1), "TOP"),
+            ("LEFTPADDING", (0, 0), (-1, -1), 0),
+            ("RIGHTPADDING", (0, 0), (-1, -1), 0),
+            ("TOPPADDING", (0, 0), (-1, -1), 0),
+            ("BOTTOMPADDING", (0, 0), (-1, -1), 0),
+        ]),
+        edu_ts=TableStyle([
+            ("BACKGROUND", (0, 0), (-1, 0), GREEN_800),
+            ("TEXTCOLOR", (0, 0), (-1, 0), WHITE),
+            ("GRID", (0, 0), (-1, -1), 0.5, GRAY_400),
+            ("VALIGN", (0, 0), (-1, -1), "TOP"),
+            ("TOPPADDING", (0, 0), (-1, -1), 3),
+            ("BOTTOMPADDING", (0, 0), (-1, -1), 3),
+            ("LEFTPADDING", (0, 0), (-1, -1), 4),
+            ("RIGHTPADDING", (0, 0), (-1, -1), 4),
+            ("ROWBACKGROUNDS", (0, 1), (-1, -1), [WHITE, HexColor("#FAFAFA")]),
+        ]),
+    )
+
+
 def _generate_professional(data: dict) -> bytes:
     """Professional template — LaTeX-inspired tight layout with gray section headers."""
-    GRAY_BG = HexColor("#F0F0F0")
-
     buffer = io.BytesIO()
     doc = SimpleDocTemplate(
         buffer, pagesize=A4,
@@ -126,18 +213,7 @@ def _generate_professional(data: dict) -> bytes:
         leftMargin=MARGIN_STANDARD, rightMargin=MARGIN_STANDARD,
     )
     content_w = A4[0] - 2 * MARGIN_STANDARD
-    styles = getSampleStyleSheet()
-
-    # Styles — tighter leading (1.3x) for dense packing
-    s_name = ParagraphStyle("PName", parent=styles["Title"], fontSize=SIZE_NAME, textColor=GRAY_900, spaceAfter=0, alignment=TA_LEFT, fontName="Helvetica-Bold")
-    s_contact = ParagraphStyle("PContact", parent=styles["Normal"], fontSize=SIZE_CONTACT, textColor=GRAY_600, spaceAfter=0, alignment=TA_RIGHT)
-    s_section = ParagraphStyle("PSection", parent=styles["Normal"], fontSize=SIZE_SECTION, textColor=GRAY_900, fontName="Helvetica-Bold", spaceBefore=SPACE_SECTION_BEFORE, spaceAfter=0, leading=_leading(SIZE_SECTION, 1.2))
-    s_body = ParagraphStyle("PBody", parent=styles["Normal"], fontSize=SIZE_BODY, textColor=GRAY_700, leading=_leading(SIZE_BODY, 1.3))
-    s_bullet = ParagraphStyle("PBullet", parent=styles["Normal"], fontSize=SIZE_BODY, textColor=GRAY_700, leading=_leading(SIZE_BODY, 1.3), leftIndent=12, bulletIndent=3, spaceBefore=0.3 * mm)
-    s_entry_title = ParagraphStyle("PEntryTitle", parent=styles["Normal"], fontSize=SIZE_ENTRY_TITLE, textColor=GRAY_900, leading=_leading(SIZE_ENTRY_TITLE, 1.3), fontName="Helvetica-Bold")
-    s_entry_sub = ParagraphStyle("PEntrySub", parent=styles["Normal"], fontSize=SIZE_SUB, textColor=GRAY_600, leading=_leading(SIZE_SUB, 1.3))
-    s_entry_right = ParagraphStyle("PEntryRight", parent=styles["Normal"], fontSize=SIZE_SUB, textColor=GRAY_600, leading=_leading(SIZE_SUB, 1.3), alignment=TA_RIGHT)
-    s_skill_inline = ParagraphStyle("PSkillInline", parent=styles["Normal"], fontSize=SIZE_BODY, textColor=GRAY_700, leading=_leading(SIZE_BODY, 1.3), spaceBefore=0.5 * mm)
+    st = get_template_styles("professional")
 
     elements = []
     pi = data.get("personal_info", {})
@@ -149,29 +225,17 @@ def _generate_professional(data: dict) -> bytes:
     contact_right = "<br/>".join([CONTACT_SEP.join(contact_parts)] + ([CONTACT_SEP.join(link_parts)] if link_parts else []))
 
     header = Table(
-        [[Paragraph(name_text, s_name), Paragraph(contact_right, s_contact)]],
+        [[Paragraph(name_text, st.name), Paragraph(contact_right, st.contact)]],
         colWidths=[content_w * 0.55, content_w * 0.45],
     )
-    header.setStyle(TableStyle([
-        ("VALIGN", (0, 0), (-1, -1), "BOTTOM"),
-        ("LEFTPADDING", (0, 0), (-1, -1), 0),
-        ("RIGHTPADDING", (0, 0), (-1, -1), 0),
-        ("TOPPADDING", (0, 0), (-1, -1), 0),
-        ("BOTTOMPADDING", (0, 0), (-1, -1), 0),
-    ]))
+    header.setStyle(st.header_ts)
     elements.append(header)
     elements.append(HRFlowable(width="100%", thickness=1.5, color=GRAY_900, spaceAfter=2 * mm, spaceBefore=1.5 * mm))
 
     # ── Helper: Section heading with gray background ──
     def add_section(title):
-        s_hdr = ParagraphStyle("SHdr", parent=styles["Normal"], fontSize=SIZE_SECTION, textColor=GRAY_900, fontName="Helvetica-Bold", leading=_leading(SIZE_SECTION, 1.2))
-        t = Table([[Paragraph(title, s_hdr)]], colWidths=[content_w])
-        t.setStyle(TableStyle([
-            ("BACKGROUND", (0, 0), (-1, -1), GRAY_BG),
-            ("LEFTPADDING", (0, 0), (-1, -1), 4),
-            ("TOPPADDING", (0, 0), (-1, -1), 2.5),
-            ("BOTTOMPADDING", (0, 0), (-1, -1), 2.5),
-        ]))
+        t = Table([[Paragraph(title, st.hdr)]], colWidths=[content_w])
+        t.setStyle(st.section_ts)
         elements.append(Spacer(1, SPACE_SECTION_BEFORE))
         elements.append(t)
         elements.append(Spacer(1, SPACE_SECTION_AFTER))
@@ -179,55 +243,38 @@ def _generate_professional(data: dict) -> bytes:
     # ── Helper: Entry row (title left, date right) ──
     def add_entry_row(left, right):
         t = Table(
-            [[Paragraph(left, s_entry_title), Paragraph(right, s_entry_right)]],
+            [[Paragraph(left, st.entry_title), Paragraph(right, st.entry_right)]],
             colWidths=[content_w * 0.72, content_w * 0.28],
         )
-        t.setStyle(TableStyle([
-            ("VALIGN", (0, 0), (-1, -1), "TOP"),
-            ("LEFTPADDING", (0, 0), (-1, -1), 0),
-            ("RIGHTPADDING", (0, 0), (-1, -1), 0),
-            ("TOPPADDING", (0, 0), (-1, -1), 0),
-            ("BOTTOMPADDING", (0, 0), (-1, -1), 0),
-        ]))
+        t.setStyle(st.entry_row_ts)
         elements.append(t)
 
     # ── Objective ──
     obj = data.get("objective", "")
     if obj:
         add_section("CAREER OBJECTIVE")
-        elements.append(Paragraph(obj, s_body))
+        elements.append(Paragraph(obj, st.body))
 
     # ── Education — bordered table (like GGSIPU template) ──
     edu_list = data.get("education", [])
     if edu_list:
         add_section("EDUCATION")
         edu_header = [
-            Paragraph("<b>Year</b>", ParagraphStyle("EH", parent=styles["Normal"], fontSize=SIZE_SUB, textColor=WHITE, fontName="Helvetica-Bold", leading=_leading(SIZE_SUB, 1.2))),
-            Paragraph("<b>Degree / Certificate</b>", ParagraphStyle("EH2", parent=styles["Normal"], fontSize=SIZE_SUB, textColor=WHITE, fontName="Helvetica-Bold", leading=_leading(SIZE_SUB, 1.2))),
-            Paragraph("<b>Institute</b>", ParagraphStyle("EH3", parent=styles["Normal"], fontSize=SIZE_SUB, textColor=WHITE, fontName="Helvetica-Bold", leading=_leading(SIZE_SUB, 1.2))),
-            Paragraph("<b>CGPA / %</b>", ParagraphStyle("EH4", parent=styles["Normal"], fontSize=SIZE_SUB, textColor=WHITE, fontName="Helvetica-Bold", leading=_leading(SIZE_SUB, 1.2))),
+            Paragraph("<b>Year</b>", st.edu_hdr),
+            Paragraph("<b>Degree / Certificate</b>", st.edu_hdr),
+            Paragraph("<b>Institute</b>", st.edu_hdr),
+            Paragraph("<b>CGPA / %</b>", st.edu_hdr),
         ]
         edu_rows = [edu_header]
-        s_edu_cell = ParagraphStyle("ECell", parent=styles["Normal"], fontSize=SIZE_SUB, textColor=GRAY_700, leading=_leading(SIZE_SUB, 1.3))
         for e in edu_list:
             edu_rows.append([
-                Paragraph(e.get("year", ""), s_edu_cell),
-                Paragraph(f"{e.get('degree', '')}" + (f" ({e['stream']})" if e.get('stream') else ""), s_edu_cell),
-                Paragraph(e.get("institution", ""), s_edu_cell),
-                Paragraph(e.get("grade", ""), s_edu_cell),
+                Paragraph(e.get("year", ""), st.edu_cell),
+                Paragraph(f"{e.get('degree', '')}" + (f" ({e['stream']})" if e.get('stream') else ""), st.edu_cell),
+                Paragraph(e.get("institution", ""), st.edu_cell),
+                Paragraph(e.get("grade", ""), st.edu_cell),
             ])
         edu_t = Table(edu_rows, colWidths=[content_w * 0.15, content_w * 0.35, content_w * 0.35, content_w * 0.15])
-        edu_t.setStyle(TableStyle([
-            ("BACKGROUND", (0, 0), (-1, 0), GREEN_800),
-            ("TEXTCOLOR", (0, 0), (-1, 0), WHITE),
-            ("GRID", (0, 0), (-1, -1), 0.5, GRAY_400),
-            ("VALIGN", (0, 0), (-1, -1), "TOP"),
-            ("TOPPADDING", (0, 0), (-1, -1), 3),
-            ("BOTTOMPADDING", (0, 0), (-1, -1), 3),
-            ("LEFTPADDING", (0, 0), (-1, -1), 4),
-            ("RIGHTPADDING", (0, 0), (-1, -1), 4),
-            ("ROWBACKGROUNDS", (0, 1), (-1, -1), [WHITE, HexColor("#FAFAFA")]),
-        ]))
+        edu_t.setStyle(st.edu_ts)
         elements.append(edu_t)
 
     # ── Experience ──
@@ -240,9 +287,9 @@ def _generate_professional(data: dict) -> bytes:
                 title += f" | {exp['company']}"
             add_entry_row(title, exp.get("duration", ""))
             if exp.get("location"):
-                elements.append(Paragraph(exp["location"], s_entry_sub))
+                elements.append(Paragraph(exp["location"], st.entry_sub))
             for b in exp.get("bullets", []):
-                elements.append(Paragraph(b, s_bullet, bulletText=BULLET_CHAR))
+                elements.append(Paragraph(b, st.bullet, bulletText=BULLET_CHAR))
             elements.append(Spacer(1, SPACE_ENTRY_GAP))
 
     # ── Projects ──
@@ -255,11 +302,11 @@ def _generate_professional(data: dict) -> bytes:
             if ts:
                 ts_str = ", ".join(ts) if isinstance(ts, list) else str(ts)
                 line += f"  <font color='#6B7280'>({ts_str})</font>"
-            elements.append(Paragraph(line, s_entry_title))
+            elements.append(Paragraph(line, st.entry_title))
             if p.get("description"):
-                elements.append(Paragraph(p["description"], s_entry_sub))
+                elements.append(Paragraph(p["description"], st.entry_sub))
             for b in p.get("bullets", []):
-                elements.append(Paragraph(b, s_bullet, bulletText=BULLET_CHAR))
+                elements.append(Paragraph(b, st.bullet, bulletText=BULLET_CHAR))
             elements.append(Spacer(1, SPACE_ENTRY_GAP))
 
     # ── Skills — inline format (no table, wraps naturally) ──
@@ -269,14 +316,14 @@ def _generate_professional(data: dict) -> bytes:
         for label, key in [("Languages / Technologies", "technical"), ("Developer Tools", "tools"), ("Soft Skills", "soft"), ("Languages", "languages")]:
             items = skills.get(key, [])
             if items:
-                elements.append(Paragraph(f"<b>{label}:</b> {', '.join(items)}", s_skill_inline))
+                elements.append(Paragraph(f"<b>{label}:</b> {', '.join(items)}", st.skill_inline))
 
     # ── Achievements ──
     achievements = data.get("achievements", [])
     if achievements:
         add_section("ACHIEVEMENTS")
         for a in achievements:
-            elements.append(Paragraph(a, s_bullet, bulletText=BULLET_CHAR))
+            elements.append(Paragraph(a, st.bullet, bulletText=BULLET_CHAR))
 
     # ── Certifications ──
     certs = data.get("certifications", [])
@@ -287,7 +334,7 @@ def _generate_professional(data: dict) -> bytes:
             parts = [p for p in [c.get("issuer"), c.get("year")] if p]
             if parts:
                 line += f" — {', '.join(parts)}"
-            elements.append(Paragraph(line, s_body))
+            elements.append(Paragraph(line, st.body))
 
     doc.build(elements, onFirstPage=_draw_page_footer, onLaterPages=_draw_page_footer)
     buffer.seek(0)
@@ -297,6 +344,33 @@ def _generate_professional(data: dict) -> bytes:
 # ─── Template 2: Modern (Two-Column) ────────────────────────
 
 
+@_template_styles("modern")
+def _modern_styles() -> SimpleNamespace:
+    styles = getSampleStyleSheet()
+    return SimpleNamespace(
+        lname=ParagraphStyle("MNameL", parent=styles["Title"], fontSize=16, textColor=WHITE, spaceAfter=2 * mm, alignment=TA_LEFT),
+        lcontact=ParagraphStyle("MContactL", parent=styles["Normal"], fontSize=8.5, textColor=HexColor("#BBFFBB"), leading=_leading(8.5)),
+        lsection=ParagraphStyle("MSectionL", parent=styles["Heading3"], fontSize=10, textColor=WHITE, spaceBefore=4 * mm, spaceAfter=1.5 * mm),
+        lbody=ParagraphStyle("MBodyL", parent=styles["Normal"], fontSize=9, textColor=HexColor("#E0E0E0"), leading=_leading(9)),
+        lbullet=ParagraphStyle("MBulletL", parent=styles["Normal"], fontSize=8.5, textColor=HexColor("#E0E0E0"), leading=_leading(8.5), leftIndent=8, bulletIndent=0),
+        rsection=ParagraphStyle("MSectionR", parent=styles["Heading2"], fontSize=SIZE_SECTION, textColor=GREEN_800, spaceBefore=4 * mm, spaceAfter=1 * mm, keepWithNext=1),
+        rbody=ParagraphStyle("MBodyR", parent=styles["Normal"], fontSize=SIZE_BODY, textColor=GRAY_700, leading=_leading(SIZE_BODY)),
+        rbullet=ParagraphStyle("MBulletR", parent=styles["Normal"], fontSize=9.5, textColor=GRAY_700, leading=_leading(9.5), leftIndent=12, bulletIndent=2),
+        rtitle=ParagraphStyle("MTitleR", parent=styles["Normal"], fontSize=SIZE_ENTRY_TITLE, textColor=GRAY_900, leading=_leading(SIZE_ENTRY_TITLE)),
+        rsub=ParagraphStyle("MSubR", parent=styles["Normal"], fontSize=SIZE_SUB, textColor=GRAY_400, leading=_leading(SIZE_SUB)),
+        columns_ts=TableStyle([
+            ("BACKGROUND", (0, 0), (0, 0), GREEN_800),
+            ("VALIGN", (0, 0), (-1, -1), "TOP"),
+            ("TOPPADDING", (0, 0), (-1, -1), 14),
+            ("BOTTOMPADDING", (0, 0), (-1, -1), 14),
+            ("LEFTPADDING", (0, 0), (0, 0), 14),
+            ("RIGHTPADDING", (0, 0), (0, 0), 12),
+            ("LEFTPADDING", (1, 0), (1, 0), 14),
+            ("RIGHTPADDING", (1, 0), (1, 0), 8),
+        ]),
+    )
+
+
 def _generate_modern(data: dict) -> bytes:
     buffer = io.BytesIO()
     doc = SimpleDocTemplate(
@@ -304,124 +378,101 @@ def _generate_modern(data: dict) -> bytes:
         topMargin=MARGIN_TIGHT, bottomMargin=MARGIN_TIGHT,
         leftMargin=MARGIN_TIGHT, rightMargin=MARGIN_TIGHT,
     )
-    styles = getSampleStyleSheet()
+    st = get_template_styles("modern")
     page_w = A4[0] - 2 * MARGIN_TIGHT
 
-    # Left column styles (white text on dark bg)
-    s_lname = ParagraphStyle("MNameL", parent=styles["Title"], fontSize=16, textColor=WHITE, spaceAfter=2 * mm, alignment=TA_LEFT)
-    s_lcontact = ParagraphStyle("MContactL", parent=styles["Normal"], fontSize=8.5, textColor=HexColor("#BBFFBB"), leading=_leading(8.5))
-    s_lsection = ParagraphStyle("MSectionL", parent=styles["Heading3"], fontSize=10, textColor=WHITE, spaceBefore=4 * mm, spaceAfter=1.5 * mm)
-    s_lbody = ParagraphStyle("MBodyL", parent=styles["Normal"], fontSize=9, textColor=HexColor("#E0E0E0"), leading=_leading(9))
-    s_lbullet = ParagraphStyle("MBulletL", parent=styles["Normal"], fontSize=8.5, textColor=HexColor("#E0E0E0"), leading=_leading(8.5), leftIndent=8, bulletIndent=0)
-
-    # Right column styles
-    s_rsection = ParagraphStyle("MSectionR", parent=styles["Heading2"], fontSize=SIZE_SECTION, textColor=GREEN_800, spaceBefore=4 * mm, spaceAfter=1 * mm, keepWithNext=1)
-    s_rbody = ParagraphStyle("MBodyR", parent=styles["Normal"], fontSize=SIZE_BODY, textColor=GRAY_700, leading=_leading(SIZE_BODY))
-    s_rbullet = ParagraphStyle("MBulletR", parent=styles["Normal"], fontSize=9.5, textColor=GRAY_700, leading=_leading(9.5), leftIndent=12, bulletIndent=2)
-    s_rtitle = ParagraphStyle("MTitleR", parent=styles["Normal"], fontSize=SIZE_ENTRY_TITLE, textColor=GRAY_900, leading=_leading(SIZE_ENTRY_TITLE))
-    s_rsub = ParagraphStyle("MSubR", parent=styles["Normal"], fontSize=SIZE_SUB, textColor=GRAY_400, leading=_leading(SIZE_SUB))
-
     pi = data.get("personal_info", {})
     skills = data.get("skills", {})
 
     # Build left column content
     left_elements = []
-    left_elements.append(Paragraph(pi.get("name", ""), s_lname))
+    left_elements.append(Paragraph(pi.get("name", ""), st.lname))
     for field in ["email", "phone", "location", "linkedin", "portfolio"]:
         val = pi.get(field)
         if val:
-            left_elements.append(Paragraph(val, s_lcontact))
+            left_elements.append(Paragraph(val, st.lcontact))
 
     # Skills in left column — bulleted for better readability
     if skills.get("technical"):
-        left_elements.append(Paragraph("SKILLS", s_lsection))
+        left_elements.append(Paragraph("SKILLS", st.lsection))
         for sk in skills["technical"]:
-            left_elements.append(Paragraph(sk, s_lbullet, bulletText=BULLET_CHAR))
+            left_elements.append(Paragraph(sk, st.lbullet, bulletText=BULLET_CHAR))
     if skills.get("tools"):
-        left_elements.append(Paragraph("TOOLS", s_lsection))
+        left_elements.append(Paragraph("TOOLS", st.lsection))
         for sk in skills["tools"]:
-            left_elements.append(Paragraph(sk, s_lbullet, bulletText=BULLET_CHAR))
+            left_elements.append(Paragraph(sk, st.lbullet, bulletText=BULLET_CHAR))
     if skills.get("languages"):
-        left_elements.append(Paragraph("LANGUAGES", s_lsection))
-        left_elements.append(Paragraph(", ".join(skills["languages"]), s_lbody))
+        left_elements.append(Paragraph("LANGUAGES", st.lsection))
+        left_elements.append(Paragraph(", ".join(skills["languages"]), st.lbody))
     if skills.get("soft"):
-        left_elements.append(Paragraph("SOFT SKILLS", s_lsection))
-        left_elements.append(Paragraph(", ".join(skills["soft"]), s_lbody))
+        left_elements.append(Paragraph("SOFT SKILLS", st.lsection))
+        left_elements.append(Paragraph(", ".join(skills["soft"]), st.lbody))
 
     certs = data.get("certifications", [])
     if certs:
-        left_elements.append(Paragraph("CERTIFICATIONS", s_lsection))
+        left_elements.append(Paragraph("CERTIFICATIONS", st.lsection))
         for c in certs:
-            left_elements.append(Paragraph(f"{BULLET_CHAR} {c.get('name', '')} ({c.get('year', '')})", s_lbody))
+            left_elements.append(Paragraph(f"{BULLET_CHAR} {c.get('name', '')} ({c.get('year', '')})", st.lbody))
 
     # Build right column content
     right_elements = []
 
     obj = data.get("objective", "")
     if obj:
-        right_elements.append(Paragraph("OBJECTIVE", s_rsection))
+        right_elements.append(Paragraph("OBJECTIVE", st.rsection))
         right_elements.append(HRFlowable(width="100%", thickness=0.5, color=GREEN_800, spaceAfter=SPACE_SECTION_AFTER))
-        right_elements.append(Paragraph(f"<i>{obj}</i>", s_rbody))
+        right_elements.append(Paragraph(f"<i>{obj}</i>", st.rbody))
 
     edu_list = data.get("education", [])
     if edu_list:
-        right_elements.append(Paragraph("EDUCATION", s_rsection))
+        right_elements.append(Paragraph("EDUCATION", st.rsection))
         right_elements.append(HRFlowable(width="100%", thickness=0.5, color=GREEN_800, spaceAfter=SPACE_SECTION_AFTER))
         for e in edu_list:
-            right_elements.append(Paragraph(f"<b>{e.get('degree', '')}</b> — {e.get('institution', '')}", s_rtitle))
+            right_elements.append(Paragraph(f"<b>{e.get('degree', '')}</b> — {e.get('institution', '')}", st.rtitle))
             sub = [p for p in [e.get("year"), e.get("grade")] if p]
             if sub:
-                right_elements.append(Paragraph(" | ".join(sub), s_rsub))
+                right_elements.append(Paragraph(" | ".join(sub), st.rsub))
             right_elements.append(Spacer(1, SPACE_ENTRY_GAP))
 
     exp_list = data.get("experience", [])
     if exp_list:
-        right_elements.append(Paragraph("EXPERIENCE", s_rsection))
+        right_elements.append(Paragraph("EXPERIENCE", st.rsection))
         right_elements.append(HRFlowable(width="100%", thickness=0.5, color=GREEN_800, spaceAfter=SPACE_SECTION_AFTER))
         for exp in exp_list:
-            right_elements.append(Paragraph(f"<b>{exp.get('title', '')}</b> — {exp.get('company', '')}", s_rtitle))
+            right_elements.append(Paragraph(f"<b>{exp.get('title', '')}</b> — {exp.get('company', '')}", st.rtitle))
             if exp.get("duration"):
-                right_elements.append(Paragraph(exp["duration"], s_rsub))
+                right_elements.append(Paragraph(exp["duration"], st.rsub))
             for b in exp.get("bullets", []):
-                right_elements.append(Paragraph(b, s_rbullet, bulletText=BULLET_CHAR))
+                right_elements.append(Paragraph(b, st.rbullet, bulletText=BULLET_CHAR))
             right_elements.append(Spacer(1, SPACE_ENTRY_GAP))
 
     proj_list = data.get("projects", [])
     if proj_list:
-        right_elements.append(Paragraph("PROJECTS", s_rsection))
+        right_elements.append(Paragraph("PROJECTS", st.rsection))
         right_elements.append(HRFlowable(width="100%", thickness=0.5, color=GREEN_800, spaceAfter=SPACE_SECTION_AFTER))
         for p in proj_list:
             tech = f" ({', '.join(p.get('tech_stack', []))})" if p.get("tech_stack") else ""
-            right_elements.append(Paragraph(f"<b>{p.get('name', '')}</b>{tech}", s_rtitle))
+            right_elements.append(Paragraph(f"<b>{p.get('name', '')}</b>{tech}", st.rtitle))
             for b in p.get("bullets", []):
-                right_elements.append(Paragraph(b, s_rbullet, bulletText=BULLET_CHAR))
+                right_elements.append(Paragraph(b, st.rbullet, bulletText=BULLET_CHAR))
             right_elements.append(Spacer(1, SPACE_ENTRY_GAP))
 
     achievements = data.get("achievements", [])
     if achievements:
-        right_elements.append(Paragraph("ACHIEVEMENTS", s_rsection))
+        right_elements.append(Paragraph("ACHIEVEMENTS", st.rsection))
         right_elements.append(HRFlowable(width="100%", thickness=0.5, color=GREEN_800, spaceAfter=SPACE_SECTION_AFTER))
         for a in achievements:
-            right_elements.append(Paragraph(a, s_rbullet, bulletText=BULLET_CHAR))
+            right_elements.append(Paragraph(a, st.rbullet, bulletText=BULLET_CHAR))
 
     # Combine into two-column table
     left_w = page_w * 0.30
     right_w = page_w * 0.70
 
-    left_cell = left_elements if left_elements else [Paragraph("", s_lbody)]
-    right_cell = right_elements if right_elements else [Paragraph("", s_rbody)]
+    left_cell = left_elements if left_elements else [Paragraph("", st.lbody)]
+    right_cell = right_elements if right_elements else [Paragraph("", st.rbody)]
 
     t = Table([[left_cell, right_cell]], colWidths=[left_w, right_w])
-    t.setStyle(TableStyle([
-        ("BACKGROUND", (0, 0), (0, 0), GREEN_800),
-        ("VALIGN", (0, 0), (-1, -1), "TOP"),
-        ("TOPPADDING", (0, 0), (-1, -1), 14),
-        ("BOTTOMPADDING", (0, 0), (-1, -1), 14),
-        ("LEFTPADDING", (0, 0), (0, 0), 14),
-        ("RIGHTPADDING", (0, 0), (0, 0), 12),
-        ("LEFTPADDING", (1, 0), (1, 0), 14),
-        ("RIGHTPADDING", (1, 0), (1, 0), 8),
-    ]))
+    t.setStyle(st.columns_ts)
 
     elements = [t]
     doc.build(elements, onFirstPage=_draw_page_footer, onLaterPages=_draw_page_footer)
@@ -432,6 +483,20 @@ def _generate_modern(data: dict) -> bytes:
 # ─── Template 3: Simple (ATS-Optimized) ─────────────────────
 
 
+@_template_styles("simple")
+def _simple_styles() -> SimpleNamespace:
+    styles = getSampleStyleSheet()
+    return SimpleNamespace(
+        name=ParagraphStyle("SName", parent=styles["Title"], fontSize=SIZE_NAME, textColor=GRAY_900, spaceAfter=1 * mm, alignment=TA_CENTER),
+        contact=ParagraphStyle("SContact", parent=styles["Normal"], fontSize=SIZE_CONTACT, textColor=GRAY_600, alignment=TA_CENTER, spaceAfter=4 * mm),
+        section=ParagraphStyle("SSection", parent=styles["Heading2"], fontSize=SIZE_SECTION, textColor=GRAY_900, spaceBefore=SPACE_SECTION_BEFORE, spaceAfter=1 * mm, keepWithNext=1),
+        body=ParagraphStyle("SBody", parent=styles["Normal"], fontSize=SIZE_BODY, textColor=GRAY_700, leading=_leading(SIZE_BODY)),
+        bullet=ParagraphStyle("SBullet", parent=styles["Normal"], fontSize=SIZE_BODY, textColor=GRAY_700, leading=_leading(SIZE_BODY), leftIndent=14, bulletIndent=4),
+        entry=ParagraphStyle("SEntry", parent=styles["Normal"], fontSize=SIZE_BODY, textColor=GRAY_900, leading=_leading(SIZE_BODY)),
+        sub=ParagraphStyle("SSub", parent=styles["Normal"], fontSize=SIZE_SUB, textColor=GRAY_600, leading=_leading(SIZE_SUB)),
+    )
+
+
 def _generate_simple(data: dict) -> bytes:
     buffer = io.BytesIO()
     doc = SimpleDocTemplate(
@@ -439,105 +504,97 @@ def _generate_simple(data: dict) -> bytes:
         topMargin=MARGIN_STANDARD, bottomMargin=MARGIN_STANDARD,
         leftMargin=MARGIN_STANDARD, rightMargin=MARGIN_STANDARD,
     )
-    styles = getSampleStyleSheet()
-
-    s_name = ParagraphStyle("SName", parent=styles["Title"], fontSize=SIZE_NAME, textColor=GRAY_900, spaceAfter=1 * mm, alignment=TA_CENTER)
-    s_contact = ParagraphStyle("SContact", parent=styles["Normal"], fontSize=SIZE_CONTACT, textColor=GRAY_600, alignment=TA_CENTER, spaceAfter=4 * mm)
-    s_section = ParagraphStyle("SSection", parent=styles["Heading2"], fontSize=SIZE_SECTION, textColor=GRAY_900, spaceBefore=SPACE_SECTION_BEFORE, spaceAfter=1 * mm, keepWithNext=1)
-    s_body = ParagraphStyle("SBody", parent=styles["Normal"], fontSize=SIZE_BODY, textColor=GRAY_700, leading=_leading(SIZE_BODY))
-    s_bullet = ParagraphStyle("SBullet", parent=styles["Normal"], fontSize=SIZE_BODY, textColor=GRAY_700, leading=_leading(SIZE_BODY), leftIndent=14, bulletIndent=4)
-    s_entry = ParagraphStyle("SEntry", parent=styles["Normal"], fontSize=SIZE_BODY, textColor=GRAY_900, leading=_leading(SIZE_BODY))
-    s_sub = ParagraphStyle("SSub", parent=styles["Normal"], fontSize=SIZE_SUB, textColor=GRAY_600, leading=_leading(SIZE_SUB))
+    st = get_template_styles("simple")
 
     elements = []
     pi = data.get("personal_info", {})
 
     # Header — centered, clean
-    elements.append(Paragraph(pi.get("name", ""), s_name))
+    elements.append(Paragraph(pi.get("name", ""), st.name))
     contact_parts = [p for p in [pi.get("email"), pi.get("phone"), pi.get("location")] if p]
     if pi.get("linkedin"):
         contact_parts.append(pi["linkedin"])
-    elements.append(Paragraph(CONTACT_SEP.join(contact_parts), s_contact))
+    elements.append(Paragraph(CONTACT_SEP.join(contact_parts), st.contact))
 
     # Objective
     obj = data.get("objective", "")
     if obj:
-        elements.append(Paragraph("CAREER OBJECTIVE", s_section))
+        elements.append(Paragraph("CAREER OBJECTIVE", st.section))
         elements.append(HRFlowable(width="100%", thickness=0.5, color=GRAY_200, spaceAfter=SPACE_SECTION_AFTER))
-        elements.append(Paragraph(obj, s_body))
+        elements.append(Paragraph(obj, st.body))
 
     # Education
     edu_list = data.get("education", [])
     if edu_list:
-        elements.append(Paragraph("EDUCATION", s_section))
+        elements.append(Paragraph("EDUCATION", st.section))
         elements.append(HRFlowable(width="100%", thickness=0.5, color=GRAY_200, spaceAfter=SPACE_SECTION_AFTER))
         for e in edu_list:
             entry = []
-            entry.append(Paragraph(f"<b>{e.get('degree', '')}</b> — {e.get('institution', '')}", s_entry))
+            entry.append(Paragraph(f"<b>{e.get('degree', '')}</b> — {e.get('institution', '')}", st.entry))
             sub = [p for p in [e.get("year"), e.get("grade"), e.get("board")] if p]
             if sub:
-                entry.append(Paragraph(" | ".join(sub), s_sub))
+                entry.append(Paragraph(" | ".join(sub), st.sub))
             entry.append(Spacer(1, SPACE_ENTRY_GAP))
             elements.append(KeepTogether(entry))
 
     # Experience
     exp_list = data.get("experience", [])
     if exp_list:
-        elements.append(Paragraph("EXPERIENCE", s_section))
+        elements.append(Paragraph("EXPERIENCE", st.section))
         elements.append(HRFlowable(width="100%", thickness=0.5, color=GRAY_200, spaceAfter=SPACE_SECTION_AFTER))
         for exp in exp_list:
             entry = []
-            entry.append(Paragraph(f"<b>{exp.get('title', '')}</b> — {exp.get('company', '')} ({exp.get('duration', '')})", s_entry))
+            entry.append(Paragraph(f"<b>{exp.get('title', '')}</b> — {exp.get('company', '')} ({exp.get('duration', '')})", st.entry))
             for b in exp.get("bullets", []):
-                entry.append(Paragraph(b, s_bullet, bulletText=BULLET_CHAR))
+                entry.append(Paragraph(b, st.bullet, bulletText=BULLET_CHAR))
             entry.append(Spacer(1, SPACE_ENTRY_GAP))
             elements.append(KeepTogether(entry))
 
     # Projects
     proj_list = data.get("projects", [])
     if proj_list:
-        elements.append(Paragraph("PROJECTS", s_section))
+        elements.append(Paragraph("PROJECTS", st.section))
         elements.append(HRFlowable(width="100%", thickness=0.5, color=GRAY_200, spaceAfter=SPACE_SECTION_AFTER))
         for p in proj_list:
             entry = []
             tech = f" [{', '.join(p.get('tech_stack', []))}]" if p.get("tech_stack") else ""
-            entry.append(Paragraph(f"<b>{p.get('name', '')}</b>{tech}", s_entry))
+            entry.append(Paragraph(f"<b>{p.get('name', '')}</b>{tech}", st.entry))
             if p.get("description"):
-                entry.append(Paragraph(p["description"], s_sub))
+                entry.append(Paragraph(p["description"], st.sub))
             for b in p.get("bullets", []):
-                entry.append(Paragraph(b, s_bullet, bulletText=BULLET_CHAR))
+                entry.append(Paragraph(b, st.bullet, bulletText=BULLET_CHAR))
             entry.append(Spacer(1, SPACE_ENTRY_GAP))
             elements.append(KeepTogether(entry))
 
     # Skills — categorized for clarity while staying ATS-friendly
     skills = data.get("skills", {})
     if any(skills.get(k) for k in ["technical", "soft", "languages", "tools"]):
-        elements.append(Paragraph("SKILLS", s_section))
+        elements.append(Paragraph("SKILLS", st.section))
         elements.append(HRFlowable(width="100%", thickness=0.5, color=GRAY_200, spaceAfter=SPACE_SECTION_AFTER))
         if skills.get("technical"):
-            elements.append(Paragraph(f"<b>Technical:</b> {', '.join(skills['technical'])}", s_body))
+            elements.append(Paragraph(f"<b>Technical:</b> {', '.join(skills['technical'])}", st.body))
         if skills.get("tools"):
-            elements.append(Paragraph(f"<b>Tools:</b> {', '.join(skills['tools'])}", s_body))
+            elements.append(Paragraph(f"<b>Tools:</b> {', '.join(skills['tools'])}", st.body))
         if skills.get("soft"):
-            elements.append(Paragraph(f"<b>Soft Skills:</b> {', '.join(skills['soft'])}", s_body))
+            elements.append(Paragraph(f"<b>Soft Skills:</b> {', '.join(skills['soft'])}", st.body))
         if skills.get("languages"):
-            elements.append(Paragraph(f"<b>Languages:</b> {', '.join(skills['languages'])}", s_body))
+            elements.append(Paragraph(f"<b>Languages:</b> {', '.join(skills['languages'])}", st.body))
 
     # Achievements
     achievements = data.get("achievements", [])
     if achievements:
-        elements.append(Paragraph("ACHIEVEMENTS", s_section))
+        elements.append(Paragraph("ACHIEVEMENTS", st.section))
         elements.append(HRFlowable(width="100%", thickness=0.5, color=GRAY_200, spaceAfter=SPACE_SECTION_AFTER))
         for a in achievements:
-            elements.append(Paragraph(a, s_bullet, bulletText=BULLET_CHAR))
+            elements.append(Paragraph(a, st.bullet, bulletText=BULLET_CHAR))
 
     # Certifications
     certs = data.get("certifications", [])
     if certs:
-        elements.append(Paragraph("CERTIFICATIONS", s_section))
+        elements.append(Paragraph("CERTIFICATIONS", st.section))
         elements.append(HRFlowable(width="100%", thickness=0.5, color=GRAY_200, spaceAfter=SPACE_SECTION_AFTER))
         for c in certs:
-            elements.append(Paragraph(f"{c.get('name', '')} — {c.get('issuer', '')} ({c.get('year', '')})", s_body))
+            elements.append(Paragraph(f"{c.get('name', '')} — {c.get('issuer', '')} ({c.get('year', '')})", st.body))
 
     doc.build(elements, onFirstPage=_draw_page_footer, onLaterPages=_draw_page_footer)
     buffer.seek(0)
@@ -552,6 +609,21 @@ RENDERCV_GRAY = HexColor("#555555")
 RENDERCV_LIGHT = HexColor("#888888")
 
 
+@_template_styles("rendercv")
+def _rendercv_styles() -> SimpleNamespace:
+    styles = getSampleStyleSheet()
+    return SimpleNamespace(
+        name=ParagraphStyle("RCVName", parent=styles["Title"], fontSize=SIZE_NAME, textColor=RENDERCV_DARK, spaceAfter=2 * mm, alignment=TA_CENTER, fontName="Helvetica-Bold"),
+        contact=ParagraphStyle("RCVContact", parent=styles["Normal"], fontSize=SIZE_CONTACT, textColor=RENDERCV_BLUE, spaceAfter=3 * mm, alignment=TA_CENTER, leading=_leading(SIZE_CONTACT)),
+        section=ParagraphStyle("RCVSection", parent=styles["Heading2"], fontSize=SIZE_SECTION, textColor=RENDERCV_BLUE, spaceBefore=SPACE_SECTION_BEFORE, spaceAfter=1 * mm, fontName="Helvetica-Bold", keepWithNext=1),
+        entry_l=ParagraphStyle("RCVEntryL", parent=styles["Normal"], fontSize=SIZE_ENTRY_TITLE, textColor=RENDERCV_DARK, leading=_leading(SIZE_ENTRY_TITLE), fontName="Helvetica-Bold"),
+        entry_r=ParagraphStyle("RCVEntryR", parent=styles["Normal"], fontSize=SIZE_SUB, textColor=RENDERCV_GRAY, leading=_leading(SIZE_SUB), alignment=TA_RIGHT),
+        sub=ParagraphStyle("RCVSub", parent=styles["Normal"], fontSize=SIZE_SUB, textColor=RENDERCV_GRAY, leading=_leading(SIZE_SUB)),
+        bullet=ParagraphStyle("RCVBullet", parent=styles["Normal"], fontSize=SIZE_BODY, textColor=RENDERCV_GRAY, leading=_leading(SIZE_BODY), leftIndent=14, bulletIndent=4),
+        skills=ParagraphStyle("RCVSkills", parent=styles["Normal"], fontSize=SIZE_BODY, textColor=RENDERCV_DARK, leading=_leading(SIZE_BODY)),
+    )
+
+
 def _generate_rendercv(data: dict) -> bytes:
     buffer = io.BytesIO()
     doc = SimpleDocTemplate(
@@ -559,23 +631,14 @@ def _generate_rendercv(data: dict) -> bytes:
         topMargin=MARGIN_TIGHT, bottomMargin=MARGIN_TIGHT,
         leftMargin=MARGIN_TIGHT, rightMargin=MARGIN_TIGHT,
     )
-    styles = getSampleStyleSheet()
+    st = get_template_styles("rendercv")
     page_w = A4[0] - 2 * MARGIN_TIGHT
 
-    s_name = ParagraphStyle("RCVName", parent=styles["Title"], fontSize=SIZE_NAME, textColor=RENDERCV_DARK, spaceAfter=2 * mm, alignment=TA_CENTER, fontName="Helvetica-Bold")
-    s_contact = ParagraphStyle("RCVContact", parent=styles["Normal"], fontSize=SIZE_CONTACT, textColor=RENDERCV_BLUE, spaceAfter=3 * mm, alignment=TA_CENTER, leading=_leading(SIZE_CONTACT))
-    s_section = ParagraphStyle("RCVSection", parent=styles["Heading2"], fontSize=SIZE_SECTION, textColor=RENDERCV_BLUE, spaceBefore=SPACE_SECTION_BEFORE, spaceAfter=1 * mm, fontName="Helvetica-Bold", keepWithNext=1)
-    s_entry_l = ParagraphStyle("RCVEntryL", parent=styles["Normal"], fontSize=SIZE_ENTRY_TITLE, textColor=RENDERCV_DARK, leading=_leading(SIZE_ENTRY_TITLE), fontName="Helvetica-Bold")
-    s_entry_r = ParagraphStyle("RCVEntryR", parent=styles["Normal"], fontSize=SIZE_SUB, textColor=RENDERCV_GRAY, leading=_leading(SIZE_SUB), alignment=TA_RIGHT)
-    s_sub = ParagraphStyle("RCVSub", parent=styles["Normal"], fontSize=SIZE_SUB, textColor=RENDERCV_GRAY, leading=_leading(SIZE_SUB))
-    s_bullet = ParagraphStyle("RCVBullet", parent=styles["Normal"], fontSize=SIZE_BODY, textColor=RENDERCV_GRAY, leading=_leading(SIZE_BODY), leftIndent=14, bulletIndent=4)
-    s_skills = ParagraphStyle("RCVSkills", parent=styles["Normal"], fontSize=SIZE_BODY, textColor=RENDERCV_DARK, leading=_leading(SIZE_BODY))
-
     elements = []
     pi = data.get("personal_info", {})
 
     # Name
-    elements.append(Paragraph(pi.get("name", ""), s_name))
+    elements.append(Paragraph(pi.get("name", ""), st.name))
 
     # Contact line
     contact_items = []
@@ -590,10 +653,10 @@ def _generate_rendercv(data: dict) -> bytes:
     if pi.get("linkedin"):
         contact_items.append(pi["linkedin"])
     if contact_items:
-        elements.append(Paragraph(CONTACT_SEP.join(contact_items), s_contact))
+        elements.append(Paragraph(CONTACT_SEP.join(contact_items), st.contact))
 
     def add_section(title):
-        elements.append(Paragraph(title, s_section))
+        elements.append(Paragraph(title, st.section))
         elements.append(HRFlowable(width="100%", thickness=0.75, color=RENDERCV_BLUE, spaceAfter=SPACE_SECTION_AFTER))
 
     # Education
@@ -604,13 +667,13 @@ def _generate_rendercv(data: dict) -> bytes:
             entry = []
             entry.append(_build_entry_row(
                 f"<b>{e.get('institution', '')}</b>", e.get("year", ""),
-                s_entry_l, s_entry_r, page_w,
+                st.entry_l, st.entry_r, page_w,
             ))
             degree_line = e.get("degree", "")
             if e.get("grade"):
                 degree_line += f" | {e['grade']}"
             if degree_line:
-                entry.append(Paragraph(degree_line, s_sub))
+                entry.append(Paragraph(degree_line, st.sub))
             entry.append(Spacer(1, SPACE_ENTRY_GAP))
             elements.append(KeepTogether(entry))
 
@@ -623,9 +686,9 @@ def _generate_rendercv(data: dict) -> bytes:
             left = f"<b>{exp.get('title', '')}</b>"
             if exp.get("company"):
                 left += f", <i>{exp['company']}</i>"
-            entry.append(_build_entry_row(left, exp.get("duration", ""), s_entry_l, s_entry_r, page_w))
+            entry.append(_build_entry_row(left, exp.get("duration", ""), st.entry_l, st.entry_r, page_w))
             for b in exp.get("bullets", []):
-                entry.append(Paragraph(b, s_bullet, bulletText=BULLET_CHAR))
+                entry.append(Paragraph(b, st.bullet, bulletText=BULLET_CHAR))
             entry.append(Spacer(1, SPACE_ENTRY_GAP))
             elements.append(KeepTogether(entry))
 
@@ -639,11 +702,11 @@ def _generate_rendercv(data: dict) -> bytes:
             ts = p.get("tech_stack", [])
             if ts:
                 title += f"  <font color='#888888'>({', '.join(ts)})</font>"
-            entry.append(Paragraph(title, s_entry_l))
+            entry.append(Paragraph(title, st.entry_l))
             if p.get("description"):
-                entry.append(Paragraph(p["description"], s_sub))
+                entry.append(Paragraph(p["description"], st.sub))
             for b in p.get("bullets", []):
-                entry.append(Paragraph(b, s_bullet, bulletText=BULLET_CHAR))
+                entry.append(Paragraph(b, st.bullet, bulletText=BULLET_CHAR))
             entry.append(Spacer(1, SPACE_ENTRY_GAP))
             elements.append(KeepTogether(entry))
 
@@ -653,7 +716,7 @@ def _generate_rendercv(data: dict) -> bytes:
         add_section("Skills")
         for cat, key in [("Technical Skills", "technical"), ("Languages", "languages"), ("Tools & Frameworks", "tools"), ("Soft Skills", "soft")]:
             if skills.get(key):
-                elements.append(Paragraph(f"<b>{cat}:</b> {', '.join(skills[key])}", s_skills))
+                elements.append(Paragraph(f"<b>{cat}:</b> {', '.join(skills[key])}", st.skills))
                 elements.append(Spacer(1, 1 * mm))
 
     # Achievements
@@ -661,7 +724,7 @@ def _generate_rendercv(data: dict) -> bytes:
     if achievements:
         add_section("Achievements")
         for a in achievements:
-            elements.append(Paragraph(a, s_bullet, bulletText=BULLET_CHAR))
+            elements.append(Paragraph(a, st.bullet, bulletText=BULLET_CHAR))
 
     # Certifications
     certs = data.get("certifications", [])
@@ -672,7 +735,7 @@ def _generate_rendercv(data: dict) -> bytes:
             parts = [p for p in [c.get("issuer"), c.get("year")] if p]
             if parts:
                 line += f" -- {', '.join(parts)}"
-            elements.append(Paragraph(line, s_skills))
+            elements.append(Paragraph(line, st.skills))
 
     doc.build(elements, onFirstPage=_draw_page_footer, onLaterPages=_draw_page_footer)
     buffer.seek(0)
@@ -687,6 +750,7 @@ SIDEBAR_WHITE = Color(1, 1, 1)
 SIDEBAR_DARK = HexColor("#2D2D2D")
 SIDEBAR_LIGHT = Color(0.9, 0.9, 0.9)
 SIDEBAR_DIM = Color(0.7, 0.7, 0.7)
+SIDEBAR_PHOTO_SIZE = 50 * mm  # profile_image_service.PHOTO_PX is sized for this
 
 
 class CircularImage(Flowable):
@@ -711,15 +775,13 @@ class CircularImage(Flowable):
         )
 
 
-def _fetch_image_bytes(url: str) -> io.BytesIO | None:
-    """Download image from URL into BytesIO."""
-    if not url:
+def _load_image(path: str | None) -> io.BytesIO | None:
+    if not path:
         return None
     try:
-        req = urllib.request.Request(url, headers={"User-Agent": "Mozilla/5.0"})
-        with urllib.request.urlopen(req, timeout=10) as resp:
-            return io.BytesIO(resp.read())
-    except Exception:
+        with open(path, "rb") as f:
+            return io.BytesIO(f.read())
+    except OSError:
         return None
 
 
@@ -733,7 +795,33 @@ def _draw_sidebar_bg(canvas, doc):
     canvas.rect(sw, 0, w - sw, h, fill=1, stroke=0)
 
 
-def _generate_sidebar(data: dict, profile_image_url: str | None = None) -> bytes:
+@_template_styles("sidebar")
+def _sidebar_styles() -> SimpleNamespace:
+    styles = getSampleStyleSheet()
+    return SimpleNamespace(
+        sname=ParagraphStyle("SBName", parent=styles["Title"], fontSize=18, textColor=SIDEBAR_WHITE, spaceAfter=1 * mm, alignment=TA_LEFT, fontName="Helvetica-Bold"),
+        stitle=ParagraphStyle("SBTitle", parent=styles["Normal"], fontSize=SIZE_BODY, textColor=SIDEBAR_LIGHT, spaceAfter=3 * mm, leading=_leading(SIZE_BODY)),
+        ssection=ParagraphStyle("SBSect", parent=styles["Heading3"], fontSize=10, textColor=SIDEBAR_WHITE, spaceBefore=4 * mm, spaceAfter=1.5 * mm, fontName="Helvetica-Bold"),
+        slabel=ParagraphStyle("SBLabel", parent=styles["Normal"], fontSize=SIZE_SMALL, textColor=SIDEBAR_DIM, leading=_leading(SIZE_SMALL)),
+        svalue=ParagraphStyle("SBVal", parent=styles["Normal"], fontSize=SIZE_SUB, textColor=SIDEBAR_WHITE, leading=_leading(SIZE_SUB)),
+        sbody=ParagraphStyle("SBBody", parent=styles["Normal"], fontSize=SIZE_SUB, textColor=SIDEBAR_LIGHT, leading=_leading(SIZE_SUB)),
+        msection=ParagraphStyle("SBMSect", parent=styles["Heading2"], fontSize=13, textColor=SIDEBAR_TEAL, spaceBefore=SPACE_SECTION_BEFORE, spaceAfter=SPACE_SECTION_AFTER, fontName="Helvetica-Bold", keepWithNext=1),
+        mentry=ParagraphStyle("SBMEntry", parent=styles["Normal"], fontSize=SIZE_BODY, textColor=SIDEBAR_DARK, leading=_leading(SIZE_BODY)),
+        msub=ParagraphStyle("SBMSub", parent=styles["Normal"], fontSize=SIZE_SUB, textColor=HexColor("#888888"), leading=_leading(SIZE_SUB)),
+        mbullet=ParagraphStyle("SBMBull", parent=styles["Normal"], fontSize=9.5, textColor=SIDEBAR_DARK, leading=_leading(9.5), leftIndent=12, bulletIndent=2),
+        columns_ts=TableStyle([
+            ("VALIGN", (0, 0), (-1, -1), "TOP"),
+            ("TOPPADDING", (0, 0), (-1, -1), 8),
+            ("BOTTOMPADDING", (0, 0), (-1, -1), 8),
+            ("LEFTPADDING", (0, 0), (0, 0), 12 * mm),
+            ("RIGHTPADDING", (0, 0), (0, 0), 8 * mm),
+            ("LEFTPADDING", (1, 0), (1, 0), 8 * mm),
+            ("RIGHTPADDING", (1, 0), (1, 0), 12 * mm),
+        ]),
+    )
+
+
+def _generate_sidebar(data: dict, profile_image_path: str | None = None) -> bytes:
     buffer = io.BytesIO()
     w, h = A4
     sw = w * 0.38
@@ -747,79 +835,64 @@ def _generate_sidebar(data: dict, profile_image_url: str | None = None) -> bytes
     full_frame = Frame(0, 0, w, h, id="full", leftPadding=0, rightPadding=0, topPadding=12 * mm, bottomPadding=12 * mm)
     doc.addPageTemplates([PageTemplate(id="sb", frames=[full_frame], onPage=_draw_sidebar_bg)])
 
-    styles = getSampleStyleSheet()
-
-    # Sidebar styles (white on teal)
-    s_sname = ParagraphStyle("SBName", parent=styles["Title"], fontSize=18, textColor=SIDEBAR_WHITE, spaceAfter=1 * mm, alignment=TA_LEFT, fontName="Helvetica-Bold")
-    s_stitle = ParagraphStyle("SBTitle", parent=styles["Normal"], fontSize=SIZE_BODY, textColor=SIDEBAR_LIGHT, spaceAfter=3 * mm, leading=_leading(SIZE_BODY))
-    s_ssection = ParagraphStyle("SBSect", parent=styles["Heading3"], fontSize=10, textColor=SIDEBAR_WHITE, spaceBefore=4 * mm, spaceAfter=1.5 * mm, fontName="Helvetica-Bold")
-    s_slabel = ParagraphStyle("SBLabel", parent=styles["Normal"], fontSize=SIZE_SMALL, textColor=SIDEBAR_DIM, leading=_leading(SIZE_SMALL))
-    s_svalue = ParagraphStyle("SBVal", parent=styles["Normal"], fontSize=SIZE_SUB, textColor=SIDEBAR_WHITE, leading=_leading(SIZE_SUB))
-    s_sbody = ParagraphStyle("SBBody", parent=styles["Normal"], fontSize=SIZE_SUB, textColor=SIDEBAR_LIGHT, leading=_leading(SIZE_SUB))
-
-    # Main styles (dark on cream)
-    s_msection = ParagraphStyle("SBMSect", parent=styles["Heading2"], fontSize=13, textColor=SIDEBAR_TEAL, spaceBefore=SPACE_SECTION_BEFORE, spaceAfter=SPACE_SECTION_AFTER, fontName="Helvetica-Bold", keepWithNext=1)
-    s_mentry = ParagraphStyle("SBMEntry", parent=styles["Normal"], fontSize=SIZE_BODY, textColor=SIDEBAR_DARK, leading=_leading(SIZE_BODY))
-    s_msub = ParagraphStyle("SBMSub", parent=styles["Normal"], fontSize=SIZE_SUB, textColor=HexColor("#888888"), leading=_leading(SIZE_SUB))
-    s_mbullet = ParagraphStyle("SBMBull", parent=styles["Normal"], fontSize=9.5, textColor=SIDEBAR_DARK, leading=_leading(9.5), leftIndent=12, bulletIndent=2)
+    st = get_template_styles("sidebar")
 
     pi = data.get("personal_info", {})
     skills = data.get("skills", {})
 
     # ── Sidebar content ──
     side = []
-    side.append(Paragraph(pi.get("name", ""), s_sname))
+    side.append(Paragraph(pi.get("name", ""), st.sname))
     obj = data.get("objective", "")
     if obj:
         short = obj[:100].rsplit(" ", 1)[0] + "..." if len(obj) > 100 else obj
-        side.append(Paragraph(short, s_stitle))
+        side.append(Paragraph(short, st.stitle))
 
     # Profile photo
-    if profile_image_url:
-        img_buf = _fetch_image_bytes(profile_image_url)
-        if img_buf:
-            side.append(Spacer(1, 3 * mm))
-            side.append(CircularImage(img_buf, size=50 * mm))
-            side.append(Spacer(1, 3 * mm))
+    img_buf = _load_image(profile_image_path)
+    if img_buf:
+        side.append(Spacer(1, 3 * mm))
+        side.append(CircularImage(img_buf, size=SIDEBAR_PHOTO_SIZE))
+        side.append(Spacer(1, 3 * mm))
 
     # Personal info
-    side.append(Paragraph("PERSONAL INFO", s_ssection))
+    side.append(Paragraph("PERSONAL INFO", st.ssection))
     for label, key in [("Email", "email"), ("Phone", "phone"), ("Location", "location")]:
         val = pi.get(key)
         if val:
-            side.append(Paragraph(label.upper(), s_slabel))
-            side.append(Paragraph(val, s_svalue))
+            side.append(Paragraph(label.upper(), st.slabel))
+            side.append(Paragraph(val, st.svalue))
             side.append(Spacer(1, 1.5 * mm))
 
     # Links
     links = [(k, pi.get(k)) for k in ["linkedin", "portfolio"] if pi.get(k)]
     if links:
-        side.append(Paragraph("LINKS", s_ssection))
+        side.append(Paragraph("LINKS", st.ssection))
         for label, val in links:
-            side.append(Paragraph(label.upper(), s_slabel))
-            side.append(Paragraph(val, s_svalue))
+            side.append(Paragraph(label.upper(), st.slabel))
+            side.append(Paragraph(val, st.svalue))
             side.append(Spacer(1, 1.5 * mm))
 
     # Skills
     if any(skills.get(k) for k in ["technical", "tools", "soft"]):
-        side.append(Paragraph("SKILLS", s_ssection))
+        side.append(Paragraph("SKILLS", st.ssection))
         for cat, key in [("Technical", "technical"), ("Tools", "tools"), ("Soft Skills", "soft")]:
             if skills.get(key):
-                side.append(Paragraph(cat.upper(), s_slabel))
-                side.append(Paragraph(", ".join(skills[key]), s_sbody))
+                side.append(Paragraph(cat.upper(), st.slabel))
+                side.append(Paragraph(", ".join(skills[key]), st.sbody))
                 side.append(Spacer(1, 2 * mm))
 
     # Languages
     if skills.get("languages"):
-        side.append(Paragraph("LANGUAGES", s_ssection))
-        side.append(Paragraph(", ".join(skills["languages"]), s_sbody))
+        side.append(Paragraph("LANGUAGES", st.ssection))
+        side.append(Paragraph(", ".join(skills["languages"]), st.sbody))
 
     # Certifications
     certs = data.get("certifications", [])
     if certs:
-        side.append(Paragraph("CERTIFICATIONS", s_ssection))
+        side.append(Paragraph("CERTIFICATIONS", st.ssection))
         for c in certs:
-            side.append(Paragraph(f"{BULLET_CHAR} {c.get('name', '')} ({c.get('year', '')})", s_sbody))
+            side.append(Paragraph(f"{BULLET_CHAR} {c.get('name', '')} ({c.get('year', '')})", st.sbody))
 
     # ── Main content ──
     main = []
@@ -827,43 +900,43 @@ def _generate_sidebar(data: dict, profile_image_url: str | None = None) -> bytes
     # Experience
     exp_list = data.get("experience", [])
     if exp_list:
-        main.append(Paragraph("WORK EXPERIENCE", s_msection))
+        main.append(Paragraph("WORK EXPERIENCE", st.msection))
         for exp in exp_list:
-            main.append(Paragraph(f"<b>{exp.get('title', '')}</b> -- {exp.get('company', '')}", s_mentry))
+            main.append(Paragraph(f"<b>{exp.get('title', '')}</b> -- {exp.get('company', '')}", st.mentry))
             if exp.get("duration"):
-                main.append(Paragraph(exp["duration"], s_msub))
+                main.append(Paragraph(exp["duration"], st.msub))
             for b in exp.get("bullets", []):
-                main.append(Paragraph(b, s_mbullet, bulletText=BULLET_CHAR))
+                main.append(Paragraph(b, st.mbullet, bulletText=BULLET_CHAR))
             main.append(Spacer(1, SPACE_ENTRY_GAP))
 
     # Education
     edu_list = data.get("education", [])
     if edu_list:
-        main.append(Paragraph("EDUCATION", s_msection))
+        main.append(Paragraph("EDUCATION", st.msection))
         for e in edu_list:
-            main.append(Paragraph(f"<b>{e.get('degree', '')}</b> -- {e.get('institution', '')}", s_mentry))
+            main.append(Paragraph(f"<b>{e.get('degree', '')}</b> -- {e.get('institution', '')}", st.mentry))
             sub = [p for p in [e.get("year"), e.get("grade")] if p]
             if sub:
-                main.append(Paragraph(" | ".join(sub), s_msub))
+                main.append(Paragraph(" | ".join(sub), st.msub))
             main.append(Spacer(1, SPACE_ENTRY_GAP))
 
     # Projects
     proj_list = data.get("projects", [])
     if proj_list:
-        main.append(Paragraph("PROJECTS", s_msection))
+        main.append(Paragraph("PROJECTS", st.msection))
         for p in proj_list:
             tech = f" ({', '.join(p.get('tech_stack', []))})" if p.get("tech_stack") else ""
-            main.append(Paragraph(f"<b>{p.get('name', '')}</b>{tech}", s_mentry))
+            main.append(Paragraph(f"<b>{p.get('name', '')}</b>{tech}", st.mentry))
             for b in p.get("bullets", []):
-                main.append(Paragraph(b, s_mbullet, bulletText=BULLET_CHAR))
+                main.append(Paragraph(b, st.mbullet, bulletText=BULLET_CHAR))
             main.append(Spacer(1, SPACE_ENTRY_GAP))
 
     # Achievements
     achievements = data.get("achievements", [])
     if achievements:
-        main.append(Paragraph("ACHIEVEMENTS", s_msection))
+        main.append(Paragraph("ACHIEVEMENTS", st.msection))
         for a in achievements:
-            main.append(Paragraph(a, s_mbullet, bulletText=BULLET_CHAR))
+            main.append(Paragraph(a, st.mbullet, bulletText=BULLET_CHAR))
 
     # ── Two-column table ──
     side_w = sw - 2 * mm
@@ -872,15 +945,7 @@ def _generate_sidebar(data: dict, profile_image_url: str | None = None) -> bytes
     main_cell = main if main else [Spacer(1, 1)]
 
     t = Table([[side_cell, main_cell]], colWidths=[side_w, main_w])
-    t.setStyle(TableStyle([
-        ("VALIGN", (0, 0), (-1, -1), "TOP"),
-        ("TOPPADDING", (0, 0), (-1, -1), 8),
-        ("BOTTOMPADDING", (0, 0), (-1, -1), 8),
-        ("LEFTPADDING", (0, 0), (0, 0), 12 * mm),
-        ("RIGHTPADDING", (0, 0), (0, 0), 8 * mm),
-        ("LEFTPADDING", (1, 0), (1, 0), 8 * mm),
-        ("RIGHTPADDING", (1, 0), (1, 0), 12 * mm),
-    ]))
+    t.setStyle(st.columns_ts)
 
     doc.build([t])
     buffer.seek(0)
@@ -894,6 +959,77 @@ JAKE_DARK = HexColor("#1A1A1A")
 JAKE_GRAY = HexColor("#555555")
 
 
+@_template_styles("jake")
+def _jake_styles() -> SimpleNamespace:
+    styles = getSampleStyleSheet()
+    return SimpleNamespace(
+        name=ParagraphStyle(
+            "JKName", parent=styles["Title"], fontSize=22,
+            textColor=JAKE_BLACK, spaceAfter=1 * mm,
+            alignment=TA_CENTER, fontName="Helvetica-Bold",
+        ),
+        contact=ParagraphStyle(
+            "JKContact", parent=styles["Normal"], fontSize=SIZE_CONTACT,
+            textColor=JAKE_DARK, spaceAfter=4 * mm,
+            alignment=TA_CENTER, leading=_leading(SIZE_CONTACT, 1.3),
+        ),
+        section=ParagraphStyle(
+            "JKSection", parent=styles["Heading2"], fontSize=SIZE_SECTION,
+            textColor=JAKE_BLACK, spaceBefore=4 * mm, spaceAfter=0.5 * mm,
+            fontName="Helvetica-Bold", keepWithNext=1,
+        ),
+        entry_bold=ParagraphStyle(
+            "JKEntryBold", parent=styles["Normal"], fontSize=SIZE_ENTRY_TITLE,
+            textColor=JAKE_BLACK, leading=_leading(SIZE_ENTRY_TITLE, 1.3), fontName="Helvetica-Bold",
+        ),
+        entry_right=ParagraphStyle(
+            "JKEntryRight", parent=styles["Normal"], fontSize=SIZE_ENTRY_TITLE,
+            textColor=JAKE_BLACK, leading=_leading(SIZE_ENTRY_TITLE, 1.3), fontName="Helvetica-Bold",
+            alignment=TA_RIGHT,
+        ),
+        entry_italic=ParagraphStyle(
+            "JKEntryItalic", parent=styles["Normal"], fontSize=SIZE_SUB,
+            textColor=JAKE_GRAY, leading=_leading(SIZE_SUB, 1.3), fontName="Helvetica-Oblique",
+        ),
+        entry_italic_r=ParagraphStyle(
+            "JKEntryItalicR", parent=styles["Normal"], fontSize=SIZE_SUB,
+            textColor=JAKE_GRAY, leading=_leading(SIZE_SUB, 1.3), fontName="Helvetica-Oblique",
+            alignment=TA_RIGHT,
+        ),
+        bullet=ParagraphStyle(
+            "JKBullet", parent=styles["Normal"], fontSize=SIZE_BODY,
+            textColor=JAKE_DARK, leading=_leading(SIZE_BODY, 1.3),
+            leftIndent=14, bulletIndent=4,
+        ),
+        body=ParagraphStyle(
+            "JKBody", parent=styles["Normal"], fontSize=SIZE_BODY,
+            textColor=JAKE_DARK, leading=_leading(SIZE_BODY, 1.3),
+        ),
+        hdr=ParagraphStyle("JHdr", parent=styles["Normal"], fontSize=SIZE_SECTION, textColor=JAKE_BLACK, fontName="Helvetica-Bold", leading=_leading(SIZE_SECTION, 1.2)),
+        edu_hdr=ParagraphStyle(
+            "JKEduHdr", parent=styles["Normal"], fontSize=SIZE_BODY,
+            textColor=WHITE, fontName="Helvetica-Bold", leading=_leading(SIZE_BODY, 1.3),
+        ),
+        edu_cell=ParagraphStyle(
+            "JKEduCell", parent=styles["Normal"], fontSize=SIZE_BODY,
+            textColor=JAKE_DARK, leading=_leading(SIZE_BODY, 1.3),
+        ),
+        entry_ts=TableStyle([
+            ("VALIGN", (0, 0), (-1, -1), "TOP"),
+            ("LEFTPADDING", (0, 0), (-1, -1), 0),
+            ("RIGHTPADDING", (0, 0), (-1, -1), 0),
+            ("TOPPADDING", (0, 0), (-1, -1), 0),
+            ("BOTTOMPADDING", (0, 0), (-1, -1), 1),
+        ]),
+        section_ts=TableStyle([
+            ("BACKGROUND", (0, 0), (-1, -1), GRAY_BG),
+            ("LEFTPADDING", (0, 0), (-1, -1), 4),
+            ("TOPPADDING", (0, 0), (-1, -1), 2.5),
+            ("BOTTOMPADDING", (0, 0), (-1, -1), 2.5),
+        ]),
+    )
+
+
 def _generate_jake(data: dict) -> bytes:
     buffer = io.BytesIO()
     doc = SimpleDocTemplate(
@@ -901,71 +1037,12 @@ def _generate_jake(data: dict) -> bytes:
         topMargin=MARGIN_TIGHT, bottomMargin=MARGIN_TIGHT,
         leftMargin=MARGIN_TIGHT, rightMargin=MARGIN_TIGHT,
     )
-    styles = getSampleStyleSheet()
+    st = get_template_styles("jake")
     page_w = A4[0] - 2 * MARGIN_TIGHT
 
-    s_name = ParagraphStyle(
-        "JKName", parent=styles["Title"], fontSize=22,
-        textColor=JAKE_BLACK, spaceAfter=1 * mm,
-        alignment=TA_CENTER, fontName="Helvetica-Bold",
-    )
-    s_contact = ParagraphStyle(
-        "JKContact", parent=styles["Normal"], fontSize=SIZE_CONTACT,
-        textColor=JAKE_DARK, spaceAfter=4 * mm,
-        alignment=TA_CENTER, leading=_leading(SIZE_CONTACT, 1.3),
-    )
-    s_section = ParagraphStyle(
-        "JKSection", parent=styles["Heading2"], fontSize=SIZE_SECTION,
-        textColor=JAKE_BLACK, spaceBefore=4 * mm, spaceAfter=0.5 * mm,
-        fontName="Helvetica-Bold", keepWithNext=1,
-    )
-    s_entry_bold = ParagraphStyle(
-        "JKEntryBold", parent=styles["Normal"], fontSize=SIZE_ENTRY_TITLE,
-        textColor=JAKE_BLACK, leading=_leading(SIZE_ENTRY_TITLE, 1.3), fontName="Helvetica-Bold",
-    )
-    s_entry_right = ParagraphStyle(
-        "JKEntryRight", parent=styles["Normal"], fontSize=SIZE_ENTRY_TITLE,
-        textColor=JAKE_BLACK, leading=_leading(SIZE_ENTRY_TITLE, 1.3), fontName="Helvetica-Bold",
-        alignment=TA_RIGHT,
-    )
-    s_entry_italic = ParagraphStyle(
-        "JKEntryItalic", parent=styles["Normal"], fontSize=SIZE_SUB,
-        textColor=JAKE_GRAY, leading=_leading(SIZE_SUB, 1.3), fontName="Helvetica-Oblique",
-    )
-    s_entry_italic_r = ParagraphStyle(
-        "JKEntryItalicR", parent=styles["Normal"], fontSize=SIZE_SUB,
-        textColor=JAKE_GRAY, leading=_leading(SIZE_SUB, 1.3), fontName="Helvetica-Oblique",
-        alignment=TA_RIGHT,
-    )
-    s_bullet = ParagraphStyle(
-        "JKBullet", parent=styles["Normal"], fontSize=SIZE_BODY,
-        textColor=JAKE_DARK, leading=_leading(SIZE_BODY, 1.3),
-        leftIndent=14, bulletIndent=4,
-    )
-    s_body = ParagraphStyle(
-        "JKBody", parent=styles["Normal"], fontSize=SIZE_BODY,
-        textColor=JAKE_DARK, leading=_leading(SIZE_BODY, 1.3),
-    )
-
-    entry_style = TableStyle([
-        ("VALIGN", (0, 0), (-1, -1), "TOP"),
-        ("LEFTPADDING", (0, 0), (-1, -1), 0),
-        ("RIGHTPADDING", (0, 0), (-1, -1), 0),
-        ("TOPPADDING", (0, 0), (-1, -1), 0),
-        ("BOTTOMPADDING", (0, 0), (-1, -1), 1),
-    ])
-
-    GRAY_BG = HexColor("#F0F0F0")
-
     def add_section(title):
-        s_hdr = ParagraphStyle("JHdr", parent=styles["Normal"], fontSize=SIZE_SECTION, textColor=JAKE_BLACK, fontName="Helvetica-Bold", leading=_leading(SIZE_SECTION, 1.2))
-        t = Table([[Paragraph(title, s_hdr)]], colWidths=[page_w])
-        t.setStyle(TableStyle([
-            ("BACKGROUND", (0, 0), (-1, -1), GRAY_BG),
-            ("LEFTPADDING", (0, 0), (-1, -1), 4),
-            ("TOPPADDING", (0, 0), (-1, -1), 2.5),
-            ("BOTTOMPADDING", (0, 0), (-1, -1), 2.5),
-        ]))
+        t = Table([[Paragraph(title, st.hdr)]], colWidths=[page_w])
+        t.setStyle(st.section_ts)
         elements.append(Spacer(1, SPACE_SECTION_BEFORE))
         elements.append(t)
         elements.append(Spacer(1, SPACE_SECTION_AFTER))
@@ -975,7 +1052,7 @@ def _generate_jake(data: dict) -> bytes:
 
     # ── Name (large, centered, uppercase for small-caps effect)
     name = pi.get("name", "")
-    elements.append(Paragraph(name.upper(), s_name))
+    elements.append(Paragraph(name.upper(), st.name))
 
     # ── Contact line (plain text, no unicode icons — Helvetica safe)
     contact_parts = []
@@ -988,31 +1065,23 @@ def _generate_jake(data: dict) -> bytes:
     if pi.get("github") or pi.get("portfolio"):
         contact_parts.append(pi.get("github") or pi.get("portfolio"))
     if contact_parts:
-        elements.append(Paragraph(CONTACT_SEP.join(contact_parts), s_contact))
+        elements.append(Paragraph(CONTACT_SEP.join(contact_parts), st.contact))
 
     # ── Objective / Summary
     obj = data.get("objective", "")
     if obj:
         add_section("Summary")
-        elements.append(Paragraph(obj, s_body))
+        elements.append(Paragraph(obj, st.body))
 
     # ── Education
     edu_list = data.get("education", [])
     if edu_list:
         add_section("Education")
-        s_edu_hdr = ParagraphStyle(
-            "JKEduHdr", parent=styles["Normal"], fontSize=SIZE_BODY,
-            textColor=WHITE, fontName="Helvetica-Bold", leading=_leading(SIZE_BODY, 1.3),
-        )
-        s_edu_cell = ParagraphStyle(
-            "JKEduCell", parent=styles["Normal"], fontSize=SIZE_BODY,
-            textColor=JAKE_DARK, leading=_leading(SIZE_BODY, 1.3),
-        )
         edu_header = [
-            Paragraph("<b>Year</b>", s_edu_hdr),
-            Paragraph("<b>Degree / Certificate</b>", s_edu_hdr),
-            Paragraph("<b>Institute</b>", s_edu_hdr),
-            Paragraph("<b>CGPA / %</b>", s_edu_hdr),
+            Paragraph("<b>Year</b>", st.edu_hdr),
+            Paragraph("<b>Degree / Certificate</b>", st.edu_hdr),
+            Paragraph("<b>Institute</b>", st.edu_hdr),
+            Paragraph("<b>CGPA / %</b>", st.edu_hdr),
         ]
         edu_rows = [edu_header]
         for e in edu_list:
@@ -1020,10 +1089,10 @@ def _generate_jake(data: dict) -> bytes:
             if e.get("stream"):
                 degree += f", {e['stream']}"
             edu_rows.append([
-                Paragraph(e.get("year", ""), s_edu_cell),
-                Paragraph(degree, s_edu_cell),
-                Paragraph(e.get("institution", ""), s_edu_cell),
-                Paragraph(e.get("grade", ""), s_edu_cell),
+                Paragraph(e.get("year", ""), st.edu_cell),
+                Paragraph(degree, st.edu_cell),
+                Paragraph(e.get("institution", ""), st.edu_cell),
+                Paragraph(e.get("grade", ""), st.edu_cell),
             ])
         edu_col_widths = [page_w * 0.15, page_w * 0.35, page_w * 0.35, page_w * 0.15]
         edu_table = Table(edu_rows, colWidths=edu_col_widths)
@@ -1051,22 +1120,22 @@ def _generate_jake(data: dict) -> bytes:
         for exp in exp_list:
             entry = []
             row1 = Table(
-                [[Paragraph(f"<b>{exp.get('company', '')}</b>", s_entry_bold),
-                  Paragraph(f"<b>{exp.get('duration', '')}</b>", s_entry_right)]],
+                [[Paragraph(f"<b>{exp.get('company', '')}</b>", st.entry_bold),
+                  Paragraph(f"<b>{exp.get('duration', '')}</b>", st.entry_right)]],
                 colWidths=[page_w * 0.65, page_w * 0.35],
             )
-            row1.setStyle(entry_style)
+            row1.setStyle(st.entry_ts)
             entry.append(row1)
             location = exp.get("location", "")
             row2 = Table(
-                [[Paragraph(exp.get("title", ""), s_entry_italic),
-                  Paragraph(location, s_entry_italic_r)]],
+                [[Paragraph(exp.get("title", ""), st.entry_italic),
+                  Paragraph(location, st.entry_italic_r)]],
                 colWidths=[page_w * 0.65, page_w * 0.35],
             )
-            row2.setStyle(entry_style)
+            row2.setStyle(st.entry_ts)
             entry.append(row2)
             for b in exp.get("bullets", []):
-                entry.append(Paragraph(b, s_bullet, bulletText=BULLET_CHAR))
+                entry.append(Paragraph(b, st.bullet, bulletText=BULLET_CHAR))
             entry.append(Spacer(1, SPACE_ENTRY_GAP))
             elements.append(KeepTogether(entry))
 
@@ -1081,14 +1150,14 @@ def _generate_jake(data: dict) -> bytes:
             if ts:
                 title_left += f"  |  <i>{', '.join(ts)}</i>"
             row1 = Table(
-                [[Paragraph(title_left, s_entry_bold),
-                  Paragraph("", s_entry_right)]],
+                [[Paragraph(title_left, st.entry_bold),
+                  Paragraph("", st.entry_right)]],
                 colWidths=[page_w * 0.75, page_w * 0.25],
             )
-            row1.setStyle(entry_style)
+            row1.setStyle(st.entry_ts)
             entry.append(row1)
             for b in p.get("bullets", []):
-                entry.append(Paragraph(b, s_bullet, bulletText=BULLET_CHAR))
+                entry.append(Paragraph(b, st.bullet, bulletText=BULLET_CHAR))
             entry.append(Spacer(1, SPACE_ENTRY_GAP))
             elements.append(KeepTogether(entry))
 
@@ -1097,7 +1166,7 @@ def _generate_jake(data: dict) -> bytes:
     if achievements:
         add_section("Achievements")
         for a in achievements:
-            elements.append(Paragraph(a, s_bullet, bulletText=BULLET_CHAR))
+            elements.append(Paragraph(a, st.bullet, bulletText=BULLET_CHAR))
 
     # ── Skills
     skills = data.get("skills", {})
@@ -1105,7 +1174,7 @@ def _generate_jake(data: dict) -> bytes:
         add_section("Technical Skills")
         for label, key in [("Languages", "languages"), ("Technologies/Frameworks", "technical"), ("Developer Tools", "tools"), ("Soft Skills", "soft")]:
             if skills.get(key):
-                elements.append(Paragraph(f"<b>{label}:</b> {', '.join(skills[key])}", s_body))
+                elements.append(Paragraph(f"<b>{label}:</b> {', '.join(skills[key])}", st.body))
                 elements.append(Spacer(1, 1 * mm))
 
     # ── Certifications
@@ -1117,7 +1186,7 @@ def _generate_jake(data: dict) -> bytes:
             parts = [p for p in [c.get("issuer"), c.get("year")] if p]
             if parts:
                 line += f" -- {', '.join(parts)}"
-            elements.append(Paragraph(line, s_body))
+            elements.append(Paragraph(line, st.body))
 
     doc.build(elements, onFirstPage=_draw_page_footer, onLaterPages=_draw_page_footer)
     buffer.seek(0)
@@ -0,0 +1,266 @@
+"""In-process background task queue backed by the ``background_tasks`` table.
+
+Work that doesn't need to finish before the client gets its response
+(session summaries, context condensation, analysis persistence) is written
+to the DB as a task row and picked up by worker coroutines running on the
+app's event loop. Rows survive restarts; failed attempts are retried with
+exponential backoff.
+
+Usage:
+    db.add(make_task("session.summarize", {"session_id": sid}, user_id=uid))
+    db.commit()
+    wake_workers()
+
+Handlers are registered with ``@task_handler("kind")`` and receive the
+decoded payload dict. A handler that may outlive ``LEASE_SECONDS`` renews
+its lease with ``renew_lease(sync_db, current_task())`` as it makes progress.
+"""
+
+import asyncio
+import contextvars
+import json
+import logging
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Session
+
+from app.config import TASK_WORKERS
+from app.database import async_session_scope
+from app.models import BackgroundTask
+
+logger = logging.getLogger(__name__)
+
+POLL_INTERVAL_SECONDS = 5.0
+LEASE_SECONDS = 300  # a "running" task whose lease expired is picked up again
+RETRY_BASE_SECONDS = 5
+MAX_ERROR_LENGTH = 2000
+
+_handlers: dict = {}
+_workers: list[asyncio.Task] = []
+_wake_event: asyncio.Event | None = None
+_loop: asyncio.AbstractEventLoop | None = None
+_current_task: contextvars.ContextVar[dict | None] = contextvars.ContextVar("current_task", default=None)
+
+
+def task_handler(kind: str):
+    """Register an ``async def handler(payload: dict)`` for a task kind."""
+    def decorator(fn):
+        _handlers[kind] = fn
+        return fn
+    return decorator
+
+
+def _iso(dt: datetime) -> str:
+    return dt.isoformat()
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def make_task(
+    kind: str,
+    payload: dict,
+    user_id: str | None = None,
+    max_attempts: int = 3,
+) -> BackgroundTask:
+    """Build a task row. Add it to the caller's session so it commits
+    atomically with the writes that produced it."""
+    return BackgroundTask(
+        kind=kind,
+        payload_json=json.dumps(payload),
+        user_id=user_id,
+        max_attempts=max_attempts,
+        run_after=_iso(_now()),
+    )
+
+
+def current_task() -> dict | None:
+    """The claimed task (id, kind, attempts, max_attempts) whose handler is
+    running in this context, or None outside a handler."""
+    return _current_task.get()
+
+
+def renew_lease(sync_db: Session, task: dict | None) -> bool:
+    """Push ``task``'s lease out by ``LEASE_SECONDS``; commits with the
+    caller's transaction.
+
+    Returns False if this attempt no longer owns the task — its lease lapsed
+    and another worker claimed it — in which case the handler should stop.
+    """
+    if task is None:
+        return True
+    now = _now()
+    return bool(
+        sync_db.query(BackgroundTask)
+        .filter(
+            BackgroundTask.id == task["id"],
+            BackgroundTask.status == "running",
+            BackgroundTask.attempts == task["attempts"],
+        )
+        .update(
+            {
+                BackgroundTask.locked_until: _iso(now + timedelta(seconds=LEASE_SECONDS)),
+                BackgroundTask.updated_at: _iso(now),
+            },
+            synchronize_session=False,
+        )
+    )
+
+
+def wake_workers() -> None:
+    """Nudge idle workers after committing a new task. Safe from any thread."""
+    if _loop is None or _wake_event is None:
+        return
+    try:
+        _loop.call_soon_threadsafe(_wake_event.set)
+    except RuntimeError:
+        pass  # loop already closed (shutdown)
+
+
+# ─── Worker internals ──────────────────────────────────────
+
+
+def _claim_next(sync_db: Session) -> dict | None:
+    """Claim the oldest runnable task. Returns a plain dict, or None."""
+    now = _iso(_now())
+    while True:
+        task = (
+            sync_db.query(BackgroundTask)
+            .filter(
+                or_(
+                    and_(BackgroundTask.status == "queued", BackgroundTask.run_after <= now),
+                    and_(BackgroundTask.status == "running", BackgroundTask.locked_until < now),
+                )
+            )
+            .order_by(BackgroundTask.run_after.asc())
+            .first()
+        )
+        if not task:
+            sync_db.rollback()
+            return None
+
+        # Conditional update so two workers (or two instances) can't both win
+        claimed = (
+            sync_db.query(BackgroundTask)
+            .filter(
+                BackgroundTask.id == task.id,
+                BackgroundTask.status == task.status,
+                BackgroundTask.attempts == task.attempts,
+            )
+            .update(
+                {
+                    BackgroundTask.status: "running",
+                    BackgroundTask.attempts: task.attempts + 1,
+                    BackgroundTask.locked_until: _iso(_now() + timedelta(seconds=LEASE_SECONDS)),
+                    BackgroundTask.updated_at: now,
+                },
+                synchronize_session=False,
+            )
+        )
+        sync_db.commit()
+        if claimed:
+            return {
+                "id": task.id,
+                "kind": task.kind,
+                "payload_json": task.payload_json,
+                "attempts": task.attempts,
+                "max_attempts": task.max_attempts,
+            }
+
+
+def _finish(sync_db: Session, task_id: str, error: str | None, attempts: int, max_attempts: int) -> None:
+    now = _now()
+    values = {BackgroundTask.locked_until: None, BackgroundTask.updated_at: _iso(now)}
+    if error is None:
+        values[BackgroundTask.status] = "done"
+        values[BackgroundTask.last_error] = None
+    elif attempts < max_attempts:
+        delay = RETRY_BASE_SECONDS * (2 ** (attempts - 1))
+        values[BackgroundTask.status] = "queued"
+        values[BackgroundTask.run_after] = _iso(now + timedelta(seconds=delay))
+        values[BackgroundTask.last_error] = error[:MAX_ERROR_LENGTH]
+    else:
+        values[BackgroundTask.status] = "failed"
+        values[BackgroundTask.last_error] = error[:MAX_ERROR_LENGTH]
+    # Only this attempt's outcome: if the lease lapsed and another worker
+    # re-claimed the task, attempts has moved on and the row is theirs
+    sync_db.query(BackgroundTask).filter(
+        BackgroundTask.id == task_id, BackgroundTask.attempts == attempts
+    ).update(values, synchronize_session=False)
+    sync_db.commit()
+
+
+async def _run_one() -> bool:
+    """Claim and run a single task. Returns False when the queue is empty."""
+    async with async_session_scope() as db:
+        task = await db.run_sync(_claim_next)
+    if not task:
+        return False
+
+    error = None
+    max_attempts = task["max_attempts"]
+    handler = _handlers.get(task["kind"])
+    if handler is None:
+        error = f"No handler registered for task kind '{task['kind']}'"
+        max_attempts = task["attempts"]  # don't retry
+    else:
+        token = _current_task.set(task)
+        try:
+            await handler(json.loads(task["payload_json"]))
+        except Exception as e:
+            logger.warning(
+                "[tasks] %s id=%s attempt %d/%d failed: %s",
+                task["kind"], task["id"][:8], task["attempts"], task["max_attempts"], e,
+            )
+            error = f"{type(e).__name__}: {e}"
+        finally:
+            _current_task.reset(token)
+
+    async with async_session_scope() as db:
+        await db.run_sync(
+            _finish, task["id"], error, task["attempts"], max_attempts
+        )
+    return True
+
+
+async def _worker_loop(worker_no: int) -> None:
+    logger.info("[tasks] worker %d started", worker_no)
+    while True:
+        # Clear before draining so a wake-up that lands mid-drain isn't lost
+        _wake_event.clear()
+        try:
+            while await _run_one():
+                pass
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # DB hiccup — back off until the next poll
+            logger.error("[tasks] worker %d error: %s", worker_no, e)
+
+        try:
+            await asyncio.wait_for(_wake_event.wait(), timeout=POLL_INTERVAL_SECONDS)
+        except asyncio.TimeoutError:
+            pass
+
+
+async def start_workers(count: int = TASK_WORKERS) -> None:
+    """Start worker coroutines on the running loop (call from app startup)."""
+    global _wake_event, _loop
+    if _workers:
+        return
+    _loop = asyncio.get_running_loop()
+    _wake_event = asyncio.Event()
+    for i in range(count):
+        _workers.append(asyncio.create_task(_worker_loop(i)))
+
+
+async def stop_workers() -> None:
+    """Cancel workers. In-flight tasks are retried after their lease expires."""
+    global _loop
+    for w in _workers:
+        w.cancel()
+    await asyncio.gather(*_workers, return_exceptions=True)
+    _workers.clear()
+    _loop = None
@@ -0,0 +1,157 @@
+"""Text extraction for uploaded resumes and documents (PDF, DOCX, TXT).
+
+pdfplumber is pure Python and holds the GIL for the whole parse — a 10 MB
+PDF used to freeze every SSE stream in the process for seconds. Parsing now
+runs in a small process pool (``TEXT_EXTRACT_WORKERS``; 0 = a thread), reads
+at most ``TEXT_EXTRACT_MAX_PAGES`` pages and gives up after
+``TEXT_EXTRACT_TIMEOUT_SECONDS`` — replacing the pool, so the stuck parse
+doesn't hold a worker that later uploads need. PDFs take pdfium's fast text
+layer when it passes a quality check and fall back to pdfplumber otherwise
+(see ``text_extractors``; ``TEXT_EXTRACT_FAST_PATH=0`` always uses pdfplumber).
+
+Results are cached by SHA-256 of the file bytes (``document_text``
+namespace of the result cache), so the same resume uploaded to the profile,
+a draft and an interview is parsed once. Callers take as many pages as they
+need from the cached result.
+"""
+
+import asyncio
+import hashlib
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import pdfplumber
+import pypdfium2
+
+from app.config import (
+    TEXT_EXTRACT_WORKERS, TEXT_EXTRACT_MAX_PAGES, TEXT_EXTRACT_TIMEOUT_SECONDS, TEXT_EXTRACT_FAST_PATH,
+)
+from app.services import text_extractors
+from app.services.llm_cache_service import ResultCache
+
+logger = logging.getLogger(__name__)
+
+EXTRACTOR_VERSION = (
+    f"pdfium-{pypdfium2.version.PDFIUM_INFO}-pdfplumber-{pdfplumber.__version__}"
+    f"-{'fast' if TEXT_EXTRACT_FAST_PATH else 'layout'}-2"
+)
+
+KINDS_BY_EXTENSION = {".pdf": "pdf", ".docx": "docx", ".doc": "docx", ".txt": "txt"}
+
+# Extracted text is much bigger than a grade; keep fewer in process memory
+_text_cache = ResultCache("document_text", memory_entries=64)
+
+_executor = None
+_lock = threading.Lock()
+
+
+class DocumentUnreadable(ValueError):
+    """The file couldn't be parsed: corrupt, encrypted, wrong format or too slow."""
+
+
+def document_kind(filename: str | None) -> str | None:
+    """``pdf`` / ``docx`` / ``txt`` from the file name, or ``None`` if unsupported."""
+    return KINDS_BY_EXTENSION.get(os.path.splitext(filename or "")[1].lower())
+
+
+# ─── Pool ──────────────────────────────────────────────────
+
+
+def _get_executor():
+    global _executor
+    with _lock:
+        if _executor is None:
+            if TEXT_EXTRACT_WORKERS > 0:
+                methods = multiprocessing.get_all_start_methods()
+                # Never fork the server process: it owns DB threads and sockets
+                ctx = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+                _executor = ProcessPoolExecutor(max_workers=TEXT_EXTRACT_WORKERS, mp_context=ctx)
+            else:
+                _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="text-extract")
+        return _executor
+
+
+def start_extract_pool() -> None:
+    _get_executor().submit(text_extractors.warm)
+
+
+def stop_extract_pool() -> None:
+    global _executor
+    with _lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _recycle_executor(executor) -> None:
+    """Replace ``executor`` (if it is still the current pool) and stop its
+    workers. A worker can't be interrupted mid-parse, so its process is
+    terminated; other parses it was running fail with ``BrokenProcessPool``
+    and are retried on the new pool. A thread can't be killed, but later
+    uploads no longer queue behind it."""
+    global _executor
+    with _lock:
+        if _executor is executor:
+            _executor = None
+    if isinstance(executor, ProcessPoolExecutor):
+        # No public way to kill busy workers before Python 3.14
+        for process in list((executor._processes or {}).values()):
+            process.terminate()
+    executor.shutdown(wait=False)
+
+
+async def _run_extract(content: bytes, kind: str) -> dict:
+    loop = asyncio.get_running_loop()
+    for attempt in range(2):
+        executor = _get_executor()
+        try:
+            fut = loop.run_in_executor(
+                executor, text_extractors.extract, content, kind, TEXT_EXTRACT_MAX_PAGES, TEXT_EXTRACT_FAST_PATH,
+            )
+            return await asyncio.wait_for(fut, TEXT_EXTRACT_TIMEOUT_SECONDS)
+        except asyncio.TimeoutError:
+            logger.warning("[extract] %s took longer than %gs; recycling the pool", kind, TEXT_EXTRACT_TIMEOUT_SECONDS)
+            _recycle_executor(executor)
+            raise DocumentUnreadable("This file took too long to read.") from None
+        except (BrokenProcessPool, RuntimeError) as e:
+            # A worker died, or another upload's timeout recycled the pool
+            # under this one (RuntimeError: submitted after shutdown)
+            pool_gone = isinstance(e, BrokenProcessPool) or executor is not _executor
+            if attempt or not pool_gone:
+                raise DocumentUnreadable("Could not read this file.") from e
+            logger.warning("[extract] pool gone, retrying on a fresh one")
+            _recycle_executor(executor)
+        except Exception as e:
+            raise DocumentUnreadable("Could not read this file.") from e
+
+
+# ─── Public API ────────────────────────────────────────────
+
+
+async def extract_document(content: bytes, kind: str) -> dict:
+    """``{"pages": [...], "page_count": n, "extractor": name}`` for an uploaded file.
+
+    ``pages`` holds at most ``TEXT_EXTRACT_MAX_PAGES`` entries (one for
+    DOCX / TXT); ``page_count`` is the document's real length.
+
+    Raises:
+        DocumentUnreadable: unsupported kind, or the file couldn't be parsed.
+    """
+    if kind == "txt":
+        return {"pages": [content.decode("utf-8", errors="ignore")], "page_count": 1, "extractor": "text"}
+    if kind not in ("pdf", "docx"):
+        raise DocumentUnreadable("Unsupported file format.")
+
+    key = _text_cache.key(hashlib.sha256(content).hexdigest(), kind, TEXT_EXTRACT_MAX_PAGES, EXTRACTOR_VERSION)
+    return await _text_cache.get_or_compute(key, lambda: _run_extract(content, kind))
+
+
+async def extract_text(content: bytes, kind: str, max_pages: int | None = None) -> str:
+    """Plain text of the first ``max_pages`` pages (all extracted pages if None)."""
+    doc = await extract_document(content, kind)
+    pages = doc["pages"][:max_pages] if max_pages else doc["pages"]
+    return "\n\n".join(page for page in pages if page)
@@ -0,0 +1,122 @@
+"""Sync PDF / DOCX text extractors.
+
+PDFs are tiered: pdfium's text layer first, pdfplumber's slower
+layout-aware extraction only when the fast output looks wrong (a scan,
+garbled font encodings, lost line breaks).
+
+These run inside the extraction process pool, so this module must not
+import anything from ``app`` — a pool child would otherwise build the
+database engine just to read a PDF.
+"""
+
+import io
+import logging
+import unicodedata
+
+import pdfplumber
+import pypdfium2 as pdfium
+
+logger = logging.getLogger(__name__)
+
+
+# Fast-path output is used only if it passes every check below
+MIN_CHARS_PER_PAGE = 80  # less than this is a scan, or text pdfium couldn't decode
+MAX_GARBAGE_RATIO = 0.05  # share of U+FFFD / control / private-use characters
+MAX_AVG_LINE_LENGTH = 250  # longer means line breaks went missing
+
+# pdfium marks soft hyphens and unmapped glyphs with these
+_PDFIUM_ARTIFACTS = str.maketrans({"\r": None, "\x02": None, "\ufffe": None})
+
+
+def _pdfium_pages(content: bytes, max_pages: int) -> tuple[list[str], int]:
+    """Text straight from pdfium's text layer: no layout analysis, ~30x
+    faster than pdfplumber on a typical resume."""
+    pdf = pdfium.PdfDocument(content)
+    try:
+        page_count = len(pdf)
+        pages = []
+        for i in range(min(page_count, max_pages)):
+            page = pdf[i]
+            textpage = page.get_textpage()
+            pages.append(textpage.get_text_range().translate(_PDFIUM_ARTIFACTS))
+            textpage.close()
+            page.close()
+    finally:
+        pdf.close()
+    return pages, page_count
+
+
+def _plumber_pages(content: bytes, max_pages: int) -> tuple[list[str], int]:
+    pages = []
+    with pdfplumber.open(io.BytesIO(content)) as pdf:
+        page_count = len(pdf.pages)
+        for page in pdf.pages[:max_pages]:
+            pages.append(page.extract_text() or "")
+            page.close()  # drop pdfplumber's per-page object cache
+    return pages, page_count
+
+
+def _is_garbage(ch: str) -> bool:
+    if ch in "\n\t":
+        return False
+    return ch == "\ufffd" or unicodedata.category(ch) in ("Cc", "Co", "Cs")
+
+
+def quality_problem(pages: list[str]) -> str | None:
+    """Why extracted text looks unusable, or ``None`` if it looks fine."""
+    text = "\n".join(pages)
+    chars = len(text) - text.count(" ") - text.count("\n")
+    if chars < MIN_CHARS_PER_PAGE * max(len(pages), 1):
+        return "too little text"
+    if sum(_is_garbage(ch) for ch in text) / chars > MAX_GARBAGE_RATIO:
+        return "garbled characters"
+    lines = [line for line in text.split("\n") if line.strip()]
+    if sum(map(len, lines)) / len(lines) > MAX_AVG_LINE_LENGTH:
+        return "missing line breaks"
+    return None
+
+
+def _pdf_pages(content: bytes, max_pages: int, fast: bool) -> dict:
+    if fast:
+        try:
+            pages, page_count = _pdfium_pages(content, max_pages)
+        except pdfium.PdfiumError:
+            problem = "pdfium could not open it"
+        else:
+            problem = quality_problem(pages)
+            if problem is None:
+                return {"pages": pages, "page_count": page_count, "extractor": "pdfium"}
+        logger.info("[extract] fast path rejected (%s), using pdfplumber", problem)
+    pages, page_count = _plumber_pages(content, max_pages)
+    return {"pages": pages, "page_count": page_count, "extractor": "pdfplumber"}
+
+
+def _docx_pages(content: bytes) -> dict:
+    from docx import Document
+
+    doc = Document(io.BytesIO(content))
+    paragraphs = [p.text for p in doc.paragraphs if p.text.strip()]
+    # Also try to get text from tables
+    for table in doc.tables:
+        for row in table.rows:
+            cells_text = [cell.text.strip() for cell in row.cells if cell.text.strip()]
+            if cells_text:
+                paragraphs.append(" | ".join(cells_text))
+    return {"pages": ["\n".join(paragraphs)], "page_count": 1, "extractor": "python-docx"}
+
+
+def extract(content: bytes, kind: str, max_pages: int, fast: bool = True) -> dict:
+    """``{"pages": [...], "page_count": n, "extractor": name}``; only the first
+    ``max_pages`` are read.
+
+    PDFs go through pdfium first and fall back to pdfplumber's layout
+    analysis when that output fails ``quality_problem`` (or ``fast`` is off).
+    """
+    if kind == "pdf":
+        return _pdf_pages(content, max_pages, fast)
+    return _docx_pages(content)
+
+
+def warm() -> None:
+    """Submitted once at startup so the first upload doesn't pay for
+    starting a worker and importing pdfplumber."""
@@ -1,6 +1,7 @@
 import httpx
 
 from app.config import ELEVENLABS_API_KEY, ELEVENLABS_INTERVIEW_VOICE_ID
+from app.services.cassette_service import http_call
 
 
 ELEVENLABS_TTS_URL = "https://api.elevenlabs.io/v1/text-to-speech/{voice_id}"
@@ -12,25 +13,31 @@ async def synthesize_speech(text: str) -> bytes:
     Returns raw audio bytes (audio/mpeg).
     """
     url = ELEVENLABS_TTS_URL.format(voice_id=ELEVENLABS_INTERVIEW_VOICE_ID)
+    payload = {
+        "text": text,
+        "model_id": "eleven_turbo_v2_5",
+        "voice_settings": {
+            "stability": 0.7,
+            "similarity_boost": 0.75,
+            "style": 0.0,
+            "use_speaker_boost": True,
+        },
+    }
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        response = await client.post(
-            url,
-            headers={
-                "xi-api-key": ELEVENLABS_API_KEY,
-                "Content-Type": "application/json",
-                "Accept": "audio/mpeg",
-            },
-            json={
-                "text": text,
-                "model_id": "eleven_turbo_v2_5",
-                "voice_settings": {
-                    "stability": 0.7,
-                    "similarity_boost": 0.75,
-                    "style": 0.0,
-                    "use_speaker_boost": True,
+    async def _send() -> httpx.Response:
+        async with httpx.AsyncClient(timeout=30.0) as client:
+            return await client.post(
+                url,
+                headers={
+                    "xi-api-key": ELEVENLABS_API_KEY,
+                    "Content-Type": "application/json",
+                    "Accept": "audio/mpeg",
                 },
-            },
-        )
-        response.raise_for_status()
-        return response.content
+                json=payload,
+            )
+
+    response = await http_call(
+        "elevenlabs", {"voice_id": ELEVENLABS_INTERVIEW_VOICE_ID, **payload}, _send
+    )
+    response.raise_for_status()
+    return response.content
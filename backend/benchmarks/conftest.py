@@ -0,0 +1,29 @@
+import pytest
+from reportlab import rl_config
+
+# Byte-stable output (no timestamps / random IDs) so PDF sizes are comparable
+rl_config.invariant = 1
+
+_results: list[tuple] = []
+
+
+@pytest.fixture
+def pdf_report():
+    """``pdf_report(name, median_ms, peak_kib, pdf_bytes, pages)`` adds a row
+    to the summary printed after the run."""
+    def record(name: str, median_ms: float, peak_kib: float, pdf_bytes: int, pages: int) -> None:
+        _results.append((name, median_ms, peak_kib, pdf_bytes, pages))
+    return record
+
+
+def pytest_terminal_summary(terminalreporter):
+    if not _results:
+        return
+    terminalreporter.section("PDF generation")
+    terminalreporter.write_line(
+        f"{'benchmark':<44}{'median ms':>11}{'peak KiB':>11}{'PDF KiB':>10}{'pages':>7}"
+    )
+    for name, median_ms, peak_kib, pdf_bytes, pages in sorted(_results):
+        terminalreporter.write_line(
+            f"{name:<44}{median_ms:>11.2f}{peak_kib:>11.1f}{pdf_bytes / 1024:>10.1f}{pages:>7}"
+        )
@@ -0,0 +1,74 @@
+"""Per-render cost of building resume template styles: cold vs registry.
+
+"cold" empties the style registry before every render, which is what each
+download used to pay (``getSampleStyleSheet()`` plus every ParagraphStyle and
+TableStyle rebuilt per call). "warm" is the current path: styles built once
+per process and reused.
+
+Usage (from backend/):
+    python -m benchmarks.pdf_template_styles [iterations]
+"""
+
+import statistics
+import sys
+import time
+import tracemalloc
+
+from app.services import resume_pdf_service
+from app.services.resume_pdf_service import _STYLE_CACHE, generate_resume_pdf, get_template_styles
+from benchmarks.samples import TYPICAL_RESUME as SAMPLE_RESUME
+
+TEMPLATES = ["professional", "modern", "simple", "rendercv", "sidebar", "jake"]
+
+
+def _measure(template: str, iterations: int, cold: bool) -> tuple[float, float]:
+    """Median ms per render and mean peak KiB allocated per render.
+
+    Timing and allocation are separate passes — tracemalloc slows Python
+    code down several times over.
+    """
+    times, allocated = [], []
+    for _ in range(iterations):
+        if cold:
+            _STYLE_CACHE.clear()
+        started = time.perf_counter()
+        generate_resume_pdf(SAMPLE_RESUME, template)
+        times.append((time.perf_counter() - started) * 1000)
+    for _ in range(max(iterations // 5, 3)):
+        if cold:
+            _STYLE_CACHE.clear()
+        tracemalloc.start()
+        generate_resume_pdf(SAMPLE_RESUME, template)
+        _current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        allocated.append(peak / 1024)
+    return statistics.median(times), statistics.mean(allocated)
+
+
+def _style_build_cost(template: str, iterations: int) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        resume_pdf_service._STYLE_BUILDERS[template]()
+    return (time.perf_counter() - started) * 1000 / iterations
+
+
+def main(iterations: int = 30) -> None:
+    for template in TEMPLATES:  # imports, font metrics, first-use caches
+        generate_resume_pdf(SAMPLE_RESUME, template)
+
+    print(f"{iterations} renders per template (ms = median wall time, KiB = peak traced allocation)")
+    print("'styles ms' is the style-building work the registry takes off every render\n")
+    print(f"{'template':<14}{'styles ms':>10}{'cold ms':>10}{'warm ms':>10}{'cold KiB':>11}{'warm KiB':>11}")
+    for template in TEMPLATES:
+        build_ms = _style_build_cost(template, iterations)
+        cold_ms, cold_kib = _measure(template, iterations, cold=True)
+        get_template_styles(template)
+        warm_ms, warm_kib = _measure(template, iterations, cold=False)
+        print(
+            f"{template:<14}{build_ms:>10.2f}{cold_ms:>10.2f}{warm_ms:>10.2f}"
+            f"{cold_kib:>11.1f}{warm_kib:>11.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 30)
@@ -0,0 +1,148 @@
+"""Upload text extraction on a resume corpus: pdfplumber vs pdfium vs tiered.
+
+The built-in corpus is every resume template at every sample size (rendered
+by our own PDF service, so the source text is known) plus an image-only
+"scan". Quality is measured against that source:
+
+- words:   share of the resume's distinct words found in the extracted text
+- phrases: share of bullets / descriptions found intact, in reading order —
+           two-column layouts read across columns score low here
+
+Templates don't print every field, so compare extractors within a column
+rather than reading the percentages as absolute. The scan scores 0 for
+everyone (there is no OCR); it's there to show the cost of a fallback.
+
+Pass a directory of real PDFs to benchmark those instead; with no ground
+truth, "words" is then agreement with pdfplumber's word set.
+
+Usage (from backend/):
+    python -m benchmarks.pdf_text_extraction [pdf_dir] [repeats]
+"""
+
+import io
+import re
+import sys
+import time
+from pathlib import Path
+
+from PIL import Image, ImageDraw
+from reportlab import rl_config
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.utils import ImageReader
+from reportlab.pdfgen import canvas
+
+from app.services import text_extractors
+from app.services.resume_pdf_service import generate_resume_pdf
+from benchmarks.samples import SIZES, resume
+
+TEMPLATES = ["professional", "modern", "simple", "rendercv", "sidebar", "jake"]
+# Single-row two-column tables can't split across pages (see test_pdf_generation)
+UNRENDERABLE = {("modern", "maximal"), ("sidebar", "maximal")}
+
+EXTRACTORS = {
+    "pdfplumber": lambda content: text_extractors.extract(content, "pdf", 50, fast=False),
+    "pdfium": lambda content: {"pages": text_extractors._pdfium_pages(content, 50)[0]},
+    "tiered": lambda content: text_extractors.extract(content, "pdf", 50),
+}
+
+_WORD = re.compile(r"[A-Za-z0-9][A-Za-z0-9+#.%-]*[A-Za-z0-9+#%]|[A-Za-z0-9]")
+
+
+def _words(text: str) -> set[str]:
+    return {w.lower() for w in _WORD.findall(text)}
+
+
+def _flatten(data) -> list[str]:
+    if isinstance(data, dict):
+        return [s for v in data.values() for s in _flatten(v)]
+    if isinstance(data, list):
+        return [s for v in data for s in _flatten(v)]
+    return [str(data)] if isinstance(data, (str, int, float)) else []
+
+
+def _squash(text: str) -> str:
+    return " ".join(text.split()).lower()
+
+
+SCAN_LINES = [f"Scanned resume line {i}: Python, SQL and teamwork across the whole team" for i in range(40)]
+
+
+def _scan_pdf() -> bytes:
+    """A page with text drawn into an image: no text layer at all."""
+    img = Image.new("L", (1240, 1754), 255)
+    draw = ImageDraw.Draw(img)
+    for i, line in enumerate(SCAN_LINES):
+        draw.text((80, 80 + i * 40), line, fill=0)
+    buf = io.BytesIO()
+    c = canvas.Canvas(buf, pagesize=A4)
+    c.drawImage(ImageReader(img), 0, 0, *A4)
+    c.showPage()
+    c.save()
+    return buf.getvalue()
+
+
+def builtin_corpus() -> list[tuple[str, bytes, list[str] | None]]:
+    """``(name, pdf bytes, source strings)`` for every template x size."""
+    rl_config.invariant = 1
+    corpus = []
+    for template in TEMPLATES:
+        for size in SIZES:
+            if (template, size) in UNRENDERABLE:
+                continue
+            data = resume(size)
+            corpus.append((f"{template}/{size}", generate_resume_pdf(data, template), _flatten(data)))
+    corpus.append(("scan", _scan_pdf(), SCAN_LINES))
+    return corpus
+
+
+def dir_corpus(path: Path) -> list[tuple[str, bytes, list[str] | None]]:
+    return [(p.name, p.read_bytes(), None) for p in sorted(path.glob("*.pdf"))]
+
+
+def _quality(text: str, source: list[str] | None, reference: str) -> tuple[float, float]:
+    got = _words(text)
+    expected = _words(" ".join(source)) if source is not None else _words(reference)
+    words = len(got & expected) / len(expected) if expected else 1.0
+    if not source:
+        return words, float("nan")
+    phrases = [_squash(s) for s in source if len(s) >= 40]
+    squashed = _squash(text)
+    return words, sum(p in squashed for p in phrases) / len(phrases) if phrases else 1.0
+
+
+def main(corpus, repeats: int = 3) -> None:
+    pages = sum(text_extractors.extract(content, "pdf", 50, fast=False)["page_count"] for _, content, _ in corpus)
+    references = {name: "\n".join(EXTRACTORS["pdfplumber"](content)["pages"]) for name, content, _ in corpus}
+
+    print(f"{len(corpus)} documents, {pages} pages, best of {repeats} passes\n")
+    print(f"{'extractor':<12}{'docs/s':>9}{'pages/s':>9}{'words':>8}{'phrases':>9}{'fast path':>11}")
+    for label, fn in EXTRACTORS.items():
+        best = float("inf")
+        for _ in range(repeats):
+            started = time.perf_counter()
+            results = [fn(content) for _, content, _ in corpus]
+            best = min(best, time.perf_counter() - started)
+        scores = [
+            _quality("\n".join(result["pages"]), source, references[name])
+            for (name, _, source), result in zip(corpus, results)
+        ]
+        fast = sum(r.get("extractor", "pdfium") == "pdfium" for r in results)
+        word_score = sum(w for w, _ in scores) / len(scores)
+        phrase_scores = [p for _, p in scores if p == p]  # drop NaN (no ground truth)
+        phrase_score = sum(phrase_scores) / len(phrase_scores) if phrase_scores else float("nan")
+        print(
+            f"{label:<12}{len(corpus) / best:>9.1f}{pages / best:>9.1f}"
+            f"{word_score:>8.1%}{phrase_score:>9.1%}{fast:>6}/{len(corpus):<4}"
+        )
+
+    print("\nper document (tiered):")
+    for name, content, source in corpus:
+        result = EXTRACTORS["tiered"](content)
+        words, phrases = _quality("\n".join(result["pages"]), source, references[name])
+        print(f"  {name:<24}{result['extractor']:<12}{words:>7.1%}{phrases:>8.1%}")
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    source_dir = Path(args.pop(0)) if args and not args[0].isdigit() else None
+    main(dir_corpus(source_dir) if source_dir else builtin_corpus(), int(args[0]) if args else 3)
@@ -0,0 +1,198 @@
+"""Synthetic resumes and reports for the PDF benchmarks.
+
+Each builder takes a size — ``sparse`` (a fresh account), ``typical`` (what
+most students download) or ``maximal`` (10 experiences with long bullets,
+every section filled) — and returns deterministic data, so output sizes are
+comparable between runs.
+"""
+
+import json
+from types import SimpleNamespace
+
+SIZES = ["sparse", "typical", "maximal"]
+
+_LONG_BULLET = (
+    "Designed and shipped {what} used by {n},000 students across 40 colleges, "
+    "cutting median response time by {pct}% through query batching, caching and "
+    "careful index design while mentoring two junior interns on code review"
+)
+
+TYPICAL_RESUME = {
+    "personal_info": {
+        "name": "Asha Verma",
+        "email": "asha@example.com",
+        "phone": "+91 98765 43210",
+        "location": "Pune, MH",
+        "linkedin": "linkedin.com/in/asha",
+        "github": "github.com/asha",
+    },
+    "objective": "Backend developer focused on reliable APIs and data pipelines.",
+    "education": [
+        {"degree": "B.Tech", "stream": "Computer Science", "institution": "PIT Pune", "year": "2025", "grade": "8.4 CGPA"},
+        {"degree": "HSC", "institution": "DPS Pune", "year": "2021", "grade": "91%"},
+    ],
+    "experience": [
+        {
+            "title": "Software Intern",
+            "company": "Acme Labs",
+            "duration": "Jun - Aug 2024",
+            "location": "Remote",
+            "bullets": ["Built 5 REST endpoints serving 2k daily users", "Cut p95 latency by 40% with query batching"],
+        },
+    ],
+    "projects": [
+        {"name": "Job Queue", "tech_stack": ["Python", "Redis"], "description": "Distributed task queue", "bullets": ["Processed 1M jobs/day"]},
+        {"name": "Portfolio", "tech_stack": "Next.js", "bullets": ["Launched personal site with blog"]},
+    ],
+    "skills": {
+        "technical": ["Python", "SQL", "FastAPI", "React"],
+        "soft": ["Teamwork", "Communication"],
+        "languages": ["English", "Hindi"],
+        "tools": ["Git", "Docker"],
+    },
+    "achievements": ["Won college hackathon 2024", "Top 5% on Codeforces"],
+    "certifications": [{"name": "AWS Cloud Practitioner", "issuer": "Amazon", "year": "2024"}],
+}
+
+
+def resume(size: str) -> dict:
+    if size == "sparse":
+        return {
+            "personal_info": {"name": "Asha Verma", "email": "asha@example.com"},
+            "education": [{"degree": "B.Tech", "institution": "PIT Pune", "year": "2025"}],
+            "skills": {"technical": ["Python", "SQL", "Git"]},
+        }
+    if size == "typical":
+        return json.loads(json.dumps(TYPICAL_RESUME))
+
+    data = json.loads(json.dumps(TYPICAL_RESUME))
+    data["personal_info"]["portfolio"] = "asha.dev"
+    data["objective"] = " ".join([TYPICAL_RESUME["objective"]] * 4)
+    data["education"] = [
+        {"degree": f"Degree {i}", "stream": "Computer Science", "institution": f"Institute of Technology {i}",
+         "year": str(2025 - 2 * i), "grade": f"{9 - i * 0.3:.1f} CGPA"}
+        for i in range(4)
+    ]
+    data["experience"] = [
+        {
+            "title": f"Software Engineer {i}",
+            "company": f"Company {i} Private Limited",
+            "duration": f"Jan {2015 + i} - Dec {2015 + i}",
+            "location": "Bengaluru, KA",
+            "bullets": [
+                _LONG_BULLET.format(what=f"feature {i}.{b}", n=i + b + 1, pct=10 + b * 5)
+                for b in range(6)
+            ],
+        }
+        for i in range(10)
+    ]
+    data["projects"] = [
+        {"name": f"Project {i}", "tech_stack": ["Python", "Postgres", "Redis", "React", "Docker"],
+         "description": "End-to-end system built and operated by a small team",
+         "bullets": [_LONG_BULLET.format(what=f"module {i}.{b}", n=b + 1, pct=20) for b in range(3)]}
+        for i in range(6)
+    ]
+    data["skills"] = {
+        "technical": [f"Technology {i}" for i in range(30)],
+        "soft": ["Teamwork", "Communication", "Leadership", "Ownership", "Mentoring"],
+        "languages": ["English", "Hindi", "Marathi", "German"],
+        "tools": [f"Tool {i}" for i in range(12)],
+    }
+    data["achievements"] = [f"Achievement {i}: ranked in the top {i + 1}% nationally" for i in range(10)]
+    data["certifications"] = [
+        {"name": f"Certification {i}", "issuer": "Issuer", "year": str(2016 + i)} for i in range(8)
+    ]
+    return data
+
+
+def interview_report(size: str) -> dict:
+    report = {
+        "overall_score": 68,
+        "verdict_label": "Almost There",
+        "verdict_description": "Clear communication and relevant examples, but little quantified impact.",
+        "scores": {
+            "confidence": 70, "clarity": 72, "structure": 64,
+            "persuasiveness": 60, "pace": 75, "domain_knowledge": 66,
+        },
+    }
+    if size == "sparse":
+        return report
+
+    n_questions, n_plan, n_fillers = (5, 3, 3) if size == "typical" else (10, 8, 10)
+    report["communication_metrics"] = {
+        "avg_answer_length_words": 62,
+        "vocabulary_richness": "moderate",
+        "stammering_frequency": "low",
+        "stammering_details": "Occasional restarts at the beginning of answers.",
+    }
+    report["filler_analysis"] = {
+        "total_fillers": n_fillers * 3,
+        "fillers_per_minute": 0.8,
+        "breakdown": [
+            {"word": f"filler{i}", "count": 3, "suggestion": "Pause briefly instead."} for i in range(n_fillers)
+        ],
+    }
+    report["question_breakdown"] = [
+        {
+            "question_index": i,
+            "question_text": f"Question {i + 1}: tell me about a time you handled a difficult situation at work?",
+            "score": 40 + i * 5,
+            "student_answer_summary": "Described the situation and the outcome but skipped the actions taken. " * (1 if size == "typical" else 3),
+            "strengths": ["Clear context", "Honest about mistakes", "Good pace"][: 2 if size == "typical" else 3],
+            "weaknesses": ["No metrics", "Rambling ending", "Missed the lesson learned"][: 2 if size == "typical" else 3],
+            "ideal_answer_outline": "Situation in one line, the specific actions you took, the measurable result, and what you'd repeat.",
+            "better_words": ["led → spearheaded", "helped → enabled", "did → delivered"][: 1 if size == "typical" else 3],
+        }
+        for i in range(n_questions)
+    ]
+    report["improvement_plan"] = [
+        {
+            "priority": i + 1,
+            "area": f"Improvement area {i + 1}",
+            "current_state": "Answers rarely include numbers",
+            "target": "One metric per example",
+            "action_steps": ["Rewrite three answers with metrics", "Practise aloud daily"],
+        }
+        for i in range(n_plan)
+    ]
+    return report
+
+
+def _analysis_markdown(sections: int) -> str:
+    lines = ["## Your Career Analysis", ""]
+    for s in range(sections):
+        lines += [f"### Section {s + 1}", "", f"**Summary {s + 1}** — you show a strong interest in building things."]
+        lines += [f"- Point {p + 1}: practise consistently and track your progress." for p in range(4)]
+        lines.append("")
+    return "\n".join(lines)
+
+
+def career_analysis(size: str) -> SimpleNamespace:
+    """Stand-in for a ``SessionAnalysis`` row."""
+    n_careers, n_steps, n_sections = {"sparse": (2, 0, 0), "typical": (3, 3, 3), "maximal": (8, 12, 10)}[size]
+    analysis = {
+        "top_careers": [
+            {"title": f"Career path {i + 1}", "match_score": 90 - i * 6,
+             "reason": "Enjoys logical problem solving and building useful things."}
+            for i in range(n_careers)
+        ],
+    }
+    roadmap = {
+        "steps": [
+            {"order": i + 1, "title": f"Milestone {i + 1}", "description": "Complete a focused course and ship a small project.",
+             "timeline": f"Month {i * 2 + 1}-{i * 2 + 2}"}
+            for i in range(n_steps)
+        ],
+    }
+    return SimpleNamespace(
+        analysis_json=json.dumps(analysis),
+        analysis_markdown=_analysis_markdown(n_sections) if n_sections else None,
+        roadmap_json=json.dumps(roadmap) if n_steps else None,
+    )
+
+
+STUDENT = SimpleNamespace(name="Asha Verma", college="PIT Pune")
+CHAT_SESSION = SimpleNamespace(title="Career guidance", started_at="2026-10-01T10:00:00+00:00")
+INTERVIEW_SESSION = SimpleNamespace(
+    started_at="2026-10-01T10:00:00+00:00", job_role="Backend Developer", duration_seconds=1260,
+)
@@ -0,0 +1,95 @@
+"""Benchmarks for every PDF the app renders.
+
+Six resume templates, the interview report (``ScoreRing``,
+``ScoreBarChart``, ``ImprovementTimeline``) and the career report
+(``CareerMatchChart``, ``RoadmapTimeline``), each at sparse / typical /
+maximal size. Everything is synthetic and offline: no DB, network or LLM.
+
+Wall time comes from pytest-benchmark. Peak Python allocation (tracemalloc)
+and PDF size come from a separate untimed run — tracemalloc slows rendering
+several times over — and are printed in a summary table and stored in each
+benchmark's ``extra_info``.
+
+From backend/ (after ``pip install -r requirements-dev.txt``):
+
+    python -m pytest benchmarks --benchmark-autosave
+    python -m pytest benchmarks --benchmark-compare --benchmark-compare-fail=median:20%
+
+The second command fails when any benchmark's median is 20% slower than the
+last saved run; cloudbuild.yaml runs it before every deploy.
+"""
+
+import os
+import re
+import tracemalloc
+
+import pytest
+from reportlab.platypus.doctemplate import LayoutError
+
+from app.services.interview_pdf_service import generate_interview_pdf
+from app.services.pdf_service import generate_pdf_report
+from app.services.resume_pdf_service import generate_resume_pdf
+from samples import (
+    CHAT_SESSION, INTERVIEW_SESSION, SIZES, STUDENT,
+    career_analysis, interview_report, resume,
+)
+
+TEMPLATES = ["professional", "modern", "simple", "rendercv", "sidebar", "jake"]
+ROUNDS = int(os.environ.get("PDF_BENCH_ROUNDS", "5"))
+
+_PAGE = re.compile(rb"/Type /Page\b(?!s)")
+
+# modern and sidebar put both columns in one single-row Table, which can't
+# split across pages: content taller than a page fails to lay out
+_ONE_PAGE_ONLY = pytest.mark.xfail(
+    raises=LayoutError, strict=True, reason="two-column table can't span pages",
+)
+RESUME_CASES = [
+    pytest.param(template, size, marks=_ONE_PAGE_ONLY)
+    if size == "maximal" and template in ("modern", "sidebar")
+    else (template, size)
+    for template in TEMPLATES
+    for size in SIZES
+]
+
+
+def _bench(benchmark, pdf_report, name: str, fn, *args) -> None:
+    fn(*args)  # first render pays for imports, styles and font metrics
+
+    tracemalloc.start()
+    pdf = fn(*args)
+    _current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    benchmark.pedantic(fn, args=args, rounds=ROUNDS, iterations=1)
+
+    assert pdf.startswith(b"%PDF")
+    pages = len(_PAGE.findall(pdf))
+    benchmark.extra_info.update(peak_alloc_kib=round(peak / 1024, 1), pdf_bytes=len(pdf), pages=pages)
+    # No stats under --benchmark-disable (a quick "does every PDF still render" run)
+    median_ms = benchmark.stats.stats.median * 1000 if benchmark.stats else float("nan")
+    pdf_report(name, median_ms, peak / 1024, len(pdf), pages)
+
+
+@pytest.mark.parametrize("template,size", RESUME_CASES)
+def test_resume(benchmark, pdf_report, template, size):
+    benchmark.group = f"resume-{size}"
+    _bench(benchmark, pdf_report, f"resume/{template}/{size}", generate_resume_pdf, resume(size), template)
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_interview_report(benchmark, pdf_report, size):
+    benchmark.group = "interview-report"
+    _bench(
+        benchmark, pdf_report, f"interview/{size}",
+        generate_interview_pdf, STUDENT, INTERVIEW_SESSION, interview_report(size),
+    )
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_career_report(benchmark, pdf_report, size):
+    benchmark.group = "career-report"
+    _bench(
+        benchmark, pdf_report, f"career/{size}",
+        generate_pdf_report, STUDENT, CHAT_SESSION, career_analysis(size),
+    )
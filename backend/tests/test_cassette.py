@@ -0,0 +1,143 @@
+"""
+Record / replay cassettes (CASSETTE_MODE=record|replay) for HTTP and Claude.
+
+Records against a mock transport and the fake LLM backend, then replays
+with the live side unreachable.
+
+Run with:
+    python -m pytest backend/tests/test_cassette.py -v
+"""
+
+import sys
+import os
+import asyncio
+import tempfile
+import unittest
+
+os.environ.setdefault("TURSO_DATABASE_URL", "https://dummy-db.turso.io")
+os.environ.setdefault("TURSO_AUTH_TOKEN", "dummy-token")
+os.environ.setdefault("JWT_SECRET", "test-secret-key-for-unit-tests")
+os.environ.setdefault("ANTHROPIC_API_KEY", "sk-ant-dummy-key")
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from unittest.mock import MagicMock, patch
+
+import httpx
+
+with patch("sqlalchemy.create_engine", return_value=MagicMock()):
+    from app.services import cassette_service
+    from app.services.cassette_service import CassetteLLMBackend, CassetteMiss, cassette_key, http_call
+    from app.services.fake_llm_service import FakeLLMBackend
+
+REQUEST = {"query": "sales jobs", "limit": 10}
+
+
+class _Offline:
+    """An LLM backend that must not be reached in replay mode."""
+
+    name = "offline"
+
+    async def stream(self, system_prompt, messages, max_tokens):
+        raise AssertionError("live backend called during replay")
+        yield
+
+    async def create(self, system_prompt, messages, max_tokens):
+        raise AssertionError("live backend called during replay")
+
+
+class _CassetteTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.dir.cleanup)
+        for name, value in (("CASSETTE_DIR", self.dir.name), ("CASSETTE_SPEED", 0)):
+            patcher = patch.object(cassette_service, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def mode(self, mode: str):
+        return patch.object(cassette_service, "CASSETTE_MODE", mode)
+
+
+class TestHTTPCassettes(_CassetteTest):
+    def _call(self, service: str, request: dict, status: int = 200) -> tuple[httpx.Response, int]:
+        sent = []
+
+        def handler(req):
+            sent.append(req)
+            return httpx.Response(status, json={"data": [{"url": "https://example.com/job"}]})
+
+        async def run():
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+                return await http_call(
+                    service, request, lambda: client.post("https://api.example.com/search", json=request)
+                )
+
+        return asyncio.run(run()), len(sent)
+
+    def test_record_then_replay(self):
+        with self.mode("record"):
+            recorded, sent = self._call("firecrawl", REQUEST, status=429)
+        self.assertEqual(sent, 1)
+
+        with self.mode("replay"):
+            replayed, sent = self._call("firecrawl", REQUEST)
+        self.assertEqual(sent, 0)
+        self.assertEqual(replayed.status_code, 429)
+        self.assertEqual(replayed.json(), recorded.json())
+        self.assertEqual(replayed.headers["content-type"], "application/json")
+
+    def test_key_matches_service_and_request(self):
+        with self.mode("record"):
+            self._call("firecrawl", REQUEST)
+
+        # Key order doesn't matter
+        self.assertEqual(cassette_key(REQUEST), cassette_key(dict(reversed(REQUEST.items()))))
+        with self.mode("replay"):
+            self.assertEqual(self._call("firecrawl", {"limit": 10, "query": "sales jobs"})[1], 0)
+            with self.assertRaises(CassetteMiss):
+                self._call("elevenlabs", REQUEST)
+            with self.assertRaises(CassetteMiss):
+                self._call("firecrawl", {**REQUEST, "limit": 5})
+
+    def test_off_mode_writes_nothing(self):
+        with self.mode("off"):
+            self._call("firecrawl", REQUEST)
+        self.assertEqual(os.listdir(self.dir.name), [])
+
+
+class TestClaudeCassettes(_CassetteTest):
+    SYSTEM = "You are an interview analyst."
+    MESSAGES = [{"role": "user", "content": "Summarise the interview."}]
+
+    def _stream(self, backend) -> list[str]:
+        async def run():
+            return [text async for text in backend.stream(self.SYSTEM, self.MESSAGES, 500)]
+
+        return asyncio.run(run())
+
+    def test_stream_record_then_replay(self):
+        with self.mode("record"):
+            recorded = self._stream(CassetteLLMBackend(FakeLLMBackend(tokens_per_second=0, first_token_ms=0), "m"))
+        self.assertTrue(recorded)
+
+        with self.mode("replay"):
+            self.assertEqual(self._stream(CassetteLLMBackend(_Offline(), "m")), recorded)
+
+    def test_create_record_then_replay(self):
+        with self.mode("record"):
+            inner = FakeLLMBackend(tokens_per_second=0, first_token_ms=0)
+            recorded = asyncio.run(CassetteLLMBackend(inner, "m").create(self.SYSTEM, self.MESSAGES, 500))
+
+        with self.mode("replay"):
+            backend = CassetteLLMBackend(_Offline(), "m")
+            self.assertEqual(asyncio.run(backend.create(self.SYSTEM, self.MESSAGES, 500)), recorded)
+            # Stream and create cassettes are keyed apart, as are models
+            with self.assertRaises(CassetteMiss):
+                self._stream(backend)
+            with self.assertRaises(CassetteMiss):
+                asyncio.run(CassetteLLMBackend(_Offline(), "other").create(self.SYSTEM, self.MESSAGES, 500))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,142 @@
+"""
+Contract tests for the offline fake LLM backend (LLM_BACKEND=fake).
+
+Checks that every canned response parses with the same extractors the
+routes use, so load tests and CI exercise the real code paths.
+
+Run with:
+    python -m pytest backend/tests/test_fake_llm.py -v
+"""
+
+import sys
+import os
+import json
+import asyncio
+import unittest
+
+os.environ.setdefault("TURSO_DATABASE_URL", "https://dummy-db.turso.io")
+os.environ.setdefault("TURSO_AUTH_TOKEN", "dummy-token")
+os.environ.setdefault("JWT_SECRET", "test-secret-key-for-unit-tests")
+os.environ.setdefault("ANTHROPIC_API_KEY", "sk-ant-dummy-key")
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from unittest.mock import MagicMock, patch
+
+with patch("sqlalchemy.create_engine", return_value=MagicMock()):
+    from types import SimpleNamespace
+    from app.prompts import (
+        build_system_prompt,
+        build_resume_system_prompt,
+        build_interview_system_prompt,
+        build_interview_analysis_prompt,
+        build_mentorship_system_prompt,
+    )
+    from app.services.analysis_service import (
+        extract_options,
+        extract_progress,
+        extract_analysis,
+    )
+    from app.services.interview_service import (
+        extract_interview_meta,
+        check_interview_complete,
+        _extract_json_from_response,
+    )
+    from app.services.ats_scoring_service import ATS_SCORING_PROMPT, ATS_SECTION_PROMPT
+    from app.services.fake_llm_service import (
+        FakeLLMBackend,
+        CHAT_QUESTIONS_BEFORE_ANALYSIS,
+        INTERVIEW_QUESTIONS,
+    )
+
+
+USER = SimpleNamespace(name="Test Student", college="Test College")
+
+
+def _history(turns: int, user_role="user", assistant_role="assistant"):
+    messages = []
+    for i in range(turns):
+        messages.append({"role": user_role, "content": f"answer {i}"})
+        messages.append({"role": assistant_role, "content": f"question {i}"})
+    messages.append({"role": user_role, "content": "latest answer"})
+    return messages
+
+
+def _collect(backend, system, messages):
+    async def run():
+        return [c async for c in backend.stream(system, messages)]
+    return asyncio.run(run())
+
+
+class TestFakeLLMBackend(unittest.TestCase):
+
+    def setUp(self):
+        self.backend = FakeLLMBackend(tokens_per_second=0, first_token_ms=0, responses={})
+
+    def test_career_chat_emits_options_and_progress(self):
+        text = self.backend.respond(build_system_prompt(USER), _history(0))
+        self.assertTrue(extract_options(text))
+        self.assertEqual(extract_progress(text)["status"], "on_track")
+        self.assertIsNone(extract_analysis(text))
+
+    def test_career_chat_emits_analysis_when_forced_or_late(self):
+        forced = self.backend.respond(build_system_prompt(USER, force_analysis=True), _history(1))
+        late = self.backend.respond(
+            build_system_prompt(USER), _history(CHAT_QUESTIONS_BEFORE_ANALYSIS)
+        )
+        for text in (forced, late):
+            analysis = extract_analysis(text)
+            self.assertIsNotNone(analysis)
+            self.assertIsNotNone(analysis["analysis_json"])
+            self.assertIsNotNone(analysis["roadmap_json"])
+
+    def test_resume_chat_emits_resume_json_when_forced(self):
+        text = self.backend.respond(build_resume_system_prompt(USER, force_resume=True), _history(1))
+        start = text.index("<resume_json>") + len("<resume_json>")
+        data = json.loads(text[start:text.index("</resume_json>")])
+        self.assertIn("personal_info", data)
+
+    def test_interview_emits_meta_then_completes(self):
+        system = build_interview_system_prompt(job_role="Bank PO")
+        first = self.backend.respond(
+            system, [{"role": "user", "content": "Begin the interview."}]
+        )
+        self.assertEqual(extract_interview_meta(first)["question_number"], 1)
+        self.assertFalse(check_interview_complete(first))
+
+        last = self.backend.respond(system, _history(INTERVIEW_QUESTIONS))
+        self.assertTrue(check_interview_complete(last))
+
+    def test_batch_responses_are_valid_json(self):
+        report = self.backend.respond(
+            "You are an expert interview analyst. Output only valid JSON.",
+            [{"role": "user", "content": build_interview_analysis_prompt("Bank PO", "...")}],
+        )
+        self.assertIn("overall_score", _extract_json_from_response(report))
+
+        ats = self.backend.respond(ATS_SCORING_PROMPT, [{"role": "user", "content": "{}"}])
+        self.assertIn("grades", json.loads(ats))
+
+        section = self.backend.respond(ATS_SECTION_PROMPT, [{"role": "user", "content": "[]"}])
+        self.assertLessEqual(set(json.loads(section)["grades"].values()), set("ABCDE"))
+
+    def test_stream_is_deterministic_and_reassembles(self):
+        system = build_system_prompt(USER)
+        first = _collect(self.backend, system, _history(2))
+        second = _collect(self.backend, system, _history(2))
+        self.assertEqual(first, second)
+        self.assertGreater(len(first), 1)
+        self.assertEqual("".join(first), self.backend.respond(system, _history(2)))
+
+    def test_overrides_replace_canned_responses(self):
+        backend = FakeLLMBackend(
+            tokens_per_second=0, first_token_ms=0,
+            responses={"mentorship_chat": ["first", "second"]},
+        )
+        system = build_mentorship_system_prompt(USER)
+        self.assertEqual(backend.respond(system, _history(0)), "first")
+        self.assertEqual(backend.respond(system, _history(1)), "second")
+
+
+if __name__ == "__main__":
+    unittest.main()
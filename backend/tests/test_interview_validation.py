@@ -45,6 +45,7 @@ with patch("sqlalchemy.create_engine", return_value=MagicMock()):
     from app.prompts import (
         build_interview_system_prompt,
         build_interview_analysis_prompt,
+        system_prompt_text,
     )
     from app.services.interview_service import (
         detect_fillers,
@@ -382,69 +383,77 @@ class TestPromptGeneration(unittest.TestCase):
 
     def test_prompt_contains_job_role(self):
         """System prompt must include the target job role."""
-        prompt = build_interview_system_prompt(job_role="Bank PO")
+        prompt = system_prompt_text(build_interview_system_prompt(job_role="Bank PO"))
         self.assertIn("Bank PO", prompt)
 
     def test_prompt_without_resume(self):
         """When no resume is provided, prompt says so."""
-        prompt = build_interview_system_prompt(job_role="Bank PO")
+        prompt = system_prompt_text(build_interview_system_prompt(job_role="Bank PO"))
         self.assertIn("No resume provided", prompt)
 
     def test_prompt_with_resume(self):
         """When resume text is provided, it appears in the prompt."""
         resume = "B.Com from Delhi University. Intern at SBI for 3 months."
-        prompt = build_interview_system_prompt(
+        prompt = system_prompt_text(build_interview_system_prompt(
             job_role="Bank PO", resume_text=resume
-        )
+        ))
         self.assertIn("Candidate's Resume", prompt)
         self.assertIn("B.Com from Delhi University", prompt)
 
     def test_prompt_truncates_long_resume(self):
         """Resume text longer than 3000 chars is truncated."""
         long_resume = "A" * 5000
-        prompt = build_interview_system_prompt(
+        prompt = system_prompt_text(build_interview_system_prompt(
             job_role="Bank PO", resume_text=long_resume
-        )
+        ))
         # The prompt should contain the truncated version (3000 chars)
         self.assertIn("A" * 3000, prompt)
         self.assertNotIn("A" * 3001, prompt)
 
     def test_prompt_without_jd(self):
         """When no JD is provided, prompt uses standard expectations."""
-        prompt = build_interview_system_prompt(job_role="Software Engineer")
+        prompt = system_prompt_text(build_interview_system_prompt(job_role="Software Engineer"))
         self.assertIn("No specific JD provided", prompt)
 
     def test_prompt_with_jd(self):
         """When JD is provided, it appears in the prompt."""
         jd = "Must have 2+ years experience with Python and cloud services."
-        prompt = build_interview_system_prompt(
+        prompt = system_prompt_text(build_interview_system_prompt(
             job_role="Software Engineer", job_description=jd
-        )
+        ))
         self.assertIn("Job Description", prompt)
         self.assertIn("Python and cloud services", prompt)
 
     def test_prompt_with_both_resume_and_jd(self):
         """When both resume and JD are provided, both appear."""
-        prompt = build_interview_system_prompt(
+        prompt = system_prompt_text(build_interview_system_prompt(
             job_role="Data Analyst",
             resume_text="Experienced in SQL and Tableau.",
             job_description="Looking for a data analyst with SQL skills.",
-        )
+        ))
         self.assertIn("Candidate's Resume", prompt)
         self.assertIn("Job Description", prompt)
         self.assertIn("Data Analyst", prompt)
 
     def test_prompt_contains_metadata_instructions(self):
         """System prompt must include the <interview_meta> tag instruction."""
-        prompt = build_interview_system_prompt(job_role="Bank PO")
+        prompt = system_prompt_text(build_interview_system_prompt(job_role="Bank PO"))
         self.assertIn("<interview_meta>", prompt)
         self.assertIn("question_number", prompt)
 
     def test_prompt_contains_completion_instruction(self):
         """System prompt must include the <interview_complete> tag instruction."""
-        prompt = build_interview_system_prompt(job_role="Bank PO")
+        prompt = system_prompt_text(build_interview_system_prompt(job_role="Bank PO"))
         self.assertIn("<interview_complete>", prompt)
 
+    def test_session_context_is_inside_cached_prefix(self):
+        """Role, resume and JD don't change mid-interview, so the whole
+        prompt is one cacheable block."""
+        blocks = build_interview_system_prompt(job_role="Bank PO", resume_text="SBI intern")
+        self.assertEqual(len(blocks), 1)
+        self.assertEqual(blocks[0]["cache_control"], {"type": "ephemeral"})
+        self.assertIn("SBI intern", blocks[0]["text"])
+
 
 class TestAnalysisPromptGeneration(unittest.TestCase):
     """4. Verify the analysis prompt includes the transcript properly."""
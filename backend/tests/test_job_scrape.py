@@ -0,0 +1,157 @@
+"""
+Scrape engine rate limiting, retries and task leases (no network; leases
+run against a local SQLite database).
+
+Run with:
+    python -m pytest backend/tests/test_job_scrape.py -v
+"""
+
+import sys
+import os
+import asyncio
+import time
+import unittest
+
+os.environ.setdefault("TURSO_DATABASE_URL", "https://dummy-db.turso.io")
+os.environ.setdefault("TURSO_AUTH_TOKEN", "dummy-token")
+os.environ.setdefault("JWT_SECRET", "test-secret-key-for-unit-tests")
+os.environ.setdefault("ANTHROPIC_API_KEY", "sk-ant-dummy-key")
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from unittest.mock import MagicMock, patch
+
+import httpx
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+with patch("sqlalchemy.create_engine", return_value=MagicMock()):
+    from app.models import BackgroundTask, ScrapeBatch
+    from app.services import job_scrape_service, task_queue_service
+    from app.services.job_scrape_service import LeaseLost, SearchFailed, TokenBucket, backoff_delay, search
+
+
+def _search(responses: list[httpx.Response]) -> tuple[list[dict], int]:
+    sent = []
+
+    def handler(request):
+        sent.append(request)
+        return responses[len(sent) - 1]
+
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return await search(client, TokenBucket(0, 1), "sales jobs")
+
+    with patch.object(job_scrape_service, "BACKOFF_BASE_SECONDS", 0.01):
+        return asyncio.run(run())
+
+
+class TestRateLimiting(unittest.TestCase):
+    def test_bucket_spaces_requests_after_burst(self):
+        async def run():
+            bucket = TokenBucket(rate=50, burst=2)
+            started = time.monotonic()
+            for _ in range(6):
+                await bucket.acquire()
+            return time.monotonic() - started
+
+        # 2 from the burst, then 4 at 50/s
+        self.assertGreaterEqual(asyncio.run(run()), 4 / 50 - 0.01)
+
+    def test_backoff_is_jittered_and_capped(self):
+        delays = {backoff_delay(2) for _ in range(20)}
+        base = job_scrape_service.BACKOFF_BASE_SECONDS * 4
+        self.assertGreater(len(delays), 1)
+        self.assertTrue(all(base / 2 <= d <= base for d in delays))
+        self.assertLessEqual(backoff_delay(50), job_scrape_service.SCRAPE_BACKOFF_MAX_SECONDS)
+        self.assertGreaterEqual(backoff_delay(0, retry_after="7"), 7)
+
+
+class TestSearch(unittest.TestCase):
+    def test_retries_429_then_returns_results(self):
+        results, throttled = _search([
+            httpx.Response(429, headers={"Retry-After": "0"}),
+            httpx.Response(503),
+            httpx.Response(200, json={"data": [{"url": "u"}]}),
+        ])
+        self.assertEqual(results, [{"url": "u"}])
+        self.assertEqual(throttled, 1)
+
+    def test_client_error_is_not_retried(self):
+        with self.assertRaises(SearchFailed) as ctx:
+            _search([httpx.Response(401), httpx.Response(200, json={"data": []})])
+        self.assertIn("401", str(ctx.exception))
+
+    def test_gives_up_after_max_retries(self):
+        attempts = job_scrape_service.SCRAPE_MAX_RETRIES + 1
+        with self.assertRaises(SearchFailed) as ctx:
+            _search([httpx.Response(429)] * attempts)
+        self.assertEqual(ctx.exception.throttled, attempts)
+
+
+class TestLeases(unittest.TestCase):
+    def setUp(self):
+        engine = create_engine("sqlite://")
+        BackgroundTask.__table__.create(engine)
+        ScrapeBatch.__table__.create(engine)
+        self.db = Session(engine)
+        self.batch = ScrapeBatch(trigger="admin", queries_total=2)
+        self.db.add(self.batch)
+        self.db.add(task_queue_service.make_task("jobs.scrape", {"batch_id": "b"}))
+        self.db.commit()
+        self.task = task_queue_service._claim_next(self.db)
+
+    def tearDown(self):
+        self.db.close()
+
+    def _steal(self):
+        """Another worker re-claims the task after this run's lease lapsed."""
+        row = self.db.get(BackgroundTask, self.task["id"])
+        row.locked_until = "2000-01-01T00:00:00+00:00"
+        self.db.commit()
+        return task_queue_service._claim_next(self.db)
+
+    def test_checkpoint_renews_lease(self):
+        row = self.db.get(BackgroundTask, self.task["id"])
+        row.locked_until = "2000-01-01T00:00:00+00:00"
+        self.db.commit()
+        job_scrape_service._checkpoint(
+            self.db, self.task, self.batch.id, "sales", "q1", lambda *a: (1, 0), [], 0, None
+        )
+        self.db.refresh(row)
+        self.assertGreater(row.locked_until, "2026")
+        self.assertIsNone(task_queue_service._claim_next(self.db))
+
+    def test_stale_run_stops_and_cannot_finish(self):
+        newer = self._steal()
+        self.assertEqual(newer["attempts"], 2)
+        with self.assertRaises(LeaseLost):
+            job_scrape_service._checkpoint(
+                self.db, self.task, self.batch.id, "sales", "q1", lambda *a: (1, 0), [], 0, None
+            )
+        self.db.refresh(self.batch)
+        self.assertEqual(self.batch.queries_done, 0)
+
+        task_queue_service._finish(self.db, self.task["id"], "boom", 1, 3)
+        row = self.db.get(BackgroundTask, self.task["id"])
+        self.db.refresh(row)
+        self.assertEqual(row.status, "running")
+
+    def test_batch_stays_running_until_last_attempt(self):
+        self.batch.status = "running"
+        self.db.commit()
+        job_scrape_service._fail(self.db, self.batch.id, "RuntimeError: boom", final=False)
+        self.db.refresh(self.batch)
+        self.assertEqual(self.batch.status, "running")
+        self.assertEqual(self.batch.last_error, "RuntimeError: boom")
+        batch, started = job_scrape_service.start_batch(self.db, "cron", 2)
+        self.assertFalse(started)
+        self.assertEqual(batch.id, self.batch.id)
+
+        job_scrape_service._fail(self.db, self.batch.id, "RuntimeError: boom", final=True)
+        self.db.refresh(self.batch)
+        self.assertEqual(self.batch.status, "failed")
+
+
+if __name__ == "__main__":
+    unittest.main()
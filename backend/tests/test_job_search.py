@@ -0,0 +1,90 @@
+"""
+Job feed full-text search against a real local SQLite (FTS5) database.
+
+Run with:
+    python -m pytest backend/tests/test_job_search.py -v
+"""
+
+import sys
+import os
+import unittest
+
+os.environ.setdefault("TURSO_DATABASE_URL", "https://dummy-db.turso.io")
+os.environ.setdefault("TURSO_AUTH_TOKEN", "dummy-token")
+os.environ.setdefault("JWT_SECRET", "test-secret-key-for-unit-tests")
+os.environ.setdefault("ANTHROPIC_API_KEY", "sk-ant-dummy-key")
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from unittest.mock import MagicMock, patch
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+with patch("sqlalchemy.create_engine", return_value=MagicMock()):
+    from app.models import Job
+    from app.services import job_search_service
+
+
+def _job(title, company, description="", location="Pune", scraped_at="2026-10-01T00:00:00+00:00"):
+    return Job(
+        title=title, company=company, location=location, description=description,
+        role_category="sales", scraped_at=scraped_at,
+    )
+
+
+class TestJobSearch(unittest.TestCase):
+    def setUp(self):
+        self.engine = create_engine("sqlite://")
+        Job.__table__.create(self.engine)
+        self.db = Session(self.engine)
+        # Indexed at startup: existing rows are copied into jobs_fts
+        self.db.add(_job("Sales Executive", "Acme", "Field sales across Maharashtra"))
+        self.db.commit()
+        with self.engine.connect() as conn:
+            self.assertTrue(job_search_service.ensure_index(conn))
+        # Added later by a scrape
+        added = [
+            _job("Receptionist", "Hotel Sales Plaza", "Front desk", scraped_at="2026-10-03T00:00:00+00:00"),
+            _job("Accounts Assistant", "Ledger Co", "Tally, GST and sales invoices", location="Mumbai"),
+            _job("Telecaller", "CallNow", "Voice process, Hindi and English"),
+        ]
+        self.db.add_all(added)
+        self.db.flush()
+        job_search_service.index_jobs(self.db, [job.id for job in added])
+        self.db.commit()
+
+    def tearDown(self):
+        self.db.close()
+        self.engine.dispose()
+
+    def _search(self, search):
+        query, order_by = job_search_service.apply_search(self.db.query(Job), search)
+        return [job.title for job in query.order_by(*order_by).all()]
+
+    def test_match_expression_quotes_prefix_terms(self):
+        self.assertEqual(job_search_service.match_expression('Sales "exec" OR'), '"sales"* "exec"* "or"*')
+        self.assertIsNone(job_search_service.match_expression("  +- "))
+
+    def test_prefix_match_across_columns(self):
+        self.assertEqual(self._search("tele"), ["Telecaller"])
+        self.assertEqual(self._search("mumb"), ["Accounts Assistant"])
+        self.assertEqual(self._search("hindi voice"), ["Telecaller"])
+        self.assertEqual(self._search("gst plumbing"), [])
+
+    def test_ranks_title_hits_first(self):
+        # Title > company > description
+        self.assertEqual(self._search("sales"), ["Sales Executive", "Receptionist", "Accounts Assistant"])
+
+    def test_operators_are_literal(self):
+        # As an operator this would match all four jobs
+        self.assertEqual(self._search("sales OR telecaller"), [])
+        self.assertEqual(self._search("front-desk"), ["Receptionist"])
+
+    def test_falls_back_to_ilike_without_fts(self):
+        with patch.object(job_search_service, "_available", False):
+            self.assertEqual(self._search("Ledger"), ["Accounts Assistant"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,220 @@
+"""
+Live ATS meter: the full score's rubric categories graded section by
+section with the fake LLM backend, cached by section content, with a
+per-section fallback when the model is overloaded.
+
+Run with:
+    python -m pytest backend/tests/test_live_ats_score.py -v
+"""
+
+import sys
+import os
+import json
+import asyncio
+import unittest
+import re
+from types import SimpleNamespace
+
+os.environ.setdefault("TURSO_DATABASE_URL", "https://dummy-db.turso.io")
+os.environ.setdefault("TURSO_AUTH_TOKEN", "dummy-token")
+os.environ.setdefault("JWT_SECRET", "test-secret-key-for-unit-tests")
+os.environ.setdefault("ANTHROPIC_API_KEY", "sk-ant-dummy-key")
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from unittest.mock import MagicMock, patch
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+with patch("sqlalchemy.create_engine", return_value=MagicMock()):
+    from app.auth import get_current_user
+    from app.database import get_db
+    from app.models import ResumeDraft
+    from app.routers import resume_drafts
+    from app.services import ats_scoring_service, claude_service, llm_cache_service
+    from app.services.ats_scoring_service import compute_ats_score, compute_section_ats_score
+    from app.services.claude_service import LLMOverloaded, set_backend
+    from app.services.fake_llm_service import FakeLLMBackend
+
+RESUME = {
+    "personal_info": {"name": "Test Student", "email": "student@example.com", "phone": "+91 98765 43210"},
+    "objective": "Entry-level data analyst role",
+    "skills": {"technical": ["Python", "SQL", "Excel"], "soft": ["Communication"]},
+    "experience": [{"title": "Intern", "company": "Acme", "bullets": ["Built 3 sales dashboards"]}],
+    "projects": [{"name": "Sales tracker", "tech_stack": ["Python"], "bullets": []}],
+    "education": [{"degree": "B.Com", "institution": "Pune University"}],
+}
+
+
+class _NoDB:
+    """Stands in for ``async_session_scope``: the cache's table is always empty."""
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def run_sync(self, fn, *args):
+        return None
+
+
+class _CountingBackend(FakeLLMBackend):
+    def __init__(self):
+        super().__init__(tokens_per_second=0, first_token_ms=0)
+        self.calls = 0
+
+    async def create(self, system_prompt, messages, max_tokens=512):
+        self.calls += 1
+        return await super().create(system_prompt, messages, max_tokens)
+
+
+class _PerSectionBackend:
+    """Grades every category of a section with that section's letter."""
+
+    name = "per-section"
+
+    def __init__(self, letters: dict):
+        self.letters = letters
+        self.sections = []
+
+    async def create(self, system_prompt, messages, max_tokens=512):
+        content = messages[-1]["content"]
+        section = re.search(r"## Section: (\w+)", content).group(1)
+        self.sections.append(section)
+        categories = re.findall(r"^- (\w+):", content, re.M)
+        return json.dumps({"grades": {key: self.letters[section] for key in categories}})
+
+
+class _OverloadedBackend:
+    name = "overloaded"
+
+    async def create(self, system_prompt, messages, max_tokens=512):
+        raise LLMOverloaded("batch", 5)
+
+
+class _LiveScoreTest(unittest.TestCase):
+    def setUp(self):
+        patcher = patch.object(llm_cache_service, "async_session_scope", _NoDB)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        ats_scoring_service._section_cache._memory.clear()
+        self.backend = _CountingBackend()
+        self.use(self.backend)
+
+    def use(self, backend):
+        previous = claude_service._backend
+        set_backend(backend)
+        self.addCleanup(set_backend, previous)
+
+    def score(self, data: dict) -> dict:
+        return asyncio.run(compute_section_ats_score(json.dumps(data), "u1"))
+
+
+class TestComputeSectionATSScore(_LiveScoreTest):
+    def test_cache_miss_grades_every_filled_section(self):
+        result = self.score(RESUME)
+        self.assertEqual(sorted(result["regraded_sections"]), sorted(ats_scoring_service.SECTION_CATEGORIES))
+        self.assertEqual(self.backend.calls, 5)
+        grades = {c["key"]: c["grade"] for c in result["categories"] if c["type"] == "semantic"}
+        self.assertEqual(set(grades.values()), {"B"})
+        self.assertIn("Docker", result["missing_keywords"])
+
+    def test_same_categories_and_weights_as_full_score(self):
+        live = self.score(RESUME)["categories"]
+        full = asyncio.run(compute_ats_score(json.dumps(RESUME), "u1"))["categories"]
+        self.assertEqual(
+            [(c["key"], c["label"], c["max"]) for c in live],
+            [(c["key"], c["label"], c["max"]) for c in full],
+        )
+
+    def test_category_grade_is_mean_over_its_filled_sections(self):
+        backend = _PerSectionBackend(
+            {"skills": "A", "experience": "A", "projects": "C", "objective": "D", "education": "E"}
+        )
+        self.use(backend)
+        grades = {c["key"]: c["grade"] for c in self.score(RESUME)["categories"] if c["type"] == "semantic"}
+        self.assertEqual(grades, {
+            "hard_skills": "A", "soft_skills": "A",
+            "experience_relevance": "B", "content_quality": "B", "action_language": "B",
+            "job_title_alignment": "D",  # D and E tie; the better grade wins
+        })
+
+        # A fresher: projects alone carry the experience categories
+        ats_scoring_service._section_cache._memory.clear()
+        fresher = self.score({**RESUME, "experience": []})
+        self.assertNotIn("experience", fresher["regraded_sections"])
+        grades = {c["key"]: c["grade"] for c in fresher["categories"] if c["type"] == "semantic"}
+        self.assertEqual(grades["experience_relevance"], "C")
+        self.assertIn("Add your experience section", fresher["suggestions"])
+
+    def test_cache_hit_regrades_only_changed_sections(self):
+        first = self.score(RESUME)
+        again = self.score(dict(reversed(RESUME.items())))  # same content, new key order
+        self.assertEqual(again["regraded_sections"], [])
+        self.assertEqual(again["total_score"], first["total_score"])
+
+        self.score({**RESUME, "skills": {**RESUME["skills"], "tools": ["Power BI"]}})
+        self.assertEqual(self.backend.calls, 6)
+
+    def test_overload_falls_back_per_section_without_caching(self):
+        self.use(_OverloadedBackend())
+        result = self.score(RESUME)
+        semantic = [c for c in result["categories"] if c["type"] == "semantic"]
+        self.assertEqual({c["grade"] for c in semantic}, {"C"})
+
+        # The fallback wasn't cached: the next save grades for real
+        self.use(self.backend)
+        self.assertEqual(len(self.score(RESUME)["regraded_sections"]), 5)
+
+
+class TestLiveATSScoreEndpoint(_LiveScoreTest):
+    def setUp(self):
+        super().setUp()
+        # TestClient runs the endpoint on another thread
+        engine = create_engine(
+            "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+        )
+        ResumeDraft.__table__.create(engine)
+        self.db = Session(engine)
+        self.addCleanup(self.db.close)
+        self.draft = ResumeDraft(user_id="u1", resume_json=json.dumps(RESUME))
+        self.db.add(self.draft)
+        self.db.commit()
+
+        app = FastAPI()
+        app.include_router(resume_drafts.router)
+        app.dependency_overrides[get_current_user] = lambda: SimpleNamespace(id="u1")
+        app.dependency_overrides[get_db] = lambda: self.db
+        self.client = TestClient(app)
+
+    def post(self, draft_id: str):
+        return self.client.post(f"/resume-drafts/{draft_id}/ats-score/live")
+
+    def test_miss_then_hit(self):
+        first = self.post(self.draft.id)
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(len(first.json()["regraded_sections"]), 5)
+
+        second = self.post(self.draft.id).json()
+        self.assertEqual(second["regraded_sections"], [])
+        self.assertEqual(second["total_score"], first.json()["total_score"])
+        self.assertEqual(self.backend.calls, 5)
+
+    def test_overloaded_model_still_scores(self):
+        self.use(_OverloadedBackend())
+        response = self.post(self.draft.id)
+        self.assertEqual(response.status_code, 200)
+        semantic = [c for c in response.json()["categories"] if c["type"] == "semantic"]
+        self.assertEqual({c["grade"] for c in semantic}, {"C"})
+
+    def test_unknown_draft(self):
+        self.assertEqual(self.post("missing").status_code, 404)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+"""
+Claude concurrency governor: per-user queue caps, keyless calls and
+lower-weight background work.
+
+Run with:
+    python -m pytest backend/tests/test_llm_governor.py -v
+"""
+
+import sys
+import os
+import asyncio
+import unittest
+
+os.environ.setdefault("TURSO_DATABASE_URL", "https://dummy-db.turso.io")
+os.environ.setdefault("TURSO_AUTH_TOKEN", "dummy-token")
+os.environ.setdefault("JWT_SECRET", "test-secret-key-for-unit-tests")
+os.environ.setdefault("ANTHROPIC_API_KEY", "sk-ant-dummy-key")
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from unittest.mock import MagicMock, patch
+
+with patch("sqlalchemy.create_engine", return_value=MagicMock()):
+    from app.services import claude_service, task_queue_service
+    from app.services.claude_service import BATCH_LANE, LLMGovernor, LLMOverloaded, get_chat_response, set_backend
+    from app.services.fake_llm_service import FakeLLMBackend
+
+
+def _burst(user_keys: list) -> tuple[int, int]:
+    """Run one call per key through a 1-slot lane; returns (admitted, rejected)."""
+    governor = LLMGovernor(
+        max_concurrency=4, lanes={BATCH_LANE: 1}, max_queue=20, max_queued_per_user=3
+    )
+
+    async def call(user_key):
+        async with governor.slot(BATCH_LANE, user_key):
+            await asyncio.sleep(0.01)
+
+    async def run():
+        return await asyncio.gather(*(call(k) for k in user_keys), return_exceptions=True)
+
+    results = asyncio.run(run())
+    rejected = sum(isinstance(r, LLMOverloaded) for r in results)
+    return len(results) - rejected, rejected
+
+
+class TestGovernorQueueing(unittest.TestCase):
+    def test_per_user_queue_cap(self):
+        # 1 running + 3 queued for the same user; the rest are turned away
+        self.assertEqual(_burst(["u1"] * 8), (4, 4))
+
+    def test_users_queue_independently(self):
+        self.assertEqual(_burst(["u1", "u2", "u3", "u4"] * 2), (8, 0))
+
+    def test_keyless_calls_only_limited_by_lane_queue(self):
+        self.assertEqual(_burst([None] * 8), (8, 0))
+        self.assertEqual(_burst([None] * 25), (21, 4))
+
+
+class TestGovernorWeights(unittest.TestCase):
+    def test_half_weight_gets_half_the_grants(self):
+        governor = LLMGovernor(
+            max_concurrency=1, lanes={BATCH_LANE: 1}, max_queue=20, max_queued_per_user=10
+        )
+        order = []
+
+        async def call(user_key, weight):
+            async with governor.slot(BATCH_LANE, user_key, weight):
+                order.append(user_key)
+                await asyncio.sleep(0)
+
+        async def run():
+            async with governor.slot(BATCH_LANE, "holder"):
+                calls = [asyncio.create_task(call("background", 0.5)) for _ in range(4)]
+                calls += [asyncio.create_task(call("user", 1.0)) for _ in range(4)]
+                await asyncio.sleep(0)  # all queued behind the holder
+            await asyncio.gather(*calls)
+
+        asyncio.run(run())
+        self.assertEqual(order[:6], ["background", "user", "user", "background", "user", "user"])
+
+    def test_background_task_calls_use_background_weight(self):
+        previous = claude_service._backend
+        set_backend(FakeLLMBackend(tokens_per_second=0, first_token_ms=0))
+        self.addCleanup(set_backend, previous)
+        weights = []
+        real_slot = claude_service.governor.slot
+
+        def slot(lane_name, user_key=None, weight=1.0):
+            weights.append(weight)
+            return real_slot(lane_name, user_key, weight)
+
+        async def run():
+            messages = [{"role": "user", "content": "hi"}]
+            await get_chat_response("You are a helpful assistant.", messages, "u1")
+            task_queue_service._current_task.set({"id": "t1", "kind": "interview.report"})
+            await get_chat_response("You are a helpful assistant.", messages, "u1")
+
+        with patch.object(claude_service.governor, "slot", slot):
+            asyncio.run(run())
+        self.assertEqual(weights, [1.0, claude_service.LLM_BACKGROUND_WEIGHT])
+
+
+if __name__ == "__main__":
+    unittest.main()
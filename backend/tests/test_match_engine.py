@@ -0,0 +1,216 @@
+"""
+Vectorized match scoring must agree exactly with compute_match_score, the
+feed's backfill rescore runs once per user, and the match-sorted feed's
+cursor walks the same order as its pages (local SQLite database).
+
+Run with:
+    python -m pytest backend/tests/test_match_engine.py -v
+"""
+
+import sys
+import os
+import json
+import random
+import unittest
+from types import SimpleNamespace
+
+os.environ.setdefault("TURSO_DATABASE_URL", "https://dummy-db.turso.io")
+os.environ.setdefault("TURSO_AUTH_TOKEN", "dummy-token")
+os.environ.setdefault("JWT_SECRET", "test-secret-key-for-unit-tests")
+os.environ.setdefault("ANTHROPIC_API_KEY", "sk-ant-dummy-key")
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from unittest.mock import MagicMock, patch
+
+from fastapi import HTTPException
+from sqlalchemy import and_, create_engine, func
+from sqlalchemy.orm import Session
+
+with patch("sqlalchemy.create_engine", return_value=MagicMock()):
+    from app.models import BackgroundTask, Job, JobMatchScore, UserProfile
+    from app.routers.jobs import _match_page
+    from app.services import job_match_service
+    from app.services.job_match_service import JobIndex, compute_match_score, queue_rescore, rescore_user
+    from app.services.match_engine import JobMatrix
+
+WORDS = [
+    "sales", "salesman", "executive", "telecaller", "fresher", "graduate", "any degree",
+    "12th pass", "10th pass", "no experience", "delivery", "marketing", "accounts",
+    "customer", "support", "data entry", "python", "developer", "B.Com", "Pune", "Mumbai",
+]
+PLACES = [("Pune", "Maharashtra"), ("Mumbai", "Maharashtra"), ("Indore", "Madhya Pradesh"), ("", "")]
+
+
+def _job(rng, i):
+    city, state = rng.choice(PLACES)
+    return SimpleNamespace(
+        id=f"job-{i}",
+        title=" ".join(rng.sample(WORDS, 2)),
+        description=" ".join(rng.choices(WORDS, k=rng.randint(0, 30))) or None,
+        city=city.lower() or None,
+        location=rng.choice([f"{city}, {state}", "Remote", None]),
+        state=state or None,
+    )
+
+
+def _profile(rng):
+    city, state = rng.choice(PLACES)
+    return SimpleNamespace(
+        city=city or None,
+        state=rng.choice([state, None]),
+        education_level=rng.choice(["Graduate", "B.Com", "12th", "", None]),
+        career_aspiration_raw=rng.choice(["I want a sales executive role", "marketing-support", "", None]),
+        interests=rng.choice([json.dumps(rng.sample(WORDS, 3)), "not json", None]),
+    )
+
+
+class TestJobMatrix(unittest.TestCase):
+    def test_matches_compute_match_score(self):
+        rng = random.Random(7)
+        jobs = [_job(rng, i) for i in range(300)]
+        profiles = [_profile(rng) for _ in range(60)]
+
+        scores = JobMatrix(jobs).score(profiles)
+
+        expected = [[compute_match_score(job, profile) for job in jobs] for profile in profiles]
+        self.assertEqual(scores.tolist(), expected)
+        self.assertTrue(scores.any())
+
+    def test_long_interest_token(self):
+        job = SimpleNamespace(id="j", title="python", description="developer", city=None, location=None, state=None)
+        profile = SimpleNamespace(
+            city=None, state=None, education_level=None,
+            career_aspiration_raw="x" * 100 + "pythondeveloper", interests=None,
+        )
+        self.assertEqual(JobMatrix([job]).score([profile]).tolist(), [[compute_match_score(job, profile)]])
+
+    def test_extend_matches_one_build(self):
+        rng = random.Random(3)
+        jobs = [_job(rng, i) for i in range(200)]
+        profiles = [_profile(rng) for _ in range(20)]
+        grown = JobMatrix(jobs[:50])
+        grown.score(profiles)  # warm the per-value caches before growing
+        grown.extend(jobs[50:120])
+        grown.extend(jobs[120:])
+        self.assertEqual(grown.ids, [job.id for job in jobs])
+        self.assertEqual(grown.score(profiles).tolist(), JobMatrix(jobs).score(profiles).tolist())
+
+    def test_empty(self):
+        self.assertEqual(JobMatrix([]).score([_profile(random.Random(1))]).shape, (1, 0))
+
+
+class TestRescoreMarker(unittest.TestCase):
+    def setUp(self):
+        engine = create_engine("sqlite://")
+        for model in (UserProfile, Job, JobMatchScore, BackgroundTask):
+            model.__table__.create(engine)
+        self.db = Session(engine)
+        self.profile = UserProfile(user_id="u1", city="Pune", updated_at="2026-01-01T00:00:00+00:00")
+        self.db.add(self.profile)
+        self.db.commit()
+        patcher = patch.object(job_match_service, "job_index", JobIndex())
+        self.index = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.db.close()
+
+    def _add_jobs(self, *titles, scraped_at="2026-10-01T00:00:00+00:00"):
+        self.db.add_all(
+            Job(title=t, company="Acme", role_category="sales", city="pune", scraped_at=scraped_at)
+            for t in titles
+        )
+        self.db.commit()
+
+    def test_rescore_tokenizes_only_new_jobs(self):
+        self._add_jobs("Sales Executive", "Telecaller")
+        self.assertEqual(rescore_user(self.db, "u1"), 2)
+
+        self._add_jobs("Fresher Accountant", scraped_at="2026-10-02T00:00:00+00:00")
+        with patch.object(self.index.matrix, "extend", wraps=self.index.matrix.extend) as extend:
+            self.assertEqual(rescore_user(self.db, "u1"), 3)
+        self.assertEqual([len(call.args[0]) for call in extend.call_args_list], [1])
+        self.assertEqual(self.db.query(JobMatchScore).count(), 3)
+        self.assertEqual(
+            sorted(score.scraped_at for score in self.db.query(JobMatchScore)),
+            ["2026-10-01T00:00:00+00:00"] * 2 + ["2026-10-02T00:00:00+00:00"],
+        )
+
+    def test_index_rebuilds_when_keyset_misses_a_job(self):
+        self._add_jobs("Sales Executive", scraped_at="2026-10-02T00:00:00+00:00")
+        self.index.refresh(self.db)
+        self._add_jobs("Late Telecaller", scraped_at="2026-10-01T00:00:00+00:00")
+        self.index.refresh(self.db)
+        self.assertEqual(self.index.matrix.size, 2)
+
+    def _tasks(self) -> int:
+        return self.db.query(BackgroundTask).count()
+
+    def test_scored_without_matches_is_marked(self):
+        # No jobs at all: nothing stored, but the user counts as scored
+        self.assertEqual(rescore_user(self.db, "u1"), 0)
+        self.db.refresh(self.profile)
+        self.assertIsNotNone(self.profile.match_scored_at)
+        self.assertEqual(self.profile.updated_at, "2026-01-01T00:00:00+00:00")
+
+    def test_backfill_skips_running_rescore(self):
+        self.assertTrue(queue_rescore(self.db, "u1", profile_changed=False))
+        self.db.commit()
+        self.db.query(BackgroundTask).update({BackgroundTask.status: "running"})
+        self.db.commit()
+
+        self.assertFalse(queue_rescore(self.db, "u1", profile_changed=False))
+        # A profile edit may postdate what the running task read
+        self.assertTrue(queue_rescore(self.db, "u1"))
+        self.assertFalse(queue_rescore(self.db, "u1"))
+        self.db.commit()
+        self.assertEqual(self._tasks(), 2)
+
+
+class TestMatchFeedCursor(unittest.TestCase):
+    def setUp(self):
+        engine = create_engine("sqlite://")
+        for model in (Job, JobMatchScore):
+            model.__table__.create(engine)
+        self.db = Session(engine)
+        self.addCleanup(self.db.close)
+        rng = random.Random(5)
+        jobs = [
+            Job(title=f"Job {i}", company="Acme", role_category="sales",
+                scraped_at=f"2026-10-{rng.randint(1, 4):02d}T00:00:00+00:00")
+            for i in range(23)
+        ]
+        self.db.add_all(jobs)
+        self.db.flush()
+        # Ties on score and on scraped_at; a third of the jobs unscored
+        self.db.add_all(
+            JobMatchScore(user_id="u1", job_id=job.id, scraped_at=job.scraped_at, score=rng.choice([20, 45, 45, 90]))
+            for job in jobs[: len(jobs) * 2 // 3]
+        )
+        self.db.add(JobMatchScore(user_id="u2", job_id=jobs[-1].id, scraped_at=jobs[-1].scraped_at, score=99))
+        self.db.commit()
+
+    def _walk(self, limit: int) -> list[str]:
+        seen, state = [], {}
+        while state is not None:
+            jobs, state = _match_page(self.db.query(Job), "u1", state, limit)
+            seen += [job.id for job in jobs]
+        return seen
+
+    def test_cursor_matches_offset_order(self):
+        ranked = self.db.query(Job.id).outerjoin(
+            JobMatchScore, and_(JobMatchScore.job_id == Job.id, JobMatchScore.user_id == "u1"),
+        ).order_by(func.coalesce(JobMatchScore.score, 0).desc(), Job.scraped_at.desc(), Job.id.desc())
+        expected = [job_id for job_id, in ranked]
+        for limit in (1, 4, 15, 23, 50):
+            self.assertEqual(self._walk(limit), expected, f"limit={limit}")
+
+    def test_invalid_cursor(self):
+        for state in ({"m": "90", "s": "x", "i": "y"}, {"m": 90, "s": "x"}, {"m": True, "s": "x", "i": "y"}):
+            with self.assertRaises(HTTPException):
+                _match_page(self.db.query(Job), "u1", state, 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
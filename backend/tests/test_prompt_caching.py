@@ -0,0 +1,123 @@
+"""
+Prompt caching: each chat builder's cached system prefix must reach the
+model's minimum cacheable length for a typical session, or cache_control
+is silently ignored and every turn pays for the full prompt.
+
+Run with:
+    python -m pytest backend/tests/test_prompt_caching.py -v
+"""
+
+import sys
+import os
+import unittest
+from types import SimpleNamespace
+
+os.environ.setdefault("TURSO_DATABASE_URL", "https://dummy-db.turso.io")
+os.environ.setdefault("TURSO_AUTH_TOKEN", "dummy-token")
+os.environ.setdefault("JWT_SECRET", "test-secret-key-for-unit-tests")
+os.environ.setdefault("ANTHROPIC_API_KEY", "sk-ant-dummy-key")
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from unittest.mock import MagicMock, patch
+
+with patch("sqlalchemy.create_engine", return_value=MagicMock()):
+    from app.prompts import (
+        CACHE_MIN_TOKENS,
+        build_interview_system_prompt,
+        build_mentorship_system_prompt,
+        build_resume_system_prompt,
+        build_system_prompt,
+    )
+
+# English prose runs ~4 characters per token; 4.2 errs towards undercounting
+CHARS_PER_TOKEN = 4.2
+
+USER = SimpleNamespace(name="Test Student", college="Pune Institute of Technology")
+
+PROFILE = SimpleNamespace(
+    education_level="Undergraduate", class_or_year="3rd year", board=None, stream="Computer Science",
+    cgpa="8.2", city="Pune", state="Maharashtra",
+    hobbies='["Chess", "Cricket"]', interests='["Data analysis", "Web development"]',
+    strengths='["Problem solving", "Teamwork"]', weaknesses='["Public speaking"]',
+    languages='["English", "Hindi", "Marathi"]', skills='["Python", "SQL", "React"]',
+    career_aspiration_raw="I want to work as a data analyst at a product company",
+    parent_occupation="Teacher", income_range="5-10 LPA",
+    summary="Computer Science student who enjoys turning data into decisions.",
+)
+
+# A condensed rolling summary is 300-400 words (see analysis_service)
+CONTEXT_SUMMARY = SimpleNamespace(cumulative_summary=" ".join(
+    ["The student is weighing data analytics against software development, enjoys SQL "
+     "and dashboards, is anxious about placements and wants a structured six-month plan."] * 14
+))
+
+RESUME_TEXT = "\n".join([
+    "Aarav Sharma | aarav.sharma@example.com | +91 98765 43210 | Pune, Maharashtra",
+    "OBJECTIVE: Computer Science graduate seeking a data analyst role where strong SQL and "
+    "Python fundamentals turn business questions into clear, measurable answers.",
+    "EDUCATION: B.Tech Computer Science, Pune Institute of Technology, 2021-2025, CGPA 8.2/10",
+    "EXPERIENCE: Data Analyst Intern, Acme Retail, May 2024 - Jul 2024",
+    "- Built 6 Power BI dashboards tracking store sales across 40 outlets",
+    "- Cut weekly reporting time by 40% by automating Excel exports with Python",
+    "- Cleaned and merged 2 years of transaction data (1.2M rows) for a churn study",
+    "PROJECTS: Campus Placement Tracker - Flask, PostgreSQL, Chart.js",
+    "- Tracked offers for 900+ students; used by the placement cell every week",
+    "PROJECTS: Cricket Stats Explorer - Pandas, Streamlit",
+    "- Scraped 15 seasons of IPL data and built an interactive player comparison tool",
+    "SKILLS: Python, SQL, Pandas, Power BI, Excel, Tableau, Git, Statistics",
+    "ACHIEVEMENTS: Winner, college hackathon 2023; Top 5%, state-level coding contest",
+    "CERTIFICATIONS: Google Data Analytics (Coursera, 2023); SQL for Data Science (2024)",
+])
+
+JOB_DESCRIPTION = (
+    "We are hiring a Junior Data Analyst to join our growth team in Pune. You will own weekly "
+    "business reviews, write SQL against our warehouse, build dashboards in Power BI and work "
+    "with product managers to size opportunities. Requirements: strong SQL, working Python or R, "
+    "comfort with basic statistics (A/B tests, confidence intervals), clear written communication. "
+    "Freshers with strong projects are encouraged to apply."
+)
+
+
+def _cached_tokens(blocks: list[dict]) -> float:
+    cached = [b for b in blocks if "cache_control" in b]
+    if not cached:
+        return 0
+    end = blocks.index(cached[-1])
+    return sum(len(b["text"]) for b in blocks[: end + 1]) / CHARS_PER_TOKEN
+
+
+class TestCachedPrefixLength(unittest.TestCase):
+    def assertCacheable(self, blocks):
+        self.assertGreaterEqual(_cached_tokens(blocks), CACHE_MIN_TOKENS)
+
+    def test_career_counselor(self):
+        self.assertCacheable(build_system_prompt(USER, PROFILE, CONTEXT_SUMMARY))
+
+    def test_resume_builder(self):
+        self.assertCacheable(build_resume_system_prompt(USER, PROFILE))
+
+    def test_mentorship(self):
+        self.assertCacheable(build_mentorship_system_prompt(USER, PROFILE, CONTEXT_SUMMARY, resume_count=1))
+
+    def test_interview(self):
+        self.assertCacheable(build_interview_system_prompt("Data Analyst", RESUME_TEXT, JOB_DESCRIPTION))
+
+
+class TestCacheBreakpoint(unittest.TestCase):
+    def test_profile_is_cached_but_late_instruction_is_not(self):
+        blocks = build_system_prompt(USER, PROFILE, CONTEXT_SUMMARY, force_analysis=True)
+        self.assertIn("Data analysis", blocks[0]["text"])
+        self.assertIn("placements", blocks[0]["text"])
+        self.assertNotIn("IMPORTANT INSTRUCTION", blocks[0]["text"])
+        self.assertIn("IMPORTANT INSTRUCTION", blocks[1]["text"])
+        self.assertNotIn("cache_control", blocks[1])
+
+    def test_forcing_keeps_the_cached_prefix(self):
+        normal = build_resume_system_prompt(USER, PROFILE)
+        forced = build_resume_system_prompt(USER, PROFILE, force_resume=True)
+        self.assertEqual(normal[0], forced[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
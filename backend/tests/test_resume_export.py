@@ -0,0 +1,238 @@
+"""
+Bulk resume export: the streamed ZIP, the ordered render window, and the
+admin endpoint's draft selection and manifest (local SQLite database).
+
+Run with:
+    python -m pytest backend/tests/test_resume_export.py -v
+"""
+
+import sys
+import os
+import io
+import csv
+import json
+import random
+import asyncio
+import zipfile
+import unittest
+from types import SimpleNamespace
+
+os.environ.setdefault("TURSO_DATABASE_URL", "https://dummy-db.turso.io")
+os.environ.setdefault("TURSO_AUTH_TOKEN", "dummy-token")
+os.environ.setdefault("JWT_SECRET", "test-secret-key-for-unit-tests")
+os.environ.setdefault("ANTHROPIC_API_KEY", "sk-ant-dummy-key")
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from unittest.mock import MagicMock, patch
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+with patch("sqlalchemy.create_engine", return_value=MagicMock()):
+    from app.auth import get_stream_user
+    from app.models import ResumeDraft, User, UserProfile
+    from app.routers import resume_drafts
+    from app.services.resume_export_service import _ChunkSink, map_ordered, zip_stream
+
+
+async def _collect(agen) -> list:
+    return [item async for item in agen]
+
+
+async def _files(*names):
+    for name in names:
+        yield name, f"contents of {name}".encode()
+
+
+class TestZipStream(unittest.TestCase):
+    def test_valid_archive(self):
+        chunks = asyncio.run(_collect(zip_stream(_files("a/one.pdf", "b/two.pdf", "manifest.csv"))))
+        with zipfile.ZipFile(io.BytesIO(b"".join(chunks))) as zf:
+            self.assertIsNone(zf.testzip())
+            self.assertEqual(zf.namelist(), ["a/one.pdf", "b/two.pdf", "manifest.csv"])
+            self.assertEqual(zf.read("b/two.pdf"), b"contents of b/two.pdf")
+            self.assertEqual({info.compress_type for info in zf.infolist()}, {zipfile.ZIP_STORED})
+
+    def test_yields_each_member_before_the_next_is_produced(self):
+        produced = []
+
+        async def files():
+            for name in ("one.pdf", "two.pdf"):
+                produced.append(name)
+                yield name, b"x" * 1000
+
+        async def run():
+            seen = []
+            async for chunk in zip_stream(files()):
+                seen.append((list(produced), chunk))
+            return seen
+
+        seen = asyncio.run(run())
+        self.assertEqual(seen[0][0], ["one.pdf"])
+        self.assertIn(b"one.pdf", seen[0][1])
+        self.assertNotIn(b"two.pdf", seen[0][1])
+        self.assertEqual(len(seen), 3)  # one chunk per member, then the central directory
+
+
+class TestChunkSink(unittest.TestCase):
+    def test_drain_returns_and_clears(self):
+        sink = _ChunkSink()
+        self.assertEqual(sink.write(b"ab"), 2)
+        sink.write(memoryview(b"cd"))
+        self.assertEqual(sink.drain(), b"abcd")
+        self.assertEqual(sink.drain(), b"")
+
+    def test_unseekable_so_zipfile_writes_data_descriptors(self):
+        sink = _ChunkSink()
+        with zipfile.ZipFile(sink, "w") as zf:
+            zf.writestr("a.txt", b"hello")
+        self.assertTrue(zf.infolist()[0].flag_bits & 0x08)
+        self.assertEqual(zipfile.ZipFile(io.BytesIO(sink.drain())).read("a.txt"), b"hello")
+
+
+class TestMapOrdered(unittest.TestCase):
+    def test_order_holds_under_concurrency(self):
+        rng = random.Random(3)
+        delays = [rng.uniform(0, 0.01) for _ in range(30)]
+        running, peak = 0, 0
+
+        async def work(i):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(delays[i])
+            running -= 1
+            return i
+
+        results = asyncio.run(_collect(map_ordered(range(30), work, 4)))
+        self.assertEqual(results, list(range(30)))
+        self.assertEqual(peak, 4)
+
+    def test_closing_early_cancels_in_flight_work(self):
+        started, cancelled = [], []
+
+        async def work(i):
+            started.append(i)
+            try:
+                await asyncio.sleep(0 if i == 0 else 10)
+            except asyncio.CancelledError:
+                cancelled.append(i)
+                raise
+            return i
+
+        async def run():
+            stream = map_ordered(range(10), work, 3)
+            first = await stream.__anext__()
+            await stream.aclose()
+            await asyncio.sleep(0)
+            return first
+
+        self.assertEqual(asyncio.run(run()), 0)
+        self.assertEqual(sorted(cancelled), sorted(set(started) - {0}))
+
+
+class _Scope:
+    """Stands in for ``async_session_scope`` over the test's session."""
+
+    def __init__(self, db):
+        self.db = db
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def run_sync(self, fn, *args):
+        return fn(self.db, *args)
+
+
+class TestExportEndpoint(unittest.TestCase):
+    def setUp(self):
+        # TestClient runs the endpoint on another thread
+        engine = create_engine(
+            "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+        )
+        for model in (User, UserProfile, ResumeDraft):
+            model.__table__.create(engine)
+        self.db = Session(engine)
+        self.addCleanup(self.db.close)
+
+        for user_id, name, college in (("u1", "Asha", "Pune University"), ("u2", "Ravi", "IIT Delhi"),
+                                       ("u3", "Meera", "Pune University")):
+            self.db.add(User(id=user_id, name=name, email=f"{user_id}@example.com",
+                             password_hash="x", college=college))
+        self.db.add_all([
+            ResumeDraft(id="d1-old", user_id="u1", resume_json=json.dumps({"v": "old"}),
+                        updated_at="2026-09-01T00:00:00+00:00"),
+            ResumeDraft(id="d1-new", user_id="u1", resume_json=json.dumps({"v": "new"}),
+                        updated_at="2026-10-05T10:00:00+00:00"),
+            ResumeDraft(id="d2", user_id="u2", resume_json=json.dumps({"v": "fail"}),
+                        updated_at="2026-10-04T00:00:00+00:00"),
+            ResumeDraft(id="d3", user_id="u3", resume_json=json.dumps({"v": "u3"}),
+                        updated_at="2026-09-15T00:00:00+00:00"),
+        ])
+        self.db.commit()
+
+        async def prepare(resume_data, template, profile_image, user_id):
+            return resume_data["v"], None
+
+        async def render(key, render_pdf):
+            if key == "fail":
+                raise RuntimeError("render crashed")
+            return f"%PDF {key}".encode()
+
+        for name, value in (
+            ("async_session_scope", lambda: _Scope(self.db)),
+            ("_prepare_pdf", prepare),
+            ("get_or_render_async", render),
+        ):
+            patcher = patch.object(resume_drafts, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        app = FastAPI()
+        app.include_router(resume_drafts.router)
+        app.dependency_overrides[get_stream_user] = lambda: SimpleNamespace(id="admin", role="admin")
+        self.client = TestClient(app)
+
+    def export(self, **params) -> tuple[zipfile.ZipFile, list[dict]]:
+        response = self.client.get("/resume-drafts/admin/export", params=params)
+        self.assertEqual(response.status_code, 200, response.text)
+        zf = zipfile.ZipFile(io.BytesIO(response.content))
+        self.assertIsNone(zf.testzip())
+        manifest = list(csv.DictReader(io.StringIO(zf.read("manifest.csv").decode())))
+        return zf, manifest
+
+    def test_latest_draft_per_student_and_failed_render_in_manifest(self):
+        zf, manifest = self.export()
+        self.assertEqual([row["draft_id"] for row in manifest], ["d2", "d1-new", "d3"])  # by college, name
+        statuses = {row["draft_id"]: row["status"] for row in manifest}
+        self.assertEqual(statuses, {"d1-new": "ok", "d2": "failed: RuntimeError", "d3": "ok"})
+        self.assertEqual(next(row["file"] for row in manifest if row["draft_id"] == "d2"), "")
+        pdfs = sorted(name for name in zf.namelist() if name.endswith(".pdf"))
+        self.assertEqual(pdfs, ["Pune University/Asha-d1-new.pdf", "Pune University/Meera-d3.pdf"])
+        self.assertEqual(zf.read("Pune University/Asha-d1-new.pdf"), b"%PDF new")
+
+    def test_updated_since_is_normalized_to_utc(self):
+        # 15:00 in India is 09:30 UTC: after d2 (Oct 4), before d1-new (10:00 UTC)
+        _, manifest = self.export(updated_since="2026-10-05T15:00:00+05:30")
+        self.assertEqual([row["draft_id"] for row in manifest], ["d1-new"])
+        _, manifest = self.export(updated_since="2026-10-04Z")
+        self.assertEqual({row["draft_id"] for row in manifest}, {"d1-new", "d2"})
+
+    def test_bad_updated_since(self):
+        response = self.client.get("/resume-drafts/admin/export", params={"updated_since": "last week"})
+        self.assertEqual(response.status_code, 400)
+
+    def test_filters_to_nothing(self):
+        response = self.client.get("/resume-drafts/admin/export", params={"college": "Nowhere"})
+        self.assertEqual(response.status_code, 404)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+"""
+Text extraction pool: a parse that runs past the timeout recycles the pool,
+so later uploads don't wait behind it.
+
+Run with:
+    python -m pytest backend/tests/test_text_extraction.py -v
+"""
+
+import sys
+import os
+import time
+import asyncio
+import threading
+import unittest
+
+os.environ.setdefault("TURSO_DATABASE_URL", "https://dummy-db.turso.io")
+os.environ.setdefault("TURSO_AUTH_TOKEN", "dummy-token")
+os.environ.setdefault("JWT_SECRET", "test-secret-key-for-unit-tests")
+os.environ.setdefault("ANTHROPIC_API_KEY", "sk-ant-dummy-key")
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from unittest.mock import MagicMock, patch
+
+with patch("sqlalchemy.create_engine", return_value=MagicMock()):
+    from app.services import text_extraction_service, text_extractors
+    from app.services.text_extraction_service import DocumentUnreadable, _run_extract
+
+_release = threading.Event()
+
+
+def _hang_on_stuck(content, kind, max_pages, fast):
+    """Stands in for ``text_extractors.extract``; module level so worker
+    processes can unpickle it."""
+    if content == b"stuck":
+        if _release.wait(5) is False:  # in a worker process nothing releases it
+            time.sleep(60)
+    return {"pages": [content.decode()], "page_count": 1, "extractor": "test"}
+
+
+class _PoolTest(unittest.TestCase):
+    WORKERS = 0
+
+    def setUp(self):
+        _release.clear()
+        self.addCleanup(_release.set)
+        text_extraction_service.stop_extract_pool()
+        self.addCleanup(text_extraction_service.stop_extract_pool)
+        for target, name, value in (
+            (text_extraction_service, "TEXT_EXTRACT_WORKERS", self.WORKERS),
+            (text_extraction_service, "TEXT_EXTRACT_TIMEOUT_SECONDS", 0.3),
+            (text_extractors, "extract", _hang_on_stuck),
+        ):
+            patcher = patch.object(target, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def extract(self, content: bytes) -> dict:
+        return asyncio.run(_run_extract(content, "pdf"))
+
+
+class TestThreadPoolTimeout(_PoolTest):
+    def test_timeout_replaces_the_busy_thread(self):
+        stuck = text_extraction_service._get_executor()
+        with self.assertRaises(DocumentUnreadable):
+            self.extract(b"stuck")
+        self.assertIsNot(text_extraction_service._get_executor(), stuck)
+
+        # Served by a fresh thread while the stuck parse is still running
+        started = time.monotonic()
+        self.assertEqual(self.extract(b"next")["pages"], ["next"])
+        self.assertLess(time.monotonic() - started, 0.3)
+
+    def test_parse_errors_do_not_recycle(self):
+        executor = text_extraction_service._get_executor()
+        with patch.object(text_extractors, "extract", side_effect=RuntimeError("bad xref")):
+            with self.assertRaises(DocumentUnreadable):
+                self.extract(b"broken")
+        self.assertIs(text_extraction_service._get_executor(), executor)
+
+
+class TestProcessPoolTimeout(_PoolTest):
+    WORKERS = 1
+
+    def test_timeout_terminates_the_worker(self):
+        # Worker started (and this module imported) before the timed parse
+        executor = text_extraction_service._get_executor()
+        executor.submit(_hang_on_stuck, b"warm", "pdf", 1, True).result(60)
+        workers = list(executor._processes.values())
+        with self.assertRaises(DocumentUnreadable):
+            self.extract(b"stuck")
+        for process in workers:
+            process.join(5)
+            self.assertFalse(process.is_alive())
+
+        # A new pool (which has to start its worker) takes the next upload
+        with patch.object(text_extraction_service, "TEXT_EXTRACT_TIMEOUT_SECONDS", 60):
+            self.assertEqual(self.extract(b"next")["pages"], ["next"])
+        self.assertIsNot(text_extraction_service._get_executor(), executor)
+
+
+if __name__ == "__main__":
+    unittest.main()